@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""A Dakota model plugin that does no work, for timing driver overhead.
+
+Run as a script, this module registers itself as the
+``dakotathon.plugins.noop`` plugin and then hands its arguments to the
+`dakota_run_plugin` driver (or, given ``--batch`` as its first
+argument, to the `dakota_run_batch` driver), so that a benchmark can time a complete
+evaluation, from interpreter startup to writing the results file,
+without a model installed.
+
+"""
+
+import sys
+from dakotathon.plugins.base import PluginBase
+from dakotathon.utils import get_response_descriptors, write_results
+
+
+classname = "NoOp"
+
+
+def is_installed():
+    """The no-op model is always available."""
+    return True
+
+
+def register():
+    """Make this module importable as the `noop` plugin."""
+    sys.modules["dakotathon.plugins.noop"] = sys.modules[__name__]
+
+
+class NoOp(PluginBase):
+
+    """A plugin whose responses are all zero."""
+
+    def __init__(self, **kwargs):
+        PluginBase.__init__(self, **kwargs)
+        self.output_values = []
+
+    def setup(self, config):
+        self.output_files = config["response_descriptors"]
+
+    def call(self):
+        pass
+
+    def load(self, output_file):
+        return None
+
+    def calculate(self):
+        self.output_values = [0.0] * len(self.output_files)
+
+    def write(self, params_file, results_file):
+        labels = get_response_descriptors(params_file)
+        write_results(results_file, self.output_values, labels)
+
+
+if __name__ == "__main__":
+    register()
+    if sys.argv[1:2] == ["--batch"]:
+        del sys.argv[1]
+        from dakotathon.run_batch import main
+    else:
+        from dakotathon.run_plugin import main
+
+    main()
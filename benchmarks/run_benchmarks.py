@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+"""Benchmarks for the Dakotathon analysis drivers and I/O helpers.
+
+All inputs are synthetic, so neither Dakota nor a model needs to be
+installed; end-to-end benchmarks run the stand-in `dakota` executable
+in **mock_dakota**. Results are written as JSON; pass a previous results file
+with ``--compare`` to flag regressions.
+
+Run all benchmarks with::
+
+    $ python benchmarks/run_benchmarks.py --output results.json
+
+or a subset, selected by name prefix, with::
+
+    $ python benchmarks/run_benchmarks.py compute_statistic write_
+
+"""
+
+import os
+import sys
+import json
+import shutil
+import timeit
+import platform
+import tempfile
+import subprocess
+import numpy as np
+
+import dakotathon
+from dakotathon.dakota import Dakota
+from dakotathon.experiment import Experiment
+from dakotathon.plugins.base import write_dflt_file, write_dtmpl_file
+from dakotathon.utils import (
+    write_results,
+    get_response_descriptors,
+    compute_statistic,
+    compute_statistics,
+    deserialize,
+    get_sidecar_file,
+)
+
+
+benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+mock_dakota_dir = os.path.join(benchmarks_dir, "mock_dakota")
+
+registry = []
+
+
+def benchmark(name, params=(None,)):
+    """Register a benchmark, run once for each of a set of parameters.
+
+    The decorated function is called with a parameter and a scratch
+    directory, and returns the function to time.
+
+    """
+
+    def register(func):
+        registry.append((name, params, func))
+        return func
+
+    return register
+
+
+# Synthetic inputs -----------------------------------------------------
+
+
+def make_names(n, prefix="x"):
+    return ["{}{}".format(prefix, i + 1) for i in range(n)]
+
+
+def make_params_file(params_file, config_file, descriptors, responses, eval_id=1):
+    """Write a Dakota parameters file in the standard format."""
+    lines = ["{:>42} variables".format(len(descriptors))]
+    for i, name in enumerate(descriptors):
+        lines.append("{:>42.15e} {}".format(0.1 * (i + 1), name))
+    lines.append("{:>42} functions".format(len(responses)))
+    for i, name in enumerate(responses):
+        lines.append("{:>42} ASV_{}:{}".format(1, i + 1, name))
+    lines.append("{:>42} derivative_variables".format(len(descriptors)))
+    for i, name in enumerate(descriptors):
+        lines.append("{:>42} DVV_{}:{}".format(i + 1, i + 1, name))
+    lines.append("{:>42} analysis_components".format(1))
+    lines.append("{:>42} AC_1:dakota_run_plugin".format(config_file))
+    lines.append("{:>42} eval_id".format(eval_id))
+    with open(params_file, "w") as fp:
+        fp.write("\n".join(lines) + "\n")
+
+
+def make_template(tmpl_file, parameters_file, n):
+    """Write a model template and parameters file with n parameters."""
+    names = make_names(n, prefix="p")
+    with open(tmpl_file, "w") as fp:
+        for name in names:
+            fp.write("{{{}}}\t\t) {} description\n".format(name, name))
+        fp.write("{_run_duration} d\n")
+    with open(parameters_file, "w") as fp:
+        for name in names:
+            fp.write("{}:\n  value:\n    default: 1.0\n".format(name))
+    return names
+
+
+# Benchmarks -----------------------------------------------------------
+
+
+@benchmark("driver_overhead_subprocess")
+def bench_driver_overhead_subprocess(param, tmp_dir):
+    """A full no-op evaluation, including interpreter startup."""
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(plugin="noop", run_directory=tmp_dir, response_descriptors=("y1",))
+    d.serialize(config_file)
+    params_file = os.path.join(tmp_dir, "params.in")
+    make_params_file(params_file, config_file, ["x1", "x2"], ["y1"])
+    results_file = os.path.join(tmp_dir, "results.out")
+    args = [
+        sys.executable,
+        os.path.join(benchmarks_dir, "noop_plugin.py"),
+        params_file,
+        results_file,
+    ]
+    return lambda: subprocess.check_call(args, cwd=tmp_dir)
+
+
+@benchmark("driver_overhead_in_process")
+def bench_driver_overhead_in_process(param, tmp_dir):
+    """A no-op evaluation in a warm interpreter."""
+    sys.path.insert(0, benchmarks_dir)
+    import noop_plugin
+    from dakotathon.run_plugin import run_plugin
+
+    noop_plugin.register()
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(plugin="noop", run_directory=tmp_dir, response_descriptors=("y1",))
+    d.serialize(config_file)
+    params_file = os.path.join(tmp_dir, "params.in")
+    make_params_file(params_file, config_file, ["x1", "x2"], ["y1"])
+    results_file = os.path.join(tmp_dir, "results.out")
+    return lambda: run_plugin(params_file, results_file)
+
+
+@benchmark("write_dflt_file", params=(10, 100, 1000))
+def bench_write_dflt_file(n, tmp_dir):
+    tmpl_file = os.path.join(tmp_dir, "model.in.tmpl")
+    parameters_file = os.path.join(tmp_dir, "parameters.yaml")
+    make_template(tmpl_file, parameters_file, n)
+    os.chdir(tmp_dir)
+    return lambda: write_dflt_file(tmpl_file, parameters_file)
+
+
+@benchmark("write_dtmpl_file", params=(10, 100, 1000))
+def bench_write_dtmpl_file(n, tmp_dir):
+    tmpl_file = os.path.join(tmp_dir, "model.in.tmpl")
+    parameters_file = os.path.join(tmp_dir, "parameters.yaml")
+    names = make_template(tmpl_file, parameters_file, n)
+    os.chdir(tmp_dir)
+    dflt_file = write_dflt_file(tmpl_file, parameters_file)
+    return lambda: write_dtmpl_file(tmpl_file, dflt_file, names[: n // 2])
+
+
+@benchmark("write_results", params=(1, 100, 10000))
+def bench_write_results(n, tmp_dir):
+    results_file = os.path.join(tmp_dir, "results.out")
+    values = np.random.random(n)
+    labels = make_names(n, prefix="y")
+    return lambda: write_results(results_file, values, labels)
+
+
+@benchmark("get_response_descriptors", params=(1, 100, 10000))
+def bench_get_response_descriptors(n, tmp_dir):
+    params_file = os.path.join(tmp_dir, "params.in")
+    make_params_file(params_file, "dakota.yaml", ["x1", "x2"], make_names(n, "y"))
+    return lambda: get_response_descriptors(params_file)
+
+
+@benchmark("compute_statistic", params=("mean", "median", "max", "std"))
+def bench_compute_statistic(statistic, tmp_dir):
+    series = np.random.random(365 * 100)
+    return lambda: compute_statistic(statistic, series)
+
+
+@benchmark("compute_statistics", params=("separate", "grouped"))
+def bench_compute_statistics(mode, tmp_dir):
+    """Five statistics of the same series, one at a time or grouped."""
+    series = np.random.random(365 * 100)
+    statistics = ["mean", "median", "std", "percentile:5", "percentile:95"]
+    if mode == "separate":
+        return lambda: [compute_statistic(s, series) for s in statistics]
+    return lambda: compute_statistics(statistics, series)
+
+
+@benchmark("hydrotrend_load", params=("loadtxt", "ascii", "binary"))
+def bench_hydrotrend_load(reader, tmp_dir):
+    """Read 100 years of daily HydroTrend output."""
+    from dakotathon.plugins.hydrotrend import read_ascii_output, read_binary_output
+
+    values = np.random.random(36500)
+    output_file = os.path.join(tmp_dir, "HYDROASCII.Q")
+    np.savetxt(output_file, values, header="h1\nh2", comments="")
+    if reader == "loadtxt":
+        return lambda: np.loadtxt(output_file, skiprows=2)
+    if reader == "ascii":
+        return lambda: read_ascii_output(output_file)
+    binary_file = os.path.join(tmp_dir, "HYDROOUTPUT.Q")
+    values.astype("<f4").tofile(binary_file)
+    return lambda: read_binary_output(binary_file)
+
+
+@benchmark("dakota_serialize")
+def bench_dakota_serialize(param, tmp_dir):
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(method="sampling", variables="uniform_uncertain", run_directory=tmp_dir)
+    return lambda: d.serialize(config_file)
+
+
+@benchmark("dakota_from_file_like")
+def bench_dakota_from_file_like(param, tmp_dir):
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(method="sampling", variables="uniform_uncertain", run_directory=tmp_dir)
+    d.serialize(config_file)
+    return lambda: Dakota.from_file_like(config_file)
+
+
+@benchmark("deserialize", params=("yaml", "sidecar"))
+def bench_deserialize(source, tmp_dir):
+    """Load the configuration, as the drivers do at each evaluation."""
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(method="sampling", variables="uniform_uncertain", run_directory=tmp_dir)
+    d.serialize(config_file)
+    if source == "yaml":
+        os.remove(get_sidecar_file(config_file))
+    return lambda: deserialize(config_file)
+
+
+@benchmark("experiment_str", params=(2, 100, 1000, 10000))
+def bench_experiment_str(n, tmp_dir):
+    """Build the input file of a study of many variables."""
+    x = Experiment(
+        method="sampling",
+        variables="uniform_uncertain",
+        descriptors=make_names(n),
+        lower_bounds=[0.0] * n,
+        upper_bounds=[1.0] * n,
+    )
+    return lambda: str(x)
+
+
+@benchmark("end_to_end_throughput", params=(1, 4, "batch"))
+def bench_end_to_end_throughput(concurrency, tmp_dir):
+    """A 20-sample study of the no-op plugin, run by the mock Dakota.
+
+    With "batch", the study is run in batch mode by the
+    `dakota_run_batch` driver, with four workers.
+    """
+    driver = "{} {}".format(
+        sys.executable, os.path.join(benchmarks_dir, "noop_plugin.py")
+    )
+    if concurrency == "batch":
+        options = dict(
+            batch=True,
+            evaluation_concurrency=4,
+            analysis_driver=driver + " --batch",
+        )
+    else:
+        options = dict(
+            asynchronous=True,
+            evaluation_concurrency=concurrency,
+            analysis_driver=driver,
+        )
+    d = Dakota(
+        method="sampling",
+        variables="uniform_uncertain",
+        plugin="noop",
+        run_directory=tmp_dir,
+        work_directory=tmp_dir,
+        samples=20,
+        **options
+    )
+    d.setup()
+    path = os.pathsep.join([mock_dakota_dir, os.environ.get("PATH", "")])
+
+    def run():
+        previous_path, os.environ["PATH"] = os.environ.get("PATH", ""), path
+        try:
+            d.run()
+        finally:
+            os.environ["PATH"] = previous_path
+        with open(d.error_log, "r") as fp:
+            if fp.read().strip():
+                raise RuntimeError("Study failed; see " + d.error_log)
+
+    return run
+
+
+# Harness --------------------------------------------------------------
+
+
+def run(selected=(), repeat=5):
+    """Run the registered benchmarks.
+
+    Parameters
+    ----------
+    selected : list of str, optional
+      Run only benchmarks whose names start with one of these.
+    repeat : int, optional
+      The number of timing repetitions (default is 5).
+
+    Returns
+    -------
+    dict
+      Timings, in seconds per call, keyed by benchmark name.
+
+    """
+    start_dir = os.getcwd()
+    results = {}
+    for name, params, func in registry:
+        if selected and not any(name.startswith(s) for s in selected):
+            continue
+        for param in params:
+            key = name if param is None else "{}[{}]".format(name, param)
+            tmp_dir = tempfile.mkdtemp(prefix="dakotathon-bench-")
+            try:
+                stmt = func(param, tmp_dir)
+                timer = timeit.Timer(stmt)
+                number, _ = timer.autorange()
+                times = [t / number for t in timer.repeat(repeat, number)]
+            except Exception as error:
+                results[key] = {"error": repr(error)}
+                print("{:<45} {}".format(key, repr(error)))
+                continue
+            finally:
+                os.chdir(start_dir)
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            results[key] = {
+                "best": min(times),
+                "mean": sum(times) / len(times),
+                "number": number,
+                "repeat": repeat,
+            }
+            print("{:<45} {:>12.6f} ms".format(key, 1000.0 * min(times)))
+    return results
+
+
+def compare(results, baseline, threshold):
+    """List benchmarks slower than a baseline by more than a factor."""
+    regressions = []
+    for key, timing in results.items():
+        if "best" in timing and "best" in baseline.get(key, {}):
+            ratio = timing["best"] / baseline[key]["best"]
+            if ratio > threshold:
+                regressions.append((key, ratio))
+    return regressions
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmarks", nargs="*", help="benchmark name prefixes")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown factor reported as a regression (default is 1.25)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    results = run(args.benchmarks, repeat=args.repeat)
+    report = {
+        "dakotathon": dakotathon.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, "r") as fp:
+            baseline = json.load(fp)["benchmarks"]
+        regressions = compare(results, baseline, args.threshold)
+        for key, ratio in regressions:
+            print("REGRESSION {}: {:.2f}x slower".format(key, ratio))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,14 @@
 """A Python interface to the Dakota iterative systems analysis toolkit."""
-from .dakota import Dakota
 
 
 __all__ = ["Dakota"]
 __version__ = "0.5"
+
+
+def __getattr__(name):
+    """Import `Dakota` on first use, so the drivers start quickly."""
+    if name == "Dakota":
+        from .dakota import Dakota
+
+        return Dakota
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,226 @@
+"""Residuals between model output series and observations.
+
+With *observation_files*, the *calibration_terms* of an experiment are
+the residuals of model output series against observed series,
+computed by the analysis driver instead of by Dakota. Each response
+file is paired with an observation file, a text file with a row for
+each observation: its time index, its value, and an optional weight.
+Each response is written to Dakota as a field of residuals, one per
+observation.
+
+The observations are read once per experiment, when it's set up, and
+packed in a NumPy ``.npz`` file in the run directory, which the
+analysis drivers load instead of parsing the text files at every
+evaluation. A driver process that runs many evaluations, in batch
+mode or for finite difference gradients, loads the file only once.
+
+Observations are aligned with the model output by time index. A
+one-dimensional series is indexed by the time index directly; in a
+two-dimensional series, the first column holds the times, and the
+second the values. The residual at an observation is
+
+.. math::
+
+   r = \\sqrt{w} \\, (y_{model} - y_{obs})
+
+so that Dakota's sum of squared residuals is weighted by *w*. The
+residual is NaN where the model output has no value at the
+observation's time; the analysis drivers report such an evaluation
+to Dakota as failed, rather than pass on the NaN.
+
+"""
+
+import os
+from .profiling import phase
+
+
+observations_file = "observations.npz"
+
+_observations = {}
+
+
+def read_observations(observation_file):
+    """Read observations from a text file.
+
+    Parameters
+    ----------
+    observation_file : str
+      The path to a file with a row for each observation: the time
+      index, the observed value, and, optionally, a weight. Lines
+      starting with ``#`` are skipped.
+
+    Returns
+    -------
+    tuple of ndarray
+      The times, values, and weights of the observations; the
+      weights are one if the file has no weight column.
+
+    """
+    import numpy as np
+
+    data = np.loadtxt(observation_file, dtype=np.float64, ndmin=2)
+    if data.shape[1] < 2:
+        raise ValueError("{} needs time and value columns".format(observation_file))
+    weights = data[:, 2] if data.shape[1] > 2 else np.ones(len(data))
+    return data[:, 0], data[:, 1], weights
+
+
+def save_observations(run_directory, observation_files):
+    """Pack the observations of an experiment in a single file.
+
+    Parameters
+    ----------
+    run_directory : str
+      The experiment's run directory.
+    observation_files : list or tuple of str
+      The paths to the observation files.
+
+    Returns
+    -------
+    str
+      The path to the ``.npz`` file.
+
+    """
+    import numpy as np
+
+    arrays = {"files": np.asarray(observation_files, dtype=str)}
+    for i, observation_file in enumerate(observation_files):
+        times, values, weights = read_observations(observation_file)
+        arrays["times_{}".format(i)] = times
+        arrays["values_{}".format(i)] = values
+        arrays["weights_{}".format(i)] = weights
+    path = os.path.join(run_directory, observations_file)
+    np.savez(path, **arrays)
+    return path
+
+
+def load_observations(config):
+    """Load the observations of an experiment.
+
+    The file written by `save_observations` is read if it's current;
+    otherwise, the observation files are read. The result is kept
+    for later calls in the same process.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+
+    Returns
+    -------
+    list of tuple of ndarray
+      The times, values, and weights of the observations in each
+      observation file.
+
+    """
+    import numpy as np
+
+    files = list(config["observation_files"])
+    path = os.path.join(config.get("run_directory") or os.curdir, observations_file)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    key = (path, mtime, tuple(files))
+    if key in _observations:
+        return _observations[key]
+
+    observations = None
+    if mtime is not None:
+        with np.load(path) as data:
+            if data["files"].tolist() == files:
+                observations = [
+                    (
+                        data["times_{}".format(i)],
+                        data["values_{}".format(i)],
+                        data["weights_{}".format(i)],
+                    )
+                    for i in range(len(files))
+                ]
+    if observations is None:
+        observations = [read_observations(name) for name in files]
+    _observations[key] = observations
+    return observations
+
+
+def compute_residuals(series, times, values, weights=None):
+    """Compute the residuals of a model output series at observations.
+
+    Parameters
+    ----------
+    series : array_like
+      The model output; a 1D array indexed by time, or a 2D array with
+      times in the first column and values in the second.
+    times : array_like
+      The time indices of the observations.
+    values : array_like
+      The observed values.
+    weights : array_like, optional
+      The weight of each observation (default is one).
+
+    Returns
+    -------
+    ndarray
+      The weighted residual at each observation; NaN where the
+      series has no value at the observation's time.
+
+    Examples
+    --------
+    >>> compute_residuals([1.0, 2.0, 4.0], [0, 2, 5], [0.5, 3.0, 1.0], [4, 1, 1])
+    array([ 1.,  1., nan])
+
+    """
+    import numpy as np
+
+    series = np.asarray(series, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    if series.ndim == 2:
+        model_times, model_values = series[:, 0], series[:, 1]
+        index = np.searchsorted(model_times, times)
+        index = np.minimum(index, len(model_times) - 1)
+        found = model_times[index] == times
+    else:
+        model_values = series
+        index = times.astype(np.intp)
+        found = (index == times) & (index >= 0) & (index < len(series))
+        index = np.where(found, index, 0)
+    residuals = np.where(found, model_values[index] - values, np.nan)
+    if weights is not None:
+        residuals *= np.sqrt(weights)
+    return residuals
+
+
+def compute_calibration_terms(sources, observations, load):
+    """Compute the residuals of each source series, loading each once.
+
+    Parameters
+    ----------
+    sources : list or tuple of str
+      The source series of each response, such as a model output file.
+    observations : list of tuple of ndarray
+      The times, values, and weights of the observations of each
+      response; see `load_observations`.
+    load : callable
+      Returns the series for a source, or None if it's unavailable.
+
+    Returns
+    -------
+    ndarray
+      The residuals of all of the responses, in order; NaN for a
+      response whose source is unavailable.
+
+    """
+    import numpy as np
+
+    series = {}
+    terms = []
+    for source, (times, values, weights) in zip(sources, observations):
+        if source not in series:
+            series[source] = load(source)
+        if series[source] is None:
+            terms.append(np.full(len(times), np.nan))
+        else:
+            with phase("residuals"):
+                residuals = compute_residuals(series[source], times, values, weights)
+            terms.append(residuals)
+    return np.concatenate(terms) if terms else np.empty(0)
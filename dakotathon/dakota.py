@@ -2,9 +2,11 @@
 """A Python interface to the Dakota iterative systems analysis toolkit."""
 
 import os
+import shutil
 import subprocess
 import types
 import yaml
+import numpy as np
 from .experiment import Experiment
 
 
@@ -20,6 +22,13 @@ class Dakota(Experiment):
         output_file="dakota.out",
         run_log="run.log",
         error_log="stderr.log",
+        restart_file="dakota.rst",
+        read_restart=False,
+        evaluation_log=None,
+        evaluation_store=None,
+        tools=None,
+        hosts=None,
+        transport="ssh",
         template_file=None,
         auxiliary_files=(),
         **kwargs
@@ -47,6 +56,38 @@ class Dakota(Experiment):
             Name of Dakota log file (default is **run.log***)
         error_log : str, optional
             Name of Dakota error log file (default is **stderr.log***)
+        restart_file : str, optional
+            Name of Dakota restart file (default is **dakota.rst**).
+        read_restart : bool, optional
+            Set to reuse evaluations stored in the restart file from a
+            previous run (default is False).
+        evaluation_log : str, optional
+            Name of a JSON-lines file in the run directory to which the
+            analysis drivers append the phase timings, peak memory,
+            and exit status of each evaluation (default is None, no
+            log). Summarize the log with the `dakota_timing_summary`
+            console script.
+        evaluation_store : str, optional
+            Name of an SQLite database in the run directory to which
+            the analysis drivers add the parameters, responses, exit
+            status, and timings of each evaluation (default is None,
+            no store). The store can be shared by many runs; see
+            `dakotathon.store.EvaluationStore`.
+        tools : dict, optional
+            The paths and versions of the executables used in the
+            experiment, by name. Found with `discover_tools` when the
+            experiment is set up, and used by the analysis drivers
+            instead of searching the execution path at each
+            evaluation (default is None).
+        hosts : str or list of str, optional
+            Hosts on which to run evaluations, each with an optional
+            number of slots, e.g., ``node1:8`` (default is None, run
+            evaluations on this host). Setting hosts turns on batch
+            mode, and sets `evaluation_concurrency` to the total
+            number of slots.
+        transport : str, optional
+            How agents are started on the `hosts`: 'ssh' (the
+            default), or 'local', which starts them on this host.
         template_file : str, optional
             The Dakota template file, formed from the input file of
             the model to study, but with study variables replaced by
@@ -68,6 +109,14 @@ class Dakota(Experiment):
         >>> d = Dakota(method='vector_parameter_study')
 
         """
+        if hosts:
+            from .dispatch import parse_hosts
+
+            kwargs.setdefault("batch", True)
+            kwargs["evaluation_concurrency"] = sum(
+                slots for _, slots in parse_hosts(hosts)
+            )
+
         Experiment.__init__(
             self,
             run_directory=run_directory,
@@ -86,6 +135,14 @@ class Dakota(Experiment):
         self._auxiliary_files = auxiliary_files
         self.run_log = run_log
         self.error_log = error_log
+        self.restart_file = restart_file
+        self.read_restart = read_restart
+        self.evaluation_log = evaluation_log
+        self.evaluation_store = evaluation_store
+        self.tools = tools
+        self.hosts = hosts
+        self.transport = transport
+        self.agents = None
 
     @property
     def run_directory(self):
@@ -184,17 +241,20 @@ class Dakota(Experiment):
             A new Dakota instance.
 
         """
-        config = {}
+        from .utils import deserialize, _safe_loader
+
         if isinstance(file_like, str):
-            with open(file_like, "r") as fp:
-                config = yaml.safe_load(fp.read())
+            config = deserialize(file_like)
         else:
-            config = yaml.safe_load(file_like)
+            config = yaml.load(file_like, Loader=_safe_loader())
         return cls(**config)
 
     def serialize(self, config_file=None):
         """Dump settings for experiment to a YAML configuration file.
 
+        A JSON copy of the settings, which the analysis drivers load
+        faster, is written beside the configuration file.
+
         Parameters
         ----------
         config_file : str, optional
@@ -209,7 +269,7 @@ class Dakota(Experiment):
         >>> d.serialize('dakota.yaml')
 
         """
-        from .utils import get_attributes
+        from .utils import get_attributes, write_sidecar, _safe_dumper
 
         if config_file is not None:
             self.configuration_file = config_file
@@ -225,14 +285,17 @@ class Dakota(Experiment):
             section_props = get_attributes(props.pop(section))
             props = dict(list(props.items()) + list(section_props.items()))
 
+        text = yaml.dump(props, Dumper=_safe_dumper(), default_flow_style=False)
         with open(self.configuration_file, "w") as fp:
-            yaml.safe_dump(props, fp, default_flow_style=False)
+            fp.write(text)
+        write_sidecar(self.configuration_file, text)
 
     def write_input_file(self, input_file=None):
         """Create the Dakota input file for the experiment.
 
         The input file is written to the directory specified by the
-        `run_directory` attribute.
+        `run_directory` attribute. The variables are validated first,
+        since they may have been changed since they were created.
 
         Parameters
         ----------
@@ -250,6 +313,8 @@ class Dakota(Experiment):
         if input_file is not None:
             self.input_file = input_file
 
+        self.variables.validate()
+
         input_file_path = os.path.abspath(
             os.path.join(self.run_directory, self.input_file)
         )
@@ -260,9 +325,45 @@ class Dakota(Experiment):
         with open(input_file_path, "w") as fp:
             fp.write(str(self))
 
+    def discover_tools(self):
+        """Locate the executables used in the experiment.
+
+        These are Dakota, ``dprepro``, and any executables listed by
+        the experiment's plugin. The result is stored in the `tools`
+        attribute.
+
+        Returns
+        -------
+        dict
+          The path and version of each executable, by name.
+
+        """
+        from .utils import discover_tools
+
+        names = ["dakota", "dprepro"]
+        if self.plugin is not None:
+            from .registry import load_plugin
+
+            try:
+                module = load_plugin(self.plugin)
+            except ImportError:
+                pass
+            else:
+                for name in getattr(module, "executables", ()):
+                    if name not in names:
+                        names.append(name)
+        self.tools = discover_tools(names)
+        return self.tools
+
     def setup(self):
         """Write the Dakota configuration and input files.
 
+        The executables used in the experiment are located first, and
+        their paths are stored in the configuration file. If the
+        responses compute residuals against *observation_files*, the
+        observations are read, and packed in a file in the run
+        directory for the analysis drivers.
+
         Examples
         --------
         As a convenience, make a configuration file and an input file
@@ -272,21 +373,149 @@ class Dakota(Experiment):
         >>> d.setup()
 
         """
+        self.discover_tools()
         self.serialize()
         self.write_input_file()
+        observation_files = getattr(self.responses, "observation_files", ())
+        if observation_files:
+            from .calibration import save_observations
+
+            save_observations(self.run_directory, observation_files)
 
     def run(self):
         """Run the Dakota experiment.
 
         Run is executed in the directory specified by run_directory keyword and
-        run log and error log are created.
+        run log and error log are created. If `read_restart` is set,
+        evaluations stored in an existing restart file are reused. If
+        `hosts` are set, an agent is started on each host for the
+        length of the run, and their addresses are stored in the
+        configuration file as `agents`; the token the agents share
+        with the analysis driver is passed to Dakota in its
+        environment, not stored. If the interface's `retention`
+        policy drops or compresses work directories, or they're
+        placed outside of the run directory, they're tidied, and
+        synced back, in the background as the evaluations complete.
         """
+        from .utils import get_tool_path
+
         os.chdir(self.run_directory)
 
-        with open(self.run_log, "w") as file_out:
-            with open(self.error_log, "w") as error_out:
-                subprocess.call(
-                    ["dakota", "-i", self.input_file, "-o", self.output_file],
-                    stdout=file_out,
-                    stderr=error_out,
+        dakota_exe = get_tool_path({"tools": self.tools}, "dakota")
+        args = [dakota_exe, "-i", self.input_file, "-o", self.output_file]
+        if self.read_restart and os.path.exists(self.restart_file):
+            previous_restart_file = self.restart_file + ".prev"
+            shutil.move(self.restart_file, previous_restart_file)
+            args += ["-read_restart", previous_restart_file]
+        args += ["-write_restart", self.restart_file]
+
+        processes = []
+        env = None
+        if self.hosts:
+            from .dispatch import start_agents, new_token, token_variable
+
+            token = new_token()
+            env = dict(os.environ)
+            env[token_variable] = token
+            processes, self.agents = start_agents(self.hosts, self.transport, token)
+            self.serialize()
+
+        compactor = None
+        retention = getattr(self.interface, "retention", "all")
+        sync_directory = getattr(self.interface, "sync_directory", None)
+        if retention in ("failures", "every", "compress") or sync_directory:
+            from .retention import Compactor
+
+            scratch = os.path.dirname(self.interface.work_directory)
+            if not os.path.isdir(scratch):
+                os.makedirs(scratch)
+            compactor = Compactor(
+                self.interface.work_directory,
+                retention,
+                results_file=self.interface.results_file,
+                destination=sync_directory,
+            )
+            compactor.start()
+
+        try:
+            with open(self.run_log, "w") as file_out:
+                with open(self.error_log, "w") as error_out:
+                    subprocess.call(args, stdout=file_out, stderr=error_out, env=env)
+        finally:
+            if compactor is not None:
+                compactor.stop()
+            if processes:
+                from .dispatch import stop_agents
+
+                stop_agents(processes)
+                self.agents = None
+                self.serialize()
+
+    def refine(self, ci_width=None, max_refinements=5):
+        """Run a sampling study with incremental refinement.
+
+        The study is run with its initial samples, then rerun with an
+        additional refinement batch, reusing previous evaluations
+        through the restart file, until the responses converge. Each
+        batch doubles the number of samples, as required by
+        incremental LHS.
+
+        Parameters
+        ----------
+        ci_width : float, optional
+          Stop when the full width of the 95% confidence interval of
+          the mean of every response is at most this value.
+        max_refinements : int, optional
+          The maximum number of refinement batches (default is 5).
+
+        Returns
+        -------
+        bool
+          True if the study converged before `max_refinements`.
+
+        Notes
+        -----
+        The study also stops when the relative change in the mean of
+        every response between batches is less than the method's
+        `convergence_tolerance`.
+
+        """
+        from .utils import read_tabular_data, compute_confidence_width
+
+        if not hasattr(self.method, "refinement_samples"):
+            raise TypeError("Refinement requires the sampling method")
+        tolerance = self.method.convergence_tolerance
+        if ci_width is None and tolerance is None:
+            raise ValueError("Set ci_width or convergence_tolerance")
+
+        data_file = os.path.join(
+            os.path.abspath(self.run_directory), self.environment.data_file
+        )
+        batches = list(self.method.refinement_samples or ())
+        previous_means = None
+
+        for i in range(max_refinements + 1):
+            if i > 0:
+                batches.append(self.method.total_samples)
+                self.method.refinement_samples = batches
+                self.read_restart = True
+            self.setup()
+            self.run()
+
+            labels, data = read_tabular_data(data_file)
+            columns = [labels.index(r) for r in self.responses.response_descriptors]
+            responses = data[:, columns]
+            means = np.mean(responses, axis=0)
+
+            if ci_width is not None:
+                if np.all(compute_confidence_width(responses) <= ci_width):
+                    return True
+            if tolerance is not None and previous_means is not None:
+                change = np.abs(means - previous_means) / np.maximum(
+                    np.abs(previous_means), np.finfo(float).tiny
                 )
+                if np.all(change < tolerance):
+                    return True
+            previous_means = means
+
+        return False
@@ -0,0 +1,770 @@
+#!/usr/bin/env python
+"""Farm out Dakota evaluations to worker agents on other hosts.
+
+An *agent* runs on each host and evaluates the plugin in a pool of
+worker processes, one per slot. The `dakota_run_batch` driver talks to
+the agents through a `Dispatcher`, which stages the experiment's
+template and auxiliary files on each host once, hands out evaluations
+as slots free up, and collects the results as they stream back.
+
+Agents are started by a *transport*: `LocalTransport` starts them on
+this host, as a stand-in for a cluster, and `SSHTransport` starts them
+on other hosts. An agent can also be started by hand with the
+`dakota_agent` console script. Agents and dispatchers exchange
+newline-delimited JSON messages over TCP.
+
+Every message from a dispatcher carries a shared secret, the *token*,
+and an agent drops a dispatcher whose token doesn't match its own.
+`start_agents` hands the token to the agents it starts on their
+standard input; the dispatcher, and an agent started by hand, read it
+from the `token_variable` environment variable.
+
+"""
+
+import os
+import re
+import sys
+import hmac
+import json
+import base64
+import signal
+import socket
+import hashlib
+import binascii
+import tempfile
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+agent_script = "dakota_agent"
+
+token_variable = "DAKOTATHON_AGENT_TOKEN"
+"""The environment variable that holds the token shared with agents."""
+
+
+def new_token():
+    """Make a random token to share with agents.
+
+    Returns
+    -------
+    str
+      A token of 32 hexadecimal digits.
+
+    """
+    return binascii.hexlify(os.urandom(16)).decode("ascii")
+
+
+def get_token(token=None):
+    """Get the token shared with agents.
+
+    Parameters
+    ----------
+    token : str, optional
+      The token; if not given, it's read from the `token_variable`
+      environment variable.
+
+    Returns
+    -------
+    str
+      The token.
+
+    Raises
+    ------
+    ValueError
+      If there is no token.
+
+    """
+    token = token or os.environ.get(token_variable)
+    if not token:
+        raise ValueError("A token is required; set " + token_variable)
+    return token
+
+
+def parse_hosts(hosts):
+    """Split host specifications into names and numbers of slots.
+
+    Parameters
+    ----------
+    hosts : str or list of str
+      Host names, each with an optional number of slots, e.g.,
+      ``node1:8``; a host without a number has one slot.
+
+    Returns
+    -------
+    list of tuple
+      The name and number of slots of each host.
+
+    Examples
+    --------
+    >>> parse_hosts(["node1:8", "node2"])
+    [('node1', 8), ('node2', 1)]
+
+    """
+    if isinstance(hosts, str):
+        hosts = [hosts]
+    parsed = []
+    for host in hosts:
+        name, _, slots = host.partition(":")
+        parsed.append((name, int(slots) if slots else 1))
+    return parsed
+
+
+def _send(writer, lock, message):
+    """Write one message to a stream shared by several threads."""
+    line = json.dumps(message) + "\n"
+    with lock:
+        writer.write(line)
+        writer.flush()
+
+
+class Agent(object):
+
+    """Evaluate a plugin for dispatchers on other hosts.
+
+    Staged files are kept for the life of the agent, so later batches
+    of the same experiment reuse them.
+    """
+
+    def __init__(self, slots=1, root=None, token=None):
+        """Create an agent.
+
+        Parameters
+        ----------
+        slots : int, optional
+          The number of concurrent evaluations (default is 1).
+        root : str, optional
+          The directory in which files are staged and evaluations are
+          run (default is a new temporary directory).
+        token : str, optional
+          The token that dispatchers must present (default is the
+          value of the `token_variable` environment variable).
+
+        """
+        self.token = get_token(token)
+        self.slots = slots
+        self.root = root or tempfile.mkdtemp(prefix="dakotathon-agent-")
+        self.staged = {}
+        self._executor = None
+
+    def stage(self, key, config, files):
+        """Write the files of an experiment to the agent's host.
+
+        Parameters
+        ----------
+        key : str
+          An identifier for the staged files; a SHA-256 hex digest.
+        config : dict
+          Configuration settings for the experiment.
+        files : dict
+          The base64-encoded contents of each file, by file name.
+
+        Returns
+        -------
+        str
+          The path to the experiment's configuration file on this
+          host, which refers to the staged files.
+
+        Raises
+        ------
+        ValueError
+          If the key isn't a hex digest, or a file name is empty.
+
+        """
+        import yaml
+        from .utils import write_sidecar
+
+        if not re.match(r"^[0-9a-f]{64}$", key):
+            raise ValueError("Invalid key for staged files: {!r}".format(key))
+        stage_dir = os.path.join(self.root, "stage." + key[:16])
+        if not os.path.isdir(stage_dir):
+            os.makedirs(stage_dir)
+        for name, data in files.items():
+            name = os.path.basename(name)
+            if name in ("", os.curdir, os.pardir):
+                raise ValueError("Invalid name for a staged file")
+            with open(os.path.join(stage_dir, name), "wb") as fp:
+                fp.write(base64.b64decode(data))
+
+        config = dict(config)
+        config["run_directory"] = stage_dir
+        if config.get("template_file"):
+            config["template_file"] = os.path.join(
+                stage_dir, os.path.basename(config["template_file"])
+            )
+        config["auxiliary_files"] = [
+            os.path.join(stage_dir, os.path.basename(name))
+            for name in config.get("auxiliary_files") or ()
+        ]
+        config.pop("agents", None)
+        config_file = os.path.join(stage_dir, "dakota.yaml")
+        text = yaml.safe_dump(config, default_flow_style=False)
+        with open(config_file, "w") as fp:
+            fp.write(text)
+        write_sidecar(config_file, text)
+
+        if config.get("component"):
+            driver, name = "component", config["component"]
+        else:
+            driver, name = "plugin", config.get("plugin")
+        self.staged[key] = (config_file, driver)
+        if self._executor is None:
+            from .run_batch import _warm_up
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.slots, initializer=_warm_up, initargs=(driver, name)
+            )
+        return config_file
+
+    def evaluate(self, key, eval_id, params_text):
+        """Start an evaluation of a staged experiment.
+
+        Parameters
+        ----------
+        key : str
+          The identifier of the staged files.
+        eval_id : int
+          The evaluation id.
+        params_text : str
+          The contents of the evaluation's parameters file.
+
+        Returns
+        -------
+        concurrent.futures.Future
+          The text of the results file, or ``fail``.
+
+        """
+        from .run_batch import _evaluate
+
+        config_file, driver = self.staged[key]
+        params_text = re.sub(
+            r"^(\s*)\S+(\s+AC_1:)",
+            lambda match: match.group(1) + config_file + match.group(2),
+            params_text,
+            flags=re.MULTILINE,
+        )
+        eval_dir = os.path.join(os.path.dirname(config_file), "eval.{}".format(eval_id))
+        return self._executor.submit(
+            _evaluate, driver, eval_dir, params_text, "params.in", "results.out"
+        )
+
+    def handle(self, reader, writer):
+        """Answer the messages of one dispatcher until it disconnects.
+
+        The dispatcher is dropped at its first message without the
+        agent's token.
+
+        Parameters
+        ----------
+        reader : file_like
+          Messages from the dispatcher.
+        writer : file_like
+          Messages to the dispatcher.
+
+        """
+        lock = threading.Lock()
+        in_flight = []
+        token = self.token.encode("utf-8")
+
+        def reply(future, eval_id):
+            try:
+                text = future.result()
+            except Exception:
+                text = "fail\n"
+            try:
+                _send(writer, lock, {"op": "result", "id": eval_id, "text": text})
+            except (IOError, OSError, ValueError):
+                pass
+
+        for line in reader:
+            message = json.loads(line)
+            presented = str(message.get("token", "")).encode("utf-8")
+            if not hmac.compare_digest(presented, token):
+                _send(writer, lock, {"op": "denied"})
+                break
+            op = message.get("op")
+            if op == "hello":
+                _send(writer, lock, {"op": "hello", "slots": self.slots})
+            elif op == "stage":
+                key = message["key"]
+                if key not in self.staged:
+                    if "files" not in message:
+                        _send(writer, lock, {"op": "need", "key": key})
+                        continue
+                    self.stage(key, message["config"], message["files"])
+                _send(writer, lock, {"op": "staged", "key": key})
+            elif op == "evaluate":
+                future = self.evaluate(message["key"], message["id"], message["params"])
+                future.add_done_callback(
+                    lambda f, eval_id=message["id"]: reply(f, eval_id)
+                )
+                in_flight.append(future)
+        for future in in_flight:
+            try:
+                future.result()
+            except Exception:
+                pass
+
+    def serve(self, server):
+        """Accept dispatchers, one at a time, until interrupted.
+
+        Parameters
+        ----------
+        server : socket.socket
+          A listening socket.
+
+        """
+        while True:
+            connection, _ = server.accept()
+            try:
+                reader = connection.makefile("r")
+                writer = connection.makefile("w")
+                try:
+                    self.handle(reader, writer)
+                except (IOError, OSError, ValueError):
+                    pass
+            finally:
+                connection.close()
+
+    def shutdown(self):
+        """Stop the agent's worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class _Connection(object):
+
+    """A dispatcher's link to one agent."""
+
+    def __init__(self, address, token):
+        host, _, port = address.rpartition(":")
+        self.address = address
+        self.token = token
+        self.socket = socket.create_connection((host, int(port)))
+        self.reader = self.socket.makefile("r")
+        self.writer = self.socket.makefile("w")
+        self.lock = threading.Lock()
+        self.in_flight = set()
+        self.alive = True
+        self.send({"op": "hello"})
+        reply = self.receive()
+        if reply.get("op") != "hello":
+            self.close()
+            raise IOError("Agent at " + address + " refused the token")
+        self.slots = int(reply["slots"])
+
+    def send(self, message):
+        message = dict(message, token=self.token)
+        _send(self.writer, self.lock, message)
+
+    def receive(self):
+        line = self.reader.readline()
+        if not line:
+            raise IOError("Lost connection to agent at " + self.address)
+        return json.loads(line)
+
+    def close(self):
+        self.alive = False
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except (IOError, OSError):
+            pass
+        for stream in (self.writer, self.reader, self.socket):
+            try:
+                stream.close()
+            except (IOError, OSError):
+                pass
+
+
+class Dispatcher(object):
+
+    """Hand out evaluations to agents on several hosts.
+
+    Examples
+    --------
+    Evaluate a batch on two agents, and collect the results in order:
+
+    >>> with Dispatcher(["node1:7000", "node2:7000"]) as d:  # doctest: +SKIP
+    ...     d.stage(config)
+    ...     results = [None] * len(blocks)
+    ...     for i, text in d.evaluate(blocks):
+    ...         results[i] = text
+
+    """
+
+    def __init__(self, agents, token=None):
+        """Connect to agents.
+
+        Parameters
+        ----------
+        agents : list of str
+          The address of each agent, as ``host:port``.
+        token : str, optional
+          The token shared with the agents (default is the value of
+          the `token_variable` environment variable).
+
+        """
+        token = get_token(token)
+        self.connections = []
+        try:
+            for address in agents:
+                self.connections.append(_Connection(address, token))
+        except Exception:
+            self.close()
+            raise
+        self.key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    @property
+    def total_slots(self):
+        """The number of concurrent evaluations on all agents."""
+        return sum(c.slots for c in self.connections if c.alive)
+
+    def stage(self, config):
+        """Stage an experiment's files on each agent's host.
+
+        The template and auxiliary files are sent only to hosts that
+        don't already have them.
+
+        Parameters
+        ----------
+        config : dict
+          Configuration settings for the experiment.
+
+        Returns
+        -------
+        str
+          The identifier of the staged files.
+
+        """
+        names = [config["template_file"]] if config.get("template_file") else []
+        names += list(config.get("auxiliary_files") or ())
+        digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8"))
+        contents = {}
+        for name in names:
+            path = os.path.join(config.get("run_directory", os.curdir), name)
+            with open(path, "rb") as fp:
+                data = fp.read()
+            digest.update(data)
+            contents[os.path.basename(name)] = data
+        self.key = digest.hexdigest()
+
+        files = None
+        for connection in self.connections:
+            connection.send({"op": "stage", "key": self.key})
+            if connection.receive()["op"] == "need":
+                if files is None:
+                    files = {
+                        name: base64.b64encode(data).decode("ascii")
+                        for name, data in contents.items()
+                    }
+                connection.send(
+                    {"op": "stage", "key": self.key, "config": config, "files": files}
+                )
+                connection.receive()
+        return self.key
+
+    def evaluate(self, blocks):
+        """Evaluate the parameters files of a batch.
+
+        Each agent is kept busy with as many evaluations as it has
+        slots. The evaluations of an agent that disconnects are handed
+        to the others.
+
+        Parameters
+        ----------
+        blocks : list of str
+          The contents of the parameters file of each evaluation.
+
+        Yields
+        ------
+        tuple
+          The index of an evaluation in `blocks`, and the text of its
+          results file, in the order in which they finish.
+
+        """
+        from .run_batch import _get_eval_id
+
+        pending = deque(range(len(blocks)))
+        events = queue.Queue()
+        eval_ids = [_get_eval_id(block, i + 1) for i, block in enumerate(blocks)]
+        index = dict((eval_id, i) for i, eval_id in enumerate(eval_ids))
+
+        def listen(connection):
+            try:
+                while True:
+                    message = connection.receive()
+                    events.put((connection, message))
+            except (IOError, OSError, ValueError):
+                events.put((connection, None))
+
+        for connection in self.connections:
+            thread = threading.Thread(target=listen, args=(connection,))
+            thread.daemon = True
+            thread.start()
+
+        def drop(connection):
+            connection.close()
+            pending.extendleft(sorted(connection.in_flight, reverse=True))
+            connection.in_flight.clear()
+
+        def fill():
+            for connection in self.connections:
+                while (
+                    connection.alive
+                    and pending
+                    and len(connection.in_flight) < connection.slots
+                ):
+                    i = pending.popleft()
+                    connection.in_flight.add(i)
+                    try:
+                        connection.send(
+                            {
+                                "op": "evaluate",
+                                "key": self.key,
+                                "id": eval_ids[i],
+                                "params": blocks[i],
+                            }
+                        )
+                    except (IOError, OSError, ValueError):
+                        drop(connection)
+
+        remaining = len(blocks)
+        fill()
+        while remaining:
+            if not any(c.alive for c in self.connections):
+                for i in pending:
+                    yield i, "fail\n"
+                return
+            connection, message = events.get()
+            if message is None:
+                drop(connection)
+            elif index.get(message.get("id")) in connection.in_flight:
+                i = index[message["id"]]
+                connection.in_flight.discard(i)
+                remaining -= 1
+                yield i, message["text"]
+            fill()
+
+    def close(self):
+        """Disconnect from the agents."""
+        for connection in self.connections:
+            connection.close()
+
+
+class LocalTransport(object):
+
+    """Start agents on this host, as a stand-in for a cluster."""
+
+    def start(self, host, slots, token):
+        """Start an agent.
+
+        Parameters
+        ----------
+        host : str
+          The host name; ignored.
+        slots : int
+          The number of concurrent evaluations.
+        token : str
+          The token shared with the agent.
+
+        Returns
+        -------
+        tuple
+          The agent's process and its address, ``host:port``.
+
+        """
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "dakotathon.dispatch",
+                "--bind",
+                "127.0.0.1",
+                "--slots",
+                str(slots),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        return process, "127.0.0.1:" + _read_port(process, token)
+
+
+class SSHTransport(object):
+
+    """Start agents on other hosts over SSH.
+
+    Dakotathon must be installed for the given Python on each host,
+    and the hosts must accept TCP connections from this one. Each
+    agent listens only on the address its host name resolves to.
+    """
+
+    def __init__(self, python="python", ssh="ssh"):
+        self.python = python
+        self.ssh = ssh
+
+    def start(self, host, slots, token):
+        """Start an agent.
+
+        Parameters
+        ----------
+        host : str
+          The host name.
+        slots : int
+          The number of concurrent evaluations.
+        token : str
+          The token shared with the agent.
+
+        Returns
+        -------
+        tuple
+          The agent's process and its address, ``host:port``.
+
+        """
+        process = subprocess.Popen(
+            [
+                self.ssh,
+                host,
+                self.python,
+                "-m",
+                "dakotathon.dispatch",
+                "--bind",
+                host,
+                "--slots",
+                str(slots),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        return process, host + ":" + _read_port(process, token)
+
+
+transports = {"local": LocalTransport, "ssh": SSHTransport}
+"""Transports that start agents, by name."""
+
+
+def _read_port(process, token):
+    """Hand a new agent its token, and read the port it listens on."""
+    try:
+        process.stdin.write(token + "\n")
+        process.stdin.close()
+    except (IOError, OSError):
+        pass
+    line = process.stdout.readline()
+    if not line.startswith("listening"):
+        process.kill()
+        raise RuntimeError("Agent failed to start")
+    return line.split()[-1]
+
+
+def start_agents(hosts, transport="local", token=None):
+    """Start an agent on each host.
+
+    Parameters
+    ----------
+    hosts : str or list of str
+      Host names, each with an optional number of slots, e.g.,
+      ``node1:8``.
+    transport : str, optional
+      The name of a transport in `transports` (default is 'local').
+    token : str, optional
+      The token shared with the agents (default is the value of the
+      `token_variable` environment variable).
+
+    Returns
+    -------
+    tuple
+      The agent processes, and the address of each agent.
+
+    """
+    token = get_token(token)
+    starter = transports[transport]()
+    processes, addresses = [], []
+    try:
+        for host, slots in parse_hosts(hosts):
+            process, address = starter.start(host, slots, token)
+            processes.append(process)
+            addresses.append(address)
+    except Exception:
+        stop_agents(processes)
+        raise
+    return processes, addresses
+
+
+def stop_agents(processes):
+    """Stop agents started with `start_agents`.
+
+    Parameters
+    ----------
+    processes : list
+      The agent processes.
+
+    """
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+        process.wait()
+
+
+def main():
+    """Handle arguments to the `dakota_agent` console script."""
+    import argparse
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        description="Evaluate Dakota experiments for a dispatcher.",
+        epilog="The token shared with dispatchers is read from the "
+        + token_variable
+        + " environment variable, or else from the first line of "
+        + "standard input.",
+    )
+    parser.add_argument(
+        "--bind",
+        default="127.0.0.1",
+        help="address to listen on (default: %(default)s)",
+    )
+    parser.add_argument("--port", type=int, default=0, help="port to listen on")
+    parser.add_argument("--slots", type=int, default=1, help="concurrent evaluations")
+    parser.add_argument("--root", help="directory for staged files")
+    parser.add_argument(
+        "--version", action="version", version=agent_script + " " + __version__
+    )
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    token = os.environ.get(token_variable) or sys.stdin.readline().strip()
+    if not token:
+        parser.error("a token is required; set " + token_variable)
+    agent = Agent(slots=args.slots, root=args.root, token=token)
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind((args.bind, args.port))
+    server.listen(5)
+    print("listening {}".format(server.getsockname()[1]))
+    sys.stdout.flush()
+    try:
+        agent.serve(server)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        agent.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """A Python interface to a Dakota input file."""
 
+import io
 import os
 import importlib
 
@@ -11,6 +12,9 @@ class Experiment(object):
     blocks = ("environment", "method", "variables", "interface", "responses")
     """The named control blocks of a Dakota input file."""
 
+    calibration_methods = ("optpp_q_newton", "coliny_pattern_search", "soga", "nl2sol")
+    """Methods that calibrate the variables against observations."""
+
     def __init__(
         self,
         component=None,
@@ -52,7 +56,9 @@ class Experiment(object):
             'direct').
         responses : str, optional
             Type of responses used in Dakota experiment (default is
-            'response_functions').
+            'response_functions'). The `calibration_methods` use
+            'calibration_terms' instead, and the gradient-based ones
+            default to 'numerical_gradients'.
         **kwargs
             Arbitrary keyword arguments.
 
@@ -74,19 +80,21 @@ class Experiment(object):
             err_msg = "The component and plugin attributes are exclusive."
             raise AttributeError(err_msg)
 
+        batch_driver = "dakota_run_batch" if kwargs.get("batch") else None
+
         if self.component is not None:
             interface = "fork"
             try:
                 kwargs["analysis_driver"]
             except KeyError:
-                kwargs["analysis_driver"] = "dakota_run_component"
+                kwargs["analysis_driver"] = batch_driver or "dakota_run_component"
 
         if self.plugin is not None:
             interface = "fork"
             try:
                 kwargs["analysis_driver"]
             except KeyError:
-                kwargs["analysis_driver"] = "dakota_run_plugin"
+                kwargs["analysis_driver"] = batch_driver or "dakota_run_plugin"
 
         if method == "multidim_parameter_study":
             try:
@@ -98,8 +106,24 @@ class Experiment(object):
             except KeyError:
                 kwargs["upper_bounds"] = (2.0, 2.0)
 
+        if method in Experiment.calibration_methods:
+            if responses == "response_functions":
+                responses = "calibration_terms"
+            if method in ("optpp_q_newton", "nl2sol"):
+                try:
+                    kwargs["gradients"]
+                except KeyError:
+                    kwargs["gradients"] = "numerical_gradients"
+
+        choices = {
+            "environment": environment,
+            "method": method,
+            "variables": variables,
+            "interface": interface,
+            "responses": responses,
+        }
         for section in Experiment.blocks:
-            cls = self._import(section, eval(section), **kwargs)
+            cls = self._import(section, choices[section], **kwargs)
             attr = "_" + section
             setattr(self, attr, cls)
 
@@ -161,9 +185,10 @@ class Experiment(object):
             subclass of dakotathon.variables.base.VariablesBase.
 
         """
-        supr = self._variables.__class__.__bases__[0]
-        if not isinstance(value, supr):
-            raise TypeError("Must be a subclass of " + str(supr))
+        from .variables.base import VariablesBase
+
+        if not isinstance(value, VariablesBase):
+            raise TypeError("Must be a subclass of " + str(VariablesBase))
         self._variables = value
 
     @property
@@ -253,7 +278,12 @@ class Experiment(object):
           no_hessians
         <BLANKLINE>
         """
-        s = "# Dakota input file\n"
+        recover_values = getattr(self.interface, "recover_values", None)
+        if self.interface.failure_capture == "recover" and recover_values:
+            if len(recover_values) != self.responses.num_responses:
+                raise ValueError("Recover values must have one item per response")
+        s = io.StringIO()
+        s.write("# Dakota input file\n")
         for section in self.blocks:
-            s += str(getattr(self, section))
-        return s
+            s.write(str(getattr(self, section)))
+        return s.getvalue()
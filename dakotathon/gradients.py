@@ -0,0 +1,434 @@
+"""Response gradients computed by finite differences in the driver.
+
+When an experiment's responses set *analytic_gradients*, Dakota asks
+the analysis driver for the gradients of the responses, through the
+active set vector (ASV) of each parameters file, instead of
+estimating them with an evaluation per perturbed point. The driver
+computes them by finite differences: the point, and its perturbation
+along each derivative variable, are evaluated concurrently in one
+driver call, by a pool of worker processes that import the model
+once, and a full gradient block is written to the results file. The
+pool is kept for later calls in the same process, e.g., a batch
+worker, and is sized to share the cores with the evaluations that
+Dakota runs concurrently.
+
+The step along variable *x* is ``fd_gradient_step_size * |x|``, or
+``fd_gradient_step_size`` where *x* is zero. With the *forward*
+interval type, *N* + 1 points are evaluated for *N* derivative
+variables; a forward step that would cross an upper bound is taken
+backward instead. With the *central* interval type, 2 *N* points are
+evaluated, plus the point itself if its values are requested.
+
+"""
+
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+fd_prefix = "fd."
+
+fd_config_file = "fd.yaml"
+
+fd_skipped = ("evaluation_log", "evaluation_store", "retention")
+"""Settings that apply to an evaluation, not to its perturbed points."""
+
+_pools = {}
+
+value_bit = 1
+gradient_bit = 2
+
+
+def read_active_set(params_file):
+    """Read the variables and the active set from a parameters file.
+
+    Parameters
+    ----------
+    params_file : str
+      The path to a Dakota parameters file.
+
+    Returns
+    -------
+    dict
+      The *descriptors* and *values* of the variables, the active set
+      vector, *asv*, with a code for each response, and the
+      derivative variables vector, *dvv*, with the (zero-based) index
+      of each derivative variable.
+
+    """
+    from .store import _to_float
+
+    with open(params_file, "r") as fp:
+        lines = [line.split() for line in fp if line.strip()]
+    n_variables = int(lines[0][0])
+    variables = lines[1 : n_variables + 1]
+    active_set = {
+        "descriptors": [item[1] for item in variables],
+        "values": [_to_float(item[0]) for item in variables],
+        "asv": [],
+        "dvv": [],
+    }
+    i = n_variables + 1
+    while i < len(lines):
+        count, label = lines[i][0], lines[i][-1]
+        if label in ("functions", "derivative_variables"):
+            items = lines[i + 1 : i + 1 + int(count)]
+            if label == "functions":
+                active_set["asv"] = [int(item[0]) for item in items]
+            else:
+                active_set["dvv"] = [int(item[0]) - 1 for item in items]
+            i += int(count)
+        i += 1
+    if not active_set["dvv"]:
+        active_set["dvv"] = list(range(n_variables))
+    return active_set
+
+
+def requests_gradients(config, params_file):
+    """Check whether Dakota asks the driver for gradients.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    params_file : str
+      The path to a Dakota parameters file.
+
+    Returns
+    -------
+    bool
+      True if the responses set *analytic_gradients*, and the active
+      set vector requests the gradient of a response.
+
+    """
+    if config.get("gradients") != "analytic_gradients":
+        return False
+    asv = read_active_set(params_file)["asv"]
+    return any(code & gradient_bit for code in asv)
+
+
+def get_steps(
+    values,
+    fd_gradient_step_size=0.001,
+    upper_bounds=None,
+    lower_bounds=None,
+    interval_type="forward",
+):
+    """Get the finite difference step along each variable.
+
+    Steps are kept within the bounds of the variables. A forward step
+    that would cross the upper bound is reversed; if neither direction
+    fits, the step is shrunk to the larger distance to a bound. A
+    central step is shrunk to the smaller distance to a bound, and is
+    zero for a variable that sits on a bound.
+
+    Parameters
+    ----------
+    values : array_like
+      The values of the variables.
+    fd_gradient_step_size : float, optional
+      The step, relative to the value of a variable (default is
+      0.001).
+    upper_bounds : array_like, optional
+      The upper bounds of the variables.
+    lower_bounds : array_like, optional
+      The lower bounds of the variables.
+    interval_type : str, optional
+      Either 'forward' or 'central' (default is 'forward').
+
+    Returns
+    -------
+    ndarray
+      The steps.
+
+    Examples
+    --------
+    >>> get_steps([100.0, 0.0, 1.0], upper_bounds=[200.0, 1.0, 1.0])
+    array([ 0.1  ,  0.001, -0.001])
+    >>> get_steps([1.0], upper_bounds=[1.0005], lower_bounds=[0.9998])
+    array([0.0005])
+    >>> get_steps([1.0], 0.001, [1.0005], [0.0], interval_type="central")
+    array([0.0005])
+
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    steps = fd_gradient_step_size * np.where(values == 0.0, 1.0, np.abs(values))
+    up = np.full_like(values, np.inf)
+    down = np.full_like(values, np.inf)
+    if upper_bounds is not None:
+        up = np.asarray(upper_bounds, dtype=np.float64) - values
+    if lower_bounds is not None:
+        down = values - np.asarray(lower_bounds, dtype=np.float64)
+    if interval_type == "central":
+        return np.maximum(np.minimum(steps, np.minimum(up, down)), 0.0)
+    return np.where(
+        steps <= up,
+        steps,
+        np.where(
+            steps <= down, -steps, np.where(up >= down, np.maximum(up, 0.0), -down)
+        ),
+    )
+
+
+def get_points(values, dvv, steps, interval_type="forward", with_center=True):
+    """Get the points evaluated for finite differences.
+
+    Parameters
+    ----------
+    values : array_like
+      The values of the variables.
+    dvv : list of int
+      The indices of the derivative variables.
+    steps : array_like
+      The step along each variable.
+    interval_type : str, optional
+      Either 'forward' or 'central' (default is 'forward').
+    with_center : bool, optional
+      Include the point itself, first, for central differences (it's
+      always included for forward differences).
+
+    Returns
+    -------
+    ndarray
+      The points, one per row: the point itself, if included, then
+      the forward steps along each derivative variable, then, for
+      central differences, the backward steps.
+
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.zeros((len(dvv), len(values)))
+    offsets[np.arange(len(dvv)), dvv] = np.asarray(steps)[dvv]
+    points = [values + offsets]
+    if interval_type == "central":
+        points.append(values - offsets)
+    if with_center or interval_type != "central":
+        points.insert(0, values[np.newaxis, :])
+    return np.vstack(points)
+
+
+def difference(responses, dvv, steps, interval_type="forward", with_center=True):
+    """Compute gradients from the responses at the points of `get_points`.
+
+    Parameters
+    ----------
+    responses : array_like
+      The responses at each point, one point per row.
+    dvv : list of int
+      The indices of the derivative variables.
+    steps : array_like
+      The step along each variable.
+    interval_type : str, optional
+      Either 'forward' or 'central' (default is 'forward').
+    with_center : bool, optional
+      Set if the point itself is the first row of `responses`.
+
+    Returns
+    -------
+    ndarray
+      The gradient of each response, one response per row.
+
+    Examples
+    --------
+    >>> points = get_points([1.0, 2.0], [0, 1], [0.5, 0.5])
+    >>> responses = (points ** 2).sum(axis=1, keepdims=True)
+    >>> difference(responses, [0, 1], [0.5, 0.5])
+    array([[2.5, 4.5]])
+
+    """
+    import numpy as np
+
+    responses = np.asarray(responses, dtype=np.float64)
+    h = np.asarray(steps)[dvv]
+    n = len(dvv)
+    if interval_type == "central":
+        start = 1 if with_center else 0
+        forward = responses[start : start + n]
+        backward = responses[start + n : start + 2 * n]
+        return ((forward - backward) / (2.0 * h[:, np.newaxis])).T
+    return ((responses[1 : n + 1] - responses[0]) / h[:, np.newaxis]).T
+
+
+def format_params(params_text, values, config_file=None):
+    """Set the variables of a parameters file, and request values only.
+
+    Parameters
+    ----------
+    params_text : str
+      The text of a Dakota parameters file.
+    values : array_like
+      The new values of the variables.
+    config_file : str, optional
+      A configuration file to name as the analysis component, in
+      place of the experiment's (default is None).
+
+    Returns
+    -------
+    str
+      The text of the new parameters file.
+
+    """
+    lines = params_text.splitlines()
+    for i, value in enumerate(values):
+        name = lines[i + 1].split()[-1]
+        lines[i + 1] = "{:>42.15e} {}".format(value, name)
+    for i, line in enumerate(lines):
+        items = line.split()
+        if len(items) == 2 and items[1].startswith("ASV_"):
+            lines[i] = "{:>42} {}".format(value_bit, items[1])
+        elif config_file and len(items) == 2 and items[1].startswith("AC_1:"):
+            lines[i] = "{:>42} {}".format(config_file, items[1])
+    return "\n".join(lines) + "\n"
+
+
+def _write_config(config, config_file):
+    """Write the configuration of the evaluations of perturbed points."""
+    import yaml
+    from .utils import write_sidecar
+
+    config = dict((k, v) for k, v in config.items() if k not in fd_skipped)
+    text = yaml.safe_dump(config, default_flow_style=False)
+    with open(config_file, "w") as fp:
+        fp.write(text)
+    write_sidecar(config_file, text)
+
+
+def get_pool(driver, name, config):
+    """Get the pool of workers that evaluate perturbed points.
+
+    Parameters
+    ----------
+    driver : str
+      Either 'plugin' or 'component'.
+    name : str
+      The name of the model.
+    config : dict
+      Configuration settings for a Dakota experiment.
+
+    Returns
+    -------
+    concurrent.futures.ProcessPoolExecutor
+      A pool, shared by later calls in this process, with the cores
+      left to each of the evaluations that Dakota runs concurrently.
+
+    """
+    from .run_batch import _warm_up
+
+    concurrency = 1
+    if config.get("asynchronous") or config.get("batch"):
+        concurrency = config.get("evaluation_concurrency") or 1
+    max_workers = max((os.cpu_count() or 1) // concurrency, 1)
+    key = (driver, name, max_workers)
+    if key not in _pools:
+        _pools[key] = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_warm_up, initargs=(driver, name)
+        )
+    return _pools[key]
+
+
+def _read_values(results_text, n_responses):
+    """Read the response values from the text of a results file."""
+    from .store import _to_float
+
+    lines = [line.split() for line in results_text.splitlines() if line.strip()]
+    if not lines or lines[0][0].lower() == "fail" or len(lines) < n_responses:
+        return None
+    return [_to_float(line[0]) for line in lines[:n_responses]]
+
+
+def evaluate_with_gradients(driver, config, params_file, results_file):
+    """Evaluate a point and the gradients of its responses.
+
+    The point and its perturbations are evaluated, by `run_plugin` or
+    `run_component`, in the subdirectories ``fd.0``, ``fd.1``, ...
+    of the evaluation's directory, which are removed afterward. They
+    aren't logged, stored, or pruned on their own; the evaluation is,
+    by its driver. The results file holds the values and the
+    gradients requested by the active set vector; if any point fails,
+    the evaluation is reported to Dakota as failed.
+
+    Parameters
+    ----------
+    driver : str
+      Either 'plugin' or 'component'.
+    config : dict
+      Configuration settings for a Dakota experiment.
+    params_file : str
+      The path to the parameters file created by Dakota.
+    results_file : str
+      The path to the results file returned to Dakota.
+
+    """
+    from .run_batch import _evaluate
+    from .utils import get_response_descriptors, write_results, write_failure
+    from .utils import get_sidecar_file
+
+    with open(params_file, "r") as fp:
+        params_text = fp.read()
+    active_set = read_active_set(params_file)
+    labels = get_response_descriptors(params_file)
+    asv, dvv = active_set["asv"], active_set["dvv"]
+    values = active_set["values"]
+
+    interval_type = config.get("interval_type") or "forward"
+    bounds = []
+    for key in ("upper_bounds", "lower_bounds"):
+        bound = config.get(key)
+        if bound is None or len(bound) != len(values):
+            bound = None
+        bounds.append(bound)
+    step_size = config.get("fd_gradient_step_size") or 0.001
+    steps = get_steps(values, step_size, *bounds, interval_type=interval_type)
+    if interval_type == "central" and not all(steps[i] > 0.0 for i in dvv):
+        interval_type = "forward"
+        steps = get_steps(values, step_size, *bounds)
+    with_center = any(code & value_bit for code in asv)
+    points = get_points(values, dvv, steps, interval_type, with_center)
+
+    name = config.get("component") if driver == "component" else config.get("plugin")
+    params_name = os.path.basename(params_file)
+    results_name = os.path.basename(results_file)
+    eval_dirs = [os.path.abspath(fd_prefix + str(i)) for i in range(len(points))]
+    config_file = os.path.abspath(fd_config_file)
+    executor = get_pool(driver, name, config)
+    try:
+        _write_config(config, config_file)
+        futures = [
+            executor.submit(
+                _evaluate,
+                driver,
+                eval_dir,
+                format_params(params_text, point, config_file),
+                params_name,
+                results_name,
+            )
+            for eval_dir, point in zip(eval_dirs, points)
+        ]
+        responses = [_read_values(future.result(), len(asv)) for future in futures]
+    except BrokenProcessPool:
+        for key, pool in list(_pools.items()):
+            if pool is executor:
+                del _pools[key]
+        raise
+    finally:
+        for eval_dir in eval_dirs:
+            shutil.rmtree(eval_dir, ignore_errors=True)
+        for path in (config_file, get_sidecar_file(config_file)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    if any(r is None for r in responses):
+        write_failure(results_file)
+        return
+    gradients = difference(responses, dvv, steps, interval_type, with_center)
+    center = responses[0] if with_center else []
+    write_results(
+        results_file,
+        [center[i] for i, code in enumerate(asv) if code & value_bit],
+        [labels[i] for i, code in enumerate(asv) if code & value_bit],
+        gradients=[gradients[i] for i, code in enumerate(asv) if code & gradient_bit],
+    )
@@ -2,6 +2,50 @@
 
 from abc import ABCMeta, abstractmethod
 import os
+import hashlib
+import tempfile
+import warnings
+
+
+failure_capture_modes = ("abort", "retry", "recover", "continuation")
+
+work_placements = ("run", "scratch", "shm")
+
+
+def get_scratch_directory(work_directory, placement, scratch_directory=None):
+    """Get a node-local directory for the work directories of evaluations.
+
+    Parameters
+    ----------
+    work_directory : str
+      The work directory in the run directory.
+    placement : str
+      Either 'scratch', for node-local scratch space, or 'shm', for
+      shared memory. Without ``/dev/shm``, 'shm' warns and falls back
+      to scratch space.
+    scratch_directory : str, optional
+      The node-local scratch space (default is the ``TMPDIR``
+      environment variable, or the system's temporary directory).
+
+    Returns
+    -------
+    str
+      The path to the work directory in node-local space. Its parent
+      is named after the original work directory, so that experiments
+      sharing a node don't collide.
+
+    """
+    if placement == "shm" and os.path.isdir("/dev/shm"):
+        root = "/dev/shm"
+    else:
+        if placement == "shm":
+            msg = "/dev/shm is unavailable; using scratch space instead"
+            warnings.warn(msg, RuntimeWarning)
+        root = scratch_directory or os.environ.get("TMPDIR") or tempfile.gettempdir()
+    key = hashlib.sha1(os.path.abspath(work_directory).encode("utf-8")).hexdigest()
+    return os.path.join(
+        root, "dakotathon-" + key[:12], os.path.basename(work_directory)
+    )
 
 
 class InterfaceBase(object):
@@ -22,6 +66,14 @@ class InterfaceBase(object):
         work_folder="run",
         parameters_file="params.in",
         results_file="results.out",
+        failure_capture=None,
+        retry_limit=1,
+        recover_values=None,
+        evaluation_timeout=None,
+        cpu_time_limit=None,
+        work_placement="run",
+        scratch_directory=None,
+        sync_directory=None,
         **kwargs
     ):
 
@@ -50,6 +102,42 @@ class InterfaceBase(object):
             The name of the parameters file (default is **params.in**).
         results_file : str, optional
             The name of the results file (default is **results.out**).
+        failure_capture : str, optional
+            How Dakota handles a failed evaluation: 'abort' the
+            experiment, 'retry' the evaluation, 'recover' by using
+            fixed response values, or take a 'continuation' step
+            toward the failed point from the last good one (default
+            is None, Dakota's default, 'abort').
+        retry_limit : int, optional
+            The number of times a failed evaluation is retried, with
+            'retry' (default is 1).
+        recover_values : tuple or list of float, optional
+            The response values reported for a failed evaluation, with
+            'recover'; one value per response is required.
+        evaluation_timeout : float, optional
+            The wall-clock time, in seconds, after which an evaluation
+            is killed and reported to Dakota as failed (default is
+            None, no limit).
+        cpu_time_limit : float, optional
+            The CPU time, in seconds, after which an evaluation is
+            stopped and reported to Dakota as failed (default is None,
+            no limit).
+        work_placement : str, optional
+            Where the work directories of evaluations are placed: in
+            the 'run' directory (the default), in node-local
+            'scratch' space, or in shared memory, 'shm'. Away from the
+            run directory, the retained work directories and the
+            results of the evaluations are synced back to the run
+            directory in the background.
+        scratch_directory : str, optional
+            The node-local scratch space, with 'scratch' (default is
+            the ``TMPDIR`` environment variable, or the system's
+            temporary directory).
+        sync_directory : str, optional
+            The work directory in the run directory, away from it; if
+            set, *work_directory* is taken as the node-local work
+            directory itself, as in a serialized configuration
+            (default is None).
         **kwargs
             Optional keyword arguments.
 
@@ -62,6 +150,21 @@ class InterfaceBase(object):
         self.parameters_file = parameters_file
         self.results_file = results_file
         self.work_directory = os.path.join(work_directory, work_folder)
+        self.work_placement = work_placement
+        self.sync_directory = None
+        if work_placement != "run" and sync_directory is not None:
+            self.work_directory = work_directory
+            self.sync_directory = sync_directory
+        elif work_placement != "run":
+            self.sync_directory = self.work_directory
+            self.work_directory = get_scratch_directory(
+                self.sync_directory, work_placement, scratch_directory
+            )
+        self.failure_capture = failure_capture
+        self.retry_limit = retry_limit
+        self.recover_values = recover_values
+        self.evaluation_timeout = evaluation_timeout
+        self.cpu_time_limit = cpu_time_limit
 
     @property
     def asynchronous(self):
@@ -101,6 +204,106 @@ class InterfaceBase(object):
             raise TypeError("Evaluation concurrency must be a int")
         self._evaluation_concurrency = value
 
+    @property
+    def failure_capture(self):
+        """How Dakota handles a failed evaluation."""
+        return self._failure_capture
+
+    @failure_capture.setter
+    def failure_capture(self, value):
+        """Set how Dakota handles a failed evaluation.
+
+        Parameters
+        ----------
+        value : str or None
+          One of 'abort', 'retry', 'recover', or 'continuation', or
+          None for Dakota's default.
+
+        """
+        if value is not None and value not in failure_capture_modes:
+            msg = "Failure capture must be one of " + ", ".join(failure_capture_modes)
+            raise TypeError(msg)
+        self._failure_capture = value
+
+    @property
+    def retry_limit(self):
+        """Number of times a failed evaluation is retried."""
+        return self._retry_limit
+
+    @retry_limit.setter
+    def retry_limit(self, value):
+        """Set the number of times a failed evaluation is retried.
+
+        Parameters
+        ----------
+        value : int
+          A positive number of retries.
+
+        """
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError("Retry limit must be an int")
+        if value < 1:
+            raise ValueError("Retry limit must be positive")
+        self._retry_limit = value
+
+    @property
+    def work_placement(self):
+        """Where the work directories of evaluations are placed."""
+        return self._work_placement
+
+    @work_placement.setter
+    def work_placement(self, value):
+        """Set where the work directories of evaluations are placed.
+
+        Parameters
+        ----------
+        value : str
+          One of 'run', 'scratch', or 'shm'.
+
+        """
+        if value not in work_placements:
+            msg = "Work placement must be one of " + ", ".join(work_placements)
+            raise TypeError(msg)
+        self._work_placement = value
+
+    @property
+    def evaluation_timeout(self):
+        """Wall-clock time limit on an evaluation, in seconds."""
+        return self._evaluation_timeout
+
+    @evaluation_timeout.setter
+    def evaluation_timeout(self, value):
+        """Set the wall-clock time limit on an evaluation.
+
+        Parameters
+        ----------
+        value : int or float or None
+          The limit, in seconds, or None for no limit.
+
+        """
+        if value is not None and not isinstance(value, (int, float)):
+            raise TypeError("Evaluation timeout must be a number")
+        self._evaluation_timeout = value
+
+    @property
+    def cpu_time_limit(self):
+        """CPU time limit on an evaluation, in seconds."""
+        return self._cpu_time_limit
+
+    @cpu_time_limit.setter
+    def cpu_time_limit(self, value):
+        """Set the CPU time limit on an evaluation.
+
+        Parameters
+        ----------
+        value : int or float or None
+          The limit, in seconds, or None for no limit.
+
+        """
+        if value is not None and not isinstance(value, (int, float)):
+            raise TypeError("CPU time limit must be a number")
+        self._cpu_time_limit = value
+
     def __str__(self):
         """Define the interface block of a Dakota input file."""
         s = (
@@ -109,6 +312,17 @@ class InterfaceBase(object):
             + "  {}\n".format(self.interface)
             + "  analysis_driver = {!r}".format(self.analysis_driver)
         )
+        if self.failure_capture is not None:
+            s += "\n" + "    failure_capture"
+            if self.failure_capture == "retry":
+                s += "\n" + "      retry = {}".format(self.retry_limit)
+            elif self.failure_capture == "recover":
+                if not self.recover_values:
+                    raise ValueError("Failure capture 'recover' needs recover_values")
+                values = " ".join(str(v) for v in self.recover_values)
+                s += "\n" + "      recover = {}".format(values)
+            else:
+                s += "\n" + "      {}".format(self.failure_capture)
         if self.asynchronous:
             s += "\n" + "  asynchronous"
             s += (
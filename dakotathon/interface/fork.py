@@ -2,6 +2,7 @@
 
 import os
 from .base import InterfaceBase
+from ..retention import retention_policies
 
 
 classname = "Fork"
@@ -11,11 +12,35 @@ class Fork(InterfaceBase):
 
     """Define attributes for a Dakota fork interface."""
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        batch=False,
+        batch_size=None,
+        retention="all",
+        retention_interval=None,
+        **kwargs
+    ):
         """Create a fork interface.
 
         Parameters
         ----------
+        batch : bool, optional
+            Set to have Dakota pass evaluations to the analysis driver
+            in batches, instead of one at a time (default is False).
+            The `dakota_run_batch` driver runs the evaluations of a
+            batch concurrently. Batch mode replaces `asynchronous`.
+        batch_size : int, optional
+            The largest number of evaluations in a batch (default is
+            None, all of the evaluations that Dakota can schedule).
+        retention : str, optional
+            Which evaluation work directories are kept: 'all' (the
+            default), 'none', 'failures', 'every' Nth directory and
+            those of failed evaluations, or 'compress', which packs
+            every directory into an archive as the experiment runs.
+            See `dakotathon.retention`.
+        retention_interval : int, optional
+            Keep every Nth directory, with 'every' (default is None,
+            every directory).
         **kwargs
             Optional keyword arguments.
 
@@ -25,9 +50,21 @@ class Fork(InterfaceBase):
 
         >>> f = Fork()
 
+        Create a fork interface that evaluates batches of 8:
+
+        >>> f = Fork(batch=True, batch_size=8)
+
+        Keep the work directories of every 100th evaluation:
+
+        >>> f = Fork(retention="every", retention_interval=100)
+
         """
         InterfaceBase.__init__(self, **kwargs)
         self.interface = self.__module__.rsplit(".")[-1]
+        self.batch = batch
+        self.batch_size = batch_size
+        self.retention = retention
+        self.retention_interval = retention_interval
         try:
             self._configuration_file = os.path.abspath(
                 os.path.join(
@@ -37,6 +74,83 @@ class Fork(InterfaceBase):
         except KeyError:
             self._configuration_file = os.path.abspath("dakota.yaml")
 
+    @property
+    def batch(self):
+        """State of batch evaluation."""
+        return self._batch
+
+    @batch.setter
+    def batch(self, value):
+        """Toggle batch evaluation.
+
+        Parameters
+        ----------
+        value : bool
+          True if evaluations are passed to the driver in batches.
+
+        """
+        if not isinstance(value, bool):
+            raise TypeError("Batch must be a bool")
+        self._batch = value
+
+    @property
+    def batch_size(self):
+        """The largest number of evaluations in a batch."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value):
+        """Set the largest number of evaluations in a batch.
+
+        Parameters
+        ----------
+        value : int or None
+          The batch size, or None for no limit.
+
+        """
+        if value is not None and not isinstance(value, int):
+            raise TypeError("Batch size must be an int")
+        self._batch_size = value
+
+    @property
+    def retention(self):
+        """Which evaluation work directories are kept."""
+        return self._retention
+
+    @retention.setter
+    def retention(self, value):
+        """Set which evaluation work directories are kept.
+
+        Parameters
+        ----------
+        value : str
+          One of 'all', 'none', 'failures', 'every', or 'compress'.
+
+        """
+        if value not in retention_policies:
+            msg = "Retention must be one of " + ", ".join(retention_policies)
+            raise TypeError(msg)
+        self._retention = value
+
+    @property
+    def retention_interval(self):
+        """Keep every Nth evaluation work directory."""
+        return self._retention_interval
+
+    @retention_interval.setter
+    def retention_interval(self, value):
+        """Set the interval between kept evaluation work directories.
+
+        Parameters
+        ----------
+        value : int or None
+          The interval, or None to keep every directory.
+
+        """
+        if value is not None and not isinstance(value, int):
+            raise TypeError("Retention interval must be an int")
+        self._retention_interval = value
+
     def __str__(self):
         """Define the block for a fork interface.
 
@@ -46,6 +160,10 @@ class Fork(InterfaceBase):
 
         """
         s = InterfaceBase.__str__(self)
+        if self.batch:
+            s += "\n" + "  batch"
+            if self.batch_size is not None:
+                s += "\n" + "    size = {}".format(self.batch_size)
         s += "\n" + "  analysis_components = {!r}\n".format(self._configuration_file)
         s += (
             "  parameters_file = {!r}\n".format(self.parameters_file)
@@ -53,8 +171,8 @@ class Fork(InterfaceBase):
             + "  work_directory\n"
             + "    named {!r}\n".format(self.work_directory)
             + "    directory_tag\n"
-            + "    directory_save\n"
-            + "  file_save\n"
         )
+        if self.retention != "none" or self.sync_directory is not None:
+            s += "    directory_save\n" + "  file_save\n"
         s += "\n"
         return s
@@ -2,6 +2,7 @@
 """Abstract base classes for Dakota analysis methods."""
 
 from abc import ABCMeta, abstractmethod
+from ..utils import format_vector
 
 
 class MethodBase(object):
@@ -115,16 +116,102 @@ class MethodBase(object):
 
 
 def _print_levels(levels):
-    s = ""
+    parts = []
     for item in levels:
         if isinstance(item, (tuple, list)):
-            s += "\n     "
-            for subitem in item:
-                s += " {}".format(subitem)
+            parts.append("\n      " + format_vector(item))
         else:
-            s += " {}".format(item)
-    s += "\n"
-    return s
+            parts.append(" {}".format(item))
+    parts.append("\n")
+    return "".join(parts)
+
+
+def _anisotropic_weights(n_variables, dimension_preference):
+    if len(dimension_preference) == 0:
+        return [1.0] * n_variables
+    if len(dimension_preference) != n_variables:
+        raise ValueError("Dimension preference must have one item per variable")
+    highest = float(max(dimension_preference))
+    return [highest / item for item in dimension_preference]
+
+
+def _count_tensor_grid(n_variables, quadrature_order, dimension_preference=()):
+    """Count the points in a (possibly anisotropic) tensor-product grid."""
+    weights = _anisotropic_weights(n_variables, dimension_preference)
+    count = 1
+    for w in weights:
+        count *= max(1, int(round(quadrature_order / w)))
+    return count
+
+
+def _count_sparse_grid(n_variables, level, dimension_preference=(), nested=False):
+    """Count the points in a Smolyak sparse grid.
+
+    Levels are mapped to quadrature orders with the growth rules
+    Dakota uses by default: linear growth (2l + 1 points) for
+    non-nested Gauss rules, and exponential growth (2**l + 1 points)
+    for nested rules. For non-nested rules, points shared between
+    tensor grids are counted once per grid, so the count is an upper
+    bound.
+
+    """
+    weights = _anisotropic_weights(n_variables, dimension_preference)
+
+    def admissible(budget, dim):
+        if dim == n_variables:
+            yield ()
+            return
+        l = 0
+        while weights[dim] * l <= budget + 1e-12:
+            for rest in admissible(budget - weights[dim] * l, dim + 1):
+                yield (l,) + rest
+            l += 1
+
+    indices = list(admissible(float(level), 0))
+
+    if nested:
+
+        def delta(l):
+            if l == 0:
+                return 1
+            elif l == 1:
+                return 2
+            return 2 ** (l - 1)
+
+        count = 0
+        for index in indices:
+            points = 1
+            for l in index:
+                points *= delta(l)
+            count += points
+        return count
+
+    def coefficient(slack, dim):
+        # Sum of (-1)**|S| over sets S of dimensions that can be
+        # incremented together while staying in the index set.
+        total = 0
+        for d in range(dim, n_variables):
+            if weights[d] <= slack + 1e-12:
+                total -= 1 + coefficient(slack - weights[d], d + 1)
+        return total
+
+    count = 0
+    for index in indices:
+        slack = level - sum(w * i for w, i in zip(weights, index))
+        if 1 + coefficient(slack, 0) != 0:
+            points = 1
+            for l in index:
+                points *= 2 * l + 1
+            count += points
+    return count
+
+
+def _count_regression(n_variables, expansion_order, collocation_ratio):
+    """Count the samples used to fit a total-order expansion by regression."""
+    n_terms = 1
+    for i in range(1, expansion_order + 1):
+        n_terms = n_terms * (n_variables + i) // i
+    return int(-(-collocation_ratio * n_terms // 1))
 
 
 class UncertaintyQuantificationBase(MethodBase):
@@ -345,3 +432,67 @@ class UncertaintyQuantificationBase(MethodBase):
         if self.variance_based_decomp:
             s += "    variance_based_decomp\n"
         return s
+
+
+class OptimizationBase(MethodBase):
+
+    """Describe features of optimization and calibration methods.
+
+    These methods search for the variables that minimize an objective,
+    or, with *calibration_terms* responses, the sum of the squares of
+    the residuals between model responses and calibration data. The
+    evaluations of each iteration of the search (a pattern, a
+    population, or the points of finite difference gradients) are
+    independent, so they run concurrently when the interface sets
+    *evaluation_concurrency*.
+
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def __init__(self, max_function_evaluations=None, **kwargs):
+        """Create default method parameters.
+
+        Parameters
+        ----------
+        max_function_evaluations : int, optional
+          Stopping criterion based on the number of function
+          evaluations.
+
+        """
+        MethodBase.__init__(self, **kwargs)
+        self._max_function_evaluations = max_function_evaluations
+
+    @property
+    def max_function_evaluations(self):
+        """Maximum number of function evaluations for the method."""
+        return self._max_function_evaluations
+
+    @max_function_evaluations.setter
+    def max_function_evaluations(self, value):
+        """Set the maximum number of function evaluations.
+
+        Parameters
+        ----------
+        value : int
+          The maximum number of function evaluations.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Max function evaluations must be an int")
+        self._max_function_evaluations = value
+
+    def __str__(self):
+        """Define the method block for an optimization experiment.
+
+        See Also
+        --------
+        dakotathon.method.base.MethodBase.__str__
+
+        """
+        s = MethodBase.__str__(self)
+        if self.max_function_evaluations is not None:
+            s += "    max_function_evaluations = "
+            s += "{}\n".format(self.max_function_evaluations)
+        return s
@@ -2,7 +2,7 @@
 """Implementation of a Dakota centered parameter study."""
 
 from .base import MethodBase
-from ..utils import to_iterable
+from ..utils import format_vector
 
 
 classname = "CenteredParameterStudy"
@@ -81,13 +81,8 @@ class CenteredParameterStudy(MethodBase):
 
         """
         s = MethodBase.__str__(self)
-        steps_per_variable = to_iterable(self.steps_per_variable)
-        step_vector = to_iterable(self.step_vector)
-        s += "    steps_per_variable ="
-        for step in steps_per_variable:
-            s += " {}".format(step)
-        s += "\n" + "    step_vector ="
-        for step in step_vector:
-            s += " {}".format(step)
-        s += "\n\n"
+        s += "    steps_per_variable = {}\n".format(
+            format_vector(self.steps_per_variable)
+        )
+        s += "    step_vector = {}\n\n".format(format_vector(self.step_vector))
         return s
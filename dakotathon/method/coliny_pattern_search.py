@@ -0,0 +1,250 @@
+#! /usr/bin/env python
+"""Implementation of the Dakota COLINY pattern search method."""
+
+from .base import OptimizationBase
+
+
+classname = "ColinyPatternSearch"
+
+
+class ColinyPatternSearch(OptimizationBase):
+
+    """The Dakota COLINY pattern search method.
+
+    A derivative-free search that polls a pattern of points around
+    the best point found, expanding the pattern after a success and
+    contracting it after a failure. The points of a pattern are
+    independent, so they're evaluated concurrently; with *nonblocking*
+    synchronization (the default), the search moves on as soon as an
+    improving point returns, instead of waiting for the whole pattern,
+    which keeps every evaluation slot busy.
+
+    """
+
+    def __init__(
+        self,
+        initial_delta=0.5,
+        variable_tolerance=1.0e-4,
+        contraction_factor=None,
+        solution_target=None,
+        exploratory_moves="basic_pattern",
+        synchronization="nonblocking",
+        seed=None,
+        **kwargs
+    ):
+        """Create a new Dakota pattern search.
+
+        Parameters
+        ----------
+        initial_delta : float, optional
+          The initial size of the pattern (default is 0.5).
+        variable_tolerance : float, optional
+          The pattern size at which the search stops (default is
+          1.0e-4).
+        contraction_factor : float, optional
+          The factor by which the pattern contracts after a failed
+          poll, on (0, 1).
+        solution_target : float, optional
+          Stop when the objective falls below this value.
+        exploratory_moves : str, optional
+          How the pattern is polled: 'basic_pattern' (the default),
+          'multi_step', or 'adaptive_pattern'.
+        synchronization : str, optional
+          Either 'nonblocking' (the default), to act on evaluations
+          as they complete, or 'blocking', to wait for each poll.
+        seed : int, optional
+          The seed for the random number generator.
+        **kwargs
+          Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default pattern search experiment:
+
+        >>> m = ColinyPatternSearch()
+
+        """
+        OptimizationBase.__init__(self, **kwargs)
+        self.method = self.__module__.rsplit(".")[-1]
+        self._initial_delta = initial_delta
+        self._variable_tolerance = variable_tolerance
+        self._contraction_factor = contraction_factor
+        self._solution_target = solution_target
+        self._exploratory_moves = exploratory_moves
+        self._synchronization = synchronization
+        self._seed = seed
+
+    @property
+    def initial_delta(self):
+        """The initial size of the pattern."""
+        return self._initial_delta
+
+    @initial_delta.setter
+    def initial_delta(self, value):
+        """Set the initial size of the pattern.
+
+        Parameters
+        ----------
+        value : float
+          The initial pattern size.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Initial delta must be a float")
+        self._initial_delta = value
+
+    @property
+    def variable_tolerance(self):
+        """The pattern size at which the search stops."""
+        return self._variable_tolerance
+
+    @variable_tolerance.setter
+    def variable_tolerance(self, value):
+        """Set the pattern size at which the search stops.
+
+        Parameters
+        ----------
+        value : float
+          The final pattern size.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Variable tolerance must be a float")
+        self._variable_tolerance = value
+
+    @property
+    def contraction_factor(self):
+        """The factor by which the pattern contracts."""
+        return self._contraction_factor
+
+    @contraction_factor.setter
+    def contraction_factor(self, value):
+        """Set the factor by which the pattern contracts.
+
+        Parameters
+        ----------
+        value : float
+          The contraction factor, on (0, 1).
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Contraction factor must be a float")
+        if value <= 0.0 or value >= 1.0:
+            raise ValueError("Contraction factor must be on (0,1)")
+        self._contraction_factor = value
+
+    @property
+    def solution_target(self):
+        """The objective value at which the search stops."""
+        return self._solution_target
+
+    @solution_target.setter
+    def solution_target(self, value):
+        """Set the objective value at which the search stops.
+
+        Parameters
+        ----------
+        value : float
+          The target value.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Solution target must be a float")
+        self._solution_target = value
+
+    @property
+    def exploratory_moves(self):
+        """How the pattern is polled."""
+        return self._exploratory_moves
+
+    @exploratory_moves.setter
+    def exploratory_moves(self, value):
+        """Set how the pattern is polled.
+
+        Parameters
+        ----------
+        value : str
+          One of 'basic_pattern', 'multi_step', or 'adaptive_pattern'.
+
+        """
+        if value not in ("basic_pattern", "multi_step", "adaptive_pattern"):
+            msg = "Exploratory moves must be 'basic_pattern', 'multi_step', "
+            msg += "or 'adaptive_pattern'"
+            raise TypeError(msg)
+        self._exploratory_moves = value
+
+    @property
+    def synchronization(self):
+        """How the concurrent evaluations of a poll are scheduled."""
+        return self._synchronization
+
+    @synchronization.setter
+    def synchronization(self, value):
+        """Set how the concurrent evaluations of a poll are scheduled.
+
+        Parameters
+        ----------
+        value : str
+          Either 'blocking' or 'nonblocking'.
+
+        """
+        if value not in ("blocking", "nonblocking"):
+            raise TypeError("Synchronization must be 'blocking' or 'nonblocking'")
+        self._synchronization = value
+
+    @property
+    def seed(self):
+        """Seed of the random number generator."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, value):
+        """Set the seed of the random number generator.
+
+        Parameters
+        ----------
+        value : int
+          The random number generator seed.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Seed must be an int")
+        self._seed = value
+
+    def __str__(self):
+        """Define the method block for a pattern search.
+
+        Examples
+        --------
+        Display the method block created by a default instance of
+        ColinyPatternSearch:
+
+        >>> m = ColinyPatternSearch()
+        >>> print(m)
+        method
+          coliny_pattern_search
+            initial_delta = 0.5
+            variable_tolerance = 0.0001
+            exploratory_moves = basic_pattern
+            synchronization = nonblocking
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.method.base.OptimizationBase.__str__
+
+        """
+        s = OptimizationBase.__str__(self)
+        s += "    initial_delta = {}\n".format(self.initial_delta)
+        s += "    variable_tolerance = {}\n".format(self.variable_tolerance)
+        if self.contraction_factor is not None:
+            s += "    contraction_factor = {}\n".format(self.contraction_factor)
+        if self.solution_target is not None:
+            s += "    solution_target = {}\n".format(self.solution_target)
+        s += "    exploratory_moves = {}\n".format(self.exploratory_moves)
+        s += "    synchronization = {}\n".format(self.synchronization)
+        if self.seed is not None:
+            s += "    seed = {}\n".format(self.seed)
+        s += "\n"
+        return s
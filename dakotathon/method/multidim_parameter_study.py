@@ -2,7 +2,7 @@
 """Implementation of a Dakota multidim parameter study."""
 
 from .base import MethodBase
-from ..utils import to_iterable
+from ..utils import format_vector
 
 
 classname = "MultidimParameterStudy"
@@ -60,9 +60,5 @@ class MultidimParameterStudy(MethodBase):
 
         """
         s = MethodBase.__str__(self)
-        partitions = to_iterable(self.partitions)
-        s += "    partitions ="
-        for p in partitions:
-            s += " {}".format(p)
-        s += "\n\n"
+        s += "    partitions = {}\n\n".format(format_vector(self.partitions))
         return s
@@ -0,0 +1,170 @@
+#! /usr/bin/env python
+"""Implementation of the Dakota NL2SOL calibration method."""
+
+from .base import OptimizationBase
+
+
+classname = "Nl2sol"
+
+
+class Nl2sol(OptimizationBase):
+
+    """The Dakota NL2SOL nonlinear least squares method.
+
+    A local, gradient-based calibration method that exploits the
+    structure of a sum of squared residuals. It needs
+    *calibration_terms* responses and their gradients, so an
+    experiment using it defaults to both, with *numerical_gradients*
+    that Dakota estimates with finite differences, evaluating the
+    points of each gradient concurrently.
+
+    """
+
+    def __init__(
+        self,
+        function_precision=None,
+        absolute_conv_tol=None,
+        x_conv_tol=None,
+        initial_trust_radius=None,
+        **kwargs
+    ):
+        """Create a new Dakota NL2SOL calibration.
+
+        Parameters
+        ----------
+        function_precision : float, optional
+          The relative precision of the residuals.
+        absolute_conv_tol : float, optional
+          Stop when the sum of the squared residuals falls below this
+          value.
+        x_conv_tol : float, optional
+          Stop when the relative change in the variables falls below
+          this value.
+        initial_trust_radius : float, optional
+          The initial size of the trust region.
+        **kwargs
+          Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default NL2SOL experiment:
+
+        >>> m = Nl2sol()
+
+        """
+        OptimizationBase.__init__(self, **kwargs)
+        self.method = self.__module__.rsplit(".")[-1]
+        self._function_precision = function_precision
+        self._absolute_conv_tol = absolute_conv_tol
+        self._x_conv_tol = x_conv_tol
+        self._initial_trust_radius = initial_trust_radius
+
+    @property
+    def function_precision(self):
+        """Relative precision of the residuals."""
+        return self._function_precision
+
+    @function_precision.setter
+    def function_precision(self, value):
+        """Set the relative precision of the residuals.
+
+        Parameters
+        ----------
+        value : float
+          The function precision.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Function precision must be a float")
+        self._function_precision = value
+
+    @property
+    def absolute_conv_tol(self):
+        """Sum of squared residuals at which the calibration stops."""
+        return self._absolute_conv_tol
+
+    @absolute_conv_tol.setter
+    def absolute_conv_tol(self, value):
+        """Set the sum of squared residuals at which the calibration stops.
+
+        Parameters
+        ----------
+        value : float
+          The absolute convergence tolerance.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Absolute convergence tolerance must be a float")
+        self._absolute_conv_tol = value
+
+    @property
+    def x_conv_tol(self):
+        """Relative change in the variables at which the calibration stops."""
+        return self._x_conv_tol
+
+    @x_conv_tol.setter
+    def x_conv_tol(self, value):
+        """Set the relative change in the variables at which to stop.
+
+        Parameters
+        ----------
+        value : float
+          The variables convergence tolerance.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("X convergence tolerance must be a float")
+        self._x_conv_tol = value
+
+    @property
+    def initial_trust_radius(self):
+        """Initial size of the trust region."""
+        return self._initial_trust_radius
+
+    @initial_trust_radius.setter
+    def initial_trust_radius(self, value):
+        """Set the initial size of the trust region.
+
+        Parameters
+        ----------
+        value : float
+          The initial trust radius.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Initial trust radius must be a float")
+        self._initial_trust_radius = value
+
+    def __str__(self):
+        """Define the method block for an NL2SOL calibration.
+
+        Examples
+        --------
+        Display the method block created by a default instance of
+        Nl2sol:
+
+        >>> m = Nl2sol(max_iterations=50)
+        >>> print(m)
+        method
+          nl2sol
+            max_iterations = 50
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.method.base.OptimizationBase.__str__
+
+        """
+        s = OptimizationBase.__str__(self)
+        for name in (
+            "function_precision",
+            "absolute_conv_tol",
+            "x_conv_tol",
+            "initial_trust_radius",
+        ):
+            value = getattr(self, name)
+            if value is not None:
+                s += "    {} = {}\n".format(name, value)
+        s += "\n"
+        return s
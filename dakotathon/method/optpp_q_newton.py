@@ -0,0 +1,177 @@
+#! /usr/bin/env python
+"""Implementation of the Dakota OPT++ quasi-Newton method."""
+
+from .base import OptimizationBase
+
+
+classname = "OptppQNewton"
+
+
+class OptppQNewton(OptimizationBase):
+
+    """The Dakota OPT++ quasi-Newton method.
+
+    A local, gradient-based search that builds a BFGS approximation to
+    the Hessian. It needs the gradients of the responses, so an
+    experiment using it defaults to *numerical_gradients*, which
+    Dakota estimates with finite differences, evaluating the points
+    of each gradient concurrently. Set *speculative* to also evaluate
+    the gradient at each trial point along with its value, instead of
+    after the step is accepted.
+
+    """
+
+    def __init__(
+        self,
+        search_method="trust_region",
+        gradient_tolerance=None,
+        max_step=None,
+        speculative=False,
+        **kwargs
+    ):
+        """Create a new Dakota quasi-Newton study.
+
+        Parameters
+        ----------
+        search_method : str, optional
+          The globalization strategy: 'trust_region' (the default),
+          'value_based_line_search', 'gradient_based_line_search', or
+          'tr_pds'.
+        gradient_tolerance : float, optional
+          Stop when the norm of the gradient falls below this value.
+        max_step : float, optional
+          The largest step taken in an iteration.
+        speculative : bool, optional
+          Set to compute gradients speculatively (default is False).
+        **kwargs
+          Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default quasi-Newton experiment:
+
+        >>> m = OptppQNewton()
+
+        """
+        OptimizationBase.__init__(self, **kwargs)
+        self.method = self.__module__.rsplit(".")[-1]
+        self._search_method = search_method
+        self._gradient_tolerance = gradient_tolerance
+        self._max_step = max_step
+        self._speculative = speculative
+
+    @property
+    def search_method(self):
+        """The globalization strategy of the search."""
+        return self._search_method
+
+    @search_method.setter
+    def search_method(self, value):
+        """Set the globalization strategy of the search.
+
+        Parameters
+        ----------
+        value : str
+          One of 'trust_region', 'value_based_line_search',
+          'gradient_based_line_search', or 'tr_pds'.
+
+        """
+        if value not in (
+            "trust_region",
+            "value_based_line_search",
+            "gradient_based_line_search",
+            "tr_pds",
+        ):
+            msg = "Search method must be 'trust_region', 'value_based_line_search', "
+            msg += "'gradient_based_line_search', or 'tr_pds'"
+            raise TypeError(msg)
+        self._search_method = value
+
+    @property
+    def gradient_tolerance(self):
+        """The gradient norm at which the search stops."""
+        return self._gradient_tolerance
+
+    @gradient_tolerance.setter
+    def gradient_tolerance(self, value):
+        """Set the gradient norm at which the search stops.
+
+        Parameters
+        ----------
+        value : float
+          The gradient tolerance.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Gradient tolerance must be a float")
+        self._gradient_tolerance = value
+
+    @property
+    def max_step(self):
+        """The largest step taken in an iteration."""
+        return self._max_step
+
+    @max_step.setter
+    def max_step(self, value):
+        """Set the largest step taken in an iteration.
+
+        Parameters
+        ----------
+        value : float
+          The maximum step.
+
+        """
+        if not isinstance(value, float):
+            raise TypeError("Max step must be a float")
+        self._max_step = value
+
+    @property
+    def speculative(self):
+        """Compute gradients speculatively."""
+        return self._speculative
+
+    @speculative.setter
+    def speculative(self, value):
+        """Toggle speculative gradients.
+
+        Parameters
+        ----------
+        value : bool
+          True to compute gradients speculatively.
+
+        """
+        if type(value) is not bool:
+            raise TypeError("Set speculative gradients with a bool")
+        self._speculative = value
+
+    def __str__(self):
+        """Define the method block for a quasi-Newton study.
+
+        Examples
+        --------
+        Display the method block created by a default instance of
+        OptppQNewton:
+
+        >>> m = OptppQNewton()
+        >>> print(m)
+        method
+          optpp_q_newton
+            search_method = trust_region
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.method.base.OptimizationBase.__str__
+
+        """
+        s = OptimizationBase.__str__(self)
+        s += "    search_method = {}\n".format(self.search_method)
+        if self.gradient_tolerance is not None:
+            s += "    gradient_tolerance = {}\n".format(self.gradient_tolerance)
+        if self.max_step is not None:
+            s += "    max_step = {}\n".format(self.max_step)
+        if self.speculative:
+            s += "    speculative\n"
+        s += "\n"
+        return s
@@ -1,25 +1,48 @@
 #! /usr/bin/env python
 """Implementation of the Dakota polynomial chaos method."""
 
-from .base import UncertaintyQuantificationBase
+from .base import (
+    UncertaintyQuantificationBase,
+    _count_tensor_grid,
+    _count_sparse_grid,
+    _count_regression,
+)
+from ..utils import format_vector
 
 
 classname = "PolynomialChaos"
 
+coefficient_estimation_approaches = (
+    "quadrature_order_sequence",
+    "sparse_grid_level_sequence",
+    "expansion_order_sequence",
+)
+"""Techniques to obtain the coefficients of the expansion."""
+
 
 class PolynomialChaos(UncertaintyQuantificationBase):
 
     """The Dakota polynomial chaos uncertainty quantification method.
 
-    Designation of a coefficient estimation approach is required, but
-    the only approach currently implemented is
-    *quadrature_order_sequence*, which obtains coefficients of the
+    Designation of a coefficient estimation approach is required. The
+    *quadrature_order_sequence* approach obtains coefficients of the
     expansion using multidimensional integration by a tensor-product
     of Gaussian quadrature rules specified with *quadrature_order*,
     and, optionally, with *dimension_preference*. If
     *dimension_preference* is defined, its highest value is set to the
     *quadrature_order*.
 
+    The number of evaluations needed for a tensor-product grid grows
+    exponentially with the number of variables. For larger studies,
+    the *sparse_grid_level_sequence* approach integrates on a Smolyak
+    sparse grid specified with *sparse_grid_level* (anisotropic if
+    *dimension_preference* is defined), and the
+    *expansion_order_sequence* approach fits an expansion of
+    *expansion_order* by regression on *collocation_ratio* times as
+    many samples as expansion terms. Grids can be refined with
+    *p_refinement*. Use `evaluation_count` to compare the cost of
+    these configurations.
+
     Notes
     -----
     This implementation of the `polynomial chaos method`_ is based on the
@@ -36,6 +59,10 @@ class PolynomialChaos(UncertaintyQuantificationBase):
         quadrature_order=2,
         dimension_preference=(),
         nested=False,
+        sparse_grid_level=2,
+        expansion_order=2,
+        collocation_ratio=2.0,
+        p_refinement=None,
         **kwargs
     ):
         """Create a new Dakota polynomial chaos study.
@@ -51,6 +78,18 @@ class PolynomialChaos(UncertaintyQuantificationBase):
           uncertain variable (dimension).
         nested : bool, optional
           Set to enforce nested quadrature rules, if available (default is False).
+        sparse_grid_level : int, optional
+          The level of the Smolyak sparse grid used with the
+          *sparse_grid_level_sequence* approach (default is 2).
+        expansion_order : int, optional
+          The total order of the expansion fit with the
+          *expansion_order_sequence* approach (default is 2).
+        collocation_ratio : float, optional
+          The ratio of samples to expansion terms used in regression
+          (default is 2.0).
+        p_refinement : str, optional
+          Refine the grid with 'uniform' or 'dimension_adaptive'
+          p-refinement (default is None).
 
         Examples
         --------
@@ -65,10 +104,39 @@ class PolynomialChaos(UncertaintyQuantificationBase):
         self._quadrature_order = quadrature_order
         self._dimension_preference = dimension_preference
         self._nested = nested
+        self._sparse_grid_level = sparse_grid_level
+        self._expansion_order = expansion_order
+        self._collocation_ratio = collocation_ratio
+        self._p_refinement = p_refinement
 
         if len(self.dimension_preference) > 0:
             self.quadrature_order = max(self.dimension_preference)
 
+    @property
+    def coefficient_estimation_approach(self):
+        """Technique used to obtain the coefficients of the expansion."""
+        return self._coefficient_estimation_approach
+
+    @coefficient_estimation_approach.setter
+    def coefficient_estimation_approach(self, value):
+        """Set the technique used to obtain the expansion coefficients.
+
+        Parameters
+        ----------
+        value : str
+          One of 'quadrature_order_sequence',
+          'sparse_grid_level_sequence', or 'expansion_order_sequence'.
+
+        """
+        if not isinstance(value, str):
+            raise TypeError("Coefficient estimation approach must be a str")
+        if value not in coefficient_estimation_approaches:
+            msg = "Coefficient estimation approach must be one of " + ", ".join(
+                coefficient_estimation_approaches
+            )
+            raise ValueError(msg)
+        self._coefficient_estimation_approach = value
+
     @property
     def quadrature_order(self):
         """The highest order polynomial used by the method."""
@@ -133,6 +201,131 @@ class PolynomialChaos(UncertaintyQuantificationBase):
             raise TypeError("Nested must be a bool")
         self._nested = value
 
+    @property
+    def sparse_grid_level(self):
+        """The level of the sparse grid used by the method."""
+        return self._sparse_grid_level
+
+    @sparse_grid_level.setter
+    def sparse_grid_level(self, value):
+        """Set the level of the sparse grid used by the method.
+
+        Parameters
+        ----------
+        value : int
+          The sparse grid level.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Sparse grid level must be an int")
+        self._sparse_grid_level = value
+
+    @property
+    def expansion_order(self):
+        """The total order of the expansion fit by regression."""
+        return self._expansion_order
+
+    @expansion_order.setter
+    def expansion_order(self, value):
+        """Set the total order of the expansion fit by regression.
+
+        Parameters
+        ----------
+        value : int
+          The expansion order.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Expansion order must be an int")
+        self._expansion_order = value
+
+    @property
+    def collocation_ratio(self):
+        """Ratio of samples to expansion terms used in regression."""
+        return self._collocation_ratio
+
+    @collocation_ratio.setter
+    def collocation_ratio(self, value):
+        """Set the ratio of samples to expansion terms used in regression.
+
+        Parameters
+        ----------
+        value : float
+          The collocation ratio.
+
+        """
+        if not isinstance(value, (int, float)):
+            raise TypeError("Collocation ratio must be a number")
+        if value <= 0:
+            raise ValueError("Collocation ratio must be positive")
+        self._collocation_ratio = value
+
+    @property
+    def p_refinement(self):
+        """The type of p-refinement used by the method."""
+        return self._p_refinement
+
+    @p_refinement.setter
+    def p_refinement(self, value):
+        """Set the type of p-refinement used by the method.
+
+        Parameters
+        ----------
+        value : str or None
+          Either 'uniform', 'dimension_adaptive', or None.
+
+        """
+        if value not in (None, "uniform", "dimension_adaptive"):
+            msg = "P-refinement must be 'uniform' or 'dimension_adaptive'"
+            raise ValueError(msg)
+        self._p_refinement = value
+
+    def evaluation_count(self, n_variables):
+        """Count the model evaluations needed by the configured study.
+
+        Use this as a dry run to compare the cost of configurations
+        before running an experiment. With p-refinement, the count is
+        for the initial grid only.
+
+        Parameters
+        ----------
+        n_variables : int
+          The number of uncertain variables.
+
+        Returns
+        -------
+        int
+          The number of model evaluations.
+
+        Examples
+        --------
+        Compare a tensor grid with a sparse grid for eight variables:
+
+        >>> m = PolynomialChaos()
+        >>> m.evaluation_count(8)
+        256
+        >>> m.coefficient_estimation_approach = "sparse_grid_level_sequence"
+        >>> m.nested = True
+        >>> m.evaluation_count(8)
+        145
+
+        """
+        approach = self.coefficient_estimation_approach
+        if approach == "quadrature_order_sequence":
+            return _count_tensor_grid(
+                n_variables, self.quadrature_order, self.dimension_preference
+            )
+        elif approach == "sparse_grid_level_sequence":
+            return _count_sparse_grid(
+                n_variables,
+                self.sparse_grid_level,
+                self.dimension_preference,
+                self.nested,
+            )
+        return _count_regression(
+            n_variables, self.expansion_order, self.collocation_ratio
+        )
+
     def __str__(self):
         """Define the method block for a polynomial_chaos experiment.
 
@@ -159,16 +352,26 @@ class PolynomialChaos(UncertaintyQuantificationBase):
 
         """
         s = UncertaintyQuantificationBase.__str__(self)
-        if self.coefficient_estimation_approach == "quadrature_order_sequence":
+        approach = self.coefficient_estimation_approach
+        if approach == "quadrature_order_sequence":
             s += "    quadrature_order = {}\n".format(self.quadrature_order)
-            if len(self.dimension_preference) > 0:
-                s += "    dimension_preference ="
-                for item in self.dimension_preference:
-                    s += " {}".format(item)
-                s += "\n"
+        elif approach == "sparse_grid_level_sequence":
+            s += "    sparse_grid_level = {}\n".format(self.sparse_grid_level)
+        elif approach == "expansion_order_sequence":
+            s += "    expansion_order = {}\n".format(self.expansion_order)
+            s += "    collocation_ratio = {}\n".format(self.collocation_ratio)
+        if len(self.dimension_preference) > 0:
+            s += "    dimension_preference = {}\n".format(
+                format_vector(self.dimension_preference)
+            )
+        if approach != "expansion_order_sequence":
             if self.nested:
                 s += "    nested\n"
             else:
                 s += "    non_nested\n"
+        if self.p_refinement == "uniform":
+            s += "    p_refinement uniform\n"
+        elif self.p_refinement == "dimension_adaptive":
+            s += "    p_refinement dimension_adaptive generalized\n"
         s += "\n"
         return s
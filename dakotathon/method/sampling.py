@@ -1,7 +1,7 @@
 #! /usr/bin/env python
 """Implementation of the Dakota sampling method."""
 
-from .base import UncertaintyQuantificationBase
+from .base import UncertaintyQuantificationBase, _print_levels
 
 
 classname = "Sampling"
@@ -9,11 +9,25 @@ classname = "Sampling"
 
 class Sampling(UncertaintyQuantificationBase):
 
-    """The Dakota sampling method."""
+    """The Dakota sampling method.
 
-    def __init__(self, **kwargs):
+    Set *refinement_samples* to perform an incremental study, in which
+    Dakota augments the initial set of *samples* with additional
+    batches. When the study is rerun with a restart file, evaluations
+    from earlier batches are reused. For incremental LHS, each
+    refinement should double the current number of samples.
+
+    """
+
+    def __init__(self, refinement_samples=None, **kwargs):
         """Create a new Dakota sampling study.
 
+        Parameters
+        ----------
+        refinement_samples : int or list or tuple of int, optional
+          Number of samples in each refinement batch appended to the
+          initial samples (default is None).
+
         Examples
         --------
         Create a default sampling experiment:
@@ -23,6 +37,42 @@ class Sampling(UncertaintyQuantificationBase):
         """
         UncertaintyQuantificationBase.__init__(self, **kwargs)
         self.method = self.__module__.rsplit(".")[-1]
+        self._refinement_samples = None
+
+        if refinement_samples is not None:
+            self.refinement_samples = refinement_samples
+
+    @property
+    def refinement_samples(self):
+        """Number of samples in each refinement batch."""
+        return self._refinement_samples
+
+    @refinement_samples.setter
+    def refinement_samples(self, value):
+        """Set the number of samples in each refinement batch.
+
+        Parameters
+        ----------
+        value : int or list or tuple of int
+          The refinement batch sizes.
+
+        """
+        if type(value) is int:
+            value = (value,)
+        if not isinstance(value, (tuple, list)):
+            raise TypeError("Refinement samples must be an int, tuple or list")
+        for item in value:
+            if type(item) is not int:
+                raise TypeError("Refinement samples must be ints")
+        self._refinement_samples = tuple(value)
+
+    @property
+    def total_samples(self):
+        """Number of samples including all refinement batches."""
+        total = self.samples
+        if self.refinement_samples is not None:
+            total += sum(self.refinement_samples)
+        return total
 
     def __str__(self):
         """Define the method block for a sampling experiment.
@@ -33,5 +83,8 @@ class Sampling(UncertaintyQuantificationBase):
 
         """
         s = UncertaintyQuantificationBase.__str__(self)
+        if self.refinement_samples is not None:
+            s += "    refinement_samples ="
+            s += _print_levels(self.refinement_samples)
         s += "\n"
         return s
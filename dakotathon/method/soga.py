@@ -0,0 +1,110 @@
+#! /usr/bin/env python
+"""Implementation of the Dakota single-objective genetic algorithm."""
+
+from .base import OptimizationBase
+
+
+classname = "Soga"
+
+
+class Soga(OptimizationBase):
+
+    """The Dakota single-objective genetic algorithm (SOGA).
+
+    A global, derivative-free search that evolves a population of
+    points through crossover and mutation. The members of each
+    generation are independent, so a population at least as large as
+    the interface's *evaluation_concurrency* keeps every evaluation
+    slot busy.
+
+    """
+
+    def __init__(self, population_size=50, seed=None, **kwargs):
+        """Create a new Dakota genetic algorithm study.
+
+        Parameters
+        ----------
+        population_size : int, optional
+          The number of points in each generation (default is 50).
+        seed : int, optional
+          The seed for the random number generator.
+        **kwargs
+          Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default genetic algorithm experiment:
+
+        >>> m = Soga()
+
+        """
+        OptimizationBase.__init__(self, **kwargs)
+        self.method = self.__module__.rsplit(".")[-1]
+        self._population_size = population_size
+        self._seed = seed
+
+    @property
+    def population_size(self):
+        """Number of points in each generation."""
+        return self._population_size
+
+    @population_size.setter
+    def population_size(self, value):
+        """Set the number of points in each generation.
+
+        Parameters
+        ----------
+        value : int
+          The population size.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Population size must be an int")
+        self._population_size = value
+
+    @property
+    def seed(self):
+        """Seed of the random number generator."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, value):
+        """Set the seed of the random number generator.
+
+        Parameters
+        ----------
+        value : int
+          The random number generator seed.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Seed must be an int")
+        self._seed = value
+
+    def __str__(self):
+        """Define the method block for a genetic algorithm study.
+
+        Examples
+        --------
+        Display the method block created by a default instance of
+        Soga:
+
+        >>> m = Soga()
+        >>> print(m)
+        method
+          soga
+            population_size = 50
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.method.base.OptimizationBase.__str__
+
+        """
+        s = OptimizationBase.__str__(self)
+        s += "    population_size = {}\n".format(self.population_size)
+        if self.seed is not None:
+            s += "    seed = {}\n".format(self.seed)
+        s += "\n"
+        return s
@@ -1,11 +1,22 @@
 #! /usr/bin/env python
 """Implementation of the Dakota stochastic collocation method."""
 
-from .base import UncertaintyQuantificationBase
+from .base import (
+    UncertaintyQuantificationBase,
+    _count_tensor_grid,
+    _count_sparse_grid,
+)
+from ..utils import format_vector
 
 
 classname = "StochasticCollocation"
 
+coefficient_estimation_approaches = (
+    "quadrature_order_sequence",
+    "sparse_grid_level_sequence",
+)
+"""Techniques to obtain the coefficients of the interpolant."""
+
 
 class StochasticCollocation(UncertaintyQuantificationBase):
 
@@ -18,6 +29,13 @@ class StochasticCollocation(UncertaintyQuantificationBase):
     orthogonal polynomial basis functions are replaced with
     interpolation polynomial bases.
 
+    Interpolation points are taken from a tensor-product grid
+    (*quadrature_order_sequence*) or, to avoid exponential growth in
+    the number of evaluations with the number of variables, from a
+    Smolyak sparse grid (*sparse_grid_level_sequence*). Grids can be
+    refined with *p_refinement*. Use `evaluation_count` to compare the
+    cost of these configurations.
+
     Notes
     -----
     This implementation of the `stochastic collocation method`_ is based
@@ -34,6 +52,8 @@ class StochasticCollocation(UncertaintyQuantificationBase):
         quadrature_order=2,
         dimension_preference=(),
         nested=False,
+        sparse_grid_level=2,
+        p_refinement=None,
         **kwargs
     ):
         """Create a new Dakota stochastic collocation study.
@@ -49,6 +69,12 @@ class StochasticCollocation(UncertaintyQuantificationBase):
           uncertain variable (dimension).
         nested : bool, optional
           Set to enforce nested quadrature rules, if available (default is False).
+        sparse_grid_level : int, optional
+          The level of the Smolyak sparse grid used with the
+          *sparse_grid_level_sequence* approach (default is 2).
+        p_refinement : str, optional
+          Refine the grid with 'uniform' or 'dimension_adaptive'
+          p-refinement (default is None).
 
         Examples
         --------
@@ -63,6 +89,8 @@ class StochasticCollocation(UncertaintyQuantificationBase):
         self._quadrature_order = quadrature_order
         self._dimension_preference = dimension_preference
         self._nested = nested
+        self._sparse_grid_level = sparse_grid_level
+        self._p_refinement = p_refinement
 
         if len(self.dimension_preference) > 0:
             self.quadrature_order = max(self.dimension_preference)
@@ -82,6 +110,31 @@ class StochasticCollocation(UncertaintyQuantificationBase):
             raise TypeError(msg)
         self._basis_polynomial_family = value
 
+    @property
+    def coefficient_estimation_approach(self):
+        """Technique used to obtain the coefficients of the expansion."""
+        return self._coefficient_estimation_approach
+
+    @coefficient_estimation_approach.setter
+    def coefficient_estimation_approach(self, value):
+        """Set the technique used to obtain the expansion coefficients.
+
+        Parameters
+        ----------
+        value : str
+          One of 'quadrature_order_sequence' or
+          'sparse_grid_level_sequence'.
+
+        """
+        if not isinstance(value, str):
+            raise TypeError("Coefficient estimation approach must be a str")
+        if value not in coefficient_estimation_approaches:
+            msg = "Coefficient estimation approach must be one of " + ", ".join(
+                coefficient_estimation_approaches
+            )
+            raise ValueError(msg)
+        self._coefficient_estimation_approach = value
+
     @property
     def quadrature_order(self):
         """The highest order polynomial used by the method."""
@@ -146,6 +199,87 @@ class StochasticCollocation(UncertaintyQuantificationBase):
             raise TypeError("Nested must be a bool")
         self._nested = value
 
+    @property
+    def sparse_grid_level(self):
+        """The level of the sparse grid used by the method."""
+        return self._sparse_grid_level
+
+    @sparse_grid_level.setter
+    def sparse_grid_level(self, value):
+        """Set the level of the sparse grid used by the method.
+
+        Parameters
+        ----------
+        value : int
+          The sparse grid level.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Sparse grid level must be an int")
+        self._sparse_grid_level = value
+
+    @property
+    def p_refinement(self):
+        """The type of p-refinement used by the method."""
+        return self._p_refinement
+
+    @p_refinement.setter
+    def p_refinement(self, value):
+        """Set the type of p-refinement used by the method.
+
+        Parameters
+        ----------
+        value : str or None
+          Either 'uniform', 'dimension_adaptive', or None.
+
+        """
+        if value not in (None, "uniform", "dimension_adaptive"):
+            msg = "P-refinement must be 'uniform' or 'dimension_adaptive'"
+            raise ValueError(msg)
+        self._p_refinement = value
+
+    def evaluation_count(self, n_variables):
+        """Count the model evaluations needed by the configured study.
+
+        Use this as a dry run to compare the cost of configurations
+        before running an experiment. With p-refinement, the count is
+        for the initial grid only.
+
+        Parameters
+        ----------
+        n_variables : int
+          The number of uncertain variables.
+
+        Returns
+        -------
+        int
+          The number of model evaluations.
+
+        Examples
+        --------
+        Compare a tensor grid with a sparse grid for eight variables:
+
+        >>> m = StochasticCollocation()
+        >>> m.evaluation_count(8)
+        256
+        >>> m.coefficient_estimation_approach = "sparse_grid_level_sequence"
+        >>> m.nested = True
+        >>> m.evaluation_count(8)
+        145
+
+        """
+        approach = self.coefficient_estimation_approach
+        if approach == "quadrature_order_sequence":
+            return _count_tensor_grid(
+                n_variables, self.quadrature_order, self.dimension_preference
+            )
+        return _count_sparse_grid(
+            n_variables,
+            self.sparse_grid_level,
+            self.dimension_preference,
+            self.nested,
+        )
+
     def __str__(self):
         """Define the method block for a stoch_collocation experiment.
 
@@ -172,16 +306,22 @@ class StochasticCollocation(UncertaintyQuantificationBase):
 
         """
         s = UncertaintyQuantificationBase.__str__(self)
-        if self.coefficient_estimation_approach == "quadrature_order_sequence":
+        approach = self.coefficient_estimation_approach
+        if approach == "quadrature_order_sequence":
             s += "    quadrature_order = {}\n".format(self.quadrature_order)
-            if len(self.dimension_preference) > 0:
-                s += "    dimension_preference ="
-                for item in self.dimension_preference:
-                    s += " {}".format(item)
-                s += "\n"
-            if self.nested:
-                s += "    nested\n"
-            else:
-                s += "    non_nested\n"
+        elif approach == "sparse_grid_level_sequence":
+            s += "    sparse_grid_level = {}\n".format(self.sparse_grid_level)
+        if len(self.dimension_preference) > 0:
+            s += "    dimension_preference = {}\n".format(
+                format_vector(self.dimension_preference)
+            )
+        if self.nested:
+            s += "    nested\n"
+        else:
+            s += "    non_nested\n"
+        if self.p_refinement == "uniform":
+            s += "    p_refinement uniform\n"
+        elif self.p_refinement == "dimension_adaptive":
+            s += "    p_refinement dimension_adaptive generalized\n"
         s += "\n"
         return s
@@ -2,7 +2,7 @@
 """Implementation of a Dakota vector parameter study."""
 
 from .base import MethodBase
-from ..utils import to_iterable
+from ..utils import format_vector
 
 
 classname = "VectorParameterStudy"
@@ -81,9 +81,6 @@ class VectorParameterStudy(MethodBase):
 
         """
         s = MethodBase.__str__(self)
-        final_point = to_iterable(self.final_point)
-        s += "    final_point ="
-        for pt in final_point:
-            s += " {}".format(pt)
-        s += "\n" + "    num_steps = {}\n\n".format(self.n_steps)
+        s += "    final_point = {}\n".format(format_vector(self.final_point))
+        s += "    num_steps = {}\n\n".format(self.n_steps)
         return s
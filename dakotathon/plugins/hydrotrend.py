@@ -4,22 +4,101 @@
 import os
 import shutil
 import subprocess
+import warnings
 import numpy as np
 from .base import PluginBase
-from dakotathon.utils import get_response_descriptors, write_results, compute_statistic
+from dakotathon.utils import (
+    call_with_limits,
+    get_limits,
+    get_response_descriptors,
+    get_tool_path,
+    reduce_responses,
+    to_iterable,
+    which,
+    write_results,
+    write_failure,
+)
+from dakotathon.profiling import phase
+from dakotathon.calibration import compute_calibration_terms, load_observations
 
 
 classname = "HydroTrend"
 
+executables = ("hydrotrend", "dprepro")
+
 
 def is_installed():
     """Check whether HydroTrend is in the execution path."""
-    try:
-        subprocess.call(["hydrotrend", "--version"])
-    except OSError:
-        return False
-    else:
-        return True
+    return which("hydrotrend") is not None
+
+
+def read_ascii_output(output_file, columns=None, skiprows=2):
+    """Read the data from a text HydroTrend output file.
+
+    The file is parsed by `numpy.loadtxt`, and only the requested
+    columns are kept.
+
+    Parameters
+    ----------
+    output_file : str
+      The path to a text HydroTrend output file.
+    columns : int or list of int, optional
+      The columns to return; by default, all columns are returned.
+    skiprows : int, optional
+      The number of header lines to skip (default is 2).
+
+    Returns
+    -------
+    ndarray
+      The data, as a 1D array for a single column, otherwise as a
+      2D array with one row per time step.
+
+    Raises
+    ------
+    ValueError
+      If the file holds no data, or its rows have unequal lengths.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile("w", suffix=".txt") as fp:
+    ...     _ = fp.write("h1\\nh2\\n0 10\\n1 11\\n2 12\\n")
+    ...     fp.flush()
+    ...     read_ascii_output(fp.name, columns=1)
+    array([10., 11., 12.])
+
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        values = np.loadtxt(output_file, skiprows=skiprows, usecols=columns)
+    if values.size == 0:
+        raise ValueError("no data in {}".format(output_file))
+    return values
+
+
+def read_binary_output(output_file, dtype="<f4", offset=0):
+    """Read the data from a binary HydroTrend output file.
+
+    Parameters
+    ----------
+    output_file : str
+      The path to a binary HydroTrend output file.
+    dtype : str or numpy.dtype, optional
+      The type of each value in the file (default is little-endian
+      float32).
+    offset : int, optional
+      The size of the file header, in bytes (default is 0).
+
+    Returns
+    -------
+    ndarray
+      The data, as a 1D float64 array.
+
+    """
+    with open(output_file, "rb") as fp:
+        fp.seek(offset)
+        values = np.fromfile(fp, dtype=dtype)
+    return values.astype(float)
 
 
 class HydroTrend(PluginBase):
@@ -35,6 +114,10 @@ class HydroTrend(PluginBase):
         hypsometry_file="HYDRO0.HYPS",
         output_files=None,
         output_statistics=None,
+        output_format="ascii",
+        binary_dtype="<f4",
+        binary_offset=0,
+        output_columns=None,
         **kwargs
     ):
         """Configure a default HydroTrend simulation.
@@ -56,6 +139,18 @@ class HydroTrend(PluginBase):
             HydroTrend output files to analyze.
         output_statistics : str or list or tuple of str, optional
             Statistics to apply to HydroTrend output.
+        output_format : str, optional
+            The format of the output files, either 'ascii' (the
+            default) or 'binary'.
+        binary_dtype : str, optional
+            The type of the values in binary output files (default is
+            little-endian float32, '<f4').
+        binary_offset : int, optional
+            The size of the header of binary output files, in bytes
+            (default is 0).
+        output_columns : int or list of int, optional
+            The columns to read from each text output file (default is
+            None, all columns).
         **kwargs
             Optional keyword arguments.
 
@@ -74,7 +169,15 @@ class HydroTrend(PluginBase):
         self.hypsometry_file = hypsometry_file
         self.output_files = output_files
         self.output_statistics = output_statistics
+        self.output_format = output_format
+        self.binary_dtype = binary_dtype
+        self.binary_offset = binary_offset
+        self.output_columns = output_columns
         self.output_values = []
+        self._series = {}
+        self._tools = {}
+        self._limits = {}
+        self._observations = None
 
     def setup(self, config):
         """Configure HydroTrend inputs.
@@ -92,11 +195,18 @@ class HydroTrend(PluginBase):
         """
         self.setup_files(config)
         self.setup_directories(config)
-        subprocess.call(
-            ["dprepro", config["parameters_file"], self.input_template, self.input_file]
-        )
-        shutil.copy(self.input_file, self.input_dir)
-        shutil.copy(self.hypsometry_file, self.input_dir)
+        with phase("dprepro"):
+            subprocess.call(
+                [
+                    get_tool_path(config, "dprepro"),
+                    config["parameters_file"],
+                    self.input_template,
+                    self.input_file,
+                ]
+            )
+        with phase("copy"):
+            shutil.copy(self.input_file, self.input_dir)
+            shutil.copy(self.hypsometry_file, self.input_dir)
 
     def setup_files(self, config):
         """Configure HydroTrend input and output files.
@@ -111,6 +221,14 @@ class HydroTrend(PluginBase):
         self.hypsometry_file, = config["auxiliary_files"]
         self.output_files = config["response_files"]
         self.output_statistics = config["response_statistics"]
+        self.output_format = config.get("output_format", self.output_format)
+        self.binary_dtype = config.get("binary_dtype", self.binary_dtype)
+        self.binary_offset = config.get("binary_offset", self.binary_offset)
+        self.output_columns = config.get("output_columns", self.output_columns)
+        self._tools = config.get("tools") or {}
+        self._limits = get_limits(config)
+        if config.get("observation_files"):
+            self._observations = load_observations(config)
 
     def setup_directories(self, config):
         """Configure HydroTrend input and output directories.
@@ -131,18 +249,39 @@ class HydroTrend(PluginBase):
             os.mkdir(self.output_dir, 0o755)
 
     def call(self):
-        """Invoke HydroTrend through the shell."""
-        subprocess.call(
-            ["hydrotrend", "--in-dir", self.input_dir, "--out-dir", self.output_dir]
-        )
+        """Invoke HydroTrend through the shell.
+
+        A run that exceeds the experiment's *evaluation_timeout* or
+        *cpu_time_limit* is killed, with any processes it started.
 
-    def load(self, output_file):
-        """Read a column of data from a HydroTrend output file.
+        Raises
+        ------
+        subprocess.TimeoutExpired
+          If the run exceeds the wall-clock time limit.
+        subprocess.CalledProcessError
+          If the run is stopped by a signal, e.g., at the CPU time
+          limit.
+
+        """
+        hydrotrend = get_tool_path({"tools": self._tools}, "hydrotrend")
+        args = [hydrotrend, "--in-dir", self.input_dir, "--out-dir", self.output_dir]
+        status = call_with_limits(args, **self._limits)
+        if status < 0:
+            raise subprocess.CalledProcessError(status, args)
+
+    def load(self, output_file, columns=None):
+        """Read data from a HydroTrend output file.
+
+        A file is read only once while it's unchanged; later calls
+        return the cached data.
 
         Parameters
         ----------
         output_file : str
-          The path to a text HydroTrend output file.
+          The path to a HydroTrend output file.
+        columns : int or list of int, optional
+          The columns to read from a text output file; by default,
+          all columns are read.
 
         Returns
         -------
@@ -151,26 +290,58 @@ class HydroTrend(PluginBase):
 
         """
         try:
-            series = np.loadtxt(output_file, skiprows=2)
-        except (IOError, StopIteration):
+            mtime = os.stat(output_file).st_mtime_ns
+        except OSError:
             return None
-        else:
-            return series
+        if columns is not None:
+            columns = tuple(to_iterable(columns))
+        key = (output_file, mtime, columns)
+        if key not in self._series:
+            try:
+                if self.output_format == "binary":
+                    series = read_binary_output(
+                        output_file, self.binary_dtype, self.binary_offset
+                    )
+                else:
+                    series = read_ascii_output(output_file, columns=columns)
+            except (IOError, ValueError):
+                return None
+            for old in [k for k in self._series if k[0] == output_file]:
+                del self._series[old]
+            self._series[key] = series
+        return self._series[key]
 
     def calculate(self):
-        """Calculate Dakota output functions."""
-        for rfile, rstat in zip(self.output_files, self.output_statistics):
-            shutil.copy(os.path.join(self.output_dir, rfile), os.curdir)
-            series = self.load(rfile)
-            if series is not None:
-                val = compute_statistic(rstat, series)
-                self.output_values.append(val)
-            else:
-                self.output_values.append(float("nan"))
+        """Calculate Dakota output functions.
+
+        Each output file is read once, and all of the statistics
+        computed from it are calculated together. If the experiment
+        has observation files, the residuals of each output series
+        against its observations are calculated instead.
+        """
+
+        def load(rfile):
+            with phase("copy"):
+                shutil.copy(os.path.join(self.output_dir, rfile), os.curdir)
+            with phase("load"):
+                return self.load(rfile, columns=self.output_columns)
+
+        if self._observations is not None:
+            self.output_values.extend(
+                compute_calibration_terms(self.output_files, self._observations, load)
+            )
+        else:
+            self.output_values.extend(
+                reduce_responses(self.output_files, self.output_statistics, load)
+            )
 
     def write(self, params_file, results_file):
         """Write the Dakota results file.
 
+        If a residual couldn't be calculated, because an output series
+        has no value at an observation, the evaluation is reported to
+        Dakota as failed.
+
         Parameters
         ----------
         params_file : str
@@ -179,5 +350,8 @@ class HydroTrend(PluginBase):
           A Dakota results file.
 
         """
+        if self._observations is not None and np.isnan(self.output_values).any():
+            write_failure(results_file)
+            return
         labels = get_response_descriptors(params_file)
         write_results(results_file, self.output_values, labels)
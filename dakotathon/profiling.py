@@ -0,0 +1,284 @@
+#! /usr/bin/env python
+"""Measure where time and memory go in a Dakota evaluation.
+
+The analysis drivers wrap each step of an evaluation in a named
+phase. When an experiment sets an ``evaluation_log``, the drivers
+append one JSON record per evaluation to the log, and
+`summarize_timings` reduces the log to a per-phase breakdown.
+
+"""
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+timing_script = "dakota_timing_summary"
+
+_active = None
+
+
+def _peak_rss(who):
+    """Get the peak resident set size, in KB, or None if unavailable."""
+    if resource is None:
+        return None
+    if who == "children":
+        peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    else:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return peak
+
+
+def process_age():
+    """Get the time since the current process started.
+
+    Returns
+    -------
+    float or None
+      The elapsed wall-clock time, in seconds, or None if the
+      process start time can't be determined on this platform.
+
+    """
+    try:
+        with open("/proc/self/stat", "r") as fp:
+            fields = fp.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", "r") as fp:
+            uptime = float(fp.read().split()[0])
+        start = float(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (IOError, OSError, IndexError, ValueError, AttributeError):
+        return None
+    else:
+        return max(uptime - start, 0.0)
+
+
+class EvaluationTimer(object):
+
+    """Record phase timings and peak memory for one evaluation.
+
+    Used as a context manager, the timer becomes the target of the
+    module-level `phase` function, so that plugins can time their own
+    steps without being passed the timer. Phases may be nested; a
+    nested phase is named after its parent, e.g., ``setup.dprepro``.
+
+    Examples
+    --------
+    Time two phases of an evaluation:
+
+    >>> with EvaluationTimer(eval_id=1) as timer:
+    ...     with phase("setup"):
+    ...         pass
+    ...     with phase("call"):
+    ...         pass
+    >>> sorted(timer.phases)
+    ['call', 'setup']
+
+    """
+
+    def __init__(self, eval_id=None):
+        """Create a timer for an evaluation.
+
+        Parameters
+        ----------
+        eval_id : int, optional
+          The Dakota evaluation id.
+
+        """
+        self.eval_id = eval_id
+        self.phases = {}
+        self.status = "running"
+        self.startup = process_age()
+        self._stack = []
+        self._start = None
+        self._elapsed = None
+        self._previous = None
+
+    def __enter__(self):
+        global _active
+        self._previous, _active = _active, self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        global _active
+        self._elapsed = time.perf_counter() - self._start
+        self.status = "ok" if exc_type is None else exc_type.__name__
+        _active = self._previous
+        return False
+
+    @contextmanager
+    def phase(self, name):
+        """Time a named phase of the evaluation.
+
+        Parameters
+        ----------
+        name : str
+          The name of the phase.
+
+        """
+        self._stack.append(name)
+        key = ".".join(self._stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[key] = self.phases.get(key, 0.0) + elapsed
+            self._stack.pop()
+
+    def record(self):
+        """Get the timings for the evaluation as a dict."""
+        return {
+            "eval_id": self.eval_id,
+            "status": self.status,
+            "startup": self.startup,
+            "elapsed": self._elapsed,
+            "phases": self.phases,
+            "peak_rss_kb": _peak_rss("self"),
+            "peak_child_rss_kb": _peak_rss("children"),
+        }
+
+    def write(self, log_file):
+        """Append the timings for the evaluation to a JSON-lines log.
+
+        Parameters
+        ----------
+        log_file : str
+          The path to the log file.
+
+        """
+        line = json.dumps(self.record()) + "\n"
+        with open(log_file, "a") as fp:
+            fp.write(line)
+
+
+@contextmanager
+def phase(name):
+    """Time a named phase with the active timer, if there is one.
+
+    Parameters
+    ----------
+    name : str
+      The name of the phase.
+
+    """
+    if _active is None:
+        yield
+    else:
+        with _active.phase(name):
+            yield
+
+
+def get_evaluation_log(config):
+    """Get the path to the evaluation log for an experiment.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+
+    Returns
+    -------
+    str or None
+      The path to the log, or None if timings aren't logged.
+
+    """
+    log_file = config.get("evaluation_log")
+    if not log_file:
+        return None
+    return os.path.join(config.get("run_directory", os.curdir), log_file)
+
+
+def summarize_timings(log_file, percentiles=(50, 90, 99)):
+    """Summarize the timings in an evaluation log.
+
+    Parameters
+    ----------
+    log_file : str
+      The path to a JSON-lines evaluation log.
+    percentiles : list or tuple of numbers, optional
+      Percentiles of phase times to report (default is 50, 90, 99).
+
+    Returns
+    -------
+    dict
+      The number of evaluations, a count of each exit status, and,
+      for each phase, the total, mean, and percentiles of its time,
+      and its fraction of the time spent in top-level phases. The
+      start-up time, elapsed time, and peak memory of the evaluations
+      are summarized apart from the phases, under ``evaluation``, by
+      their mean, maximum, and percentiles.
+
+    """
+    import numpy as np
+
+    with open(log_file, "r") as fp:
+        records = [json.loads(line) for line in fp if line.strip()]
+
+    status = {}
+    times = {}
+    measures = {}
+    for record in records:
+        status[record["status"]] = status.get(record["status"], 0) + 1
+        for name, value in record["phases"].items():
+            times.setdefault(name, []).append(value)
+        for name in ("startup", "elapsed", "peak_rss_kb", "peak_child_rss_kb"):
+            if record.get(name) is not None:
+                measures.setdefault(name, []).append(record[name])
+
+    top_level = [name for name in times if "." not in name]
+    top_level_total = sum(sum(times[name]) for name in top_level)
+
+    phases = {}
+    for name, values in times.items():
+        arr = np.asarray(values, dtype=float)
+        summary = {"total": float(arr.sum()), "mean": float(arr.mean())}
+        for q, v in zip(percentiles, np.percentile(arr, percentiles)):
+            summary["p{}".format(q)] = float(v)
+        if name in top_level and top_level_total > 0:
+            summary["fraction"] = summary["total"] / top_level_total
+        phases[name] = summary
+
+    evaluation = {}
+    for name, values in measures.items():
+        arr = np.asarray(values, dtype=float)
+        summary = {"mean": float(arr.mean()), "max": float(arr.max())}
+        for q, v in zip(percentiles, np.percentile(arr, percentiles)):
+            summary["p{}".format(q)] = float(v)
+        evaluation[name] = summary
+
+    return {
+        "evaluations": len(records),
+        "status": status,
+        "phases": phases,
+        "evaluation": evaluation,
+    }
+
+
+def main():
+    """Handle arguments to the `dakota_timing_summary` console script."""
+    import argparse
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        description="Summarize the timings in a Dakota evaluation log."
+    )
+    parser.add_argument("log_file", help="JSON-lines evaluation log")
+    parser.add_argument(
+        "--version", action="version", version=timing_script + " " + __version__
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(summarize_timings(args.log_file), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#! /usr/bin/env python
+"""Find and load the model plugins that Dakota can call.
+
+Plugins are modules that follow the protocol of the modules in
+`dakotathon.plugins`: each defines a `classname` attribute that names
+a subclass of `dakotathon.plugins.base.PluginBase`, and an
+`is_installed` function that reports whether the model can be run.
+A plugin may also list the commands it runs in an `executables`
+attribute; their paths are recorded when an experiment is set up.
+
+Besides the built-in plugins, a third-party package can provide a
+plugin by naming its module in the ``dakotathon.plugins`` entry point
+group, e.g., in its setup.py::
+
+    entry_points={
+        "dakotathon.plugins": ["mymodel = mypackage.dakota_plugin"],
+    }
+
+Scanning the installed distributions for entry points is slow, so the
+result is cached on disk and rescanned only when a directory on the
+Python path that holds distributions changes. Nothing is scanned, or imported, until a plugin
+is asked for.
+
+"""
+
+import os
+import sys
+import json
+import tempfile
+import importlib
+
+
+entry_point_group = "dakotathon.plugins"
+
+builtin_plugins = {"hydrotrend": "dakotathon.plugins.hydrotrend"}
+"""Plugins distributed with dakotathon, by name."""
+
+_plugins_path = "dakotathon.plugins."
+
+_index = None
+
+
+def _cache_file():
+    """Get the path to the cached plugin index."""
+    cache_dir = os.environ.get("DAKOTATHON_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "dakotathon")
+    return os.path.join(cache_dir, "plugins.json")
+
+
+def _path_key():
+    """Describe the Python path, to tell when the cached index is stale.
+
+    Installing or removing a distribution changes the modification
+    time of the directory it's installed in. Only the directories
+    that hold distributions are described; the current directory,
+    which is on the path when a driver is run with ``-m`` and differs
+    for each evaluation, is left out.
+    """
+    cwd = os.getcwd()
+    key = []
+    for path in sys.path:
+        if not path or os.path.abspath(path) == cwd:
+            continue
+        try:
+            names = os.listdir(path)
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        if any(name.endswith((".dist-info", ".egg-info")) for name in names):
+            key.append([path, mtime])
+    return key
+
+
+def _scan_entry_points():
+    """Get the plugins advertised by installed distributions."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        import pkg_resources
+
+        return {
+            ep.name: ep.module_name
+            for ep in pkg_resources.iter_entry_points(entry_point_group)
+        }
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        eps = eps.select(group=entry_point_group)
+    else:
+        eps = eps.get(entry_point_group, [])
+    return {ep.name: ep.value.split(":")[0].strip() for ep in eps}
+
+
+def _write_cache(cache_file, cache):
+    """Replace the cached plugin index, so readers never see a torn file."""
+    cache_dir = os.path.dirname(cache_file)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            json.dump(cache, fp)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+
+
+def get_plugin_index(refresh=False):
+    """Get the names and modules of the installed plugins.
+
+    Parameters
+    ----------
+    refresh : bool, optional
+      Set to rescan the installed distributions, ignoring the cached
+      index (default is False).
+
+    Returns
+    -------
+    dict
+      The module that provides each plugin, by plugin name.
+
+    """
+    global _index
+    if _index is not None and not refresh:
+        return _index
+
+    cache_file = _cache_file()
+    key = _path_key()
+    plugins = None
+    if not refresh:
+        try:
+            with open(cache_file, "r") as fp:
+                cache = json.load(fp)
+        except (IOError, OSError, ValueError):
+            pass
+        else:
+            if cache.get("key") == key:
+                plugins = cache.get("plugins")
+
+    if plugins is None:
+        plugins = _scan_entry_points()
+        try:
+            _write_cache(cache_file, {"key": key, "plugins": plugins})
+        except (IOError, OSError):
+            pass
+
+    _index = dict(plugins)
+    _index.update(builtin_plugins)
+    return _index
+
+
+def list_plugins():
+    """Get the names of the installed plugins.
+
+    Returns
+    -------
+    list of str
+      The plugin names, in alphabetical order.
+
+    """
+    return sorted(get_plugin_index())
+
+
+def load_plugin(name):
+    """Import the module that provides a plugin.
+
+    Built-in plugins and modules in `dakotathon.plugins` are found
+    without consulting the plugin index.
+
+    Parameters
+    ----------
+    name : str
+      The name of the plugin.
+
+    Returns
+    -------
+    module
+      The plugin module.
+
+    Raises
+    ------
+    ImportError
+      If no plugin has the given name.
+
+    Examples
+    --------
+    >>> load_plugin("hydrotrend").classname
+    'HydroTrend'
+
+    """
+    if name in builtin_plugins:
+        return importlib.import_module(builtin_plugins[name])
+
+    try:
+        return importlib.import_module(_plugins_path + name)
+    except ImportError as error:
+        if getattr(error, "name", _plugins_path + name) != _plugins_path + name:
+            raise
+
+    index = get_plugin_index()
+    if name not in index:
+        index = get_plugin_index(refresh=True)
+    if name not in index:
+        raise ImportError("No plugin named {!r}".format(name))
+    return importlib.import_module(index[name])
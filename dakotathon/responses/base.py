@@ -1,6 +1,7 @@
 """An abstract base class for all Dakota responses."""
 
 from abc import ABCMeta, abstractmethod
+from ..utils import to_iterable
 
 
 class ResponsesBase(object):
@@ -16,6 +17,8 @@ class ResponsesBase(object):
         response_descriptors=(),
         gradients="no_gradients",
         hessians="no_hessians",
+        fd_gradient_step_size=0.001,
+        interval_type="forward",
         **kwargs
     ):
         """Create a default response.
@@ -27,15 +30,27 @@ class ResponsesBase(object):
         response_descriptors : str or tuple or list of str, optional
             Labels attached to the responses.
         gradients : str, optional
-            Gradient type (default is 'no_gradients').
+            Gradient type (default is 'no_gradients'). With
+            'analytic_gradients', the analysis driver computes the
+            gradients by finite differences; see
+            `dakotathon.gradients`.
         hessians : str, optional
             Hessian type (default is 'no_hessians').
+        fd_gradient_step_size : float, optional
+            The relative step of the finite differences, computed by
+            Dakota with 'numerical_gradients', or by the driver
+            (default is 0.001).
+        interval_type : str, optional
+            The type of finite differences, either 'forward' or
+            'central' (default is 'forward').
 
         """
         self.responses = responses
         self._response_descriptors = response_descriptors
         self.gradients = gradients
         self.hessians = hessians
+        self.fd_gradient_step_size = fd_gradient_step_size
+        self.interval_type = interval_type
 
     @property
     def response_descriptors(self):
@@ -58,6 +73,20 @@ class ResponsesBase(object):
             raise TypeError("Descriptors must be a string, tuple or list")
         self._response_descriptors = value
 
+    @property
+    def num_responses(self):
+        """Number of response values reported in each evaluation."""
+        return len(to_iterable(self.response_descriptors))
+
+    def _print_gradients(self):
+        """Define the gradients section of the responses block."""
+        s = "  {}\n".format(self.gradients)
+        if self.gradients == "numerical_gradients":
+            s += "    method_source dakota\n"
+            s += "    interval_type = {}\n".format(self.interval_type)
+            s += "    fd_gradient_step_size = {}\n".format(self.fd_gradient_step_size)
+        return s
+
     def __str__(self):
         """Define the responses block of a Dakota input file."""
         s = "responses\n"
@@ -0,0 +1,290 @@
+"""Implementation of the Dakota calibration_terms response type."""
+
+import os
+from .base import ResponsesBase
+from ..utils import to_iterable, format_vector
+
+
+classname = "CalibrationTerms"
+
+
+class CalibrationTerms(ResponsesBase):
+
+    """Define attributes for Dakota calibration terms.
+
+    Calibration terms are model responses that a calibration method
+    matches to observations. With a *calibration_data_file*, the
+    responses are the model's predictions of the observations, and
+    Dakota forms the residuals; without one, the responses are the
+    residuals themselves. The terms are squared, optionally weighted,
+    and summed into the objective minimized by the method.
+
+    With *observation_files*, one per response file, the analysis
+    driver computes the residuals of each model output series against
+    an observed series, and each response is a field of residuals,
+    one per observation; see `dakotathon.calibration`.
+
+    """
+
+    def __init__(
+        self,
+        response_descriptors=("y1",),
+        response_files=(),
+        response_statistics=("mean",),
+        calibration_data_file=None,
+        calibration_data_format="freeform",
+        num_experiments=1,
+        weights=None,
+        observation_files=(),
+        **kwargs
+    ):
+        """Create a response using calibration terms.
+
+        Parameters
+        ----------
+        response_descriptors : str or tuple or list of str, optional
+            Labels attached to the responses.
+        response_files : str or tuple or list of str, optional
+            Model output files from which responses are calculated.
+        response_statistics : str or tuple or list of str, optional
+            Statistics used to generate responses.
+        calibration_data_file : str, optional
+            Path to a file of observations, one row per experiment,
+            with a value for each response.
+        calibration_data_format : str, optional
+            The format of the calibration data file: 'freeform' (the
+            default), a table of values, or 'annotated', with a
+            header line and leading columns of evaluation ids and
+            interface ids.
+        num_experiments : int, optional
+            The number of experiments in the calibration data file
+            (default is 1).
+        weights : tuple or list of float, optional
+            Multipliers of the squared calibration terms.
+        observation_files : str or tuple or list of str, optional
+            Observed series, one per response file, against which the
+            analysis driver computes residuals. Exclusive of
+            `calibration_data_file`.
+        **kwargs
+            Optional keyword arguments.
+
+        Examples
+        --------
+        Create a CalibrationTerms instance:
+
+        >>> f = CalibrationTerms()
+
+        """
+        ResponsesBase.__init__(self, **kwargs)
+        self.responses = self.__module__.rsplit(".")[-1]
+        self._response_descriptors = response_descriptors
+        self._response_files = response_files
+        self._response_statistics = response_statistics
+        self._calibration_data_file = None
+        self._calibration_data_format = calibration_data_format
+        self._num_experiments = num_experiments
+        self._weights = weights
+        self._observation_files = ()
+
+        if calibration_data_file is not None:
+            self.calibration_data_file = calibration_data_file
+        if observation_files:
+            self.observation_files = observation_files
+        if self.calibration_data_file and self.observation_files:
+            msg = "The calibration_data_file and observation_files are exclusive."
+            raise ValueError(msg)
+
+    @property
+    def response_files(self):
+        """Model output files used in Dakota responses."""
+        return self._response_files
+
+    @response_files.setter
+    def response_files(self, value):
+        """Set model output files used in Dakota responses.
+
+        Parameters
+        ----------
+        value : str, or list or tuple of str
+          The new response files.
+
+        """
+        if type(value) is str:
+            value = (value,)
+        if not isinstance(value, (tuple, list)):
+            raise TypeError("Response files must be a string, tuple, or list")
+        self._response_files = value
+
+    @property
+    def response_statistics(self):
+        """Statistics used to calculate Dakota responses."""
+        return self._response_statistics
+
+    @response_statistics.setter
+    def response_statistics(self, value):
+        """Set statistics used to calculate Dakota responses.
+
+        Parameters
+        ----------
+        value : str, or list or tuple of str
+          The new response statistics.
+
+        """
+        if type(value) is str:
+            value = (value,)
+        if not isinstance(value, (tuple, list)):
+            raise TypeError("Response statistics must be a string, tuple, or list")
+        self._response_statistics = value
+
+    @property
+    def calibration_data_file(self):
+        """Path to the file of observations."""
+        return self._calibration_data_file
+
+    @calibration_data_file.setter
+    def calibration_data_file(self, value):
+        """Set the path to the file of observations.
+
+        Parameters
+        ----------
+        value : str
+          The new file path.
+
+        """
+        if not isinstance(value, str):
+            raise TypeError("Calibration data file must be a str")
+        self._calibration_data_file = os.path.abspath(value)
+
+    @property
+    def calibration_data_format(self):
+        """Format of the calibration data file."""
+        return self._calibration_data_format
+
+    @calibration_data_format.setter
+    def calibration_data_format(self, value):
+        """Set the format of the calibration data file.
+
+        Parameters
+        ----------
+        value : str
+          Either 'freeform' or 'annotated'.
+
+        """
+        if value not in ("freeform", "annotated"):
+            raise TypeError("Calibration data format must be 'freeform' or 'annotated'")
+        self._calibration_data_format = value
+
+    @property
+    def num_experiments(self):
+        """Number of experiments in the calibration data file."""
+        return self._num_experiments
+
+    @num_experiments.setter
+    def num_experiments(self, value):
+        """Set the number of experiments in the calibration data file.
+
+        Parameters
+        ----------
+        value : int
+          The number of experiments.
+
+        """
+        if type(value) is not int:
+            raise TypeError("Number of experiments must be an int")
+        self._num_experiments = value
+
+    @property
+    def weights(self):
+        """Multipliers of the squared calibration terms."""
+        return self._weights
+
+    @weights.setter
+    def weights(self, value):
+        """Set multipliers of the squared calibration terms.
+
+        Parameters
+        ----------
+        value : tuple or list of float
+          The new weights, one per response.
+
+        """
+        if not isinstance(value, (tuple, list)):
+            raise TypeError("Weights must be a tuple or a list")
+        self._weights = value
+
+    @property
+    def observation_files(self):
+        """Observed series against which residuals are computed."""
+        return self._observation_files
+
+    @observation_files.setter
+    def observation_files(self, value):
+        """Set the observed series against which residuals are computed.
+
+        Parameters
+        ----------
+        value : str, or list or tuple of str
+          The new observation files, one per response file.
+
+        """
+        if type(value) is str:
+            value = (value,)
+        if not isinstance(value, (tuple, list)):
+            raise TypeError("Observation files must be a string, tuple, or list")
+        self._observation_files = tuple(os.path.abspath(item) for item in value)
+
+    @property
+    def lengths(self):
+        """Number of residuals in each response, from the observation files."""
+        from ..calibration import read_observations
+
+        return [len(read_observations(item)[0]) for item in self.observation_files]
+
+    @property
+    def num_responses(self):
+        """Number of residuals reported in each evaluation."""
+        if self.observation_files:
+            return sum(self.lengths)
+        return ResponsesBase.num_responses.fget(self)
+
+    def __str__(self):
+        """Define the responses block of a Dakota input file.
+
+        Examples
+        --------
+        Display the responses block created by a default instance of
+        CalibrationTerms:
+
+        >>> f = CalibrationTerms()
+        >>> print(f)
+        responses
+          calibration_terms = 1
+            response_descriptors = 'y1'
+          no_gradients
+          no_hessians
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.responses.base.ResponsesBase.__str__
+
+        """
+        descriptors = to_iterable(self.response_descriptors)
+        s = ResponsesBase.__str__(self)
+        s += "  calibration_terms = {}\n".format(len(descriptors))
+        if self.observation_files:
+            if len(self.observation_files) != len(descriptors):
+                raise ValueError("Observation files must have one item per response")
+            s += "    field_calibration_terms = {}\n".format(len(descriptors))
+            s += "      lengths = {}\n".format(format_vector(self.lengths))
+        s += "    response_descriptors = {}\n".format(
+            format_vector(descriptors, fmt="{!r}")
+        )
+        if self.weights is not None:
+            s += "    weights = {}\n".format(format_vector(self.weights))
+        if self.calibration_data_file is not None:
+            s += "    calibration_data_file = {!r}\n".format(self.calibration_data_file)
+            s += "      {}\n".format(self.calibration_data_format)
+            s += "      num_experiments = {}\n".format(self.num_experiments)
+        s += self._print_gradients() + "  {}\n".format(self.hessians)
+        return s
@@ -1,7 +1,7 @@
 """Implementation of the Dakota response_function response type."""
 
 from .base import ResponsesBase
-from ..utils import to_iterable
+from ..utils import to_iterable, format_vector
 
 
 classname = "ResponseFunctions"
@@ -97,8 +97,8 @@ class ResponseFunctions(ResponsesBase):
         descriptors = to_iterable(self.response_descriptors)
         s = ResponsesBase.__str__(self)
         s += "  response_functions = {}\n".format(len(descriptors))
-        s += "    response_descriptors ="
-        for rd in descriptors:
-            s += " {!r}".format(rd)
-        s += "\n" + "  {}\n".format(self.gradients) + "  {}\n".format(self.hessians)
+        s += "    response_descriptors = {}\n".format(
+            format_vector(descriptors, fmt="{!r}")
+        )
+        s += self._print_gradients() + "  {}\n".format(self.hessians)
         return s
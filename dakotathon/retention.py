@@ -0,0 +1,344 @@
+#! /usr/bin/env python
+"""Decide which evaluation directories to keep, and pack them away.
+
+By default, Dakota keeps the work directory of every evaluation, which
+can exhaust the disk, or its inodes, over a long study. A fork
+interface's *retention* policy sets which directories are kept:
+
+* ``all`` -- keep every directory (the default);
+* ``none`` -- keep none; Dakota removes each directory when it has
+  read the results;
+* ``failures`` -- keep the directories of failed evaluations;
+* ``every`` -- keep every Nth directory, and those of failed
+  evaluations;
+* ``compress`` -- keep every directory, packed into a single archive.
+
+The analysis driver removes the files of an evaluation that isn't
+kept, as soon as it has written the results. A `Compactor`, run in the
+background by `dakotathon.dakota.Dakota.run`, then removes the emptied
+directories, including the ``eval.<id>`` directories of the
+evaluations of a batch, and packs the kept directories into a zip
+archive, whose central directory serves as an index of the
+evaluations.
+
+When the work directories are placed in node-local scratch space, the
+`Compactor` also syncs the kept directories, or the archive, and the
+results of every evaluation back to the run directory.
+
+"""
+
+import os
+import re
+import time
+import shutil
+import zipfile
+import threading
+
+
+retention_policies = ("all", "none", "failures", "every", "compress")
+
+archive_suffix = ".zip"
+
+pruned_marker = ".pruned"
+"""Marks the directory of an evaluation whose files were removed."""
+
+
+def should_keep(config, eval_id, failed=False):
+    """Check whether the directory of an evaluation is kept.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    eval_id : int or None
+      The evaluation id.
+    failed : bool, optional
+      Set if the evaluation failed (default is False).
+
+    Returns
+    -------
+    bool
+      True if the evaluation's files are kept.
+
+    Examples
+    --------
+    >>> config = {"retention": "every", "retention_interval": 10}
+    >>> [should_keep(config, i) for i in (1, 2, 11)]
+    [True, False, True]
+
+    """
+    policy = config.get("retention") or "all"
+    if policy in ("all", "compress"):
+        return True
+    if policy == "none":
+        return False
+    if failed:
+        return True
+    if policy == "every" and eval_id is not None:
+        interval = config.get("retention_interval") or 1
+        return (int(eval_id) - 1) % interval == 0
+    return False
+
+
+def _is_work_directory(config, directory):
+    """Check that a directory was made by Dakota for an evaluation."""
+    name = os.path.basename(os.path.abspath(directory))
+    work_folder = os.path.basename(config.get("work_directory") or "run")
+    return re.match(r"^({}|eval)\.\d+$".format(re.escape(work_folder)), name)
+
+
+def prune_evaluation(config, params_file, results_file, failed=False):
+    """Remove the files of an evaluation that isn't kept.
+
+    The parameters and results files are left for Dakota, and the
+    directory is marked for removal by a `Compactor`. Nothing is
+    removed outside of a work directory made by Dakota.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    params_file : str
+      The path to the evaluation's parameters file.
+    results_file : str
+      The path to the evaluation's results file.
+    failed : bool, optional
+      Set if the evaluation failed (default is False).
+
+    Returns
+    -------
+    bool
+      True if files were removed.
+
+    """
+    from .utils import get_evaluation_id
+
+    if config.get("retention") in (None, "all", "compress"):
+        return False
+    directory = os.path.dirname(os.path.abspath(params_file))
+    if not _is_work_directory(config, directory):
+        return False
+    try:
+        eval_id = get_evaluation_id(params_file)
+    except (IOError, OSError):
+        eval_id = None
+    if should_keep(config, eval_id, failed):
+        return False
+
+    spared = {os.path.basename(params_file), os.path.basename(results_file)}
+    for name in os.listdir(directory):
+        if name in spared:
+            continue
+        path = os.path.join(directory, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    open(os.path.join(directory, pruned_marker), "w").close()
+    return True
+
+
+def get_archive_index(archive_file):
+    """List the evaluation directories packed in an archive.
+
+    Parameters
+    ----------
+    archive_file : str
+      The path to an archive written by a `Compactor`.
+
+    Returns
+    -------
+    dict
+      The names of the files of each evaluation directory, by
+      directory name.
+
+    """
+    index = {}
+    with zipfile.ZipFile(archive_file, "r") as archive:
+        for name in archive.namelist():
+            tag, _, member = name.partition("/")
+            index.setdefault(tag, []).append(member)
+    return index
+
+
+class Compactor(threading.Thread):
+
+    """Tidy the work directories of a running experiment.
+
+    Directories marked by `prune_evaluation` are removed, as are the
+    marked ``eval.<id>`` directories inside the directory of a batch,
+    once the batch has finished. With the
+    ``compress`` policy, each directory is packed into the archive and
+    then removed. A directory is only touched once its results file
+    is older than `delay`, so that Dakota has read the results.
+
+    If the work directories are in node-local space, kept directories
+    are moved to the `destination`, the archive is written beside it,
+    and the results files of the other directories are appended to a
+    single file, ``<destination>.results``.
+
+    Examples
+    --------
+    Tidy the work directories while Dakota runs:
+
+    >>> compactor = Compactor("/path/to/run", "failures")  # doctest: +SKIP
+    >>> compactor.start()  # doctest: +SKIP
+    >>> compactor.stop()  # doctest: +SKIP
+
+    """
+
+    def __init__(
+        self,
+        work_directory,
+        policy,
+        results_file="results.out",
+        interval=5.0,
+        delay=30.0,
+        destination=None,
+    ):
+        """Create a compactor.
+
+        Parameters
+        ----------
+        work_directory : str
+          The interface's work directory; evaluations are run in
+          tagged copies, e.g., ``run.1``.
+        policy : str
+          The retention policy.
+        results_file : str, optional
+          The name of the results file (default is **results.out**).
+        interval : float, optional
+          The time between passes, in seconds (default is 5).
+        delay : float, optional
+          The age of a results file, in seconds, after which its
+          directory is tidied (default is 30).
+        destination : str, optional
+          The work directory in the run directory, if the work
+          directories are placed elsewhere (default is None).
+
+        """
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.work_directory = os.path.abspath(work_directory)
+        self.policy = policy
+        self.results_file = results_file
+        self.interval = interval
+        self.delay = delay
+        self.destination = destination and os.path.abspath(destination)
+        self.archive_file = (self.destination or self.work_directory) + archive_suffix
+        self._pattern = re.compile(
+            r"^{}\.(\d+)$".format(re.escape(os.path.basename(self.work_directory)))
+        )
+        self._stopped = threading.Event()
+
+    def _finished(self, delay):
+        """Get the tagged directories whose results are older than a delay."""
+        parent = os.path.dirname(self.work_directory)
+        now = time.time()
+        finished = []
+        for name in os.listdir(parent):
+            match = self._pattern.match(name)
+            if match is None:
+                continue
+            path = os.path.join(parent, name)
+            try:
+                mtime = os.stat(os.path.join(path, self.results_file)).st_mtime
+            except OSError:
+                continue
+            if now - mtime >= delay:
+                finished.append((int(match.group(1)), name, path))
+        return sorted(finished)
+
+    def compact(self, delay=None):
+        """Make one pass over the work directories.
+
+        Parameters
+        ----------
+        delay : float, optional
+          Override the compactor's `delay`, e.g., with 0 once Dakota
+          has finished.
+
+        Returns
+        -------
+        int
+          The number of directories removed.
+
+        """
+        parent = os.path.dirname(self.work_directory)
+        finished = self._finished(self.delay if delay is None else delay)
+        removed = 0
+        archive = None
+        try:
+            for _, name, path in finished:
+                pruned = os.path.exists(os.path.join(path, pruned_marker))
+                if self.policy != "compress" and not pruned:
+                    removed += self._remove_pruned(name, path)
+                if self.policy == "compress":
+                    if archive is None:
+                        archive = zipfile.ZipFile(
+                            self.archive_file, "a", zipfile.ZIP_DEFLATED
+                        )
+                    for root, _, files in os.walk(path):
+                        for filename in files:
+                            full = os.path.join(root, filename)
+                            archive.write(full, os.path.relpath(full, parent))
+                elif self.destination is None:
+                    if not pruned:
+                        continue
+                elif pruned:
+                    self._sync_results(name, path)
+                else:
+                    target = os.path.join(os.path.dirname(self.destination), name)
+                    if os.path.isdir(target):
+                        shutil.rmtree(target)
+                    shutil.copytree(path, target)
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        finally:
+            if archive is not None:
+                archive.close()
+        return removed
+
+    def _remove_pruned(self, name, path):
+        """Remove the marked evaluation directories of a batch."""
+        removed = 0
+        for child in sorted(os.listdir(path)):
+            nested = os.path.join(path, child)
+            if not re.match(r"^eval\.\d+$", child):
+                continue
+            if not os.path.exists(os.path.join(nested, pruned_marker)):
+                continue
+            if self.destination is not None:
+                self._sync_results(name + "/" + child, nested)
+            shutil.rmtree(nested, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def _sync_results(self, name, path):
+        """Append the results file of a directory to the synced results."""
+        try:
+            with open(os.path.join(path, self.results_file), "r") as fp:
+                text = fp.read()
+        except (IOError, OSError):
+            return
+        with open(self.destination + ".results", "a") as fp:
+            fp.write("# {}\n".format(name) + text.rstrip("\n") + "\n")
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.compact()
+
+    def stop(self):
+        """Stop the background passes, and tidy every directory left."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+        self.compact(delay=0)
+        if self.destination is not None:
+            try:
+                os.rmdir(os.path.dirname(self.work_directory))
+            except OSError:
+                pass
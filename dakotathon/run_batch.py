@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""Defines the `dakota_run_batch` console script."""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from .utils import get_configuration_file, deserialize
+
+
+batch_script = "dakota_run_batch"
+
+_block_start = re.compile(r"^\s*\d+\s+variables\s*$", re.MULTILINE)
+
+
+def split_params_file(params_file):
+    """Split a Dakota batch parameters file into its evaluations.
+
+    Parameters
+    ----------
+    params_file : str
+      The path to a parameters file written by Dakota in batch mode.
+
+    Returns
+    -------
+    list of str
+      The text of the parameters file of each evaluation.
+
+    """
+    with open(params_file, "r") as fp:
+        text = fp.read()
+    starts = [match.start() for match in _block_start.finditer(text)]
+    return [text[i:j] for i, j in zip(starts, starts[1:] + [len(text)])]
+
+
+def _get_eval_id(params_text, default):
+    """Read the evaluation id from the text of a parameters file."""
+    for line in reversed(params_text.splitlines()):
+        items = line.split()
+        if len(items) == 2 and items[1].endswith("eval_id"):
+            return items[0]
+    return str(default)
+
+
+def _warm_up(driver, name):
+    """Import the model in a new worker, before its first evaluation."""
+    if driver == "plugin":
+        from .registry import load_plugin
+
+        try:
+            load_plugin(name)
+        except ImportError:
+            pass
+
+
+def _evaluate(driver, eval_dir, params_text, params_file, results_file):
+    """Run one evaluation of a batch in its own directory.
+
+    Returns the text of the results file, or ``fail`` if the
+    evaluation raised an error, so that the rest of the batch
+    survives a failed evaluation.
+    """
+    if driver == "plugin":
+        from .run_plugin import run_plugin as run
+    else:
+        from .run_component import run_component as run
+
+    if not os.path.isdir(eval_dir):
+        os.makedirs(eval_dir)
+    start_dir = os.getcwd()
+    os.chdir(eval_dir)
+    try:
+        with open(params_file, "w") as fp:
+            fp.write(params_text)
+        run(params_file, results_file)
+        with open(results_file, "r") as fp:
+            text = fp.read()
+        return text if text.endswith("\n") else text + "\n"
+    except Exception:
+        return "fail\n"
+    finally:
+        os.chdir(start_dir)
+
+
+def run_batch(params_file, results_file, max_workers=None):
+    """Evaluate a batch of Dakota evaluations concurrently.
+
+    Parameters
+    ----------
+    params_file : str
+      The path to the batch parameters file created by Dakota.
+    results_file : str
+      The path to the batch results file returned to Dakota.
+    max_workers : int, optional
+      The number of worker processes (default is the experiment's
+      *evaluation_concurrency*).
+
+    Notes
+    -----
+    When an experiment's fork interface sets *batch*, Dakota calls
+    this script once per batch. The parameters file holds the
+    parameters of each evaluation in the batch, one after the other.
+
+    Each evaluation is run by `run_plugin` or `run_component` in its
+    own subdirectory, ``eval.<id>``, of the batch's work directory.
+    The evaluations are run by a pool of worker processes that import
+    the model once, when they start. Evaluations are handed out one at
+    a time, so a worker that finishes a short evaluation takes the
+    next one while another is still busy with a long one.
+
+    If the experiment lists *agents*, the evaluations are instead
+    farmed out to them with a `dakotathon.dispatch.Dispatcher`.
+
+    The results of the evaluations are written to the results file in
+    the order of the batch, separated by lines starting with ``#``. An
+    evaluation that fails is reported to Dakota as ``fail``.
+
+    """
+    blocks = split_params_file(params_file)
+    config = deserialize(get_configuration_file(params_file))
+    if config.get("agents"):
+        _dispatch(blocks, config, results_file)
+        return
+    if config.get("component"):
+        driver, name = "component", config["component"]
+    else:
+        driver, name = "plugin", config.get("plugin")
+    if max_workers is None:
+        max_workers = config.get("evaluation_concurrency") or 1
+    max_workers = max(min(int(max_workers), len(blocks)), 1)
+
+    params_name = os.path.basename(params_file)
+    results_name = os.path.basename(results_file)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_warm_up, initargs=(driver, name)
+    ) as executor:
+        futures = []
+        for i, block in enumerate(blocks):
+            eval_dir = os.path.abspath("eval." + _get_eval_id(block, i + 1))
+            futures.append(
+                executor.submit(
+                    _evaluate, driver, eval_dir, block, params_name, results_name
+                )
+            )
+        results = [future.result() for future in futures]
+
+    _write_results(results_file, results)
+
+
+def _dispatch(blocks, config, results_file):
+    """Evaluate a batch on the experiment's agents."""
+    from .dispatch import Dispatcher
+
+    results = ["fail\n"] * len(blocks)
+    with Dispatcher(config["agents"]) as dispatcher:
+        dispatcher.stage(config)
+        for i, text in dispatcher.evaluate(blocks):
+            results[i] = text if text.endswith("\n") else text + "\n"
+    _write_results(results_file, results)
+
+
+def _write_results(results_file, results):
+    """Write the results of a batch, separated by ``#`` lines."""
+    with open(results_file, "w") as fp:
+        fp.write("#\n".join(results))
+
+
+def main():
+    """Handle arguments to the `dakota_run_batch` console script."""
+    import argparse
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        description="An analysis driver for batches of Dakota evaluations."
+    )
+    parser.add_argument("parameters_file", help="batch parameters file from Dakota")
+    parser.add_argument("results_file", help="batch results file to Dakota")
+    parser.add_argument("--max-workers", type=int, help="number of worker processes")
+    parser.add_argument(
+        "--version", action="version", version=batch_script + " " + __version__
+    )
+    args = parser.parse_args()
+
+    run_batch(args.parameters_file, args.results_file, args.max_workers)
+
+
+if __name__ == "__main__":
+    main()
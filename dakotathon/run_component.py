@@ -2,17 +2,30 @@
 """Defines the `dakota_run_component` console script."""
 
 import os
+import math
+import logging
 import shutil
 import subprocess
 import importlib
-import numpy as np
+import threading
 from .utils import (
     get_configuration_file,
+    get_evaluation_id,
+    get_tool_path,
+    get_response_descriptors,
     deserialize,
-    compute_statistic,
+    reduce_responses,
     write_results,
+    write_failure,
     to_iterable,
+    limit_evaluation,
 )
+from .profiling import EvaluationTimer, get_evaluation_log, phase
+from .retention import prune_evaluation
+from .store import get_evaluation_store, record_evaluation
+from .variables.random_field import write_field
+from .calibration import compute_calibration_terms, load_observations
+from .gradients import requests_gradients, evaluate_with_gradients
 
 
 component_script = "dakota_run_component"
@@ -37,6 +50,120 @@ class ComponentOutput(object):
         return getattr(self, var)
 
 
+class ComponentPool(object):
+
+    """Keeps instances of a component for reuse across evaluations.
+
+    At most `size` instances are checked out at once; `acquire` blocks
+    until one is returned. A component that can't be initialized again
+    after `finalize` marks the pool as not `reusable`, after which a
+    fresh instance is created for each evaluation.
+
+    Examples
+    --------
+    >>> pool = ComponentPool(list, size=2)
+    >>> a = pool.acquire()
+    >>> pool.release(a)
+    >>> pool.acquire() is a
+    True
+
+    """
+
+    def __init__(self, cls, size=1):
+        """Create a pool of instances of a component.
+
+        Parameters
+        ----------
+        cls : class
+          The component class.
+        size : int, optional
+          The largest number of instances in the pool (default is 1).
+
+        """
+        self.cls = cls
+        self.size = max(int(size), 1)
+        self.reusable = True
+        self._idle = []
+        self._checked_out = 0
+        self._lock = threading.Condition()
+
+    def acquire(self):
+        """Check out an instance of the component.
+
+        Returns
+        -------
+        object
+          An idle instance, or a new one if none are idle.
+
+        """
+        return self.checkout()[0]
+
+    def checkout(self):
+        """Check out an instance of the component, and say if it's reused.
+
+        Returns
+        -------
+        tuple
+          An idle instance, or a new one if none are idle, and True if
+          the instance was idle.
+
+        """
+        with self._lock:
+            while self._checked_out >= self.size:
+                self._lock.wait()
+            self._checked_out += 1
+            if self._idle and self.reusable:
+                return self._idle.pop(), True
+        return self.cls(), False
+
+    def release(self, component, reusable=True):
+        """Return an instance of the component to the pool.
+
+        Parameters
+        ----------
+        component : object
+          The instance.
+        reusable : bool, optional
+          Set to False to discard the instance, e.g., after a failed
+          evaluation (default is True). Other idle instances are kept,
+          unless the pool is no longer `reusable`.
+
+        """
+        with self._lock:
+            self._checked_out -= 1
+            if reusable and self.reusable:
+                self._idle.append(component)
+            elif not self.reusable:
+                del self._idle[:]
+            self._lock.notify()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_component_pool(cls, size=1):
+    """Get the pool of instances of a component class.
+
+    Parameters
+    ----------
+    cls : class
+      The component class.
+    size : int, optional
+      The size of a new pool (default is 1).
+
+    Returns
+    -------
+    ComponentPool
+      The pool shared by evaluations in this process.
+
+    """
+    with _pools_lock:
+        if cls not in _pools:
+            _pools[cls] = ComponentPool(cls, size=size)
+        return _pools[cls]
+
+
 class RunComponent(object):
 
     """Provides framework to run a CSDMS component from Dakota."""
@@ -49,6 +176,9 @@ class RunComponent(object):
         self.component = None
         self.output = None
         self.results = []
+        self.pool = None
+        self.reused = False
+        self.field = None
 
         config_file = get_configuration_file(self.params_file)
         self.config = deserialize(config_file)
@@ -56,41 +186,95 @@ class RunComponent(object):
     def create_component(self):
         module = importlib.import_module(self.component_path)
         cls = getattr(module, self.config["component"])
-        self.component = cls()
+        self.pool = get_component_pool(
+            cls, size=self.config.get("evaluation_concurrency") or 1
+        )
+        self.component, self.reused = self.pool.checkout()
+
+    def release_component(self, reusable=True):
+        if self.pool is not None and self.component is not None:
+            self.pool.release(self.component, reusable=reusable)
+            self.component = None
+            self.reused = False
+
+    def initialize(self):
+        try:
+            self.component.initialize(self.config["initialize_args"])
+        except Exception:
+            if not self.reused or not self.pool.reusable:
+                raise
+            # An idle instance may not support a second initialize;
+            # fall back to fresh instances for this component.
+            self.pool.reusable = False
+            self.component = self.pool.cls()
+            self.output.component = self.component
+            self.component.initialize(self.config["initialize_args"])
 
     def setup(self):
-        shutil.copy(
-            os.path.join(self.config["run_directory"], self.config["template_file"]),
-            os.getcwd(),
-        )
+        with phase("copy"):
+            shutil.copy(
+                os.path.join(
+                    self.config["run_directory"], self.config["template_file"]
+                ),
+                os.getcwd(),
+            )
         input_file, _ = os.path.splitext(self.config["template_file"])
-        subprocess.call(
-            ["dprepro", self.params_file, self.config["template_file"], input_file]
-        )
-        for fname in self.config["auxiliary_files"]:
-            shutil.copy(os.path.join(self.config["run_directory"], fname), os.getcwd())
+        with phase("dprepro"):
+            subprocess.call(
+                [
+                    get_tool_path(self.config, "dprepro"),
+                    self.params_file,
+                    self.config["template_file"],
+                    input_file,
+                ]
+            )
+        with phase("copy"):
+            for fname in self.config["auxiliary_files"]:
+                shutil.copy(
+                    os.path.join(self.config["run_directory"], fname), os.getcwd()
+                )
+        with phase("field"):
+            self.field = write_field(self.config, self.params_file)
         self.output = ComponentOutput(
             self.component, self.config["response_descriptors"]
         )
 
     def run(self):
-        self.component.initialize(self.config["initialize_args"])
+        self.initialize()
+        if self.field is not None:
+            self.component.set_value(self.config["field_name"], self.field)
         while self.component.get_current_time() < self.component.get_end_time():
             self.component.update()
             self.output.update()
         self.component.finalize()
 
     def calculate(self):
-        for i in range(len(self.config["response_descriptors"])):
-            desc = self.config["response_descriptors"][i]
-            stat = self.config["response_statistics"][i]
-            r = compute_statistic(stat, self.output.get_value(desc))
-            self.results.append(r)
+        if self.config.get("observation_files"):
+            self.results.extend(
+                compute_calibration_terms(
+                    self.config["response_descriptors"],
+                    load_observations(self.config),
+                    self.output.get_value,
+                )
+            )
+        else:
+            self.results.extend(
+                reduce_responses(
+                    self.config["response_descriptors"],
+                    self.config["response_statistics"],
+                    self.output.get_value,
+                )
+            )
 
     def write(self):
-        write_results(
-            self.results_file, self.results, self.config["response_descriptors"]
-        )
+        if self.config.get("observation_files"):
+            if any(math.isnan(value) for value in self.results):
+                write_failure(self.results_file)
+                return
+            labels = get_response_descriptors(self.params_file)
+        else:
+            labels = self.config["response_descriptors"]
+        write_results(self.results_file, self.results, labels)
 
 
 def run_component(params_file, results_file):
@@ -130,13 +314,81 @@ def run_component(params_file, results_file):
     it. This number, one for each response, is returned to Dakota
     through the results file, ending the Dakota evaluation step.
 
+    Component instances are drawn from a pool sized to the
+    experiment's *evaluation_concurrency*, so evaluations run in the
+    same process (e.g., by the workers of ``dakota_run_batch``) reuse
+    instances and skip their one-time setup. Each evaluation
+    initializes its instance again from the rendered input file.
+    If the experiment's variables are a *random_field*, the field is
+    expanded from its coefficients, and passed to the component with
+    its BMI `set_value` method. If its responses have
+    *observation_files*, the residuals of each output variable's
+    series, one value per time step, against its observations are
+    returned instead of statistics; see `dakotathon.calibration`.
+
+    If the experiment's responses set *analytic_gradients*, and Dakota
+    asks for gradients, the point and its perturbations are evaluated
+    concurrently, and the gradients are computed by finite
+    differences; see `dakotathon.gradients`.
+
+    If the evaluation exceeds the experiment's *evaluation_timeout* or
+    *cpu_time_limit*, it's stopped, its component instance is
+    discarded, and the evaluation is reported to Dakota as failed;
+    see `dakotathon.utils.limit_evaluation`.
+
+    If the experiment sets an *evaluation_log*, the time spent in each
+    step, the peak memory used, and the exit status of the evaluation
+    are appended to the log. If it sets an *evaluation_store*, the
+    parameters, responses, and timings of the evaluation are added to
+    the store. Once the results are written, the files
+    of an evaluation that the interface's *retention* policy doesn't
+    keep are removed.
+
     """
-    runner = RunComponent(params_file, results_file)
-    runner.create_component()
-    runner.setup()
-    runner.run()
-    runner.calculate()
-    runner.write()
+    timer = EvaluationTimer(get_evaluation_id(params_file))
+    runner = None
+    ok = False
+    try:
+        with timer:
+            with phase("deserialize"):
+                runner = RunComponent(params_file, results_file)
+            if requests_gradients(runner.config, params_file):
+                with phase("gradients"):
+                    evaluate_with_gradients(
+                        "component", runner.config, params_file, results_file
+                    )
+            else:
+                with limit_evaluation(runner.config):
+                    with phase("import"):
+                        runner.create_component()
+                    with phase("setup"):
+                        runner.setup()
+                    with phase("run"):
+                        runner.run()
+                    with phase("calculate"):
+                        runner.calculate()
+                    with phase("write"):
+                        runner.write()
+        ok = True
+    except subprocess.SubprocessError:
+        write_failure(results_file)
+    finally:
+        if runner is not None:
+            runner.release_component(reusable=ok)
+            log_file = get_evaluation_log(runner.config)
+            if log_file is not None:
+                timer.write(log_file)
+            store_file = get_evaluation_store(runner.config)
+            if store_file is not None:
+                try:
+                    record_evaluation(
+                        store_file, params_file, results_file, timer, runner.config
+                    )
+                except Exception:
+                    logging.getLogger(__name__).exception(
+                        "Unable to record the evaluation in %s", store_file
+                    )
+            prune_evaluation(runner.config, params_file, results_file, not ok)
 
 
 def main():
@@ -1,12 +1,57 @@
 #!/usr/bin/env python
 """Defines the `dakota_run_plugin` console script."""
 
-import importlib
-from .utils import get_configuration_file, deserialize
+import logging
+import subprocess
+from .registry import load_plugin
+from .utils import get_configuration_file, get_evaluation_id, deserialize, has_tools
+from .utils import write_failure, limit_evaluation
+from .profiling import EvaluationTimer, get_evaluation_log, phase
+from .retention import prune_evaluation
+from .store import get_evaluation_store, record_evaluation
+from .variables.random_field import write_field
+from .gradients import requests_gradients, evaluate_with_gradients
 
 
 plugin_script = "dakota_run_plugin"
-_plugins_path = "dakotathon.plugins."
+
+
+def evaluate_plugin(config, params_file, results_file):
+    """Set up and call a model, and write its responses.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    params_file : str
+      The path to the parameters file created by Dakota.
+    results_file : str
+      The path the results file returned to Dakota.
+
+    """
+    with phase("import"):
+        _module = load_plugin(config["plugin"])
+        executables = getattr(_module, "executables", ())
+        if (executables and has_tools(config, executables)) or (
+            _module.is_installed()
+        ):
+            _class = getattr(_module, _module.classname)
+            model = _class()
+        else:
+            raise NameError("Model cannot be created.")
+
+    # Set up the simulation, call the model, calculate the response
+    # statistic for the simulation, write the output to the Dakota
+    # results file.
+    with phase("setup"):
+        write_field(config, params_file)
+        model.setup(config)
+    with phase("call"):
+        model.call()
+    with phase("calculate"):
+        model.calculate()
+    with phase("write"):
+        model.write(params_file, results_file)
 
 
 def run_plugin(params_file, results_file):
@@ -36,6 +81,12 @@ def run_plugin(params_file, results_file):
     2. The results file contains model output values in a format
        specified by the Dakota documentation.
 
+    The model is found by name with `dakotathon.registry.load_plugin`,
+    so it can be a built-in plugin or one installed by another package.
+    If the paths to the model's executables were recorded when the
+    experiment was set up, they are trusted, and the execution path
+    isn't searched again.
+
     Once the model is identified, an interface is created to perform
     three steps: preprocessing, execution, and postprocessing. In the
     preprocessing step, information from the configuration file is
@@ -46,24 +97,61 @@ def run_plugin(params_file, results_file):
     it. This number, one for each response, is returned to Dakota
     through the results file, ending the Dakota evaluation step.
 
-    """
-    config_file = get_configuration_file(params_file)
-    config = deserialize(config_file)
+    If the experiment's responses set *analytic_gradients*, and Dakota
+    asks for gradients, the point and its perturbations are evaluated
+    concurrently, and the gradients are computed by finite
+    differences; see `dakotathon.gradients`.
 
-    _module = importlib.import_module(_plugins_path + config["plugin"])
-    if _module.is_installed():
-        _class = getattr(_module, _module.classname)
-        model = _class()
-    else:
-        raise NameError("Model cannot be created.")
+    If the experiment's variables are a *random_field*, the field is
+    expanded from its coefficients, and written to a file for the
+    model, before the model is set up.
 
-    # Set up the simulation, call the model, calculate the response
-    # statistic for the simulation, write the output to the Dakota
-    # results file.
-    model.setup(config)
-    model.call()
-    model.calculate()
-    model.write(params_file, results_file)
+    If the experiment sets an *evaluation_log*, the time spent in each
+    step, the peak memory used, and the exit status of the evaluation
+    are appended to the log. If it sets an *evaluation_store*, the
+    parameters, responses, and timings of the evaluation are added to
+    the store.
+
+    If the evaluation, or the model's run, exceeds the experiment's
+    *evaluation_timeout* or *cpu_time_limit*, it's stopped, and the
+    evaluation is reported to Dakota as failed, and is handled as set
+    by the interface's *failure_capture*, instead of holding up the
+    experiment; see `dakotathon.utils.limit_evaluation`. With
+    gradients, the limits apply to each of the evaluations.
+
+    Once the results are written, the files of an evaluation that the
+    interface's *retention* policy doesn't keep are removed.
+
+    """
+    timer = EvaluationTimer(get_evaluation_id(params_file))
+    config = {}
+    try:
+        with timer:
+            with phase("deserialize"):
+                config_file = get_configuration_file(params_file)
+                config = deserialize(config_file)
+
+            if requests_gradients(config, params_file):
+                with phase("gradients"):
+                    evaluate_with_gradients("plugin", config, params_file, results_file)
+            else:
+                with limit_evaluation(config):
+                    evaluate_plugin(config, params_file, results_file)
+    except subprocess.SubprocessError:
+        write_failure(results_file)
+    finally:
+        log_file = get_evaluation_log(config)
+        if log_file is not None:
+            timer.write(log_file)
+        store_file = get_evaluation_store(config)
+        if store_file is not None:
+            try:
+                record_evaluation(store_file, params_file, results_file, timer, config)
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    "Unable to record the evaluation in %s", store_file
+                )
+        prune_evaluation(config, params_file, results_file, timer.status != "ok")
 
 
 def main():
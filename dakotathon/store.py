@@ -0,0 +1,535 @@
+#! /usr/bin/env python
+"""Keep a record of every evaluation in a single queryable store.
+
+When an experiment sets an ``evaluation_store``, the analysis drivers
+append the parameters, responses, exit status, and timings of each
+evaluation to an SQLite database, which can be shared by the runs on
+a host. SQLite's file locking is unreliable on network filesystems,
+such as NFS, so a store shared by evaluations on several hosts should
+be on a local disk of one of them. Parameters and responses are
+stored as arrays of doubles, and indexed by a hash of the parameters,
+so that earlier evaluations of a point can be found quickly.
+
+For analysis, `EvaluationStore.consolidate` writes the store out as
+columnar NumPy ``.npy`` files, one per column, which
+`EvaluationStore.load_columns` memory-maps, so that the responses of
+millions of evaluations can be read without loading the whole store.
+
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from array import array
+
+
+store_columns = ("eval_id", "status", "elapsed", "param_hash")
+"""Columns of a consolidated store besides the parameters and responses."""
+
+_schema = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    experiment TEXT,
+    eval_id INTEGER,
+    param_hash TEXT,
+    descriptors TEXT,
+    parameters BLOB,
+    response_descriptors TEXT,
+    responses BLOB,
+    status TEXT,
+    elapsed REAL,
+    record TEXT,
+    created REAL
+);
+CREATE INDEX IF NOT EXISTS evaluations_param_hash ON evaluations (param_hash);
+"""
+
+_chunk_size = 65536
+
+
+def _pack(values):
+    """Pack a sequence of numbers into a blob of doubles."""
+    return array("d", values).tobytes()
+
+
+def _unpack(blob):
+    """Unpack a blob of doubles."""
+    values = array("d")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+def hash_parameters(parameters, descriptors=()):
+    """Compute the hash under which an evaluation is indexed.
+
+    Parameters
+    ----------
+    parameters : list of float
+      The values of the variables.
+    descriptors : list of str, optional
+      The names of the variables.
+
+    Returns
+    -------
+    str
+      The hash of the names and values.
+
+    Examples
+    --------
+    >>> hash_parameters([1.0, 2.0]) == hash_parameters((1, 2))
+    True
+
+    """
+    digest = hashlib.sha1("\0".join(descriptors).encode("utf-8"))
+    digest.update(_pack(parameters))
+    return digest.hexdigest()
+
+
+def _to_float(item):
+    try:
+        return float(item)
+    except ValueError:
+        return float("nan")
+
+
+def read_parameters(params_file):
+    """Read the variables from a Dakota parameters file.
+
+    Parameters
+    ----------
+    params_file : str
+      The path to a Dakota parameters file.
+
+    Returns
+    -------
+    (list, list)
+      The names and the values of the variables; a value that isn't
+      a number is returned as NaN.
+
+    """
+    with open(params_file, "r") as fp:
+        n_variables = int(fp.readline().split()[0])
+        items = [fp.readline().split() for _ in range(n_variables)]
+    descriptors = [item[1] for item in items]
+    values = [_to_float(item[0]) for item in items]
+    return descriptors, values
+
+
+def read_results(results_file, n_responses):
+    """Read the responses from a Dakota results file.
+
+    Parameters
+    ----------
+    results_file : str
+      The path to a Dakota results file.
+    n_responses : int
+      The number of responses.
+
+    Returns
+    -------
+    list of float
+      The values of the responses, all NaN for a failed evaluation.
+
+    """
+    nan = float("nan")
+    try:
+        with open(results_file, "r") as fp:
+            lines = [line.split() for line in fp if line.strip()]
+    except (IOError, OSError):
+        return [nan] * n_responses
+    if not lines or lines[0][0].lower() == "fail":
+        return [nan] * n_responses
+    values = [_to_float(line[0]) for line in lines[:n_responses]]
+    return values + [nan] * (n_responses - len(values))
+
+
+class EvaluationStore(object):
+
+    """An append-only store of Dakota evaluations.
+
+    Examples
+    --------
+    Add an evaluation to a store, then find it by its parameters:
+
+    >>> import tempfile
+    >>> store = EvaluationStore(tempfile.mktemp(suffix=".db"))
+    >>> store.add([1.0, 2.0], [5.0], ["x1", "x2"], ["y1"], eval_id=1)
+    1
+    >>> [r["responses"] for r in store.find([1.0, 2.0], ["x1", "x2"])]
+    [[5.0]]
+    >>> store.close()
+
+    """
+
+    def __init__(self, path):
+        """Open or create a store.
+
+        Parameters
+        ----------
+        path : str
+          The path to the SQLite database.
+
+        """
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self):
+        """The connection to the database, opened on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=60.0)
+            self._connection.executescript(_schema)
+        return self._connection
+
+    def close(self):
+        """Close the connection to the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def __len__(self):
+        cursor = self.connection.execute("SELECT COUNT(*) FROM evaluations")
+        return cursor.fetchone()[0]
+
+    def add(
+        self,
+        parameters,
+        responses,
+        descriptors=(),
+        response_descriptors=(),
+        eval_id=None,
+        status="ok",
+        timings=None,
+        experiment=None,
+    ):
+        """Append an evaluation to the store.
+
+        Parameters
+        ----------
+        parameters : list of float
+          The values of the variables.
+        responses : list of float
+          The values of the responses.
+        descriptors : list of str, optional
+          The names of the variables.
+        response_descriptors : list of str, optional
+          The names of the responses.
+        eval_id : int, optional
+          The Dakota evaluation id.
+        status : str, optional
+          The exit status of the evaluation (default is 'ok').
+        timings : dict, optional
+          The record of an `dakotathon.profiling.EvaluationTimer`.
+        experiment : str, optional
+          An identifier for the experiment, e.g., its configuration
+          file.
+
+        Returns
+        -------
+        int
+          The id of the new record.
+
+        """
+        timings = timings or {}
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO evaluations (experiment, eval_id, param_hash,"
+                " descriptors, parameters, response_descriptors, responses,"
+                " status, elapsed, record, created)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    experiment,
+                    eval_id,
+                    hash_parameters(parameters, descriptors),
+                    " ".join(descriptors),
+                    _pack(parameters),
+                    " ".join(response_descriptors),
+                    _pack(responses),
+                    status,
+                    timings.get("elapsed"),
+                    json.dumps(timings),
+                    time.time(),
+                ),
+            )
+        return cursor.lastrowid
+
+    def _records(self, where="", args=()):
+        cursor = self.connection.execute(
+            "SELECT id, experiment, eval_id, descriptors, parameters,"
+            " response_descriptors, responses, status, elapsed, record,"
+            " param_hash FROM evaluations " + where + " ORDER BY id",
+            args,
+        )
+        for row in cursor:
+            yield {
+                "id": row[0],
+                "experiment": row[1],
+                "eval_id": row[2],
+                "descriptors": row[3].split(),
+                "parameters": _unpack(row[4]),
+                "response_descriptors": row[5].split(),
+                "responses": _unpack(row[6]),
+                "status": row[7],
+                "elapsed": row[8],
+                "timings": json.loads(row[9]) if row[9] else {},
+                "param_hash": row[10],
+            }
+
+    def records(self):
+        """Iterate over the evaluations in the store, oldest first.
+
+        Yields
+        ------
+        dict
+          The fields of each evaluation.
+
+        """
+        return self._records()
+
+    def find(self, parameters, descriptors=()):
+        """Find the evaluations of a point, through the parameter index.
+
+        Parameters
+        ----------
+        parameters : list of float
+          The values of the variables.
+        descriptors : list of str, optional
+          The names of the variables.
+
+        Returns
+        -------
+        list of dict
+          The fields of each evaluation of the point.
+
+        """
+        key = hash_parameters(parameters, descriptors)
+        return list(self._records("WHERE param_hash = ?", (key,)))
+
+    def _columns_directory(self, directory):
+        return directory or os.path.splitext(self.path)[0] + ".columns"
+
+    def consolidate(self, directory=None):
+        """Write the store as columnar NumPy files.
+
+        Each variable and response is a column, matched by name across
+        experiments; a missing value is NaN. Their files are named
+        ``param.<name>.npy`` and ``resp.<name>.npy``, so they can't
+        clash with each other or with the `store_columns`. Rows are
+        written in chunks, so the store needn't fit in memory.
+
+        Parameters
+        ----------
+        directory : str, optional
+          The directory for the column files (default is the path to
+          the store, with the suffix ``.columns``).
+
+        Returns
+        -------
+        str
+          The directory of the column files.
+
+        """
+        import numpy as np
+        from numpy.lib.format import open_memmap
+
+        directory = self._columns_directory(directory)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        names, response_names = [], []
+        cursor = self.connection.execute(
+            "SELECT DISTINCT descriptors, response_descriptors FROM evaluations"
+        )
+        for descriptors, response_descriptors in cursor:
+            for name in descriptors.split():
+                if name not in names:
+                    names.append(name)
+            for name in response_descriptors.split():
+                if name not in response_names:
+                    response_names.append(name)
+        n_rows = len(self)
+
+        def new_column(name, dtype, fill):
+            path = os.path.join(directory, name + ".npy")
+            if n_rows == 0:
+                np.save(path, np.empty(0, dtype=dtype))
+                return None
+            column = open_memmap(path, mode="w+", dtype=dtype, shape=(n_rows,))
+            column[:] = fill
+            return column
+
+        arrays = {}
+        for name in names:
+            arrays["param." + name] = new_column("param." + name, np.float64, np.nan)
+        for name in response_names:
+            arrays["resp." + name] = new_column("resp." + name, np.float64, np.nan)
+        arrays["eval_id"] = new_column("eval_id", np.int64, -1)
+        arrays["elapsed"] = new_column("elapsed", np.float64, np.nan)
+        status = np.empty(n_rows, dtype="U32")
+        param_hash = np.empty(n_rows, dtype="U40")
+
+        cursor = self.connection.execute(
+            "SELECT eval_id, descriptors, parameters, response_descriptors,"
+            " responses, status, elapsed, param_hash FROM evaluations ORDER BY id"
+        )
+        start = 0
+        while True:
+            chunk = cursor.fetchmany(_chunk_size)
+            if not chunk:
+                break
+            rows = slice(start, start + len(chunk))
+            for fields, values, prefix in ((1, 2, "param."), (3, 4, "resp.")):
+                groups = {}
+                for i, record in enumerate(chunk):
+                    groups.setdefault(record[fields], []).append(i)
+                for descriptors, index in groups.items():
+                    descriptors = descriptors.split()
+                    if not descriptors:
+                        continue
+                    blob = b"".join(chunk[i][values] for i in index)
+                    data = np.frombuffer(blob, dtype=np.float64)
+                    data = data.reshape(len(index), len(descriptors))
+                    index = np.asarray(index) + start
+                    for j, name in enumerate(descriptors):
+                        arrays[prefix + name][index] = data[:, j]
+            eval_ids = [-1 if r[0] is None else r[0] for r in chunk]
+            arrays["eval_id"][rows] = eval_ids
+            arrays["elapsed"][rows] = [np.nan if r[6] is None else r[6] for r in chunk]
+            status[rows] = [r[5] or "" for r in chunk]
+            param_hash[rows] = [r[7] for r in chunk]
+            start += len(chunk)
+        for column in arrays.values():
+            if column is not None:
+                column.flush()
+        del arrays
+        np.save(os.path.join(directory, "status.npy"), status)
+        np.save(os.path.join(directory, "param_hash.npy"), param_hash)
+
+        with open(os.path.join(directory, "columns.json"), "w") as fp:
+            json.dump(
+                {
+                    "rows": n_rows,
+                    "parameters": names,
+                    "responses": response_names,
+                    "columns": list(store_columns),
+                },
+                fp,
+            )
+        return directory
+
+    def load_columns(self, directory=None, mmap_mode="r"):
+        """Read the columns written by `consolidate`.
+
+        Parameters
+        ----------
+        directory : str, optional
+          The directory of the column files (default is the path to
+          the store, with the suffix ``.columns``).
+        mmap_mode : str or None, optional
+          How the numeric columns are memory-mapped (default is 'r',
+          read-only; None reads them into memory).
+
+        Returns
+        -------
+        dict
+          The array of each column, by name, with the names of the
+          parameter and response columns under the keys
+          ``parameters`` and ``responses``. Parameter and response
+          columns are also keyed by their file names, such as
+          ``param.x1`` and ``resp.y1``; a bare name is given to a
+          store column before a parameter, and to a parameter before
+          a response.
+
+        """
+        import numpy as np
+
+        directory = self._columns_directory(directory)
+        with open(os.path.join(directory, "columns.json"), "r") as fp:
+            meta = json.load(fp)
+
+        def load(name, mode):
+            return np.load(os.path.join(directory, name + ".npy"), mmap_mode=mode)
+
+        columns = {"parameters": meta["parameters"], "responses": meta["responses"]}
+        for name in meta["columns"]:
+            mode = None if name in ("status", "param_hash") else mmap_mode
+            columns[name] = load(name, mode)
+        prefixes = ("param.", "resp.")
+        for prefix, names in zip(prefixes, (meta["parameters"], meta["responses"])):
+            for name in names:
+                columns[prefix + name] = load(prefix + name, mmap_mode)
+                columns.setdefault(name, columns[prefix + name])
+        return columns
+
+
+def get_evaluation_store(config):
+    """Get the path to the evaluation store for an experiment.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+
+    Returns
+    -------
+    str or None
+      The path to the store, or None if evaluations aren't stored.
+
+    """
+    store_file = config.get("evaluation_store")
+    if not store_file:
+        return None
+    return os.path.join(config.get("run_directory", os.curdir), store_file)
+
+
+def record_evaluation(store_file, params_file, results_file, timer=None, config=None):
+    """Add an evaluation to a store from its parameters and results files.
+
+    Parameters
+    ----------
+    store_file : str
+      The path to the store.
+    params_file : str
+      The path to the evaluation's parameters file.
+    results_file : str
+      The path to the evaluation's results file.
+    timer : EvaluationTimer, optional
+      The timer of the evaluation.
+    config : dict, optional
+      Configuration settings for the experiment.
+
+    Returns
+    -------
+    int
+      The id of the new record.
+
+    """
+    from .utils import get_evaluation_id, get_response_descriptors
+
+    descriptors, parameters = read_parameters(params_file)
+    response_descriptors = get_response_descriptors(params_file) or []
+    responses = read_results(results_file, len(response_descriptors))
+    timings = timer.record() if timer is not None else {}
+    status = timings.get("status", "ok")
+    if status == "ok" and any(value != value for value in responses):
+        status = "fail"
+    with EvaluationStore(store_file) as store:
+        return store.add(
+            parameters,
+            responses,
+            descriptors,
+            response_descriptors,
+            eval_id=get_evaluation_id(params_file),
+            status=status,
+            timings=timings,
+            experiment=(config or {}).get("configuration_file"),
+        )
@@ -0,0 +1,86 @@
+"""Tests for the dakotathon.calibration module."""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from nose.tools import assert_true, assert_is, assert_equal
+from numpy.testing import assert_allclose, assert_array_equal
+from dakotathon.calibration import (
+    observations_file,
+    read_observations,
+    save_observations,
+    load_observations,
+    compute_residuals,
+    compute_calibration_terms,
+)
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global tmp_dir, obs_files
+    tmp_dir = tempfile.mkdtemp()
+    obs_files = [os.path.join(tmp_dir, "qs.txt"), os.path.join(tmp_dir, "q.txt")]
+    with open(obs_files[0], "w") as fp:
+        fp.write("# day value weight\n0 1.0 4.0\n2 3.0 1.0\n")
+    with open(obs_files[1], "w") as fp:
+        fp.write("1 10.0\n")
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    shutil.rmtree(tmp_dir)
+
+
+def test_read_observations():
+    """Test reading observations with and without weights."""
+    times, values, weights = read_observations(obs_files[0])
+    assert_array_equal(times, [0, 2])
+    assert_array_equal(weights, [4.0, 1.0])
+    times, values, weights = read_observations(obs_files[1])
+    assert_array_equal(values, [10.0])
+    assert_array_equal(weights, [1.0])
+
+
+def test_compute_residuals_with_time_column():
+    """Test aligning observations with a series of times and values."""
+    series = np.array([[0.0, 1.0], [0.5, 2.0], [1.0, 4.0]])
+    residuals = compute_residuals(series, [0.5, 1.0, 0.75], [1.0, 1.0, 1.0])
+    assert_allclose(residuals, [1.0, 3.0, np.nan])
+
+
+def test_compute_calibration_terms():
+    """Test that each source is loaded once, and missing ones are NaN."""
+    loaded = []
+
+    def load(source):
+        loaded.append(source)
+        return None if source == "missing" else np.arange(5.0)
+
+    observations = [read_observations(name) for name in obs_files]
+    terms = compute_calibration_terms(
+        ["QS", "QS", "missing"], observations + observations[:1], load
+    )
+    assert_equal(loaded, ["QS", "missing"])
+    assert_allclose(terms, [-2.0, -1.0, -9.0, np.nan, np.nan])
+
+
+def test_load_observations_reads_packed_file():
+    """Test that observations are loaded from the packed file, once."""
+    run_dir = tempfile.mkdtemp(dir=tmp_dir)
+    path = save_observations(run_dir, obs_files)
+    assert_equal(path, os.path.join(run_dir, observations_file))
+    config = {"run_directory": run_dir, "observation_files": obs_files}
+    observations = load_observations(config)
+    assert_array_equal(observations[0][1], [1.0, 3.0])
+    assert_is(load_observations(config), observations)
+
+
+def test_load_observations_without_packed_file():
+    """Test that observations are read from text without a packed file."""
+    run_dir = tempfile.mkdtemp(dir=tmp_dir)
+    config = {"run_directory": run_dir, "observation_files": obs_files[1:]}
+    observations = load_observations(config)
+    assert_true(len(observations) == 1)
+    assert_array_equal(observations[0][0], [1.0])
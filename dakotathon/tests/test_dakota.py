@@ -8,7 +8,10 @@
 # Mark Piper (mark.piper@colorado.edu)
 
 import os
+import json
 import filecmp
+import yaml
+import numpy as np
 from subprocess import CalledProcessError
 from nose.tools import (
     raises,
@@ -19,7 +22,7 @@ from nose.tools import (
     nottest,
 )
 from dakotathon.dakota import Dakota
-from dakotathon.utils import is_dakota_installed
+from dakotathon.utils import is_dakota_installed, which_dakota
 from . import start_dir, data_dir
 
 
@@ -39,6 +42,7 @@ tmp_files = [
     data_file,
     restart_file,
     "dakota.yaml",
+    "dakota.yaml.json",
 ]
 
 # Fixtures -------------------------------------------------------------
@@ -161,6 +165,32 @@ def test_write_configuration_file():
     assert_true(os.path.exists(k.configuration_file))
 
 
+def test_write_configuration_file_with_arrays():
+    """Test that arrays of variables are written compactly, and read back."""
+    n = 100
+    k = Dakota(
+        method="sampling",
+        variables="uniform_uncertain",
+        descriptors=["x{}".format(i) for i in range(n)],
+        lower_bounds=np.zeros(n),
+        upper_bounds=np.ones(n),
+    )
+    k.serialize()
+    with open(k.configuration_file, "r") as fp:
+        text = fp.read()
+    assert_true("lower_bounds: [0.0, 0.0," in text)
+    m = Dakota.from_file_like(k.configuration_file)
+    assert_true(np.array_equal(m.variables.upper_bounds, np.ones(n)))
+
+
+@raises(ValueError)
+def test_write_input_file_validates_variables():
+    """Test that write_input_file checks the variables."""
+    k = Dakota(method="vector_parameter_study")
+    k.variables.descriptors = ("x1", "x2", "x3")
+    k.write_input_file()
+
+
 def test_write_input_file_with_method_default_name():
     """Test write_input_file works when instanced with method."""
     k = Dakota(method="vector_parameter_study")
@@ -190,6 +220,56 @@ def test_setup():
     assert_true(filecmp.cmp(known_file, input_file))
 
 
+def test_serialize_writes_sidecar():
+    """Test that serialize writes a JSON copy of the configuration."""
+    k = Dakota(method="vector_parameter_study")
+    k.serialize()
+    with open(k.configuration_file + ".json", "r") as fp:
+        record = json.load(fp)
+    with open(k.configuration_file, "r") as fp:
+        assert_equal(record["config"], yaml.safe_load(fp))
+
+
+def test_setup_records_tools():
+    """Test that setup stores the paths to executables in the config."""
+    k = Dakota(method="vector_parameter_study", plugin="hydrotrend")
+    k.setup()
+    with open(k.configuration_file, "r") as fp:
+        config = yaml.safe_load(fp)
+    assert_equal(sorted(config["tools"]), ["dakota", "dprepro", "hydrotrend"])
+    assert_equal(config["tools"]["dakota"]["path"], which_dakota())
+
+
+@raises(TypeError)
+def test_refine_fails_without_sampling():
+    """Test that refine fails for a method other than sampling."""
+    k = Dakota(method="vector_parameter_study")
+    k.refine(ci_width=1.0)
+
+
+@raises(ValueError)
+def test_refine_fails_without_stopping_criterion():
+    """Test that refine fails without a stopping criterion."""
+    k = Dakota(method="sampling", variables="uniform_uncertain")
+    k.refine()
+
+
+def test_init_with_scalar_parameters():
+    """Test creating an experiment with one variable set by scalars."""
+    parameters = {
+        "component": "FrostNumberModel",
+        "descriptors": "T_air_min",
+        "initial_point": -10.0,
+        "final_point": -5.0,
+        "n_steps": 5,
+        "response_descriptors": "frostnumber__air",
+        "response_statistics": "median",
+    }
+    k = Dakota(method="vector_parameter_study", **parameters)
+    assert_equal(k.variables.initial_point.tolist(), [-10.0])
+    assert_true("initial_point = -10.0\n" in str(k))
+
+
 def test_default_run_with_input_file():
     """Test default object run method with input file."""
     if is_dakota_installed():
@@ -231,6 +311,7 @@ def test_changing_parameter_names():
         k.run()
 
         os.remove(configuration_file)
+        os.remove(configuration_file + ".json")
         os.remove(run_log)
         os.remove(error_log)
         teardown_module()
@@ -276,6 +357,7 @@ def test_running_in_different_directory():
     for f in lhc_filelist:
         os.remove(f)
     os.remove(configuration_file)
+    os.remove(configuration_file + ".json")
     os.remove(run_log)
     os.remove(error_log)
     os.remove(input_file)
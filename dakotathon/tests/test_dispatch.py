@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+#
+# Tests for the dakotathon.dispatch module.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+import sys
+import types
+import socket
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from nose.tools import assert_equal, assert_true, raises
+from nose.plugins.skip import SkipTest
+from dakotathon.dakota import Dakota
+from dakotathon.dispatch import Agent, Dispatcher, parse_hosts
+from dakotathon.dispatch import start_agents, stop_agents, new_token
+from dakotathon.utils import deserialize
+from .test_run_batch import Double, params_template
+
+
+# Global variables -----------------------------------------------------
+
+tmp_dir = None
+plugin_module = "dakotathon.plugins._dispatch_test"
+token = new_token()
+agents = []
+servers = []
+addresses = []
+
+
+class CountingAgent(Agent):
+
+    """An agent that counts how often files are staged."""
+
+    def __init__(self, *args, **kwargs):
+        super(CountingAgent, self).__init__(*args, **kwargs)
+        self.stage_count = 0
+
+    def stage(self, key, config, files):
+        self.stage_count += 1
+        return super(CountingAgent, self).stage(key, config, files)
+
+
+def serve(agent, server):
+    """Serve an agent in a thread until its socket is closed."""
+    try:
+        agent.serve(server)
+    except (IOError, OSError):
+        pass
+
+
+# Fixtures -------------------------------------------------------------
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    global tmp_dir
+    print("\n*** " + __name__)
+    tmp_dir = tempfile.mkdtemp()
+    module = types.ModuleType(plugin_module)
+    module.classname = "Double"
+    module.is_installed = lambda: True
+    module.Double = Double
+    sys.modules[plugin_module] = module
+
+    for i in range(2):
+        root = os.path.join(tmp_dir, "agent" + str(i))
+        agent = CountingAgent(slots=1, root=root, token=token)
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(5)
+        thread = threading.Thread(target=serve, args=(agent, server))
+        thread.daemon = True
+        thread.start()
+        agents.append(agent)
+        servers.append(server)
+        addresses.append("127.0.0.1:{}".format(server.getsockname()[1]))
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    for server in servers:
+        server.close()
+    for agent in agents:
+        agent.shutdown()
+    del sys.modules[plugin_module]
+    shutil.rmtree(tmp_dir)
+
+
+def write_experiment():
+    """Write a configuration file and a template file."""
+    with open(os.path.join(tmp_dir, "model.tmpl"), "w") as fp:
+        fp.write("x = {x1}\n")
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(
+        plugin="_dispatch_test",
+        template_file="model.tmpl",
+        run_directory=tmp_dir,
+        work_directory=tmp_dir,
+    )
+    d.serialize(config_file)
+    return config_file
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_parse_hosts():
+    """Test parsing host names and slots."""
+    assert_equal(parse_hosts("node1:4"), [("node1", 4)])
+    assert_equal(parse_hosts(["a", "b:2"]), [("a", 1), ("b", 2)])
+
+
+def test_stage_once():
+    """Test that files are sent to an agent only once."""
+    config = deserialize(write_experiment())
+    with Dispatcher(addresses, token) as dispatcher:
+        key = dispatcher.stage(config)
+        assert_equal(dispatcher.total_slots, 2)
+    counts = [agent.stage_count for agent in agents]
+    with Dispatcher(addresses, token) as dispatcher:
+        assert_equal(dispatcher.stage(config), key)
+    assert_equal([agent.stage_count for agent in agents], counts)
+    for agent in agents:
+        config_file, _ = agent.staged[key]
+        assert_true(config_file.startswith(agent.root))
+        stage_dir = os.path.dirname(config_file)
+        assert_true(os.path.isfile(os.path.join(stage_dir, "model.tmpl")))
+        assert_equal(deserialize(config_file)["run_directory"], stage_dir)
+
+
+@raises(IOError)
+def test_wrong_token():
+    """Test that an agent refuses a dispatcher with the wrong token."""
+    Dispatcher(addresses, new_token())
+
+
+@raises(ValueError)
+def test_stage_bad_key():
+    """Test that a staging key must be a hex digest."""
+    agents[0].stage("../../outside", {}, {})
+
+
+def test_stage_file_names():
+    """Test that staged files can't be written outside the stage."""
+    key = "0" * 64
+    config_file = agents[0].stage(key, {}, {"../../escaped": ""})
+    stage_dir = os.path.dirname(config_file)
+    assert_true(os.path.isfile(os.path.join(stage_dir, "escaped")))
+    assert_true(not os.path.exists(os.path.join(tmp_dir, "escaped")))
+
+
+def test_evaluate():
+    """Test evaluating a batch on two agents, with a failed evaluation."""
+    if multiprocessing.get_start_method() != "fork":
+        raise SkipTest("test plugin is only visible to forked workers")
+    config_file = write_experiment()
+    values = [1.0, -1.0, 3.0, 4.0]
+    blocks = [
+        params_template.format(x=x, config=config_file, eval_id=i + 1)
+        for i, x in enumerate(values)
+    ]
+    results = [None] * len(blocks)
+    with Dispatcher(addresses, token) as dispatcher:
+        dispatcher.stage(deserialize(config_file))
+        for i, text in dispatcher.evaluate(blocks):
+            results[i] = text
+    assert_equal(results[1].strip(), "fail")
+    for i in (0, 2, 3):
+        assert_equal(float(results[i].split()[0]), 2.0 * values[i])
+
+
+def test_start_local_agents():
+    """Test starting and stopping agents on this host."""
+    processes, started = start_agents(["a:2", "b"], "local", token)
+    try:
+        with Dispatcher(started, token) as dispatcher:
+            assert_equal(dispatcher.total_slots, 3)
+    finally:
+        stop_agents(processes)
+    for process in processes:
+        assert_true(process.poll() is not None)
+
+
+def test_dakota_hosts():
+    """Test that hosts set the concurrency of a batch experiment."""
+    d = Dakota(
+        plugin="_dispatch_test", hosts=["node1:4", "node2:2"], run_directory=tmp_dir
+    )
+    assert_equal(d.hosts, ["node1:4", "node2:2"])
+    assert_true(d.interface.batch)
+    assert_equal(d.interface.evaluation_concurrency, 6)
+    assert_equal(d.interface.analysis_driver, "dakota_run_batch")
@@ -0,0 +1,103 @@
+"""Tests for the dakotathon.distributions module."""
+
+import math
+import numpy as np
+from statistics import NormalDist
+from nose.tools import assert_true, assert_equal
+from numpy.testing import assert_allclose, assert_array_equal
+from dakotathon.distributions import (
+    normal_ppf,
+    normal_cdf,
+    gamma_cdf,
+    gamma_ppf,
+    beta_cdf,
+    beta_ppf,
+    triangular_ppf,
+    weibull_ppf,
+    histogram_ppf,
+    lognormal_parameters,
+    unit_samples,
+    induce_correlation,
+)
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_normal_ppf():
+    """Test the normal quantiles against the standard library."""
+    p = np.linspace(1e-8, 1.0 - 1e-8, 1001)
+    expected = [NormalDist().inv_cdf(value) for value in p]
+    assert_allclose(normal_ppf(p), expected, atol=1e-8)
+
+
+def test_normal_cdf():
+    """Test the normal probabilities against the standard library."""
+    x = np.linspace(-8.0, 8.0, 1001)
+    expected = [NormalDist().cdf(value) for value in x]
+    assert_allclose(normal_cdf(x), expected, atol=1e-15)
+
+
+def test_gamma_cdf_exponential():
+    """Test that a gamma with unit shape is an exponential."""
+    x = np.linspace(0.0, 30.0, 301)
+    assert_allclose(gamma_cdf(x, 1.0, 2.0), 1.0 - np.exp(-x / 2.0), atol=1e-14)
+
+
+def test_beta_cdf_closed_forms():
+    """Test the beta distribution function against closed forms."""
+    x = np.linspace(0.0, 1.0, 101)
+    assert_allclose(beta_cdf(x, 1.0, 1.0), x, atol=1e-14)
+    assert_allclose(beta_cdf(x, 2.0, 2.0), 3 * x ** 2 - 2 * x ** 3, atol=1e-14)
+
+
+def test_gamma_ppf_inverts_cdf():
+    """Test that the gamma quantiles invert the distribution function."""
+    p = np.random.random((50, 2))
+    alpha, beta = np.array([0.5, 9.0]), np.array([1.0, 0.5])
+    assert_allclose(gamma_cdf(gamma_ppf(p, alpha, beta), alpha, beta), p, atol=1e-12)
+
+
+def test_beta_ppf_inverts_cdf():
+    """Test that the beta quantiles invert the distribution function."""
+    p = np.random.random((50, 2))
+    alpha, beta = np.array([2.0, 0.5]), np.array([5.0, 0.5])
+    assert_allclose(beta_cdf(beta_ppf(p, alpha, beta), alpha, beta), p, atol=1e-12)
+
+
+def test_closed_form_quantiles():
+    """Test the triangular, Weibull, and histogram quantiles."""
+    assert_allclose(triangular_ppf([0.0, 0.5, 1.0], 0.0, -2.0, 2.0), [-2, 0, 2])
+    assert_allclose(weibull_ppf(1.0 - math.exp(-1.0), 2.0, 3.0), 3.0)
+    assert_allclose(histogram_ppf([0.25, 0.5], [0.0, 1.0, 2.0], [1, 3, 0]), [1, 4 / 3])
+
+
+def test_lognormal_parameters():
+    """Test the parameters of the logs of lognormal variables."""
+    lambdas, zetas = lognormal_parameters([2.0], [0.5])
+    assert_allclose(np.exp(lambdas + zetas ** 2 / 2), 2.0)
+
+
+def test_lhs_is_stratified():
+    """Test that a Latin hypercube has one point per stratum."""
+    u = unit_samples(20, 3, sample_type="lhs", seed=1)
+    assert_equal(u.shape, (20, 3))
+    for column in u.T:
+        assert_array_equal(np.sort(np.floor(column * 20)), np.arange(20))
+
+
+def test_induce_correlation():
+    """Test the rank correlation and marginals of a reordered sample."""
+    correlation = np.array([[1.0, 0.7], [0.7, 1.0]])
+    sample = np.random.random((2000, 2))
+    x = induce_correlation(sample, correlation, seed=3)
+    assert_array_equal(np.sort(x, axis=0), np.sort(sample, axis=0))
+    ranks = np.argsort(np.argsort(x, axis=0), axis=0)
+    assert_true(abs(np.corrcoef(ranks, rowvar=False)[0, 1] - 0.7) < 0.03)
@@ -87,6 +87,13 @@ def test_plugin_sets_analysis_driver():
     assert_equal(e.interface.analysis_driver, "dakota_run_plugin")
 
 
+def test_batch_plugin_sets_analysis_driver():
+    """Test that a plugin in batch mode uses the batch driver."""
+    e = Experiment(plugin="hydrotrend", batch=True)
+    assert_equal(e.interface.analysis_driver, "dakota_run_batch")
+    assert_true(e.interface.batch)
+
+
 @raises(AttributeError)
 def test_setting_component_and_plugin():
     """Test that setting component and plugin raises exception."""
@@ -168,6 +175,16 @@ def test_set_variables():
     assert_equal(e.variables, inst)
 
 
+def test_set_variables_from_shape_scale():
+    """Test replacing gamma variables with another variables type."""
+    from dakotathon.variables.normal_uncertain import NormalUncertain
+
+    e = Experiment(variables="gamma_uncertain")
+    inst = NormalUncertain()
+    e.variables = inst
+    assert_equal(e.variables, inst)
+
+
 @raises(TypeError)
 def test_set_variables_fails_if_not_instance():
     """Test that variables fails with a non-instance input."""
@@ -238,3 +255,47 @@ def test_str_length():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 25)
+
+
+def test_str_with_many_variables():
+    """Test __str__ with a large set of variables."""
+    n = 10000
+    x = Experiment(
+        variables="uniform_uncertain",
+        descriptors=["x{}".format(i) for i in range(n)],
+        lower_bounds=[0.0] * n,
+        upper_bounds=[1.0] * n,
+    )
+    lines = str(x).splitlines()
+    bounds = [line for line in lines if line.strip().startswith("lower_bounds")]
+    assert_equal(len(bounds), 1)
+    assert_equal(len(bounds[0].split()), n + 2)
+
+
+def test_calibration_method_defaults():
+    """Test the responses and gradients used by calibration methods."""
+    x = Experiment(method="nl2sol")
+    assert_equal(x.responses.responses, "calibration_terms")
+    assert_equal(x.responses.gradients, "numerical_gradients")
+    x = Experiment(method="soga")
+    assert_equal(x.responses.responses, "calibration_terms")
+    assert_equal(x.responses.gradients, "no_gradients")
+    x = Experiment(method="optpp_q_newton", gradients="analytic_gradients")
+    assert_equal(x.responses.gradients, "analytic_gradients")
+
+
+def test_str_recover_values():
+    """Test that recover values are checked against the responses."""
+    x = Experiment(
+        failure_capture="recover",
+        recover_values=[0.0, 1.0],
+        response_descriptors=("y1", "y2"),
+    )
+    assert_true("recover = 0.0 1.0" in str(x))
+
+
+@raises(ValueError)
+def test_str_recover_values_fails_if_wrong_length():
+    """Test that recover values need one item per response."""
+    x = Experiment(failure_capture="recover", recover_values=[0.0, 1.0])
+    str(x)
@@ -0,0 +1,187 @@
+"""Tests for the dakotathon.gradients module."""
+
+import os
+import sys
+import types
+import shutil
+import tempfile
+import numpy as np
+from nose.tools import assert_true, assert_false, assert_equal
+from numpy.testing import assert_allclose
+from dakotathon.gradients import (
+    read_active_set,
+    requests_gradients,
+    get_steps,
+    get_points,
+    difference,
+    format_params,
+    get_pool,
+)
+from dakotathon.plugins.base import PluginBase
+from dakotathon.run_plugin import run_plugin
+from dakotathon.store import read_parameters
+from dakotathon.utils import get_response_descriptors, write_results
+
+
+plugin_module = "dakotathon.plugins._quadratic_test"
+
+params_text = """\
+                                          2 variables
+                      1.000000000000000e+00 x1
+                      2.000000000000000e+00 x2
+                                          2 functions
+                                          3 ASV_1:y1
+                                          2 ASV_2:y2
+                                          1 derivative_variables
+                                          2 DVV_1:x2
+                                          1 analysis_components
+{:>42} AC_1:dakota_run_plugin
+                                          7 eval_id
+"""
+
+
+class Quadratic(PluginBase):
+
+    """A plugin whose responses are quadratics of the variables."""
+
+    def setup(self, config):
+        pass
+
+    def call(self):
+        pass
+
+    def load(self, output_file):
+        return None
+
+    def calculate(self):
+        pass
+
+    def write(self, params_file, results_file):
+        _, (x1, x2) = read_parameters(params_file)
+        values = [x1 ** 2 + x2 ** 2, x1 * x2 ** 2]
+        write_results(results_file, values, get_response_descriptors(params_file))
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    module = types.ModuleType(plugin_module)
+    module.classname = "Quadratic"
+    module.is_installed = lambda: True
+    module.Quadratic = Quadratic
+    sys.modules[plugin_module] = module
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    del sys.modules[plugin_module]
+
+
+def write_params(tmp_dir, config_file):
+    """Write a parameters file that asks for values and gradients."""
+    params_file = os.path.join(tmp_dir, "params.in")
+    with open(params_file, "w") as fp:
+        fp.write(params_text.format(config_file))
+    return params_file
+
+
+def test_read_active_set():
+    """Test reading the active set from a parameters file."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        active_set = read_active_set(write_params(tmp_dir, "dakota.yaml"))
+        assert_equal(active_set["values"], [1.0, 2.0])
+        assert_equal(active_set["asv"], [3, 2])
+        assert_equal(active_set["dvv"], [1])
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_requests_gradients():
+    """Test that gradients are computed only for analytic gradients."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        params_file = write_params(tmp_dir, "dakota.yaml")
+        assert_true(
+            requests_gradients({"gradients": "analytic_gradients"}, params_file)
+        )
+        assert_false(requests_gradients({"gradients": "no_gradients"}, params_file))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_central_differences_are_exact_for_quadratics():
+    """Test central differences of a quadratic."""
+    values = np.array([1.0, -2.0, 3.0])
+    steps = get_steps(values, 0.01)
+    points = get_points(values, [0, 2], steps, "central", with_center=False)
+    assert_equal(points.shape, (4, 3))
+    responses = (points ** 2).sum(axis=1, keepdims=True)
+    gradients = difference(responses, [0, 2], steps, "central", with_center=False)
+    assert_allclose(gradients, [[2.0, 6.0]])
+
+
+def test_steps_stay_within_bounds():
+    """Test that steps keep the perturbed points within the bounds."""
+    values = np.array([0.5, 0.9, 0.1, 1.0])
+    lower, upper = [0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 1.0, 1.0]
+    for interval_type in ("forward", "central"):
+        steps = get_steps(values, 1.0, upper, lower, interval_type)
+        points = get_points(values, [0, 1, 2, 3], steps, interval_type)
+        assert_true(np.all(points >= lower))
+        assert_true(np.all(points <= upper))
+    assert_allclose(get_steps(values, 1.0, upper, lower), [0.5, -0.9, 0.1, 0.0])
+    assert_allclose(get_steps(values, 2.0, upper, lower), [0.5, -0.9, 0.2, 0.0])
+
+
+def test_format_params():
+    """Test that a perturbed parameters file asks for values only."""
+    text = format_params(params_text.format("dakota.yaml"), [1.5, 2.0])
+    assert_true("1.500000000000000e+00 x1\n" in text)
+    assert_true(" 1 ASV_1:y1\n" in text)
+    assert_true(" 1 ASV_2:y2\n" in text)
+    assert_true(text.endswith("7 eval_id\n"))
+    text = format_params(params_text.format("dakota.yaml"), [1.5, 2.0], "fd.yaml")
+    assert_true(" fd.yaml AC_1:dakota_run_plugin\n" in text)
+
+
+def test_get_pool_is_reused():
+    """Test that the pool of workers is kept across calls."""
+    config = {"asynchronous": True, "evaluation_concurrency": 2}
+    pool = get_pool("plugin", "_quadratic_test", config)
+    assert_true(get_pool("plugin", "_quadratic_test", config) is pool)
+    assert_equal(pool._max_workers, max((os.cpu_count() or 1) // 2, 1))
+
+
+def test_run_plugin_writes_gradients():
+    """Test that the driver writes values and a gradient block."""
+    from dakotathon.dakota import Dakota
+
+    tmp_dir = tempfile.mkdtemp()
+    start_dir = os.getcwd()
+    try:
+        os.chdir(tmp_dir)
+        d = Dakota(
+            plugin="_quadratic_test",
+            response_descriptors=("y1", "y2"),
+            gradients="analytic_gradients",
+            interval_type="central",
+            evaluation_log="evaluations.log",
+            run_directory=tmp_dir,
+        )
+        config_file = os.path.join(tmp_dir, "dakota.yaml")
+        d.serialize(config_file)
+        params_file = write_params(tmp_dir, config_file)
+        run_plugin(params_file, "results.out")
+        with open("results.out", "r") as fp:
+            lines = fp.read().splitlines()
+        assert_equal(len(lines), 3)
+        assert_allclose(float(lines[0].split()[0]), 5.0)
+        assert_allclose(float(lines[1].strip("[ ]")), 4.0, rtol=1e-9)
+        assert_allclose(float(lines[2].strip("[ ]")), 4.0, rtol=1e-9)
+        assert_equal([name for name in os.listdir(".") if name.startswith("fd.")], [])
+        with open("evaluations.log", "r") as fp:
+            assert_equal(len(fp.readlines()), 1)
+    finally:
+        os.chdir(start_dir)
+        shutil.rmtree(tmp_dir)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+#
+# Cold-start regression tests for the dakotathon package and drivers.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+import sys
+import subprocess
+from nose.tools import assert_true, assert_less
+from . import start_dir
+
+
+# Global variables -----------------------------------------------------
+
+package_root = os.path.dirname(os.path.dirname(start_dir))
+budget = 0.15  # seconds, for the cumulative import of a driver
+heavy_modules = ("numpy", "yaml", "bmipy")
+
+# Helpers --------------------------------------------------------------
+
+
+def import_times(module):
+    """Import a module in a fresh interpreter with ``-X importtime``.
+
+    Returns the cumulative import time of each module, in seconds.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [package_root] + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    _, err = proc.communicate()
+    times = {}
+    for line in err.decode("utf-8").splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue
+        times[fields[2].strip()] = cumulative * 1e-6
+    return times
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_import_dakotathon_is_light():
+    """Test that importing the package doesn't import heavy modules."""
+    times = import_times("dakotathon")
+    assert_true("dakotathon" in times)
+    for name in heavy_modules:
+        assert_true(name not in times, name + " imported by dakotathon")
+
+
+def test_run_plugin_cold_start():
+    """Test the import time of the run_plugin driver."""
+    times = import_times("dakotathon.run_plugin")
+    for name in heavy_modules:
+        assert_true(name not in times, name + " imported by run_plugin")
+    assert_less(times["dakotathon.run_plugin"], budget)
+
+
+def test_run_component_cold_start():
+    """Test the import time of the run_component driver."""
+    times = import_times("dakotathon.run_component")
+    for name in heavy_modules:
+        assert_true(name not in times, name + " imported by run_component")
+    assert_less(times["dakotathon.run_component"], budget)
@@ -1,6 +1,7 @@
 """Tests for the dakotathon.interface.base module."""
 
 import os, sys
+import warnings
 from nose.tools import raises, assert_true, assert_false, assert_equal
 from dakotathon.interface.base import InterfaceBase
 
@@ -128,3 +129,101 @@ def test_change_parameter_names():
     c = ConcreteKwargs(
         work_directory="yay", parameters_file="hello.in", results_file="goodbye.out"
     )
+
+
+def test_str_failure_capture():
+    """Test __str__ with each failure capture mode."""
+    for mode in ("abort", "continuation"):
+        b = ConcreteKwargs(failure_capture=mode)
+        assert_true("failure_capture\n      " + mode in str(b))
+    b = ConcreteKwargs(failure_capture="retry", retry_limit=3)
+    assert_true("retry = 3" in str(b))
+    b = ConcreteKwargs(failure_capture="recover", recover_values=[0.0, 1.5])
+    assert_true("recover = 0.0 1.5" in str(b))
+
+
+@raises(TypeError)
+def test_set_failure_capture_fails_if_unknown():
+    """Test that the failure_capture property fails with an unknown mode."""
+    b = Concrete()
+    b.failure_capture = "ignore"
+
+
+@raises(ValueError)
+def test_str_recover_fails_without_values():
+    """Test that 'recover' fails without recover values."""
+    b = ConcreteKwargs(failure_capture="recover")
+    str(b)
+
+
+@raises(TypeError)
+def test_set_retry_limit_fails_if_float():
+    """Test that the retry_limit property fails with a float."""
+    b = Concrete()
+    b.retry_limit = 2.0
+
+
+@raises(ValueError)
+def test_set_retry_limit_fails_if_not_positive():
+    """Test that the retry_limit property fails with zero."""
+    b = Concrete()
+    b.retry_limit = 0
+
+
+@raises(TypeError)
+def test_set_evaluation_timeout_fails_if_str():
+    """Test that the evaluation_timeout property fails with a str."""
+    b = Concrete()
+    b.evaluation_timeout = "10"
+
+
+def test_work_placement_scratch():
+    """Test placing work directories in node-local scratch space."""
+    b = ConcreteKwargs(
+        work_directory="yay", work_placement="scratch", scratch_directory="/scratch"
+    )
+    assert_equal(b.sync_directory, os.path.join("yay", "run"))
+    assert_true(b.work_directory.startswith("/scratch/dakotathon-"))
+    assert_equal(os.path.basename(b.work_directory), "run")
+
+
+def test_work_placement_scratch_round_trip():
+    """Test that resolved scratch work directories are kept."""
+    b = ConcreteKwargs(work_directory="yay", work_placement="scratch")
+    c = ConcreteKwargs(
+        work_directory=b.work_directory,
+        work_placement="scratch",
+        sync_directory=b.sync_directory,
+    )
+    assert_equal(c.work_directory, b.work_directory)
+    assert_equal(c.sync_directory, b.sync_directory)
+
+
+def test_work_placement_shm_warns_without_shm():
+    """Test that shm falls back to scratch space with a warning."""
+    isdir = os.path.isdir
+    os.path.isdir = lambda path: path != "/dev/shm" and isdir(path)
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            b = ConcreteKwargs(
+                work_directory="yay", work_placement="shm", scratch_directory="/s"
+            )
+    finally:
+        os.path.isdir = isdir
+    assert_equal(caught[0].category, RuntimeWarning)
+    assert_true(b.work_directory.startswith("/s/dakotathon-"))
+
+
+def test_work_placement_run():
+    """Test that work directories are in the run directory by default."""
+    b = ConcreteKwargs(work_directory="yay")
+    assert_equal(b.work_directory, os.path.join("yay", "run"))
+    assert_true(b.sync_directory is None)
+
+
+@raises(TypeError)
+def test_set_work_placement_fails_if_unknown():
+    """Test that the work_placement property fails with an unknown place."""
+    b = Concrete()
+    b.work_placement = "nfs"
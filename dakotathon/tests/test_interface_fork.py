@@ -1,7 +1,7 @@
 """Tests for the dakotathon.interface.fork module."""
 
 import os
-from nose.tools import assert_true, assert_false, assert_equal
+from nose.tools import raises, assert_true, assert_false, assert_equal
 from dakotathon.interface.fork import Fork
 from .test_interface_base import default_str_lines
 
@@ -60,3 +60,66 @@ def test_str_length():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, default_str_lines + 9)
+
+
+def test_batch_default():
+    """Test that batch mode is off by default."""
+    assert_false(f.batch)
+    assert_equal(f.batch_size, None)
+
+
+@raises(TypeError)
+def test_set_batch_fails_if_not_bool():
+    """Test that a non-bool batch fails."""
+    x = Fork()
+    x.batch = 1
+
+
+@raises(TypeError)
+def test_set_batch_size_fails_if_not_int():
+    """Test that a non-int batch size fails."""
+    x = Fork()
+    x.batch_size = 2.5
+
+
+def test_str_batch():
+    """Test the batch keywords in __str__."""
+    x = Fork(batch=True, batch_size=8)
+    s = str(x)
+    assert_true("\n  batch\n    size = 8\n" in s)
+    assert_equal(len(s.splitlines()), default_str_lines + 11)
+
+
+def test_str_retention_none():
+    """Test that work directories aren't saved with retention 'none'."""
+    f = Fork(retention="none")
+    s = str(f)
+    assert_true("directory_tag" in s)
+    assert_true("directory_save" not in s)
+    assert_true("file_save" not in s)
+
+
+def test_str_retention_failures():
+    """Test that work directories are saved for the driver to prune."""
+    f = Fork(retention="failures")
+    assert_true("directory_save" in str(f))
+
+
+@raises(TypeError)
+def test_set_retention_fails_if_unknown():
+    """Test that the retention property fails with an unknown policy."""
+    f = Fork()
+    f.retention = "some"
+
+
+@raises(TypeError)
+def test_set_retention_interval_fails_if_float():
+    """Test that the retention_interval property fails with a float."""
+    f = Fork()
+    f.retention_interval = 2.5
+
+
+def test_str_retention_none_in_scratch():
+    """Test that work directories in scratch are saved to be synced."""
+    f = Fork(retention="none", work_placement="scratch")
+    assert_true("directory_save" in str(f))
@@ -0,0 +1,48 @@
+"""Tests for dakotathon.method.base.OptimizationBase."""
+
+from nose.tools import raises, assert_true, assert_equal, assert_is_none
+from dakotathon.method.base import OptimizationBase
+
+
+class Concrete(OptimizationBase):
+
+    """A subclass of OptimizationBase used for testing."""
+
+    def __init__(self, **kwargs):
+        OptimizationBase.__init__(self, **kwargs)
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = Concrete(method="soga")
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    pass
+
+
+def test_get_max_function_evaluations():
+    """Test getting the default max_function_evaluations property."""
+    assert_is_none(c.max_function_evaluations)
+
+
+def test_set_max_function_evaluations():
+    """Test setting the max_function_evaluations property."""
+    m = Concrete(method="soga")
+    m.max_function_evaluations = 500
+    assert_equal(m.max_function_evaluations, 500)
+    assert_true("max_function_evaluations = 500" in str(m))
+
+
+@raises(TypeError)
+def test_max_function_evaluations_fails_if_not_int():
+    """Test that a non-int max_function_evaluations fails."""
+    c.max_function_evaluations = 1.0e3
+
+
+def test_str_length():
+    """Test the default length of __str__."""
+    assert_equal(len(str(c).splitlines()), 2)
@@ -0,0 +1,68 @@
+"""Tests for the dakotathon.method.coliny_pattern_search module."""
+
+from nose.tools import raises, assert_true, assert_false, assert_equal
+from dakotathon.method.coliny_pattern_search import ColinyPatternSearch
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+    global m
+    m = ColinyPatternSearch()
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    pass
+
+
+def test_method_attr():
+    """Test the value of the method attribute."""
+    assert_equal(m.method, "coliny_pattern_search")
+
+
+def test_default_synchronization_is_nonblocking():
+    """Test that the search acts on evaluations as they complete."""
+    assert_equal(m.synchronization, "nonblocking")
+    assert_true("synchronization = nonblocking" in str(m))
+
+
+def test_set_synchronization():
+    """Test setting the synchronization property."""
+    x = ColinyPatternSearch()
+    x.synchronization = "blocking"
+    assert_equal(x.synchronization, "blocking")
+
+
+@raises(TypeError)
+def test_set_synchronization_fails_if_unknown():
+    """Test that an unknown synchronization fails."""
+    m.synchronization = "asynchronous"
+
+
+@raises(TypeError)
+def test_set_exploratory_moves_fails_if_unknown():
+    """Test that unknown exploratory moves fail."""
+    m.exploratory_moves = "random"
+
+
+@raises(ValueError)
+def test_set_contraction_factor_fails_out_of_range():
+    """Test that a contraction factor outside (0,1) fails."""
+    m.contraction_factor = 1.5
+
+
+def test_str_optional_keywords():
+    """Test that optional keywords are written only when set."""
+    x = ColinyPatternSearch()
+    assert_false("seed" in str(x))
+    x.seed = 7
+    x.solution_target = 0.0
+    s = str(x)
+    assert_true("seed = 7" in s)
+    assert_true("solution_target = 0.0" in s)
+
+
+def test_str_length():
+    """Test the default length of __str__."""
+    assert_equal(len(str(ColinyPatternSearch()).splitlines()), 7)
@@ -0,0 +1,49 @@
+"""Tests for the dakotathon.method.nl2sol module."""
+
+from nose.tools import raises, assert_true, assert_false, assert_equal
+from dakotathon.method.nl2sol import Nl2sol
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+    global m
+    m = Nl2sol()
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    pass
+
+
+def test_method_attr():
+    """Test the value of the method attribute."""
+    assert_equal(m.method, "nl2sol")
+
+
+def test_str_tolerances():
+    """Test that tolerances are written only when set."""
+    x = Nl2sol()
+    assert_false("conv_tol" in str(x))
+    x.absolute_conv_tol = 1.0e-8
+    x.x_conv_tol = 1.0e-6
+    s = str(x)
+    assert_true("absolute_conv_tol = 1e-08" in s)
+    assert_true("x_conv_tol = 1e-06" in s)
+
+
+@raises(TypeError)
+def test_set_function_precision_fails_if_not_float():
+    """Test that a non-float function precision fails."""
+    m.function_precision = 1
+
+
+@raises(TypeError)
+def test_set_initial_trust_radius_fails_if_not_float():
+    """Test that a non-float initial trust radius fails."""
+    m.initial_trust_radius = "1"
+
+
+def test_str_length():
+    """Test the default length of __str__."""
+    assert_equal(len(str(Nl2sol()).splitlines()), 3)
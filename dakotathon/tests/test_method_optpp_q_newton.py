@@ -0,0 +1,59 @@
+"""Tests for the dakotathon.method.optpp_q_newton module."""
+
+from nose.tools import raises, assert_true, assert_false, assert_equal
+from dakotathon.method.optpp_q_newton import OptppQNewton
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+    global m
+    m = OptppQNewton()
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    pass
+
+
+def test_method_attr():
+    """Test the value of the method attribute."""
+    assert_equal(m.method, "optpp_q_newton")
+
+
+def test_set_search_method():
+    """Test setting the search_method property."""
+    x = OptppQNewton()
+    x.search_method = "gradient_based_line_search"
+    assert_true("search_method = gradient_based_line_search" in str(x))
+
+
+@raises(TypeError)
+def test_set_search_method_fails_if_unknown():
+    """Test that an unknown search method fails."""
+    m.search_method = "newton"
+
+
+def test_speculative():
+    """Test toggling speculative gradients."""
+    x = OptppQNewton()
+    assert_false("speculative" in str(x))
+    x.speculative = True
+    assert_true("    speculative\n" in str(x))
+
+
+@raises(TypeError)
+def test_set_speculative_fails_if_not_bool():
+    """Test that a non-bool speculative fails."""
+    m.speculative = 1
+
+
+@raises(TypeError)
+def test_set_gradient_tolerance_fails_if_not_float():
+    """Test that a non-float gradient tolerance fails."""
+    m.gradient_tolerance = "small"
+
+
+def test_str_length():
+    """Test the default length of __str__."""
+    assert_equal(len(str(OptppQNewton()).splitlines()), 4)
@@ -135,3 +135,119 @@ def test_str_length_with_options():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 9)
+
+
+def test_get_sparse_grid_level():
+    """Test getting the sparse_grid_level property."""
+    assert_true(type(x.sparse_grid_level) is int)
+
+
+@raises(TypeError)
+def test_set_sparse_grid_level_fails_if_float():
+    """Test that the sparse_grid_level property fails with a float."""
+    m = PolynomialChaos()
+    m.sparse_grid_level = 2.0
+
+
+def test_set_p_refinement():
+    """Test setting the p_refinement property."""
+    m = PolynomialChaos()
+    for value in ["uniform", "dimension_adaptive", None]:
+        m.p_refinement = value
+        assert_equal(m.p_refinement, value)
+
+
+@raises(ValueError)
+def test_set_p_refinement_fails_if_unknown():
+    """Test that the p_refinement property fails with an unknown type."""
+    m = PolynomialChaos()
+    m.p_refinement = "foo"
+
+
+def test_str_sparse_grid():
+    """Test __str__ with the sparse grid approach."""
+    m = PolynomialChaos(
+        coefficient_estimation_approach="sparse_grid_level_sequence",
+        sparse_grid_level=3,
+        p_refinement="dimension_adaptive",
+    )
+    s = str(m)
+    assert_true("sparse_grid_level = 3" in s)
+    assert_true("p_refinement dimension_adaptive" in s)
+    assert_true("quadrature_order" not in s)
+
+
+def test_evaluation_count_tensor_grid():
+    """Test evaluation_count with a tensor grid."""
+    m = PolynomialChaos(quadrature_order=3)
+    assert_equal(m.evaluation_count(4), 81)
+
+
+def test_evaluation_count_sparse_grid():
+    """Test evaluation_count with a sparse grid."""
+    m = PolynomialChaos(coefficient_estimation_approach="sparse_grid_level_sequence")
+    m.nested = True
+    assert_equal(m.evaluation_count(2), 13)
+    assert_equal(m.evaluation_count(8), 145)
+
+
+def test_evaluation_count_anisotropic_sparse_grid():
+    """Test that dimension_preference reduces the sparse grid."""
+    m = PolynomialChaos(coefficient_estimation_approach="sparse_grid_level_sequence")
+    n_isotropic = m.evaluation_count(2)
+    m.dimension_preference = (2, 1)
+    assert_true(m.evaluation_count(2) < n_isotropic)
+
+
+@raises(ValueError)
+def test_evaluation_count_fails_with_mismatched_dimension_preference():
+    """Test that evaluation_count fails if dimension_preference is too short."""
+    m = PolynomialChaos(dimension_preference=(2, 1))
+    m.evaluation_count(3)
+
+
+def test_set_collocation_ratio():
+    """Test setting the collocation_ratio property."""
+    m = PolynomialChaos()
+    m.collocation_ratio = 1.5
+    assert_equal(m.collocation_ratio, 1.5)
+
+
+@raises(ValueError)
+def test_set_collocation_ratio_fails_if_negative():
+    """Test that the collocation_ratio property fails if negative."""
+    m = PolynomialChaos()
+    m.collocation_ratio = -1.0
+
+
+def test_str_regression():
+    """Test __str__ with the regression approach."""
+    m = PolynomialChaos(coefficient_estimation_approach="expansion_order_sequence")
+    s = str(m)
+    assert_true("expansion_order = 2" in s)
+    assert_true("collocation_ratio = 2.0" in s)
+    assert_true("nested" not in s)
+
+
+def test_evaluation_count_regression():
+    """Test evaluation_count with regression."""
+    m = PolynomialChaos(
+        coefficient_estimation_approach="expansion_order_sequence",
+        expansion_order=2,
+        collocation_ratio=2.0,
+    )
+    assert_equal(m.evaluation_count(8), 90)
+
+
+@raises(ValueError)
+def test_set_coefficient_estimation_approach_fails_if_unknown():
+    """Test that an unknown coefficient estimation approach fails."""
+    m = PolynomialChaos()
+    m.coefficient_estimation_approach = "foo"
+
+
+@raises(TypeError)
+def test_set_coefficient_estimation_approach_fails_if_not_str():
+    """Test that the coefficient estimation approach must be a str."""
+    m = PolynomialChaos()
+    m.coefficient_estimation_approach = 2
@@ -56,3 +56,37 @@ def test_str_length():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 6)
+
+
+def test_get_refinement_samples():
+    """Test getting the refinement_samples property."""
+    assert_is_none(x.refinement_samples)
+
+
+def test_set_refinement_samples():
+    """Test setting the refinement_samples property."""
+    m = Sampling()
+    for items in [10, [10, 20], (10, 20)]:
+        m.refinement_samples = items
+        assert_true(type(m.refinement_samples) is tuple)
+
+
+@raises(TypeError)
+def test_set_refinement_samples_fails_if_float():
+    """Test that the refinement_samples property fails with a float."""
+    m = Sampling()
+    m.refinement_samples = 10.0
+
+
+def test_total_samples():
+    """Test that total_samples includes refinement batches."""
+    m = Sampling(samples=10, refinement_samples=(10, 20))
+    assert_equal(m.total_samples, 40)
+
+
+def test_str_with_refinement_samples():
+    """Test that __str__ includes refinement samples."""
+    m = Sampling(refinement_samples=(10, 20))
+    s = str(m)
+    assert_true("refinement_samples = 10 20" in s)
+    assert_equal(len(s.splitlines()), 7)
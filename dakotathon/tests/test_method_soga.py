@@ -0,0 +1,55 @@
+"""Tests for the dakotathon.method.soga module."""
+
+from nose.tools import raises, assert_true, assert_equal, assert_is_none
+from dakotathon.method.soga import Soga
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+    global m
+    m = Soga()
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    pass
+
+
+def test_method_attr():
+    """Test the value of the method attribute."""
+    assert_equal(m.method, "soga")
+
+
+def test_get_population_size():
+    """Test getting the default population_size property."""
+    assert_equal(m.population_size, 50)
+
+
+def test_set_population_size():
+    """Test setting the population_size property."""
+    x = Soga()
+    x.population_size = 64
+    assert_true("population_size = 64" in str(x))
+
+
+@raises(TypeError)
+def test_set_population_size_fails_if_not_int():
+    """Test that a non-int population_size fails."""
+    m.population_size = 64.0
+
+
+def test_get_seed():
+    """Test getting the default seed property."""
+    assert_is_none(m.seed)
+
+
+@raises(TypeError)
+def test_set_seed_fails_if_not_int():
+    """Test that a non-int seed fails."""
+    m.seed = "42"
+
+
+def test_str_length():
+    """Test the default length of __str__."""
+    assert_equal(len(str(Soga()).splitlines()), 4)
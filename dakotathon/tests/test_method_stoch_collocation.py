@@ -155,3 +155,86 @@ def test_str_length_with_options():
     s = str(m)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 9)
+
+
+def test_get_sparse_grid_level():
+    """Test getting the sparse_grid_level property."""
+    assert_true(type(x.sparse_grid_level) is int)
+
+
+@raises(TypeError)
+def test_set_sparse_grid_level_fails_if_float():
+    """Test that the sparse_grid_level property fails with a float."""
+    m = StochasticCollocation()
+    m.sparse_grid_level = 2.0
+
+
+def test_set_p_refinement():
+    """Test setting the p_refinement property."""
+    m = StochasticCollocation()
+    for value in ["uniform", "dimension_adaptive", None]:
+        m.p_refinement = value
+        assert_equal(m.p_refinement, value)
+
+
+@raises(ValueError)
+def test_set_p_refinement_fails_if_unknown():
+    """Test that the p_refinement property fails with an unknown type."""
+    m = StochasticCollocation()
+    m.p_refinement = "foo"
+
+
+def test_str_sparse_grid():
+    """Test __str__ with the sparse grid approach."""
+    m = StochasticCollocation(
+        coefficient_estimation_approach="sparse_grid_level_sequence",
+        sparse_grid_level=3,
+        p_refinement="dimension_adaptive",
+    )
+    s = str(m)
+    assert_true("sparse_grid_level = 3" in s)
+    assert_true("p_refinement dimension_adaptive" in s)
+    assert_true("quadrature_order" not in s)
+
+
+def test_evaluation_count_tensor_grid():
+    """Test evaluation_count with a tensor grid."""
+    m = StochasticCollocation(quadrature_order=3)
+    assert_equal(m.evaluation_count(4), 81)
+
+
+def test_evaluation_count_sparse_grid():
+    """Test evaluation_count with a sparse grid."""
+    m = StochasticCollocation(coefficient_estimation_approach="sparse_grid_level_sequence")
+    m.nested = True
+    assert_equal(m.evaluation_count(2), 13)
+    assert_equal(m.evaluation_count(8), 145)
+
+
+def test_evaluation_count_anisotropic_sparse_grid():
+    """Test that dimension_preference reduces the sparse grid."""
+    m = StochasticCollocation(coefficient_estimation_approach="sparse_grid_level_sequence")
+    n_isotropic = m.evaluation_count(2)
+    m.dimension_preference = (2, 1)
+    assert_true(m.evaluation_count(2) < n_isotropic)
+
+
+@raises(ValueError)
+def test_evaluation_count_fails_with_mismatched_dimension_preference():
+    """Test that evaluation_count fails if dimension_preference is too short."""
+    m = StochasticCollocation(dimension_preference=(2, 1))
+    m.evaluation_count(3)
+
+
+@raises(ValueError)
+def test_set_coefficient_estimation_approach_fails_if_unknown():
+    """Test that an unknown coefficient estimation approach fails."""
+    m = StochasticCollocation()
+    m.coefficient_estimation_approach = "expansion_order_sequence"
+
+
+@raises(TypeError)
+def test_set_coefficient_estimation_approach_fails_if_not_str():
+    """Test that the coefficient estimation approach must be a str."""
+    m = StochasticCollocation()
+    m.coefficient_estimation_approach = 2
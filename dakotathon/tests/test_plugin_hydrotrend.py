@@ -13,9 +13,15 @@ import filecmp
 import tempfile
 import numpy as np
 from numpy.testing import assert_almost_equal
-from nose.tools import raises, with_setup, assert_is, assert_true
-from dakotathon.plugins.hydrotrend import HydroTrend, is_installed
+from nose.tools import raises, with_setup, assert_is, assert_true, assert_equal
+from dakotathon.plugins.hydrotrend import (
+    HydroTrend,
+    is_installed,
+    read_ascii_output,
+    read_binary_output,
+)
 from dakotathon.utils import deserialize
+from dakotathon.calibration import load_observations
 from . import start_dir, data_dir
 
 
@@ -112,9 +118,153 @@ def test_load_does_not_exist():
     assert_is(r, None)
 
 
+def test_load_is_cached():
+    """Test that load() reads an unchanged output file only once."""
+    x = HydroTrend()
+    with tempfile.NamedTemporaryFile("w", delete=False) as fp:
+        fp.write("h1\nh2\n0\n1\n2\n")
+        output_file = fp.name
+    try:
+        r1 = x.load(output_file)
+        r2 = x.load(output_file)
+        with open(output_file, "w") as fp:
+            fp.write("h1\nh2\n5\n")
+        os.utime(output_file, ns=(0, os.stat(output_file).st_mtime_ns + 10 ** 9))
+        r3 = x.load(output_file)
+    finally:
+        os.remove(output_file)
+    assert_is(r1, r2)
+    assert_almost_equal(r3, 5.0)
+    assert_equal(len(x._series), 1)
+
+
+def test_calculate_reads_output_columns():
+    """Test that calculate() reads the configured columns."""
+    tmp_dir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_dir)
+        os.mkdir("output")
+        with open(os.path.join("output", "HYDROASCII.QS"), "w") as fp:
+            fp.write("h1\nh2\n0 1.0\n1 3.0\n")
+        x = HydroTrend(
+            output_dir="output",
+            output_files=["HYDROASCII.QS"],
+            output_statistics=["mean"],
+            output_columns=1,
+        )
+        x.calculate()
+        assert_almost_equal(x.output_values, [2.0])
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp_dir)
+
+
+def test_load_binary():
+    """Test load() with a binary output file."""
+    x = HydroTrend(output_format="binary", binary_offset=4)
+    with tempfile.NamedTemporaryFile("wb", delete=False) as fp:
+        fp.write(b"HEAD")
+        np.arange(5, dtype="<f4").tofile(fp)
+        output_file = fp.name
+    r = x.load(output_file)
+    os.remove(output_file)
+    assert_almost_equal(r, np.arange(5, dtype=float))
+
+
+def test_setup_files_binary():
+    """Test that setup_files() reads the binary output settings."""
+    x = HydroTrend()
+    x.setup_files(
+        {
+            "template_file": "HYDRO.IN.dtmpl",
+            "auxiliary_files": ["HYDRO0.HYPS"],
+            "response_files": ["HYDROOUTPUT.Q"],
+            "response_statistics": ["mean"],
+            "output_format": "binary",
+            "binary_dtype": ">f8",
+            "binary_offset": 8,
+            "output_columns": [1],
+        }
+    )
+    assert_equal(x.output_columns, [1])
+    assert_equal(x.output_format, "binary")
+    assert_equal(x.binary_dtype, ">f8")
+    assert_equal(x.binary_offset, 8)
+
+
+def test_read_ascii_output_columns():
+    """Test selecting columns from a text output file."""
+    with tempfile.NamedTemporaryFile("w", delete=False) as fp:
+        fp.write("h1\nh2\n0 10 20\n1 11 21\n")
+        output_file = fp.name
+    r = read_ascii_output(output_file)
+    c = read_ascii_output(output_file, columns=[0, 2])
+    os.remove(output_file)
+    assert_equal(r.shape, (2, 3))
+    assert_almost_equal(c, [[0, 20], [1, 21]])
+
+
+@raises(ValueError)
+def test_read_ascii_output_ragged():
+    """Test that rows of unequal length raise an error."""
+    with tempfile.NamedTemporaryFile("w", delete=False) as fp:
+        fp.write("h1\nh2\n0 10\n1\n")
+        output_file = fp.name
+    try:
+        read_ascii_output(output_file)
+    finally:
+        os.remove(output_file)
+
+
+def test_read_binary_output():
+    """Test reading a binary output file with a given dtype."""
+    with tempfile.NamedTemporaryFile("wb", delete=False) as fp:
+        np.arange(3, dtype=">f8").tofile(fp)
+        output_file = fp.name
+    r = read_binary_output(output_file, dtype=">f8")
+    os.remove(output_file)
+    assert_almost_equal(r, np.arange(3, dtype=float))
+
+
 @with_setup(setup, teardown)
 def test_write():
     """Test the write method output versus a known results file."""
     h.output_values = [1.0, 2.0]
     h.write(params_file, results_file)
     assert_true(filecmp.cmp(known_results_file, results_file))
+
+
+def test_calculate_residuals():
+    """Test that calculate() computes residuals against observations."""
+    tmp_dir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_dir)
+        os.mkdir("output")
+        with open(os.path.join("output", "HYDROASCII.QS"), "w") as fp:
+            fp.write("h1\nh2\n1.0\n2.0\n4.0\n")
+        with open("qs.txt", "w") as fp:
+            fp.write("0 0.5 4.0\n2 3.0 1.0\n")
+        x = HydroTrend(output_dir="output", output_files=["HYDROASCII.QS"])
+        x._observations = load_observations({"observation_files": ["qs.txt"]})
+        x.calculate()
+        assert_almost_equal(x.output_values, [1.0, 1.0])
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp_dir)
+
+
+def test_write_fails_on_missing_residual():
+    """Test that a residual without model output fails the evaluation."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        x = HydroTrend()
+        x._observations = [(np.array([0.0]), np.array([1.0]), np.array([1.0]))]
+        x.output_values = [np.nan]
+        results_file = os.path.join(tmp_dir, "results.out")
+        x.write(None, results_file)
+        with open(results_file, "r") as fp:
+            assert_equal(fp.read().strip(), "fail")
+    finally:
+        shutil.rmtree(tmp_dir)
@@ -43,6 +43,8 @@ def teardown():
     """Called at end of any test using it @with_setup()"""
     if os.path.exists(config_file):
         os.remove(config_file)
+    if os.path.exists(config_file + ".json"):
+        os.remove(config_file + ".json")
     if os.path.exists("dakota.in"):
         os.remove("dakota.in")
     if os.path.exists("run.log"):
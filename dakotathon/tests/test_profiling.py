@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# Tests for the dakotathon.profiling module.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+from nose.tools import (
+    raises,
+    assert_equal,
+    assert_true,
+    assert_is_none,
+    assert_almost_equal,
+)
+from dakotathon.profiling import (
+    EvaluationTimer,
+    phase,
+    process_age,
+    get_evaluation_log,
+    summarize_timings,
+)
+
+
+# Global variables -----------------------------------------------------
+
+log_file = "evaluations.jsonl"
+
+# Fixtures -------------------------------------------------------------
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    if os.path.exists(log_file):
+        os.remove(log_file)
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_phase_without_timer():
+    """Test that phase is a no-op without an active timer."""
+    with phase("setup"):
+        pass
+
+
+def test_timer_phases():
+    """Test that a timer records top-level and nested phases."""
+    with EvaluationTimer(eval_id=3) as timer:
+        with phase("setup"):
+            with phase("dprepro"):
+                pass
+        with phase("call"):
+            pass
+    assert_equal(sorted(timer.phases), ["call", "setup", "setup.dprepro"])
+    assert_equal(timer.status, "ok")
+    assert_equal(timer.record()["eval_id"], 3)
+
+
+@raises(ValueError)
+def test_timer_status_on_error():
+    """Test that a timer records the exception type as its status."""
+    timer = EvaluationTimer()
+    try:
+        with timer:
+            raise ValueError
+    finally:
+        assert_equal(timer.status, "ValueError")
+
+
+def test_process_age():
+    """Test that process_age is positive or unavailable."""
+    age = process_age()
+    assert_true(age is None or age >= 0.0)
+
+
+def test_get_evaluation_log():
+    """Test get_evaluation_log with and without a log file."""
+    assert_is_none(get_evaluation_log({}))
+    config = {"run_directory": "/foo", "evaluation_log": log_file}
+    assert_equal(get_evaluation_log(config), os.path.join("/foo", log_file))
+
+
+def test_summarize_timings():
+    """Test summarizing an evaluation log."""
+    if os.path.exists(log_file):
+        os.remove(log_file)
+    for i in range(4):
+        with EvaluationTimer(eval_id=i + 1) as timer:
+            with phase("setup"):
+                pass
+            with phase("call"):
+                pass
+        timer.write(log_file)
+    summary = summarize_timings(log_file)
+    assert_equal(summary["evaluations"], 4)
+    assert_equal(summary["status"], {"ok": 4})
+    fractions = [summary["phases"][name]["fraction"] for name in ("setup", "call")]
+    assert_almost_equal(sum(fractions), 1.0)
+    assert_true("p90" in summary["phases"]["call"])
+    assert_true("elapsed" not in summary["phases"])
+    assert_true("peak_rss_kb" not in summary["phases"])
+    assert_true("max" in summary["evaluation"]["elapsed"])
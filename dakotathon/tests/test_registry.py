@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#
+# Tests for the dakotathon.registry module.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+import sys
+import json
+import types
+import shutil
+import tempfile
+from nose.tools import raises, assert_equal, assert_is, assert_true
+from dakotathon import registry
+from dakotathon.registry import get_plugin_index, list_plugins, load_plugin
+
+
+# Global variables -----------------------------------------------------
+
+cache_dir = None
+saved_cache_dir = None
+fake_module = "_dakotathon_fake_plugin"
+
+# Fixtures -------------------------------------------------------------
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    global cache_dir, saved_cache_dir
+    print("\n*** " + __name__)
+    cache_dir = tempfile.mkdtemp()
+    saved_cache_dir = os.environ.get("DAKOTATHON_CACHE_DIR")
+    os.environ["DAKOTATHON_CACHE_DIR"] = cache_dir
+    registry._index = None
+    module = types.ModuleType(fake_module)
+    module.classname = "Fake"
+    sys.modules[fake_module] = module
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    if saved_cache_dir is None:
+        del os.environ["DAKOTATHON_CACHE_DIR"]
+    else:
+        os.environ["DAKOTATHON_CACHE_DIR"] = saved_cache_dir
+    registry._index = None
+    del sys.modules[fake_module]
+    shutil.rmtree(cache_dir)
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_load_builtin_plugin():
+    """Test loading a built-in plugin."""
+    module = load_plugin("hydrotrend")
+    assert_equal(module.classname, "HydroTrend")
+
+
+@raises(ImportError)
+def test_load_unknown_plugin():
+    """Test that loading an unknown plugin fails."""
+    load_plugin("foo")
+
+
+def test_list_plugins():
+    """Test that the built-in plugins are listed."""
+    assert_true("hydrotrend" in list_plugins())
+
+
+def test_index_is_cached():
+    """Test that the plugin index is written to the cache."""
+    registry._index = None
+    get_plugin_index()
+    cache_file = os.path.join(cache_dir, "plugins.json")
+    assert_true(os.path.exists(cache_file))
+    with open(cache_file, "r") as fp:
+        cache = json.load(fp)
+    assert_equal(cache["key"], registry._path_key())
+    assert_equal(os.listdir(cache_dir), ["plugins.json"])
+
+
+def test_path_key_ignores_current_directory():
+    """Test that evaluation directories on the path don't change the key."""
+    key = registry._path_key()
+    run_dir = tempfile.mkdtemp()
+    start_dir = os.getcwd()
+    sys.path.insert(0, run_dir)
+    try:
+        os.chdir(run_dir)
+        with open("params.in", "w") as fp:
+            fp.write("")
+        assert_equal(registry._path_key(), key)
+    finally:
+        os.chdir(start_dir)
+        sys.path.remove(run_dir)
+        shutil.rmtree(run_dir)
+
+
+def test_load_from_cached_index():
+    """Test loading a plugin listed in the cached index."""
+    cache_file = os.path.join(cache_dir, "plugins.json")
+    with open(cache_file, "w") as fp:
+        json.dump({"key": registry._path_key(), "plugins": {"fake": fake_module}}, fp)
+    registry._index = None
+    module = load_plugin("fake")
+    assert_is(module, sys.modules[fake_module])
+
+
+def test_stale_index_is_rescanned():
+    """Test that an index for a different path is ignored."""
+    cache_file = os.path.join(cache_dir, "plugins.json")
+    with open(cache_file, "w") as fp:
+        json.dump({"key": [], "plugins": {"fake": fake_module}}, fp)
+    registry._index = None
+    assert_true("fake" not in get_plugin_index())
@@ -0,0 +1,103 @@
+"""Tests for the dakotathon.responses.calibration_terms module."""
+
+import os
+import shutil
+import tempfile
+from nose.tools import raises, assert_true, assert_false, assert_equal, assert_is_none
+from dakotathon.responses.calibration_terms import CalibrationTerms
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global r
+    r = CalibrationTerms()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_responses():
+    """Test the responses attribute."""
+    assert_equal(r.responses, "calibration_terms")
+
+
+def test_get_calibration_data_file():
+    """Test getting the default calibration_data_file property."""
+    assert_is_none(r.calibration_data_file)
+
+
+def test_calibration_data_file_is_absolute():
+    """Test that the calibration data file path is made absolute."""
+    x = CalibrationTerms(calibration_data_file="obs.dat")
+    assert_equal(x.calibration_data_file, os.path.abspath("obs.dat"))
+
+
+@raises(TypeError)
+def test_set_calibration_data_format_fails_if_unknown():
+    """Test that an unknown calibration data format fails."""
+    r.calibration_data_format = "csv"
+
+
+@raises(TypeError)
+def test_set_num_experiments_fails_if_not_int():
+    """Test that a non-int number of experiments fails."""
+    r.num_experiments = 2.0
+
+
+@raises(TypeError)
+def test_set_weights_fails_with_scalar():
+    """Test that scalar weights fail."""
+    r.weights = 1.0
+
+
+def test_str_with_calibration_data():
+    """Test the responses block with weights and calibration data."""
+    x = CalibrationTerms(
+        response_descriptors=("Qs_mean", "Q_mean"),
+        calibration_data_file="obs.dat",
+        num_experiments=3,
+        weights=(1.0, 0.5),
+    )
+    s = str(x)
+    assert_true("  calibration_terms = 2\n" in s)
+    assert_true("    weights = 1.0 0.5\n" in s)
+    path = os.path.abspath("obs.dat")
+    assert_true("    calibration_data_file = '{}'\n".format(path) in s)
+    assert_true("      freeform\n      num_experiments = 3\n" in s)
+
+
+def test_str_numerical_gradients():
+    """Test that numerical gradients are computed by Dakota."""
+    x = CalibrationTerms(gradients="numerical_gradients", interval_type="central")
+    s = str(x)
+    assert_true("    method_source dakota\n" in s)
+    assert_true("    interval_type = central\n" in s)
+    assert_false("calibration_data_file" in s)
+
+
+def test_str_length():
+    """Test the default length of __str__."""
+    assert_equal(len(str(CalibrationTerms()).splitlines()), 5)
+
+
+def test_str_observation_files():
+    """Test that responses with observations are fields of residuals."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        obs_file = os.path.join(tmp_dir, "qs.txt")
+        with open(obs_file, "w") as fp:
+            fp.write("0 1.0\n1 2.0\n2 3.0\n")
+        x = CalibrationTerms(response_descriptors="Qs", observation_files=obs_file)
+        s = str(x)
+        assert_true("    field_calibration_terms = 1\n      lengths = 3\n" in s)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+@raises(ValueError)
+def test_observation_files_exclude_calibration_data():
+    """Test that observation files and calibration data are exclusive."""
+    CalibrationTerms(calibration_data_file="obs.dat", observation_files="qs.txt")
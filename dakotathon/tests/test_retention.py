@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#
+# Tests for the dakotathon.retention module.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+import shutil
+import tempfile
+from nose.tools import assert_equal, assert_true, assert_false
+from dakotathon.retention import (
+    should_keep,
+    prune_evaluation,
+    get_archive_index,
+    pruned_marker,
+    Compactor,
+)
+
+
+# Global variables -----------------------------------------------------
+
+tmp_dir = None
+params_text = "                                          {} eval_id\n"
+
+
+# Fixtures -------------------------------------------------------------
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    print("\n*** " + __name__)
+
+
+def setup_tmp_dir():
+    """Called at start of each test."""
+    global tmp_dir
+    tmp_dir = tempfile.mkdtemp()
+
+
+def teardown_tmp_dir():
+    """Called at end of each test."""
+    shutil.rmtree(tmp_dir)
+
+
+def make_evaluation(eval_id, name="run"):
+    """Make the work directory of a finished evaluation."""
+    work_dir = os.path.join(tmp_dir, "{}.{}".format(name, eval_id))
+    os.makedirs(os.path.join(work_dir, "output"))
+    with open(os.path.join(work_dir, "params.in"), "w") as fp:
+        fp.write(params_text.format(eval_id))
+    with open(os.path.join(work_dir, "results.out"), "w") as fp:
+        fp.write("1.0 y1\n")
+    with open(os.path.join(work_dir, "output", "model.txt"), "w") as fp:
+        fp.write("output\n")
+    return work_dir
+
+
+def config(policy, interval=None):
+    """Make the configuration settings of a retention policy."""
+    return {
+        "retention": policy,
+        "retention_interval": interval,
+        "work_directory": os.path.join(tmp_dir, "run"),
+    }
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_should_keep():
+    """Test the retention policies."""
+    assert_true(should_keep({}, 1))
+    assert_true(should_keep({"retention": "compress"}, 1))
+    assert_false(should_keep({"retention": "none"}, 1, failed=True))
+    assert_false(should_keep({"retention": "failures"}, 1))
+    assert_true(should_keep({"retention": "failures"}, 1, failed=True))
+    assert_true(should_keep({"retention": "every", "retention_interval": 3}, 4))
+    assert_false(should_keep({"retention": "every", "retention_interval": 3}, 5))
+
+
+def test_prune_evaluation():
+    """Test removing the files of an evaluation that isn't kept."""
+    setup_tmp_dir()
+    try:
+        work_dir = make_evaluation(2)
+        params_file = os.path.join(work_dir, "params.in")
+        results_file = os.path.join(work_dir, "results.out")
+        assert_false(
+            prune_evaluation(config("failures"), params_file, results_file, True)
+        )
+        assert_true(os.path.isdir(os.path.join(work_dir, "output")))
+        assert_true(prune_evaluation(config("failures"), params_file, results_file))
+        assert_equal(
+            sorted(os.listdir(work_dir)),
+            sorted([pruned_marker, "params.in", "results.out"]),
+        )
+    finally:
+        teardown_tmp_dir()
+
+
+def test_prune_evaluation_only_in_work_directory():
+    """Test that files outside of a Dakota work directory are left alone."""
+    setup_tmp_dir()
+    try:
+        work_dir = make_evaluation(1, name="data")
+        params_file = os.path.join(work_dir, "params.in")
+        results_file = os.path.join(work_dir, "results.out")
+        assert_false(prune_evaluation(config("none"), params_file, results_file))
+        assert_true(os.path.isdir(os.path.join(work_dir, "output")))
+    finally:
+        teardown_tmp_dir()
+
+
+def test_compactor_removes_pruned():
+    """Test that the compactor removes only pruned directories."""
+    setup_tmp_dir()
+    try:
+        for eval_id in (1, 2, 3):
+            work_dir = make_evaluation(eval_id)
+            prune_evaluation(
+                config("every", 2),
+                os.path.join(work_dir, "params.in"),
+                os.path.join(work_dir, "results.out"),
+            )
+        compactor = Compactor(os.path.join(tmp_dir, "run"), "every")
+        assert_equal(compactor.compact(), 0)
+        assert_equal(compactor.compact(delay=0), 1)
+        assert_equal(sorted(os.listdir(tmp_dir)), ["run.1", "run.3"])
+    finally:
+        teardown_tmp_dir()
+
+
+def test_compactor_removes_pruned_in_batch():
+    """Test that pruned evaluations inside a batch directory are removed."""
+    setup_tmp_dir()
+    try:
+        batch_dir = make_evaluation(1)
+        for eval_id in (1, 2, 3):
+            eval_dir = make_evaluation(eval_id, name=os.path.join("run.1", "eval"))
+            prune_evaluation(
+                config("every", 2),
+                os.path.join(eval_dir, "params.in"),
+                os.path.join(eval_dir, "results.out"),
+            )
+        compactor = Compactor(os.path.join(tmp_dir, "run"), "every")
+        assert_equal(compactor.compact(delay=0), 1)
+        assert_equal(sorted(os.listdir(tmp_dir)), ["run.1"])
+        names = sorted(n for n in os.listdir(batch_dir) if n.startswith("eval."))
+        assert_equal(names, ["eval.1", "eval.3"])
+    finally:
+        teardown_tmp_dir()
+
+
+def test_compactor_compress():
+    """Test packing directories into an archive in the background."""
+    setup_tmp_dir()
+    try:
+        for eval_id in (1, 2):
+            make_evaluation(eval_id)
+        compactor = Compactor(os.path.join(tmp_dir, "run"), "compress", interval=0.01)
+        compactor.start()
+        make_evaluation(3)
+        compactor.stop()
+        assert_equal(os.listdir(tmp_dir), ["run.zip"])
+        index = get_archive_index(compactor.archive_file)
+        assert_equal(sorted(index), ["run.1", "run.2", "run.3"])
+        assert_true("output/model.txt" in index["run.3"])
+    finally:
+        teardown_tmp_dir()
+
+
+def test_compactor_syncs_from_scratch():
+    """Test syncing kept directories and results back from scratch."""
+    setup_tmp_dir()
+    try:
+        scratch = os.path.join(tmp_dir, "scratch")
+        destination = os.path.join(tmp_dir, "dest", "run")
+        os.makedirs(os.path.dirname(destination))
+        for eval_id in (1, 2):
+            work_dir = make_evaluation(eval_id)
+            shutil.move(work_dir, os.path.join(scratch, os.path.basename(work_dir)))
+        prune_evaluation(
+            config("failures"),
+            os.path.join(scratch, "run.2", "params.in"),
+            os.path.join(scratch, "run.2", "results.out"),
+        )
+        compactor = Compactor(
+            os.path.join(scratch, "run"), "failures", destination=destination
+        )
+        compactor.stop()
+        assert_false(os.path.exists(scratch))
+        assert_equal(
+            sorted(os.listdir(os.path.dirname(destination))), ["run.1", "run.results"]
+        )
+        assert_true(
+            os.path.isfile(os.path.join(destination + ".1", "output", "model.txt"))
+        )
+        with open(destination + ".results", "r") as fp:
+            assert_equal(fp.read(), "# run.2\n1.0 y1\n")
+    finally:
+        teardown_tmp_dir()
@@ -27,6 +27,8 @@ def teardown_module():
         os.remove(input_file)
     if os.path.exists(config_file):
         os.remove(config_file)
+    if os.path.exists(config_file + ".json"):
+        os.remove(config_file + ".json")
 
 
 def test_create_input_file():
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+#
+# Tests for the dakotathon.run_batch module.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+import sys
+import types
+import shutil
+import tempfile
+import multiprocessing
+from nose.tools import raises, assert_equal, assert_true
+from nose.plugins.skip import SkipTest
+from dakotathon.dakota import Dakota
+from dakotathon.plugins.base import PluginBase
+from dakotathon.run_batch import split_params_file, run_batch, main, _get_eval_id
+from dakotathon.utils import get_response_descriptors, write_results
+
+
+# Global variables -----------------------------------------------------
+
+tmp_dir = None
+plugin_module = "dakotathon.plugins._batch_test"
+params_template = """\
+                                          1 variables
+                      {x:.15e} x1
+                                          1 functions
+                                          1 ASV_1:y1
+                                          1 derivative_variables
+                                          1 DVV_1:x1
+                                          1 analysis_components
+                                {config} AC_1:dakota_run_batch
+                                          {eval_id} eval_id
+"""
+
+
+class Double(PluginBase):
+
+    """A plugin whose response is twice its variable, or fails if negative."""
+
+    def setup(self, config):
+        self.params_file = config["parameters_file"]
+
+    def call(self):
+        with open(self.params_file, "r") as fp:
+            self.x = float(fp.readlines()[1].split()[0])
+        if self.x < 0:
+            raise ValueError("negative")
+
+    def load(self, output_file):
+        return None
+
+    def calculate(self):
+        self.value = 2.0 * self.x
+
+    def write(self, params_file, results_file):
+        labels = get_response_descriptors(params_file)
+        write_results(results_file, [self.value], labels)
+
+
+# Fixtures -------------------------------------------------------------
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    global tmp_dir
+    print("\n*** " + __name__)
+    tmp_dir = tempfile.mkdtemp()
+    module = types.ModuleType(plugin_module)
+    module.classname = "Double"
+    module.is_installed = lambda: True
+    module.Double = Double
+    sys.modules[plugin_module] = module
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    del sys.modules[plugin_module]
+    shutil.rmtree(tmp_dir)
+
+
+def write_batch(values):
+    """Write a configuration and a batch parameters file."""
+    config_file = os.path.join(tmp_dir, "dakota.yaml")
+    d = Dakota(
+        plugin="_batch_test",
+        batch=True,
+        evaluation_concurrency=2,
+        run_directory=tmp_dir,
+        work_directory=tmp_dir,
+    )
+    d.serialize(config_file)
+    params_file = os.path.join(tmp_dir, "params.in")
+    with open(params_file, "w") as fp:
+        for i, x in enumerate(values):
+            fp.write(params_template.format(x=x, config=config_file, eval_id=i + 1))
+    return params_file
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_split_params_file():
+    """Test splitting a batch parameters file into evaluations."""
+    params_file = write_batch([1.0, 2.0, 3.0])
+    blocks = split_params_file(params_file)
+    assert_equal(len(blocks), 3)
+    assert_true(blocks[1].strip().startswith("1 variables"))
+    assert_equal([_get_eval_id(block, 0) for block in blocks], ["1", "2", "3"])
+
+
+def test_run_batch():
+    """Test running a batch, with a failed evaluation."""
+    if multiprocessing.get_start_method() != "fork":
+        raise SkipTest("test plugin is only visible to forked workers")
+    params_file = write_batch([1.0, -1.0, 3.0])
+    results_file = os.path.join(tmp_dir, "results.out")
+    start_dir = os.getcwd()
+    os.chdir(tmp_dir)
+    try:
+        run_batch(params_file, results_file)
+    finally:
+        os.chdir(start_dir)
+    with open(results_file, "r") as fp:
+        blocks = fp.read().split("#\n")
+    assert_equal(len(blocks), 3)
+    assert_equal(float(blocks[0].split()[0]), 2.0)
+    assert_equal(blocks[1].strip(), "fail")
+    assert_equal(float(blocks[2].split()[0]), 6.0)
+    assert_true(os.path.isdir(os.path.join(tmp_dir, "eval.3")))
+
+
+@raises(IndexError)
+def test_main_no_args():
+    """Tests main() fails without args."""
+    sys.argv = []
+    main()
@@ -3,8 +3,25 @@
 import os
 import sys
 import shutil
-from nose.tools import raises, with_setup, assert_is_instance, assert_true
-from dakotathon.run_component import run_component, main, ComponentOutput, RunComponent
+import tempfile
+import threading
+from nose.tools import (
+    raises,
+    with_setup,
+    assert_is_instance,
+    assert_true,
+    assert_false,
+    assert_is,
+    assert_is_not,
+    assert_equal,
+)
+from dakotathon.run_component import (
+    run_component,
+    main,
+    ComponentOutput,
+    ComponentPool,
+    RunComponent,
+)
 from dakotathon.dakota import Dakota
 from . import start_dir, data_dir
 
@@ -34,6 +51,8 @@ def teardown():
         os.remove(results_file)
     if os.path.exists(local_config_file):
         os.remove(local_config_file)
+    if os.path.exists(local_config_file + ".json"):
+        os.remove(local_config_file + ".json")
     if os.path.exists(local_params_file):
         os.remove(local_params_file)
 
@@ -88,3 +107,164 @@ def test_ComponentOutput_get_value():
 #     """Test RunComponent initializes"""
 #     x = RunComponent(params_file, results_file)
 #     assert_is_instance(x, RunComponent)
+
+
+class Reinitializable(object):
+    """A stand-in for a component that can be initialized repeatedly."""
+
+    def __init__(self):
+        self.initialized = 0
+
+    def initialize(self, args):
+        self.initialized += 1
+
+
+class InitializeOnce(Reinitializable):
+    """A stand-in for a component that can be initialized only once."""
+
+    def initialize(self, args):
+        if self.initialized:
+            raise RuntimeError("already initialized")
+        Reinitializable.initialize(self, args)
+
+
+class InitializeNever(Reinitializable):
+    """A stand-in for a component that fails to initialize."""
+
+    def initialize(self, args):
+        raise RuntimeError("bad input")
+
+
+residuals_params = """\
+                                          1 variables
+                      1.000000000000000e+00 x1
+                                          2 functions
+                                          1 ASV_1:q_1
+                                          1 ASV_2:q_2
+                                          1 eval_id
+"""
+
+
+def make_runner(pool):
+    """Create a RunComponent without reading a parameters file."""
+    runner = RunComponent.__new__(RunComponent)
+    runner.config = {"initialize_args": "input.txt"}
+    runner.pool = pool
+    runner.component, runner.reused = pool.checkout()
+    runner.output = ComponentOutput(runner.component, [])
+    return runner
+
+
+def test_ComponentPool_reuses_instances():
+    """Test that a released instance is reused."""
+    pool = ComponentPool(Reinitializable, size=2)
+    a = pool.acquire()
+    b = pool.acquire()
+    assert_is_not(a, b)
+    pool.release(a)
+    assert_is(pool.acquire(), a)
+
+
+def test_ComponentPool_discards_failed_instances():
+    """Test that an instance released as not reusable is discarded."""
+    pool = ComponentPool(Reinitializable)
+    a = pool.acquire()
+    pool.release(a, reusable=False)
+    assert_is_not(pool.acquire(), a)
+
+
+def test_ComponentPool_keeps_healthy_instances():
+    """Test that discarding one instance keeps the other idle ones."""
+    pool = ComponentPool(Reinitializable, size=2)
+    a = pool.acquire()
+    b = pool.acquire()
+    pool.release(a)
+    pool.release(b, reusable=False)
+    assert_is(pool.acquire(), a)
+
+
+def test_ComponentPool_blocks_when_full():
+    """Test that acquire waits for an instance to be released."""
+    pool = ComponentPool(Reinitializable, size=1)
+    a = pool.acquire()
+    acquired = []
+    t = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    t.start()
+    t.join(0.05)
+    assert_equal(acquired, [])
+    pool.release(a)
+    t.join(1.0)
+    assert_equal(acquired, [a])
+
+
+def test_RunComponent_reinitializes_pooled_instance():
+    """Test that a pooled instance is initialized for each evaluation."""
+    pool = ComponentPool(Reinitializable)
+    for _ in range(2):
+        runner = make_runner(pool)
+        runner.initialize()
+        runner.release_component()
+    assert_equal(pool.acquire().initialized, 2)
+
+
+def test_RunComponent_falls_back_to_fresh_instances():
+    """Test the fallback for a component that can't be initialized again."""
+    pool = ComponentPool(InitializeOnce)
+    runner = make_runner(pool)
+    runner.initialize()
+    first = runner.component
+    runner.release_component()
+
+    runner = make_runner(pool)
+    runner.initialize()
+    assert_is_not(runner.component, first)
+    assert_is(runner.output.component, runner.component)
+    assert_false(pool.reusable)
+
+
+@raises(RuntimeError)
+def test_RunComponent_fresh_instance_failure_is_raised():
+    """Test that a fresh instance that fails to initialize isn't retried."""
+    pool = ComponentPool(InitializeNever)
+    runner = make_runner(pool)
+    try:
+        runner.initialize()
+    finally:
+        assert_true(pool.reusable)
+
+
+def test_RunComponent_calculates_residuals():
+    """Test residuals of output series against observations."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        observation_file = os.path.join(tmp_dir, "obs.txt")
+        with open(observation_file, "w") as fp:
+            fp.write("0 0.5\n2 3.0\n")
+        params_file = os.path.join(tmp_dir, "params.in")
+        with open(params_file, "w") as fp:
+            fp.write(residuals_params)
+        runner = RunComponent.__new__(RunComponent)
+        runner.config = {
+            "observation_files": [observation_file],
+            "response_descriptors": ["q"],
+            "run_directory": tmp_dir,
+        }
+        runner.params_file = params_file
+        runner.results_file = os.path.join(tmp_dir, "results.out")
+        runner.results = []
+        runner.output = ComponentOutput(None, ["q"])
+        runner.output.q = [1.0, 2.0, 4.0]
+        runner.calculate()
+        assert_equal(list(runner.results), [0.5, 1.0])
+        runner.write()
+        with open(runner.results_file, "r") as fp:
+            assert_equal(len(fp.read().splitlines()), 2)
+
+        runner.results = []
+        runner.output.q = [1.0]
+        runner.calculate()
+        runner.write()
+        with open(runner.results_file, "r") as fp:
+            assert_equal(fp.read().strip(), "fail")
+    finally:
+        shutil.rmtree(tmp_dir)
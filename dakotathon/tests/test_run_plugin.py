@@ -9,16 +9,19 @@
 
 import os
 import sys
+import types
 import shutil
 
 # import filecmp
 # import tempfile
 # import numpy as np
 # from numpy.testing import assert_almost_equal
-from nose.tools import raises, with_setup
+from nose.tools import raises, with_setup, assert_equal
 from dakotathon.run_plugin import run_plugin, main
 from dakotathon.dakota import Dakota
+from dakotathon.plugins.base import PluginBase
 from dakotathon.plugins.hydrotrend import is_installed
+from dakotathon.utils import call_with_limits, get_limits
 from . import start_dir, data_dir
 
 
@@ -30,6 +33,38 @@ config_file = os.path.join(data_dir, local_config_file)
 local_params_file = "params.in"
 params_file = os.path.join(data_dir, local_params_file)
 results_file = "results.out"
+plugin_module = "dakotathon.plugins._hang_test"
+spin_module = "dakotathon.plugins._spin_test"
+
+
+class Hang(PluginBase):
+
+    """A plugin whose model never finishes."""
+
+    def setup(self, config):
+        self.limits = get_limits(config)
+
+    def call(self):
+        call_with_limits([sys.executable, "-c", "while True: pass"], **self.limits)
+
+    def load(self, output_file):
+        return None
+
+    def calculate(self):
+        pass
+
+    def write(self, params_file, results_file):
+        pass
+
+
+class Spin(Hang):
+
+    """A plugin whose model never finishes, in this process."""
+
+    def call(self):
+        while True:
+            pass
+
 
 # Fixtures -------------------------------------------------------------
 
@@ -37,6 +72,16 @@ results_file = "results.out"
 def setup_module():
     """Called before any tests are performed."""
     print("\n*** " + __name__)
+    module = types.ModuleType(plugin_module)
+    module.classname = "Hang"
+    module.is_installed = lambda: True
+    module.Hang = Hang
+    sys.modules[plugin_module] = module
+    module = types.ModuleType(spin_module)
+    module.classname = "Spin"
+    module.is_installed = lambda: True
+    module.Spin = Spin
+    sys.modules[spin_module] = module
 
 
 def setup():
@@ -51,13 +96,16 @@ def teardown():
         os.remove(results_file)
     if os.path.exists(local_config_file):
         os.remove(local_config_file)
+    if os.path.exists(local_config_file + ".json"):
+        os.remove(local_config_file + ".json")
     if os.path.exists(local_params_file):
         os.remove(local_params_file)
 
 
 def teardown_module():
     """Called after all tests have completed."""
-    pass
+    del sys.modules[plugin_module]
+    del sys.modules[spin_module]
 
 
 # Tests ----------------------------------------------------------------
@@ -96,6 +144,55 @@ def test_run_plugin_uninstalled_module():
     run_plugin(params_file, results_file)
 
 
+def test_run_plugin_timeout():
+    """Tests run_plugin() reports a failure when the model times out."""
+    d = Dakota.from_file_like(config_file)
+    d.plugin = "_hang_test"
+    d.interface.evaluation_timeout = 0.2
+    try:
+        d.serialize(local_config_file)
+        shutil.copy(params_file, local_params_file)
+        run_plugin(local_params_file, results_file)
+        with open(results_file, "r") as fp:
+            assert_equal(fp.read().strip(), "fail")
+    finally:
+        teardown()
+
+
+def test_run_plugin_cpu_time_limit():
+    """Tests run_plugin() stops a model that runs in the driver."""
+    d = Dakota.from_file_like(config_file)
+    d.plugin = "_spin_test"
+    d.interface.cpu_time_limit = 0.2
+    try:
+        d.serialize(local_config_file)
+        shutil.copy(params_file, local_params_file)
+        run_plugin(local_params_file, results_file)
+        with open(results_file, "r") as fp:
+            assert_equal(fp.read().strip(), "fail")
+    finally:
+        teardown()
+
+
+def test_run_plugin_store_error():
+    """Tests run_plugin() finishes when the evaluation can't be stored."""
+    d = Dakota.from_file_like(config_file)
+    d.plugin = "_hang_test"
+    d.interface.evaluation_timeout = 0.2
+    d.evaluation_store = "store.db"
+    d.run_directory = run_dir
+    try:
+        os.mkdir("store.db")
+        d.serialize(local_config_file)
+        shutil.copy(params_file, local_params_file)
+        run_plugin(local_params_file, results_file)
+        with open(results_file, "r") as fp:
+            assert_equal(fp.read().strip(), "fail")
+    finally:
+        os.rmdir("store.db")
+        teardown()
+
+
 @raises(IndexError)
 def test_main_no_args():
     """Tests main() fails without args."""
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+#
+# Tests for the dakotathon.store module.
+#
+# Call with:
+#   $ nosetests -sv
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from nose.tools import assert_equal, assert_true, assert_false
+from numpy.testing import assert_array_equal
+from dakotathon.profiling import EvaluationTimer
+from dakotathon.store import (
+    EvaluationStore,
+    hash_parameters,
+    read_parameters,
+    read_results,
+    record_evaluation,
+    get_evaluation_store,
+)
+from . import data_dir
+
+
+# Global variables -----------------------------------------------------
+
+tmp_dir = None
+params_file = os.path.join(data_dir, "params.in")
+results_file = os.path.join(data_dir, "results.out")
+descriptors = ["starting_mean_annual_temperature", "total_annual_precipitation"]
+
+# Fixtures -------------------------------------------------------------
+
+
+def setup_module():
+    """Called before any tests are performed."""
+    global tmp_dir
+    print("\n*** " + __name__)
+    tmp_dir = tempfile.mkdtemp()
+
+
+def teardown_module():
+    """Called after all tests have completed."""
+    shutil.rmtree(tmp_dir)
+
+
+# Tests ----------------------------------------------------------------
+
+
+def test_hash_parameters_uses_names():
+    """Test that the parameter hash depends on the names."""
+    assert_false(hash_parameters([1.0], ["a"]) == hash_parameters([1.0], ["b"]))
+
+
+def test_read_parameters():
+    """Test reading the variables from a parameters file."""
+    names, values = read_parameters(params_file)
+    assert_equal(names, descriptors)
+    assert_equal(values, [10.0, 1.5])
+
+
+def test_read_results_fail():
+    """Test that a failed evaluation has NaN responses."""
+    fail_file = os.path.join(tmp_dir, "fail.out")
+    with open(fail_file, "w") as fp:
+        fp.write("fail\n")
+    assert_true(all(np.isnan(read_results(fail_file, 2))))
+
+
+def test_get_evaluation_store():
+    """Test getting the path to the store of an experiment."""
+    assert_true(get_evaluation_store({}) is None)
+    path = get_evaluation_store({"run_directory": "a", "evaluation_store": "b.db"})
+    assert_equal(path, os.path.join("a", "b.db"))
+
+
+def test_record_evaluation():
+    """Test adding an evaluation from its parameters and results files."""
+    store_file = os.path.join(tmp_dir, "record.db")
+    with EvaluationTimer(eval_id=1) as timer:
+        pass
+    record_evaluation(store_file, params_file, results_file, timer)
+    with EvaluationStore(store_file) as store:
+        assert_equal(len(store), 1)
+        (record,) = store.find([10.0, 1.5], descriptors)
+        assert_equal(record["eval_id"], 1)
+        assert_equal(record["status"], "ok")
+        assert_equal(record["response_descriptors"], ["Qs_median", "Q_mean"])
+        assert_equal(len(record["responses"]), 2)
+        assert_equal(record["timings"]["eval_id"], 1)
+
+
+def test_consolidate():
+    """Test writing and memory-mapping the columns of a store."""
+    with EvaluationStore(os.path.join(tmp_dir, "columns.db")) as store:
+        for i in range(5):
+            store.add([i, 2.0 * i], [3.0 * i], ["x1", "x2"], ["y1"], eval_id=i + 1)
+        store.add([9.0], [1.0, 2.0], ["x1"], ["y1", "y2"], status="fail")
+        directory = store.consolidate()
+        columns = store.load_columns()
+    assert_equal(columns["parameters"], ["x1", "x2"])
+    assert_equal(columns["responses"], ["y1", "y2"])
+    assert_true(isinstance(columns["y1"], np.memmap))
+    assert_array_equal(columns["y1"], [0.0, 3.0, 6.0, 9.0, 12.0, 1.0])
+    assert_array_equal(columns["x2"][:5], [0.0, 2.0, 4.0, 6.0, 8.0])
+    assert_true(np.isnan(columns["x2"][5]))
+    assert_true(np.isnan(columns["y2"][:5]).all())
+    assert_array_equal(columns["eval_id"], [1, 2, 3, 4, 5, -1])
+    assert_equal(columns["status"][-1], "fail")
+    assert_true(os.path.isfile(os.path.join(directory, "columns.json")))
+
+
+def test_consolidate_names_do_not_clash():
+    """Test that columns named like store columns are kept apart."""
+    with EvaluationStore(os.path.join(tmp_dir, "clash.db")) as store:
+        store.add([1.0, 2.0], [3.0, 4.0], ["status", "x"], ["x", "eval_id"], eval_id=7)
+        directory = store.consolidate()
+        columns = store.load_columns()
+    assert_true(os.path.isfile(os.path.join(directory, "param.status.npy")))
+    assert_equal(columns["status"][0], "ok")
+    assert_array_equal(columns["eval_id"], [7])
+    assert_array_equal(columns["param.status"], [1.0])
+    assert_array_equal(columns["param.x"], [2.0])
+    assert_array_equal(columns["resp.x"], [3.0])
+    assert_array_equal(columns["resp.eval_id"], [4.0])
+    assert_array_equal(columns["x"], [2.0])
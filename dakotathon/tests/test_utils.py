@@ -8,7 +8,17 @@
 # Mark Piper (mark.piper@colorado.edu)
 
 import os
-from nose.tools import raises, assert_equal, assert_false, assert_true, assert_is_none
+import signal
+import subprocess
+import numpy as np
+from nose.tools import (
+    raises,
+    assert_equal,
+    assert_false,
+    assert_true,
+    assert_is_none,
+    assert_almost_equal,
+)
 from dakotathon.utils import *
 from . import start_dir, data_dir
 
@@ -18,6 +28,7 @@ parameters_file = os.path.join(data_dir, "params.in")
 results_file = "results.out"
 response_labels = ["Qs_median", "Q_mean"]
 config_file = os.path.join(data_dir, "dakota.yaml")
+data_file = os.path.join(data_dir, "dakota.dat")
 plugin = "hydrotrend"
 
 # Fixtures -------------------------------------------------------------
@@ -55,6 +66,45 @@ def test_which_fails_with_nonexistent_program():
     assert_is_none(r)
 
 
+def test_which_env_override():
+    """Test that an environment variable overrides the command name."""
+    os.environ["DAKOTATHON_TEST_PROG"] = "python"
+    try:
+        r = which("vvwuvnfub", env="DAKOTATHON_TEST_PROG")
+    finally:
+        del os.environ["DAKOTATHON_TEST_PROG"]
+    assert_equal(r, which("python"))
+
+
+def test_discover_tools():
+    """Test locating commands and their versions."""
+    tools = discover_tools(["python", "vvwuvnfub"])
+    assert_equal(tools["python"]["path"], which("python"))
+    assert_true(tools["python"]["version"].startswith("Python"))
+    assert_equal(tools["vvwuvnfub"], {"path": None, "version": None})
+
+
+def test_get_tool_path():
+    """Test getting a recorded path to a command."""
+    config = {"tools": {"dprepro": {"path": "/opt/bin/dprepro", "version": None}}}
+    assert_equal(get_tool_path(config, "dprepro"), "/opt/bin/dprepro")
+    assert_equal(get_tool_path(config, "hydrotrend"), "hydrotrend")
+    assert_equal(get_tool_path({}, "dprepro"), "dprepro")
+
+
+def test_has_tools():
+    """Test checking for recorded paths to commands."""
+    config = {
+        "tools": {
+            "dprepro": {"path": "/opt/bin/dprepro", "version": None},
+            "hydrotrend": {"path": None, "version": None},
+        }
+    }
+    assert_true(has_tools(config, ["dprepro"]))
+    assert_false(has_tools(config, ["dprepro", "hydrotrend"]))
+    assert_false(has_tools({}, ["dprepro"]))
+
+
 def test_which_dakota():
     """Test the 'which_dakota' function."""
     r = which_dakota()
@@ -103,6 +153,51 @@ def test_deserialize_unknown_file():
     deserialize("foo.yaml")
 
 
+def test_deserialize_prefers_sidecar():
+    """Test that deserialize reads a sidecar that matches its config file."""
+    local_config = "dakota_sidecar.yaml"
+    with open(local_config, "w") as fp:
+        fp.write("plugin: hydrotrend\n")
+    try:
+        sidecar = write_sidecar(local_config, "plugin: hydrotrend\n")
+        assert_equal(sidecar, get_sidecar_file(local_config))
+        with open(sidecar, "r") as fp:
+            record = fp.read()
+        with open(sidecar, "w") as fp:
+            fp.write(record.replace("hydrotrend", "sidecar"))
+        assert_equal(deserialize(local_config)["plugin"], "sidecar")
+    finally:
+        os.remove(local_config)
+        os.remove(get_sidecar_file(local_config))
+
+
+def test_deserialize_stale_sidecar():
+    """Test that deserialize ignores a sidecar for other contents."""
+    local_config = "dakota_sidecar.yaml"
+    write_sidecar(local_config, "plugin: stale\n")
+    with open(local_config, "w") as fp:
+        fp.write("plugin: hydrotrend\n")
+    try:
+        assert_equal(deserialize(local_config)["plugin"], plugin)
+    finally:
+        os.remove(local_config)
+        os.remove(get_sidecar_file(local_config))
+
+
+def test_deserialize_corrupt_sidecar():
+    """Test that deserialize ignores an unreadable sidecar."""
+    local_config = "dakota_sidecar.yaml"
+    with open(local_config, "w") as fp:
+        fp.write("plugin: hydrotrend\n")
+    with open(get_sidecar_file(local_config), "w") as fp:
+        fp.write("{")
+    try:
+        assert_equal(deserialize(local_config)["plugin"], plugin)
+    finally:
+        os.remove(local_config)
+        os.remove(get_sidecar_file(local_config))
+
+
 def test_compute_statistic():
     """Test the compute_statistic function."""
     stat = "mean"
@@ -126,6 +221,109 @@ def test_compute_statistic_nonumeric_array():
     r = compute_statistic(stat, arr)
 
 
+def test_parse_statistic():
+    """Test the parse_statistic function."""
+    assert_equal(parse_statistic("mean"), ("mean", []))
+    assert_equal(parse_statistic("window_mean:0:10"), ("window_mean", [0.0, 10.0]))
+
+
+@raises(ValueError)
+def test_compute_statistics_percentile_out_of_range():
+    """Test that a percentile outside [0, 100] fails."""
+    compute_statistics(["mean", "percentile:150"], range(5))
+
+
+@raises(ValueError)
+def test_parse_statistic_negative_percentile():
+    """Test that a negative percentile fails."""
+    parse_statistic("percentile:-5")
+
+
+def test_compute_statistics_matches_numpy():
+    """Test that compute_statistics matches the numpy functions."""
+    arr = np.random.random(1001)
+    stats = ["mean", "median", "percentile:95", "max", "std", "var", "percentile:2.5"]
+    expected = [
+        np.mean(arr),
+        np.median(arr),
+        np.percentile(arr, 95),
+        np.max(arr),
+        np.std(arr),
+        np.var(arr),
+        np.percentile(arr, 2.5),
+    ]
+    for r, e in zip(compute_statistics(stats, arr), expected):
+        assert_almost_equal(r, e)
+
+
+def test_compute_statistics_quantiles_of_nan():
+    """Test that quantiles are NaN for NaN inputs, like numpy's."""
+    arr = [1.0, np.nan, 3.0]
+    results = compute_statistics(["median", "percentile:90", "max"], arr)
+    assert_true(np.isnan(results).all())
+    assert_true(np.isnan(np.median(arr)))
+
+
+def test_compute_statistics_quantiles_of_empty():
+    """Test that the quantiles of an empty array are NaN."""
+    results = compute_statistics(["median", "percentile:90"], [])
+    assert_true(np.isnan(results).all())
+
+
+def test_compute_statistics_exceedance():
+    """Test the exceedance statistic."""
+    arr = list(range(10))
+    assert_equal(compute_statistics(["exceedance:6"], arr), [0.3])
+
+
+def test_compute_statistics_window_mean():
+    """Test the window_mean statistic."""
+    arr = list(range(10))
+    assert_equal(compute_statistics(["window_mean:2:5"], arr), [3.0])
+
+
+def test_compute_statistic_parameterized():
+    """Test compute_statistic with a parameterized statistic."""
+    assert_equal(compute_statistic("percentile:50", list(range(5))), 2.0)
+
+
+def test_reduce_responses_loads_each_source_once():
+    """Test that reduce_responses loads a shared source once."""
+    loaded = []
+
+    def load(source):
+        loaded.append(source)
+        return {"a": [1.0, 2.0, 3.0], "b": None}[source]
+
+    values = reduce_responses(["a", "b", "a"], ["mean", "max", "max"], load)
+    assert_equal(loaded, ["a", "b"])
+    assert_equal(values[0], 2.0)
+    assert_true(np.isnan(values[1]))
+    assert_equal(values[2], 3.0)
+
+
+def test_read_tabular_data():
+    """Test the read_tabular_data function."""
+    labels, data = read_tabular_data(data_file)
+    assert_equal(labels[-2:], response_labels)
+    assert_equal(data.shape[1], len(labels))
+    assert_true(np.isnan(data[0, 1]))
+    assert_equal(data[0, -2], 2.116)
+
+
+def test_compute_confidence_width():
+    """Test the compute_confidence_width function."""
+    arr = np.array([[1.0, 2.0], [3.0, 2.0]])
+    r = compute_confidence_width(arr)
+    assert_equal(r.shape, (2,))
+    assert_equal(r[1], 0.0)
+
+
+def test_compute_confidence_width_single_sample():
+    """Test that compute_confidence_width is infinite for one sample."""
+    assert_equal(compute_confidence_width([1.0]), np.inf)
+
+
 def test_write_results_scalar_input():
     """Test the write_results function works with scalar inputs."""
     values = 1.0
@@ -154,6 +352,20 @@ def test_to_iterable_with_list():
     assert_true(r is value)
 
 
+def test_format_vector():
+    """Test formatting a vector of values."""
+    assert_equal(format_vector((1.0, 0.25)), "1.0 0.25")
+    assert_equal(format_vector(2), "2")
+    assert_equal(format_vector(["x1", "x2"], fmt="{!r}"), "'x1' 'x2'")
+
+
+def test_format_vector_with_array():
+    """Test that an array is formatted like a list."""
+    values = np.random.random(100)
+    assert_equal(format_vector(values), format_vector(list(values)))
+    assert_equal(format_vector(np.array(["x1"]), fmt="{!r}"), "'x1'")
+
+
 @raises(KeyError)
 def test_configure_parameters_fails_without_descriptors():
     """Test that configure_parameters fails without descriptors."""
@@ -210,3 +422,78 @@ def test_configure_parameters_sets_analysis_driver_plugin():
     updated, subs = configure_parameters(params)
     assert_equal(updated["analysis_driver"], "dakota_run_plugin")
     assert_equal(updated["component"], "")
+
+
+def test_get_evaluation_id():
+    """Test the get_evaluation_id function."""
+    assert_equal(get_evaluation_id(parameters_file), 1)
+
+
+def test_write_failure():
+    """Test reporting a failed evaluation."""
+    write_failure(results_file)
+    with open(results_file, "r") as fp:
+        assert_equal(fp.read().strip(), "fail")
+
+
+def test_get_limits():
+    """Test getting the time limits on an evaluation."""
+    limits = get_limits({"evaluation_timeout": 60, "plugin": plugin})
+    assert_equal(limits, {"timeout": 60, "cpu_time": None})
+
+
+@raises(subprocess.TimeoutExpired)
+def test_limit_evaluation_cpu_time():
+    """Test that work in this process is stopped at the CPU time limit."""
+    with limit_evaluation({"cpu_time_limit": 0.1}):
+        while True:
+            pass
+
+
+def test_limit_evaluation_restores_timers():
+    """Test that no timer is left running after the block."""
+    with limit_evaluation({"evaluation_timeout": 10, "cpu_time_limit": 10}):
+        pass
+    assert_equal(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+    assert_equal(signal.getitimer(signal.ITIMER_PROF), (0.0, 0.0))
+
+
+def test_call_with_limits():
+    """Test that a command within its limits runs to completion."""
+    assert_equal(call_with_limits(["true"], timeout=10, cpu_time=10), 0)
+
+
+def test_call_with_limits_kills_process_group():
+    """Test that a command and its children are killed on a timeout."""
+    import time
+    import subprocess
+
+    script = "sleep 30 & echo $! > sleep.pid; wait"
+    start = time.time()
+    try:
+        call_with_limits(["sh", "-c", script], timeout=0.5)
+    except subprocess.TimeoutExpired:
+        pass
+    else:
+        raise AssertionError("TimeoutExpired not raised")
+    assert_true(time.time() - start < 10)
+    with open("sleep.pid", "r") as fp:
+        pid = int(fp.read())
+    os.remove("sleep.pid")
+    time.sleep(0.1)
+    try:
+        os.kill(pid, 0)
+        with open("/proc/{}/stat".format(pid), "r") as fp:
+            state = fp.read().rsplit(")", 1)[1].split()[0]
+    except (IOError, OSError):
+        pass
+    else:
+        assert_equal(state, "Z", "child of timed-out command is still running")
+
+
+def test_call_with_limits_cpu_time():
+    """Test that a command is stopped at its CPU time limit."""
+    import sys
+
+    status = call_with_limits([sys.executable, "-c", "while True: pass"], cpu_time=1)
+    assert_true(status < 0)
@@ -0,0 +1,63 @@
+"""Tests for the dakotathon.variables.beta_uncertain module."""
+
+import numpy as np
+from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.beta_uncertain import BetaUncertain
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = BetaUncertain()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_instantiate():
+    """Test whether BetaUncertain instantiates."""
+    x = BetaUncertain()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "beta_uncertain")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("x1", "x2"))
+
+
+def test_default_str_length():
+    """Test the default length of __str__."""
+    x = BetaUncertain()
+    n_lines = len(str(x).splitlines())
+    assert_equal(n_lines, 8)
+
+
+def test_get_initial_point():
+    """Test getting the initial_point property."""
+    assert_is_none(c.initial_point)
+
+
+def test_get_alphas_and_betas():
+    """Test getting the shape parameters."""
+    assert_array_equal(c.alphas, (2.0, 2.0))
+    assert_array_equal(c.betas, (2.0, 2.0))
+
+
+@raises(ValueError)
+def test_fails_if_bounds_crossed():
+    """Test that lower bounds must be less than upper bounds."""
+    x = BetaUncertain(lower_bounds=(0.0, 3.0))
+
+
+def test_from_unit():
+    """Test that a symmetric beta has its median at the midpoint."""
+    x = BetaUncertain(alphas=(2.0, 1.0), betas=(2.0, 1.0))
+    assert_allclose(x.from_unit([[0.5, 0.25]]), [[0.0, -1.0]], atol=1e-12)
@@ -1,7 +1,9 @@
 """Tests for the dakotathon.variables.continuous_design module."""
 
 import os
+import numpy as np
 from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal
 from dakotathon.variables.continuous_design import ContinuousDesign
 
 
@@ -42,7 +44,7 @@ def test_descriptors():
 
 def test_get_initial_point():
     """Test getting the initial_point property."""
-    assert_equal(c.initial_point, (-0.3, 0.2))
+    assert_array_equal(c.initial_point, (-0.3, 0.2))
 
 
 def test_set_initial_point():
@@ -50,7 +52,7 @@ def test_set_initial_point():
     x = ContinuousDesign()
     for items in [[0, 1], (0, 1)]:
         x.initial_point = items
-        assert_equal(x.initial_point, items)
+        assert_array_equal(x.initial_point, items)
 
 
 @raises(TypeError)
@@ -71,7 +73,7 @@ def test_set_lower_bounds():
     x = ContinuousDesign()
     for items in [[0, 1], (0, 1)]:
         x.lower_bounds = items
-        assert_equal(x.lower_bounds, items)
+        assert_array_equal(x.lower_bounds, items)
 
 
 @raises(TypeError)
@@ -92,7 +94,7 @@ def test_set_upper_bounds():
     x = ContinuousDesign()
     for items in [[0, 1], (0, 1)]:
         x.upper_bounds = items
-        assert_equal(x.upper_bounds, items)
+        assert_array_equal(x.upper_bounds, items)
 
 
 @raises(TypeError)
@@ -116,3 +118,9 @@ def test_str_length_with_options():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 6)
+
+
+@raises(ValueError)
+def test_fails_if_design_variables_correlated():
+    """Test that only uncertain variables can be correlated."""
+    x = ContinuousDesign(uncertain_correlation_matrix=np.eye(2))
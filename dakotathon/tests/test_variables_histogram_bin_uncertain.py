@@ -0,0 +1,79 @@
+"""Tests for the dakotathon.variables.histogram_bin_uncertain module."""
+
+import numpy as np
+from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.histogram_bin_uncertain import HistogramBinUncertain
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = HistogramBinUncertain()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_instantiate():
+    """Test whether HistogramBinUncertain instantiates."""
+    x = HistogramBinUncertain()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "histogram_bin_uncertain")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("x1", "x2"))
+
+
+def test_default_str_length():
+    """Test the default length of __str__."""
+    x = HistogramBinUncertain()
+    n_lines = len(str(x).splitlines())
+    assert_equal(n_lines, 7)
+
+
+def test_get_initial_point():
+    """Test getting the initial_point property."""
+    assert_is_none(c.initial_point)
+
+
+def test_get_pairs_per_variable():
+    """Test getting the pairs_per_variable property."""
+    assert_equal(c.pairs_per_variable, (3, 3))
+
+
+@raises(TypeError)
+def test_set_pairs_per_variable_fails_if_not_ints():
+    """Test that the pairs_per_variable property needs integers."""
+    x = HistogramBinUncertain()
+    x.pairs_per_variable = (3.0, 3.0)
+
+
+@raises(ValueError)
+def test_fails_if_pairs_disagree():
+    """Test that the pairs must match the abscissas."""
+    x = HistogramBinUncertain(pairs_per_variable=(2, 3))
+
+
+@raises(ValueError)
+def test_fails_if_last_count_not_zero():
+    """Test that the last count of each variable must be zero."""
+    x = HistogramBinUncertain(counts=(1.0, 2.0, 1.0, 1.0, 2.0, 0.0))
+
+
+def test_variables_with_different_bins():
+    """Test mapping points with a different number of bins per variable."""
+    x = HistogramBinUncertain(
+        pairs_per_variable=[2, 3],
+        abscissas=[0.0, 10.0, 0.0, 1.0, 2.0],
+        counts=[5.0, 0.0, 1.0, 3.0, 0.0],
+    )
+    assert_allclose(x.from_unit([[0.5, 0.25], [1.0, 0.5]]), [[5, 1], [10, 4 / 3]])
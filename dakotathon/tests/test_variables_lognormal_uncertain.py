@@ -0,0 +1,70 @@
+"""Tests for the dakotathon.variables.lognormal_uncertain module."""
+
+import numpy as np
+from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.lognormal_uncertain import LognormalUncertain
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = LognormalUncertain()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_instantiate():
+    """Test whether LognormalUncertain instantiates."""
+    x = LognormalUncertain()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "lognormal_uncertain")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("x1", "x2"))
+
+
+def test_default_str_length():
+    """Test the default length of __str__."""
+    x = LognormalUncertain()
+    n_lines = len(str(x).splitlines())
+    assert_equal(n_lines, 6)
+
+
+def test_get_initial_point():
+    """Test getting the initial_point property."""
+    assert_is_none(c.initial_point)
+
+
+def test_get_means():
+    """Test getting the means property."""
+    assert_array_equal(c.means, (1.0, 1.0))
+
+
+@raises(TypeError)
+def test_set_std_deviations_fails_if_scalar():
+    """Test that the std_deviations property fails with scalar."""
+    x = LognormalUncertain()
+    x.std_deviations = 0.5
+
+
+@raises(ValueError)
+def test_fails_if_means_not_positive():
+    """Test that lognormal means must be positive."""
+    x = LognormalUncertain(means=(1.0, 0.0))
+
+
+def test_from_unit():
+    """Test that the median is the exponential of the log mean."""
+    x = LognormalUncertain(means=(2.0, 1.0), std_deviations=(0.5, 0.1))
+    zetas = np.sqrt(np.log1p((x.std_deviations / x.means) ** 2))
+    assert_allclose(x.from_unit([0.5, 0.5]), x.means * np.exp(-0.5 * zetas ** 2))
@@ -0,0 +1,62 @@
+"""Tests for the dakotathon.variables.loguniform_uncertain module."""
+
+import numpy as np
+from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.loguniform_uncertain import LoguniformUncertain
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = LoguniformUncertain()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_instantiate():
+    """Test whether LoguniformUncertain instantiates."""
+    x = LoguniformUncertain()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "loguniform_uncertain")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("x1", "x2"))
+
+
+def test_default_str_length():
+    """Test the default length of __str__."""
+    x = LoguniformUncertain()
+    n_lines = len(str(x).splitlines())
+    assert_equal(n_lines, 6)
+
+
+def test_get_initial_point():
+    """Test getting the initial_point property."""
+    assert_is_none(c.initial_point)
+
+
+def test_get_bounds():
+    """Test getting the bounds properties."""
+    assert_array_equal(c.lower_bounds, (0.1, 0.1))
+    assert_array_equal(c.upper_bounds, (10.0, 10.0))
+
+
+@raises(ValueError)
+def test_fails_if_bounds_not_positive():
+    """Test that loguniform bounds must be positive."""
+    x = LoguniformUncertain(lower_bounds=(0.0, 1.0))
+
+
+def test_from_unit():
+    """Test that the midpoint maps to the geometric mean of the bounds."""
+    assert_allclose(c.from_unit([0.0, 0.5]), [0.1, 1.0])
@@ -1,7 +1,9 @@
 """Tests for the dakotathon.variables.normal_uncertain module."""
 
 import os
+import numpy as np
 from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
 from dakotathon.variables.normal_uncertain import NormalUncertain
 
 
@@ -42,7 +44,7 @@ def test_descriptors():
 
 def test_get_means():
     """Test getting the means property."""
-    assert_equal(c.means, (0.0, 0.0))
+    assert_array_equal(c.means, (0.0, 0.0))
 
 
 def test_set_means():
@@ -50,7 +52,7 @@ def test_set_means():
     x = NormalUncertain()
     for items in [[0, 1], (0, 1)]:
         x.means = items
-        assert_equal(x.means, items)
+        assert_array_equal(x.means, items)
 
 
 @raises(TypeError)
@@ -63,7 +65,7 @@ def test_set_means_fails_if_scalar():
 
 def test_get_std_deviations():
     """Test getting the std_deviations property."""
-    assert_equal(c.std_deviations, (1.0, 1.0))
+    assert_array_equal(c.std_deviations, (1.0, 1.0))
 
 
 def test_set_std_deviations():
@@ -71,7 +73,7 @@ def test_set_std_deviations():
     x = NormalUncertain()
     for items in [[0, 1], (0, 1)]:
         x.std_deviations = items
-        assert_equal(x.std_deviations, items)
+        assert_array_equal(x.std_deviations, items)
 
 
 @raises(TypeError)
@@ -92,7 +94,7 @@ def test_set_lower_bounds():
     x = NormalUncertain()
     for items in [[0, 1], (0, 1)]:
         x.lower_bounds = items
-        assert_equal(x.lower_bounds, items)
+        assert_array_equal(x.lower_bounds, items)
 
 
 @raises(TypeError)
@@ -113,7 +115,7 @@ def test_set_upper_bounds():
     x = NormalUncertain()
     for items in [[0, 1], (0, 1)]:
         x.upper_bounds = items
-        assert_equal(x.upper_bounds, items)
+        assert_array_equal(x.upper_bounds, items)
 
 
 @raises(TypeError)
@@ -134,7 +136,7 @@ def test_set_initial_point():
     x = NormalUncertain()
     for items in [[0, 1], (0, 1)]:
         x.initial_point = items
-        assert_equal(x.initial_point, items)
+        assert_array_equal(x.initial_point, items)
 
 
 @raises(TypeError)
@@ -160,3 +162,81 @@ def test_str_length_with_options():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 9)
+
+
+def test_set_means_with_array():
+    """Test that the means property stores an array of doubles."""
+    x = NormalUncertain()
+    x.means = np.arange(2)
+    assert_equal(x.means.dtype, np.float64)
+    assert_true(x.means.flags["C_CONTIGUOUS"])
+
+
+@raises(ValueError)
+def test_fails_if_lengths_disagree():
+    """Test that each vector needs one value per descriptor."""
+    x = NormalUncertain(descriptors=("x1", "x2", "x3"))
+
+
+@raises(ValueError)
+def test_fails_if_std_deviations_not_positive():
+    """Test that standard deviations must be positive."""
+    x = NormalUncertain(std_deviations=(1.0, 0.0))
+
+
+def test_correlation_matrix_in_str():
+    """Test that a correlation matrix is written in row order."""
+    x = NormalUncertain(uncertain_correlation_matrix=[[1.0, 0.5], [0.5, 1.0]])
+    s = str(x)
+    assert_true("uncertain_correlation_matrix = 1.0 0.5 0.5 1.0\n" in s)
+
+
+def test_correlation_matrix_from_flat_values():
+    """Test setting a correlation matrix from its values in row order."""
+    x = NormalUncertain()
+    x.uncertain_correlation_matrix = (1.0, 0.5, 0.5, 1.0)
+    assert_equal(x.uncertain_correlation_matrix.shape, (2, 2))
+
+
+@raises(ValueError)
+def test_fails_if_correlation_matrix_not_positive_definite():
+    """Test that a correlation matrix must be positive definite."""
+    x = NormalUncertain(
+        descriptors=("x1", "x2", "x3"),
+        means=(0, 0, 0),
+        std_deviations=(1, 1, 1),
+        uncertain_correlation_matrix=[[1, 0.9, -0.9], [0.9, 1, 0.9], [-0.9, 0.9, 1]],
+    )
+
+
+@raises(ValueError)
+def test_fails_if_correlation_matrix_wrong_size():
+    """Test that a correlation matrix has a row per variable."""
+    x = NormalUncertain(uncertain_correlation_matrix=np.eye(3))
+
+
+def test_sample():
+    """Test drawing a correlated Latin hypercube sample."""
+    x = NormalUncertain(
+        means=(1.0, -1.0),
+        lower_bounds=(-3.0, -3.0),
+        upper_bounds=(3.0, 3.0),
+        uncertain_correlation_matrix=[[1.0, 0.8], [0.8, 1.0]],
+    )
+    sample = x.sample(500, sample_type="lhs", seed=1)
+    assert_equal(sample.shape, (500, 2))
+    assert_true(np.all(sample >= -3.0) and np.all(sample <= 3.0))
+    assert_true(abs(sample[:, 0].mean() - 0.9446) < 0.01)  # truncated mean
+    assert_true(np.corrcoef(sample, rowvar=False)[0, 1] > 0.7)
+
+
+def test_from_unit_truncated():
+    """Test that bounded variables follow the truncated distribution."""
+    x = NormalUncertain(
+        descriptors=("x1",), means=(0.0,), std_deviations=(1.0,), lower_bounds=(0.0,)
+    )
+    assert_allclose(x.from_unit([[0.0], [0.5]]), [[0.0], [0.6744897501960817]])
+    sample = x.sample(2000, sample_type="lhs", seed=1)
+    assert_true(np.all(sample > 0.0))
+    assert_true(np.mean(sample == 0.0) == 0.0)
+    assert_true(abs(sample.mean() - np.sqrt(2.0 / np.pi)) < 0.01)
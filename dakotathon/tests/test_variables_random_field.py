@@ -0,0 +1,155 @@
+"""Tests for the dakotathon.variables.random_field module."""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from nose.tools import raises, assert_true, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.random_field import (
+    RandomField,
+    basis_from_covariance,
+    basis_from_samples,
+    save_field_basis,
+    load_field_basis,
+    expand_field,
+    write_field,
+)
+
+
+params_text = """\
+                                          2 variables
+                      1.000000000000000e+00 xi1
+                     -1.000000000000000e+00 xi2
+                                          1 eval_id
+"""
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = RandomField()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def make_field_file(tmp_dir, n_cells=20, shape=None):
+    """Save the KL basis of an exponential covariance on a line."""
+    x = np.linspace(0.0, 1.0, n_cells)
+    covariance = np.exp(-np.abs(x[:, None] - x[None, :]) / 0.3)
+    mean, basis, eigenvalues = basis_from_covariance(covariance, n_modes=3)
+    field_file = os.path.join(tmp_dir, "field.npz")
+    save_field_basis(field_file, mean + 1.0, basis, eigenvalues, shape=shape)
+    return field_file
+
+
+def test_instantiate():
+    """Test whether RandomField instantiates."""
+    x = RandomField()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "random_field")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("xi1", "xi2"))
+
+
+def test_str_uses_normal_uncertain():
+    """Test that Dakota sees the coefficients as normal variables."""
+    s = str(c)
+    assert_true("  normal_uncertain = 2\n" in s)
+    assert_true("random_field" not in s)
+
+
+@raises(IOError)
+def test_set_field_file_fails_if_missing():
+    """Test that the field file must exist."""
+    x = RandomField(field_file="not-a-file.npz")
+
+
+def test_modes_from_field_file():
+    """Test that the number of coefficients is read from the file."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        x = RandomField(field_file=make_field_file(tmp_dir))
+        assert_equal(x.n_modes, 3)
+        assert_equal(x.descriptors, ("xi1", "xi2", "xi3"))
+        assert_array_equal(x.std_deviations, [1.0, 1.0, 1.0])
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+@raises(ValueError)
+def test_too_many_modes():
+    """Test that n_modes can't exceed the modes in the file."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        RandomField(field_file=make_field_file(tmp_dir), n_modes=4)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_basis_from_samples():
+    """Test that a PCA basis captures a field of low rank."""
+    modes = np.array([[1.0, 0.0, -1.0, 0.0], [0.0, 1.0, 0.0, -1.0]])
+    samples = np.random.standard_normal((500, 2)) @ modes + 2.0
+    mean, basis, eigenvalues = basis_from_samples(samples, energy=0.999)
+    assert_equal(basis.shape, (4, 2))
+    assert_allclose(mean, 2.0, atol=0.2)
+    assert_allclose(basis.T @ basis, np.eye(2), atol=1e-12)
+
+
+def test_expand_field_vectorized():
+    """Test expanding many sets of coefficients at once."""
+    x = np.linspace(0.0, 1.0, 10)
+    covariance = np.exp(-np.abs(x[:, None] - x[None, :]))
+    mean, basis, eigenvalues = basis_from_covariance(covariance, n_modes=4)
+    coefficients = np.random.standard_normal((5, 4))
+    fields = expand_field(coefficients, mean, basis, eigenvalues)
+    assert_equal(fields.shape, (5, 10))
+    assert_allclose(fields[2], expand_field(coefficients[2], mean, basis, eigenvalues))
+
+
+def test_write_field():
+    """Test that a driver expands and writes the field of an evaluation."""
+    tmp_dir = tempfile.mkdtemp()
+    start_dir = os.getcwd()
+    try:
+        field_file = make_field_file(tmp_dir, n_cells=20, shape=(4, 5))
+        x = RandomField(field_file=field_file, field_name="precip", n_modes=2)
+        config = {
+            "variables": x.variables,
+            "field_file": x.field_file,
+            "field_name": x.field_name,
+            "n_modes": x.n_modes,
+            "descriptors": x.descriptors,
+        }
+        os.chdir(tmp_dir)
+        with open("params.in", "w") as fp:
+            fp.write(params_text)
+        field = write_field(config, "params.in")
+        basis = load_field_basis(field_file, n_modes=2)
+        assert_allclose(
+            field,
+            expand_field(
+                [1.0, -1.0], basis["mean"], basis["basis"], basis["eigenvalues"]
+            ),
+        )
+        assert_equal(np.loadtxt("precip.txt").shape, (4, 5))
+        assert_true(write_field({"variables": "normal_uncertain"}, "params.in") is None)
+
+        with open("params.in", "w") as fp:
+            fp.write(params_text.replace("2 variables", "1 variables"))
+        config.update(n_modes=1, descriptors="xi1")
+        assert_equal(write_field(config, "params.in").shape, (20,))
+    finally:
+        os.chdir(start_dir)
+        shutil.rmtree(tmp_dir)
@@ -0,0 +1,63 @@
+"""Tests for the dakotathon.variables.triangular_uncertain module."""
+
+import numpy as np
+from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.triangular_uncertain import TriangularUncertain
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = TriangularUncertain()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_instantiate():
+    """Test whether TriangularUncertain instantiates."""
+    x = TriangularUncertain()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "triangular_uncertain")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("x1", "x2"))
+
+
+def test_default_str_length():
+    """Test the default length of __str__."""
+    x = TriangularUncertain()
+    n_lines = len(str(x).splitlines())
+    assert_equal(n_lines, 7)
+
+
+def test_get_initial_point():
+    """Test getting the initial_point property."""
+    assert_is_none(c.initial_point)
+
+
+def test_set_modes():
+    """Test setting the modes property."""
+    x = TriangularUncertain()
+    x.modes = [1, -1]
+    assert_array_equal(x.modes, (1.0, -1.0))
+
+
+@raises(ValueError)
+def test_fails_if_mode_out_of_bounds():
+    """Test that the modes must lie within the bounds."""
+    x = TriangularUncertain(modes=(0.0, 3.0))
+
+
+def test_from_unit():
+    """Test mapping points to a triangular distribution."""
+    assert_allclose(c.from_unit([[0.0, 0.5], [0.5, 1.0]]), [[-2, 0], [0, 2]])
@@ -2,6 +2,7 @@
 
 import os
 from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal
 from dakotathon.variables.uniform_uncertain import UniformUncertain
 
 
@@ -49,7 +50,7 @@ def test_set_initial_point():
     """Test setting the initial_point property."""
     for items in [[0, 1], (0, 1)]:
         c.initial_point = items
-        assert_equal(c.initial_point, items)
+        assert_array_equal(c.initial_point, items)
 
 
 @raises(TypeError)
@@ -61,14 +62,14 @@ def test_set_initial_point_fails_if_scalar():
 
 def test_get_lower_bounds():
     """Test getting the lower_bounds property."""
-    assert_equal(c.lower_bounds, (-2.0, -2.0))
+    assert_array_equal(c.lower_bounds, (-2.0, -2.0))
 
 
 def test_set_lower_bounds():
     """Test setting the lower_bounds property."""
     for items in [[0, 1], (0, 1)]:
         c.lower_bounds = items
-        assert_equal(c.lower_bounds, items)
+        assert_array_equal(c.lower_bounds, items)
 
 
 @raises(TypeError)
@@ -80,14 +81,14 @@ def test_set_lower_bounds_fails_if_scalar():
 
 def test_get_upper_bounds():
     """Test getting the upper_bounds property."""
-    assert_equal(c.upper_bounds, (2.0, 2.0))
+    assert_array_equal(c.upper_bounds, (2.0, 2.0))
 
 
 def test_set_upper_bounds():
     """Test setting the upper_bounds property."""
     for items in [[0, 1], (0, 1)]:
         c.upper_bounds = items
-        assert_equal(c.upper_bounds, items)
+        assert_array_equal(c.upper_bounds, items)
 
 
 @raises(TypeError)
@@ -111,3 +112,16 @@ def test_str_length_with_options():
     s = str(x)
     n_lines = len(s.splitlines())
     assert_equal(n_lines, 7)
+
+
+@raises(ValueError)
+def test_fails_if_bounds_crossed():
+    """Test that lower bounds must be less than upper bounds."""
+    x = UniformUncertain(lower_bounds=(0.0, 1.0), upper_bounds=(1.0, 1.0))
+
+
+@raises(TypeError)
+def test_set_lower_bounds_fails_if_not_numbers():
+    """Test that the lower_bounds property fails with strings."""
+    x = UniformUncertain()
+    x.lower_bounds = ("a", "b")
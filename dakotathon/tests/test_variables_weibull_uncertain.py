@@ -0,0 +1,58 @@
+"""Tests for the dakotathon.variables.weibull_uncertain module."""
+
+import numpy as np
+from nose.tools import raises, assert_true, assert_is_none, assert_equal
+from numpy.testing import assert_array_equal, assert_allclose
+from dakotathon.variables.weibull_uncertain import WeibullUncertain
+
+
+def setup_module():
+    """Fixture called before any tests are performed."""
+    print("\n*** " + __name__)
+    global c
+    c = WeibullUncertain()
+
+
+def teardown_module():
+    """Fixture called after all tests have completed."""
+    pass
+
+
+def test_instantiate():
+    """Test whether WeibullUncertain instantiates."""
+    x = WeibullUncertain()
+
+
+def test_variables():
+    """Test the variables attribute."""
+    assert_equal(c.variables, "weibull_uncertain")
+
+
+def test_descriptors():
+    """Test getting the default descriptors property."""
+    assert_equal(c.descriptors, ("x1", "x2"))
+
+
+def test_default_str_length():
+    """Test the default length of __str__."""
+    x = WeibullUncertain()
+    n_lines = len(str(x).splitlines())
+    assert_equal(n_lines, 6)
+
+
+def test_get_initial_point():
+    """Test getting the initial_point property."""
+    assert_is_none(c.initial_point)
+
+
+@raises(TypeError)
+def test_set_betas_fails_if_not_numbers():
+    """Test that the betas property fails with strings."""
+    x = WeibullUncertain()
+    x.betas = ("a", "b")
+
+
+def test_from_unit():
+    """Test that a Weibull with unit shape is an exponential."""
+    x = WeibullUncertain(alphas=(1.0, 2.0), betas=(1.0, 1.0))
+    assert_allclose(x.from_unit([0.5, 0.5]), [np.log(2.0), np.sqrt(np.log(2.0))])
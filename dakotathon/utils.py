@@ -2,11 +2,22 @@
 """Helper functions for processing Dakota parameter and results files."""
 
 import os
+import shutil
 import subprocess
 import re
-import yaml
-import numpy as np
+import json
+import hashlib
+import signal
+import threading
 import collections
+import math
+from contextlib import contextmanager
+from .profiling import phase
+
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 
 
 def is_dakota_installed():
@@ -18,23 +29,21 @@ def is_dakota_installed():
       True if Dakota is callable.
 
     """
-    try:
-        subprocess.check_call(["dakota", "--version"])
-    except (subprocess.CalledProcessError, OSError):
-        return False
-    else:
-        return True
+    return which_dakota() is not None
 
 
 def which(prog, env=None):
-    """Call the OS `which` function.
+    """Locate a command in the execution path.
+
+    The path is searched in-process, without starting a shell.
 
     Parameters
     ----------
     prog : str
       The command name.
     env : str, optional
-      An environment variable.
+      An environment variable that overrides the command name
+      (default is the command name in upper case).
 
     Returns
     -------
@@ -42,15 +51,103 @@ def which(prog, env=None):
 
     """
     prog = os.environ.get(env or prog.upper(), prog)
+    return shutil.which(prog)
+
 
+def get_tool_version(path):
+    """Get the version string reported by a command.
+
+    Parameters
+    ----------
+    path : str
+      The path to the command.
+
+    Returns
+    -------
+    str or None
+      The first line printed by ``<path> --version``, or None if the
+      command fails.
+
+    """
     try:
-        prog = subprocess.check_output(
-            ["/usr/bin/which", prog], stderr=open("/dev/null", "w")
-        ).strip()
-    except subprocess.CalledProcessError:
+        output = subprocess.check_output(
+            [path, "--version"], stderr=subprocess.STDOUT
+        )
+    except (subprocess.CalledProcessError, OSError):
         return None
-    else:
-        return prog
+    lines = output.decode("utf-8", "replace").strip().splitlines()
+    return lines[0].strip() if lines else None
+
+
+def discover_tools(names):
+    """Locate commands and record their versions.
+
+    Parameters
+    ----------
+    names : list or tuple of str
+      The command names.
+
+    Returns
+    -------
+    dict
+      The ``path`` and ``version`` of each command, by name; both are
+      None for a command that isn't found.
+
+    """
+    tools = {}
+    for name in names:
+        path = which(name)
+        version = get_tool_version(path) if path else None
+        tools[name] = {"path": path, "version": version}
+    return tools
+
+
+def get_tool_path(config, name):
+    """Get the path to a command recorded in an experiment's configuration.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    name : str
+      The command name.
+
+    Returns
+    -------
+    str
+      The recorded path to the command, or the command name if no
+      path was recorded.
+
+    """
+    try:
+        path = config["tools"][name]["path"]
+    except (KeyError, TypeError):
+        path = None
+    return path or name
+
+
+def has_tools(config, names):
+    """Check whether the configuration records paths to commands.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    names : list or tuple of str
+      The command names.
+
+    Returns
+    -------
+    bool
+      True if a path was found for each command when the experiment
+      was set up.
+
+    """
+    tools = config.get("tools") or {}
+    for name in names:
+        if not (tools.get(name) or {}).get("path"):
+            return False
+    return True
 
 
 def which_dakota():
@@ -148,9 +245,120 @@ def get_configuration_file(params_file):
                 return line.split("AC_1")[0].strip()
 
 
+def get_evaluation_id(params_file):
+    """Extract the evaluation id from a Dakota parameters file.
+
+    Parameters
+    ----------
+    params_file : str
+      The path to a Dakota parameters file.
+
+    Returns
+    -------
+    int or None
+      The evaluation id, or None if it isn't present.
+
+    """
+    with open(params_file, "r") as fp:
+        for line in fp:
+            items = line.split()
+            if len(items) == 2 and items[1] == "eval_id":
+                return int(items[0])
+
+
+def _safe_loader():
+    """Get the fastest available safe YAML loader."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _represent_array(dumper, array):
+    """Represent an array as a YAML flow sequence, on as few lines as fit."""
+    return dumper.represent_sequence(
+        "tag:yaml.org,2002:seq", array.tolist(), flow_style=True
+    )
+
+
+def _safe_dumper():
+    """Get the fastest available safe YAML dumper that handles arrays."""
+    import yaml
+    import numpy as np
+
+    base = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    dumper = type("ArraySafeDumper", (base,), {})
+    dumper.add_representer(np.ndarray, _represent_array)
+    return dumper
+
+
+def _content_hash(text):
+    """Compute a hash of the contents of a text file."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_sidecar_file(config_file):
+    """Get the path to the JSON sidecar of a YAML configuration file.
+
+    Parameters
+    ----------
+    config_file : str
+      The path to a YAML configuration file.
+
+    Returns
+    -------
+    str
+      The path to the sidecar.
+
+    """
+    return config_file + ".json"
+
+
+def write_sidecar(config_file, text):
+    """Write a JSON copy of a YAML configuration file.
+
+    The copy is tagged with a hash of the YAML text, so that a stale
+    copy can be detected. If the settings can't be represented in
+    JSON, no copy is written.
+
+    Parameters
+    ----------
+    config_file : str
+      The path to a YAML configuration file.
+    text : str
+      The contents of the configuration file.
+
+    Returns
+    -------
+    str or None
+      The path to the sidecar, or None if it wasn't written.
+
+    """
+    import yaml
+
+    sidecar_file = get_sidecar_file(config_file)
+    config = yaml.load(text, Loader=_safe_loader())
+    try:
+        record = json.dumps({"hash": _content_hash(text), "config": config})
+    except (TypeError, ValueError):
+        if os.path.exists(sidecar_file):
+            os.remove(sidecar_file)
+        return None
+    with open(sidecar_file, "w") as fp:
+        fp.write(record)
+    return sidecar_file
+
+
 def deserialize(config_file):
     """Load settings from a YAML configuration file.
 
+    The JSON sidecar written by `Dakota.serialize` is read instead, if
+    it matches the contents of the configuration file.
+
+    Parameters
+    ----------
+    config_file : str
+      The path to a YAML configuration file.
+
     Returns
     -------
     dict
@@ -158,7 +366,147 @@ def deserialize(config_file):
 
     """
     with open(config_file, "r") as fp:
-        return yaml.safe_load(fp)
+        text = fp.read()
+    try:
+        with open(get_sidecar_file(config_file), "r") as fp:
+            record = json.load(fp)
+    except (IOError, OSError, ValueError):
+        record = None
+    if isinstance(record, dict) and record.get("hash") == _content_hash(text):
+        return record["config"]
+
+    import yaml
+
+    return yaml.load(text, Loader=_safe_loader())
+
+
+def parse_statistic(statistic):
+    """Split a statistic specification into a name and its arguments.
+
+    Parameters
+    ----------
+    statistic : str
+      A statistic name, optionally followed by colon-separated
+      arguments; e.g., 'mean', 'percentile:95', or
+      'window_mean:0:365'.
+
+    Returns
+    -------
+    (str, list of float)
+      The name of the statistic and its numeric arguments.
+
+    Raises
+    ------
+    ValueError
+      If a percentile isn't given one argument in [0, 100].
+
+    """
+    items = statistic.split(":")
+    name, args = items[0], [float(item) for item in items[1:]]
+    if name == "percentile" and (len(args) != 1 or not 0.0 <= args[0] <= 100.0):
+        msg = "Bad statistic {!r}: q must be in [0, 100]".format(statistic)
+        raise ValueError(msg)
+    return name, args
+
+
+def _percentiles(array, qs):
+    """Compute several percentiles of an array from one partial sort.
+
+    Like `numpy.median`, each percentile is NaN if the array is empty
+    or holds a NaN.
+
+    """
+    import numpy as np
+
+    flat = np.ravel(array)
+    n = flat.size
+    if n == 0 or np.isnan(flat).any():
+        return [np.nan] * len(qs)
+    positions = [q / 100.0 * (n - 1) for q in qs]
+    kth = set()
+    for pos in positions:
+        kth.update((int(np.floor(pos)), int(np.ceil(pos))))
+    partitioned = np.partition(flat, sorted(kth))
+    values = []
+    for pos in positions:
+        lo, hi = int(np.floor(pos)), int(np.ceil(pos))
+        step = (partitioned[hi] - partitioned[lo]) * (pos - lo)
+        values.append(partitioned[lo] + step)
+    return values
+
+
+def compute_statistics(statistics, array):
+    """Compute several statistics of the same array.
+
+    Quantile statistics ('median', 'percentile:q') share a single
+    partial sort of the array, and moment statistics ('mean', 'std',
+    'var') share a single computation of the mean. Other names are
+    dispatched to the NumPy function of the same name.
+
+    Parameters
+    ----------
+    statistics : list or tuple of str
+      Statistic specifications. Besides the names of NumPy functions,
+      parameterized statistics are supported:
+
+      * 'percentile:q' -- the q-th percentile, for q in [0, 100]
+      * 'exceedance:threshold' -- the fraction of values greater
+        than threshold
+      * 'window_mean:start:end' -- the mean of the values with
+        indices from start up to, but not including, end
+
+    array : array_like
+      An array data structure, such as a numpy array.
+
+    Returns
+    -------
+    list of float
+      The value of each statistic, in order.
+
+    Examples
+    --------
+    >>> compute_statistics(['mean', 'median', 'percentile:75'], range(5))
+    [2.0, 2.0, 3.0]
+
+    """
+    import numpy as np
+
+    parsed = [parse_statistic(statistic) for statistic in statistics]
+    arr = np.asarray(array)
+    values = [None] * len(parsed)
+
+    quantiles = []
+    for i, (name, args) in enumerate(parsed):
+        if name == "median":
+            quantiles.append((i, 50.0))
+        elif name == "percentile":
+            quantiles.append((i, args[0]))
+    if quantiles:
+        qs = [q for _, q in quantiles]
+        for (i, _), value in zip(quantiles, _percentiles(arr, qs)):
+            values[i] = value
+
+    mean = None
+    for i, (name, args) in enumerate(parsed):
+        if values[i] is not None:
+            continue
+        if name in ("mean", "std", "var"):
+            if mean is None:
+                mean = np.mean(arr)
+            if name == "mean":
+                values[i] = mean
+            else:
+                var = np.mean(np.square(arr - mean))
+                values[i] = var if name == "var" else np.sqrt(var)
+        elif name == "exceedance":
+            values[i] = np.count_nonzero(arr > args[0]) / float(arr.size)
+        elif name == "window_mean":
+            start, end = (int(arg) for arg in args)
+            values[i] = np.mean(np.ravel(arr)[start:end])
+        else:
+            values[i] = np.__getattribute__(name)(arr)
+
+    return [float(value) if np.ndim(value) == 0 else value for value in values]
 
 
 def compute_statistic(statistic, array):
@@ -168,7 +516,8 @@ def compute_statistic(statistic, array):
     ----------
     statistic : str
       A string with the name of the statistic to compute ('mean',
-      'median', etc.).
+      'median', etc.), or a parameterized statistic (e.g.,
+      'percentile:95'); see `compute_statistics`.
     array : array_like
       An array data structure, such as a numpy array.
 
@@ -178,10 +527,109 @@ def compute_statistic(statistic, array):
       The value of the computed statistic.
 
     """
-    return np.__getattribute__(statistic)(array)
+    return compute_statistics((statistic,), array)[0]
+
 
+def reduce_responses(sources, statistics, load):
+    """Compute response statistics, loading each source series once.
+
+    Responses that share a source series, such as a model output file
+    or variable, are grouped so that the series is loaded once and
+    all of its statistics are computed together.
+
+    Parameters
+    ----------
+    sources : list or tuple of str
+      The source series of each response.
+    statistics : list or tuple of str
+      The statistic computed for each response.
+    load : callable
+      Returns the series for a source, or None if it's unavailable.
+
+    Returns
+    -------
+    list of float
+      The value of each response, in order; NaN if its source is
+      unavailable.
 
-def write_results(results_file, values, labels):
+    """
+    groups = collections.OrderedDict()
+    for i, (source, statistic) in enumerate(zip(sources, statistics)):
+        groups.setdefault(source, []).append((i, statistic))
+
+    values = [float("nan")] * len(sources)
+    for source, items in groups.items():
+        series = load(source)
+        if series is None:
+            continue
+        with phase("statistic"):
+            results = compute_statistics(
+                [statistic for _, statistic in items], series
+            )
+        for (i, _), value in zip(items, results):
+            values[i] = value
+    return values
+
+
+def read_tabular_data(data_file):
+    """Read a Dakota tabular data file.
+
+    Parameters
+    ----------
+    data_file : str
+      The path to a Dakota tabular data file; e.g., **dakota.dat**.
+
+    Returns
+    -------
+    (list, array_like)
+      The column labels, and a 2D array of values with one row per
+      evaluation. Non-numeric columns (e.g., the interface id) are
+      returned as NaN.
+
+    """
+    import numpy as np
+
+    with open(data_file, "r") as fp:
+        labels = fp.readline().lstrip("%").split()
+        rows = [line.split() for line in fp if line.strip()]
+
+    data = np.full((len(rows), len(labels)), np.nan)
+    for i, row in enumerate(rows):
+        for j, item in enumerate(row):
+            try:
+                data[i, j] = float(item)
+            except ValueError:
+                pass
+    return labels, data
+
+
+def compute_confidence_width(array, z=1.96):
+    """Compute the width of the confidence interval of a sample mean.
+
+    Parameters
+    ----------
+    array : array_like
+      A 1D array of samples, or a 2D array with samples in rows.
+    z : float, optional
+      The standard normal quantile for the confidence level (default
+      is 1.96, a 95% interval).
+
+    Returns
+    -------
+    float or array_like
+      The full width of the confidence interval, per column.
+
+    """
+    import numpy as np
+
+    arr = np.asarray(array, dtype=float)
+    n = arr.shape[0]
+    if n < 2:
+        return np.full(arr.shape[1:], np.inf) if arr.ndim > 1 else np.inf
+    return 2.0 * z * np.std(arr, axis=0, ddof=1) / np.sqrt(n)
+
+
+def write_results(results_file, values, labels, gradients=None):
     """Write a Dakota results file from a set of input values.
 
     Parameters
@@ -192,12 +640,177 @@ def write_results(results_file, values, labels):
       A list or array of numeric values.
     labels : str
       A list of labels to attach to the values.
+    gradients : array_like, optional
+      The gradients of the responses, one response per row, written
+      after the values in Dakota's ``[ ... ]`` format.
 
     """
+    import numpy as np
+
     arr_values = np.asarray(values)
     arr_labels = np.asarray(labels)
     results = np.column_stack((arr_values, arr_labels))
     np.savetxt(results_file, results, delimiter="\t", fmt="%s")
+    if gradients is not None:
+        with open(results_file, "a") as fp:
+            for gradient in gradients:
+                fp.write("[ {} ]\n".format(format_vector(gradient, fmt="{:.16e}")))
+
+
+def write_failure(results_file):
+    """Report a failed evaluation to Dakota.
+
+    Dakota handles the failure as set by the `failure_capture` option
+    of the experiment's interface.
+
+    Parameters
+    ----------
+    results_file : str
+      The path to a Dakota results file.
+
+    """
+    with open(results_file, "w") as fp:
+        fp.write("fail\n")
+
+
+def _set_cpu_limit(cpu_time):
+    """Limit the CPU time of the current process, in seconds."""
+    import resource
+
+    limit = int(math.ceil(cpu_time))
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, limit + 1))
+
+
+def call_with_limits(args, timeout=None, cpu_time=None, **kwargs):
+    """Run a command, killing it if it exceeds its time limits.
+
+    The command is started in a new session, so that, if it runs too
+    long, it's killed along with any processes it started.
+
+    Parameters
+    ----------
+    args : list of str
+      The command and its arguments.
+    timeout : float, optional
+      The limit on wall-clock time, in seconds (default is None, no
+      limit).
+    cpu_time : float, optional
+      The limit on the CPU time of the command, in seconds (default is
+      None, no limit). The operating system stops the command when it
+      reaches the limit.
+    **kwargs
+      Optional keyword arguments to `subprocess.Popen`.
+
+    Returns
+    -------
+    int
+      The exit status of the command, which is negative if it was
+      stopped by a signal.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+      If the command runs longer than `timeout`.
+
+    Examples
+    --------
+    >>> call_with_limits(["sleep", "5"], timeout=0.1)
+    Traceback (most recent call last):
+    ...
+    subprocess.TimeoutExpired: Command '['sleep', '5']' timed out after 0.1 seconds
+
+    """
+    if cpu_time is not None:
+        kwargs["preexec_fn"] = lambda: _set_cpu_limit(cpu_time)
+    process = subprocess.Popen(args, start_new_session=True, **kwargs)
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        process.wait()
+        raise
+
+
+def get_limits(config):
+    """Get the time limits on an evaluation of an experiment.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+
+    Returns
+    -------
+    dict
+      The `timeout` and `cpu_time` arguments to `call_with_limits`.
+
+    """
+    return {
+        "timeout": config.get("evaluation_timeout"),
+        "cpu_time": config.get("cpu_time_limit"),
+    }
+
+
+@contextmanager
+def limit_evaluation(config):
+    """Stop an evaluation run in this process at its time limits.
+
+    The experiment's *evaluation_timeout* limits the wall-clock time,
+    and its *cpu_time_limit* the CPU time of this process, spent in
+    the block; the CPU time of a command the model runs is limited by
+    `call_with_limits`. The limits are enforced with interval timers,
+    so an evaluation must run in the main thread.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+      If the block exceeds either limit.
+    RuntimeError
+      If limits are set, but this isn't the main thread.
+
+    Examples
+    --------
+    >>> with limit_evaluation({"evaluation_timeout": 0.1}):
+    ...     while True:
+    ...         pass
+    Traceback (most recent call last):
+    ...
+    subprocess.TimeoutExpired: Command 'evaluation' timed out after 0.1 seconds
+
+    """
+    limits = get_limits(config)
+    timers = []
+    if limits["timeout"]:
+        timers.append((signal.ITIMER_REAL, signal.SIGALRM, limits["timeout"]))
+    if limits["cpu_time"]:
+        timers.append((signal.ITIMER_PROF, signal.SIGPROF, limits["cpu_time"]))
+    if not timers:
+        yield
+        return
+    if threading.current_thread() is not threading.main_thread():
+        raise RuntimeError("Time limits are only enforced in the main thread")
+
+    def expire(signum, frame):
+        seconds = [item[2] for item in timers if item[1] == signum][0]
+        raise subprocess.TimeoutExpired("evaluation", seconds)
+
+    handlers = [signal.signal(signum, expire) for _, signum, _ in timers]
+    for which, _, seconds in timers:
+        signal.setitimer(which, seconds)
+    try:
+        yield
+    finally:
+        for (which, signum, _), handler in zip(timers, handlers):
+            signal.setitimer(which, 0)
+            signal.signal(signum, handler)
 
 
 def to_iterable(x):
@@ -218,12 +831,46 @@ def to_iterable(x):
     Courtesy http://stackoverflow.com/a/6711233/1563298
 
     """
-    if isinstance(x, collections.Iterable) and not isinstance(x, str):
+    if isinstance(x, Iterable) and not isinstance(x, str):
         return x
     else:
         return (x,)
 
 
+def format_vector(values, fmt="{}"):
+    """Format a vector of values for a Dakota input file.
+
+    Parameters
+    ----------
+    values
+      A value, or a list, tuple, or NumPy array of values.
+    fmt : str, optional
+      The format applied to each value (default is ``"{}"``).
+
+    Returns
+    -------
+    str
+      The formatted values, separated by spaces.
+
+    Notes
+    -----
+    The values are joined in a single pass, so the time taken grows
+    linearly with the number of values. NumPy arrays are converted to
+    Python scalars in bulk, so that they format like lists.
+
+    Examples
+    --------
+    >>> format_vector([1.0, 0.25])
+    '1.0 0.25'
+    >>> format_vector(("x1", "x2"), fmt="{!r}")
+    "'x1' 'x2'"
+
+    """
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    return " ".join(map(fmt.format, to_iterable(values)))
+
+
 def configure_parameters(params):
     """Preprocess Dakota parameters prior to committing to a config file.
 
@@ -2,6 +2,8 @@
 
 The module name in this package must match the keyword used by Dakota
 for the variable; e.g., the Dakota keyword ``continuous_design`` is
-used to name **continuous_design.py**.
+used to name **continuous_design.py**. The exception is
+**random_field.py**, whose coefficients Dakota sees as
+``normal_uncertain`` variables.
 
 """
@@ -1,17 +1,35 @@
 """An abstract base class for all Dakota variable types."""
 
 from abc import ABCMeta, abstractmethod
-from ..utils import to_iterable
+import numbers
+from ..utils import to_iterable, format_vector
 
 
 class VariablesBase(object):
 
-    """Describe features common to all Dakota variable types."""
+    """Describe features common to all Dakota variable types.
+
+    Vectors of values, such as bounds, are stored as contiguous arrays
+    of doubles, one value per variable.
+
+    """
 
     __metaclass__ = ABCMeta
 
+    _keyword = None
+    """The Dakota keyword for the variables, if not the `variables` type."""
+
+    _vectors = ()
+    """Names of the vector attributes, in the order they're printed."""
+
     @abstractmethod
-    def __init__(self, variables="continuous_design", descriptors=(), **kwargs):
+    def __init__(
+        self,
+        variables="continuous_design",
+        descriptors=(),
+        uncertain_correlation_matrix=None,
+        **kwargs
+    ):
         """Create default variables parameters.
 
         Parameters
@@ -20,10 +38,17 @@ class VariablesBase(object):
             Labels for the variables.
         variables : str, optional
             The type of parameter set (default is 'continuous_design').
+        uncertain_correlation_matrix : array_like, optional
+            The rank correlations between uncertain variables, an *n* x
+            *n* matrix, or its *n* * *n* values in row order (default
+            is uncorrelated).
 
         """
         self.variables = variables
         self._descriptors = descriptors
+        self._uncertain_correlation_matrix = None
+        if uncertain_correlation_matrix is not None:
+            self.uncertain_correlation_matrix = uncertain_correlation_matrix
 
     @property
     def descriptors(self):
@@ -46,11 +71,336 @@ class VariablesBase(object):
             raise TypeError("Descriptors must be a string, tuple or list")
         self._descriptors = value
 
+    @property
+    def uncertain_correlation_matrix(self):
+        """Rank correlations between uncertain variables."""
+        return self._uncertain_correlation_matrix
+
+    @uncertain_correlation_matrix.setter
+    def uncertain_correlation_matrix(self, value):
+        """Set the rank correlations between uncertain variables.
+
+        Parameters
+        ----------
+        value : array_like or None
+          A square matrix, or its values in row order.
+
+        """
+        import numpy as np
+
+        if value is None:
+            self._uncertain_correlation_matrix = None
+            return
+        if not isinstance(value, (tuple, list, np.ndarray)):
+            raise TypeError("Correlation matrix must be a tuple, a list, or an array")
+        try:
+            matrix = np.array(value, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError("Correlation matrix must be numbers")
+        if matrix.ndim == 1:
+            n = int(round(np.sqrt(matrix.size)))
+            if n * n != matrix.size:
+                raise TypeError("Correlation matrix must be square")
+            matrix = matrix.reshape((n, n))
+        if matrix.ndim != 2:
+            raise TypeError("Correlation matrix must be two-dimensional")
+        self._uncertain_correlation_matrix = matrix
+
     def __str__(self):
         """Define the variables block of a Dakota input file."""
         descriptors = to_iterable(self.descriptors)
-        s = "variables\n" + "  {0} = {1}\n".format(self.variables, len(descriptors))
-        s += "    descriptors ="
-        for vd in descriptors:
-            s += " {!r}".format(vd)
+        keyword = self._keyword or self.variables
+        s = "variables\n" + "  {0} = {1}\n".format(keyword, len(descriptors))
+        s += _print_vector("descriptors", descriptors, fmt="{!r}")
+        return s
+
+    def validate(self):
+        """Check that the vectors of values agree with one another.
+
+        Every vector must have one value per descriptor, and lower
+        bounds must be less than upper bounds.
+
+        Raises
+        ------
+        ValueError
+          If the vectors don't agree.
+
+        """
+        import numpy as np
+
+        n_variables = len(to_iterable(self.descriptors))
+        for name in self._vectors:
+            value = getattr(self, name)
+            if value is not None and len(value) != n_variables:
+                raise ValueError(
+                    "Expected {} values for {}, got {}".format(
+                        n_variables, name, len(value)
+                    )
+                )
+        lower = getattr(self, "lower_bounds", None)
+        upper = getattr(self, "upper_bounds", None)
+        if lower is not None and upper is not None and not np.all(lower < upper):
+            raise ValueError("Lower bounds must be less than upper bounds")
+        self._validate_correlations()
+
+    def _validate_correlations(self):
+        """Check that the correlation matrix is a valid one."""
+        import numpy as np
+
+        matrix = self.uncertain_correlation_matrix
+        if matrix is None:
+            return
+        keyword = self._keyword or self.variables
+        if not keyword.endswith("_uncertain"):
+            raise ValueError("Only uncertain variables can be correlated")
+        n_variables = len(to_iterable(self.descriptors))
+        if matrix.shape != (n_variables, n_variables):
+            raise ValueError(
+                "Expected a {0} x {0} correlation matrix, got {1}".format(
+                    n_variables, matrix.shape
+                )
+            )
+        if not np.allclose(matrix, matrix.T) or not np.allclose(np.diag(matrix), 1.0):
+            raise ValueError("Correlation matrix must be symmetric, with unit diagonal")
+        try:
+            np.linalg.cholesky(matrix)
+        except np.linalg.LinAlgError:
+            raise ValueError("Correlation matrix must be positive definite")
+
+    def _print_vectors(self):
+        """Define the lines of a variables block set by vector attributes."""
+        lines = [
+            "\n" + _print_vector(name, getattr(self, name))
+            for name in self._vectors
+            if getattr(self, name) is not None
+        ]
+        if self.uncertain_correlation_matrix is not None:
+            lines.append(
+                "\n"
+                + _print_vector(
+                    "uncertain_correlation_matrix",
+                    self.uncertain_correlation_matrix.ravel(),
+                )
+            )
+        return "".join(lines)
+
+    @abstractmethod
+    def from_unit(self, u):
+        """Map points on the unit hypercube to values of the variables.
+
+        Parameters
+        ----------
+        u : array_like
+          Points on the unit hypercube, one per row, with one column
+          per variable.
+
+        Returns
+        -------
+        ndarray
+          The values of the variables at the points.
+
+        """
+        raise NotImplementedError(
+            "Can't map points to {} variables".format(self.variables)
+        )
+
+    def sample(self, n_samples, sample_type="random", seed=None):
+        """Draw a sample of the variables.
+
+        Points are drawn on the unit hypercube, mapped to the
+        distributions of the variables, then, if the variables are
+        correlated, reordered to match their rank correlations.
+
+        Parameters
+        ----------
+        n_samples : int
+          The number of points.
+        sample_type : str, optional
+          Either ``random`` or ``lhs`` (default is ``random``).
+        seed : int or numpy.random.Generator, optional
+          A seed, or a random number generator.
+
+        Returns
+        -------
+        ndarray
+          The points, one per row.
+
+        """
+        import numpy as np
+        from ..distributions import unit_samples, induce_correlation
+
+        rng = np.random.default_rng(seed)
+        n_variables = len(to_iterable(self.descriptors))
+        x = self.from_unit(unit_samples(n_samples, n_variables, sample_type, rng))
+        if self.uncertain_correlation_matrix is not None:
+            x = induce_correlation(x, self.uncertain_correlation_matrix, rng)
+        return x
+
+
+class ShapeScaleUncertain(VariablesBase):
+
+    """Describe uncertain variables with shape and scale parameters.
+
+    The shape parameters, *alphas*, and scale parameters, *betas*, are
+    required specifications; the initial point is optional. Subclasses
+    map points to their distributions with `from_unit`.
+
+    """
+
+    _vectors = ("alphas", "betas", "initial_point")
+
+    def __init__(
+        self,
+        descriptors=("x1", "x2"),
+        alphas=(2.0, 2.0),
+        betas=(1.0, 1.0),
+        initial_point=None,
+        **kwargs
+    ):
+        """Create the parameter set for shape and scale variables.
+
+        Parameters
+        ----------
+        descriptors : str or tuple or list of str, optional
+            Labels for the variables.
+        alphas : tuple or list or array of numbers
+            Shape parameters of the distributions.
+        betas : tuple or list or array of numbers
+            Scale parameters of the distributions.
+        initial_point : tuple or list or array of numbers, optional
+            Start points used by study variables.
+        **kwargs
+            Optional keyword arguments.
+
+        """
+        VariablesBase.__init__(self, **kwargs)
+        self.variables = self.__module__.rsplit(".")[-1]
+        self._descriptors = descriptors
+        self._alphas = _to_array(alphas, "Alphas")
+        self._betas = _to_array(betas, "Betas")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
+
+    @property
+    def alphas(self):
+        """Shape parameters of study variables."""
+        return self._alphas
+
+    @alphas.setter
+    def alphas(self, value):
+        """Set the shape parameters of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The shape parameters.
+
+        """
+        self._alphas = _to_array(value, "Alphas", scalar=False)
+
+    @property
+    def betas(self):
+        """Scale parameters of study variables."""
+        return self._betas
+
+    @betas.setter
+    def betas(self, value):
+        """Set the scale parameters of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The scale parameters.
+
+        """
+        self._betas = _to_array(value, "Betas", scalar=False)
+
+    @property
+    def initial_point(self):
+        """Start points used by study variables."""
+        return self._initial_point
+
+    @initial_point.setter
+    def initial_point(self, value):
+        """Set start points used by study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The new initial points.
+
+        """
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def validate(self):
+        """Check the vectors of values, and that the parameters are positive.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.validate
+
+        """
+        import numpy as np
+
+        VariablesBase.validate(self)
+        if not np.all(self.alphas > 0) or not np.all(self.betas > 0):
+            raise ValueError("Alphas and betas must be positive")
+
+    def __str__(self):
+        """Define the variables block for shape and scale variables.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.__str__
+
+        """
+        s = VariablesBase.__str__(self) + self._print_vectors()
+        s += "\n\n"
         return s
+
+
+def _to_array(value, name, scalar=True):
+    """Convert a vector of numbers to a contiguous array of doubles.
+
+    Parameters
+    ----------
+    value : number, or list or tuple or array of numbers, or None
+      The values.
+    name : str
+      The name of the values, used in error messages.
+    scalar : bool, optional
+      Whether a single number is taken as a vector of one value, as
+      for a single variable (default is True).
+
+    Returns
+    -------
+    ndarray or None
+      The values, as a one-dimensional array of float64.
+
+    Examples
+    --------
+    >>> _to_array(-10.0, "Initial points")
+    array([-10.])
+
+    """
+    import numpy as np
+
+    if value is None:
+        return None
+    if scalar and isinstance(value, numbers.Real) and not isinstance(value, bool):
+        value = np.atleast_1d(value)
+    if not isinstance(value, (tuple, list, np.ndarray)):
+        raise TypeError("{} must be a tuple, a list, or an array".format(name))
+    try:
+        array = np.ascontiguousarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise TypeError("{} must be numbers".format(name))
+    if array.ndim != 1:
+        raise TypeError("{} must be one-dimensional".format(name))
+    return array
+
+
+def _print_vector(keyword, values, fmt="{}"):
+    """Define a keyword of a Dakota input file set by a vector of values."""
+    s = format_vector(values, fmt=fmt)
+    return "    {} =".format(keyword) + (" " + s if s else "")
@@ -0,0 +1,206 @@
+"""Implementation of a Dakota beta uncertain variable."""
+
+from .base import VariablesBase, _to_array
+
+
+classname = "BetaUncertain"
+
+
+class BetaUncertain(VariablesBase):
+
+    """Define attributes for Dakota beta uncertain variables.
+
+    The two shape parameters, and the distribution lower and upper
+    bounds, are required specifications; the initial point is
+    optional.
+
+    """
+
+    _vectors = ("alphas", "betas", "lower_bounds", "upper_bounds", "initial_point")
+
+    def __init__(
+        self,
+        descriptors=("x1", "x2"),
+        alphas=(2.0, 2.0),
+        betas=(2.0, 2.0),
+        lower_bounds=(-2.0, -2.0),
+        upper_bounds=(2.0, 2.0),
+        initial_point=None,
+        **kwargs
+    ):
+        """Create the parameter set for a beta uncertain variable.
+
+        Parameters
+        ----------
+        descriptors : str or tuple or list of str, optional
+            Labels for the variables.
+        alphas : tuple or list or array of numbers
+            First shape parameters of the beta distributions.
+        betas : tuple or list or array of numbers
+            Second shape parameters of the beta distributions.
+        lower_bounds : tuple or list or array of numbers
+            Minimum values used by the study variables.
+        upper_bounds : tuple or list or array of numbers
+            Maximum values used by the study variables.
+        initial_point : tuple or list or array of numbers, optional
+            Start points used by study variables.
+        **kwargs
+            Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default instance of BetaUncertain with:
+
+        >>> v = BetaUncertain()
+
+        """
+        VariablesBase.__init__(self, **kwargs)
+        self.variables = self.__module__.rsplit(".")[-1]
+        self._descriptors = descriptors
+        self._alphas = _to_array(alphas, "Alphas")
+        self._betas = _to_array(betas, "Betas")
+        self._lower_bounds = _to_array(lower_bounds, "Lower bounds")
+        self._upper_bounds = _to_array(upper_bounds, "Upper bounds")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
+
+    @property
+    def alphas(self):
+        """First shape parameters of study variables."""
+        return self._alphas
+
+    @alphas.setter
+    def alphas(self, value):
+        """Set the first shape parameters of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The shape parameters.
+
+        """
+        self._alphas = _to_array(value, "Alphas", scalar=False)
+
+    @property
+    def betas(self):
+        """Second shape parameters of study variables."""
+        return self._betas
+
+    @betas.setter
+    def betas(self, value):
+        """Set the second shape parameters of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The shape parameters.
+
+        """
+        self._betas = _to_array(value, "Betas", scalar=False)
+
+    @property
+    def lower_bounds(self):
+        """Minimum values of study variables."""
+        return self._lower_bounds
+
+    @lower_bounds.setter
+    def lower_bounds(self, value):
+        """Set minimum values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The minimum values.
+
+        """
+        self._lower_bounds = _to_array(value, "Lower bounds", scalar=False)
+
+    @property
+    def upper_bounds(self):
+        """Maximum values of study variables."""
+        return self._upper_bounds
+
+    @upper_bounds.setter
+    def upper_bounds(self, value):
+        """Set maximum values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The maximum values.
+
+        """
+        self._upper_bounds = _to_array(value, "Upper bounds", scalar=False)
+
+    @property
+    def initial_point(self):
+        """Start points used by study variables."""
+        return self._initial_point
+
+    @initial_point.setter
+    def initial_point(self, value):
+        """Set start points used by study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The new initial points.
+
+        """
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def validate(self):
+        """Check the vectors of values, and that the shapes are positive.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.validate
+
+        """
+        import numpy as np
+
+        VariablesBase.validate(self)
+        if not np.all(self.alphas > 0) or not np.all(self.betas > 0):
+            raise ValueError("Alphas and betas must be positive")
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to beta distributions.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        from ..distributions import beta_ppf
+
+        width = self.upper_bounds - self.lower_bounds
+        return self.lower_bounds + width * beta_ppf(u, self.alphas, self.betas)
+
+    def __str__(self):
+        """Define the variables block for a beta uncertain variable.
+
+        Examples
+        --------
+        Display the variables block created by a default instance of
+        BetaUncertain:
+
+        >>> v = BetaUncertain()
+        >>> print(v)
+        variables
+          beta_uncertain = 2
+            descriptors = 'x1' 'x2'
+            alphas = 2.0 2.0
+            betas = 2.0 2.0
+            lower_bounds = -2.0 -2.0
+            upper_bounds = 2.0 2.0
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.__str__
+
+        """
+        s = VariablesBase.__str__(self) + self._print_vectors()
+        s += "\n\n"
+        return s
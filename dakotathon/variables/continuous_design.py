@@ -1,7 +1,6 @@
 """Implementation of a Dakota continous design variable."""
 
-from .base import VariablesBase
-from ..utils import to_iterable
+from .base import VariablesBase, _to_array
 
 
 classname = "ContinuousDesign"
@@ -16,6 +15,8 @@ class ContinuousDesign(VariablesBase):
 
     """
 
+    _vectors = ("initial_point", "lower_bounds", "upper_bounds")
+
     def __init__(
         self,
         descriptors=("x1", "x2"),
@@ -30,11 +31,11 @@ class ContinuousDesign(VariablesBase):
         ----------
         descriptors : str or tuple or list of str, optional
             Labels for the variables.
-        initial_point : tuple or list of numbers
+        initial_point : tuple or list or array of numbers
             Start points used by study variables.
-        lower_bounds : tuple or list of numbers
+        lower_bounds : tuple or list or array of numbers
             Minimum values used by the study variables.
-        upper_bounds : tuple or list of numbers
+        upper_bounds : tuple or list or array of numbers
             Maximum values used by the study variables.
         **kwargs
             Optional keyword arguments.
@@ -49,12 +50,13 @@ class ContinuousDesign(VariablesBase):
         VariablesBase.__init__(self, **kwargs)
         self.variables = self.__module__.rsplit(".")[-1]
         self._descriptors = descriptors
-        self._initial_point = initial_point
-        self._lower_bounds = lower_bounds
-        self._upper_bounds = upper_bounds
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self._lower_bounds = _to_array(lower_bounds, "Lower bounds")
+        self._upper_bounds = _to_array(upper_bounds, "Upper bounds")
 
         if initial_point is None and lower_bounds is None and upper_bounds is None:
-            self._initial_point = (-0.3, 0.2)
+            self._initial_point = _to_array((-0.3, 0.2), "Initial points")
+        self.validate()
 
     @property
     def initial_point(self):
@@ -67,13 +69,11 @@ class ContinuousDesign(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The new initial points.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Initial points must be a tuple or a list")
-        self._initial_point = value
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
 
     @property
     def lower_bounds(self):
@@ -86,13 +86,11 @@ class ContinuousDesign(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The minimum values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Lower bounds must be a tuple or a list")
-        self._lower_bounds = value
+        self._lower_bounds = _to_array(value, "Lower bounds", scalar=False)
 
     @property
     def upper_bounds(self):
@@ -105,13 +103,32 @@ class ContinuousDesign(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The maximum values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Upper bounds must be a tuple or a list")
-        self._upper_bounds = value
+        self._upper_bounds = _to_array(value, "Upper bounds", scalar=False)
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to the bounds of the variables.
+
+        Without bounds, a variable spans one unit either side of its
+        initial point.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        import numpy as np
+
+        u = np.asarray(u, dtype=np.float64)
+        center = self.initial_point
+        if center is None:
+            center = np.zeros(u.shape[-1])
+        lower = self.lower_bounds if self.lower_bounds is not None else center - 1.0
+        upper = self.upper_bounds if self.upper_bounds is not None else center + 1.0
+        return lower + (upper - lower) * u
 
     def __str__(self):
         """Define the variables block for continous design variables.
@@ -135,21 +152,6 @@ class ContinuousDesign(VariablesBase):
         dakotathon.variables.base.VariablesBase.__str__
 
         """
-        s = VariablesBase.__str__(self)
-        if self.initial_point is not None:
-            initial_point = to_iterable(self.initial_point)
-            s += "\n" + "    initial_point ="
-            for pt in initial_point:
-                s += " {}".format(pt)
-        if self.lower_bounds is not None:
-            lower_bounds = to_iterable(self.lower_bounds)
-            s += "\n" + "    lower_bounds ="
-            for b in lower_bounds:
-                s += " {}".format(b)
-        if self.upper_bounds is not None:
-            upper_bounds = to_iterable(self.upper_bounds)
-            s += "\n" + "    upper_bounds ="
-            for b in upper_bounds:
-                s += " {}".format(b)
+        s = VariablesBase.__str__(self) + self._print_vectors()
         s += "\n\n"
         return s
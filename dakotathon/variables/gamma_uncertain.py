@@ -0,0 +1,43 @@
+"""Implementation of a Dakota gamma uncertain variable."""
+
+from .base import ShapeScaleUncertain
+
+
+classname = "GammaUncertain"
+
+
+class GammaUncertain(ShapeScaleUncertain):
+
+    """Define attributes for Dakota gamma uncertain variables.
+
+    The shape and scale parameters are required specifications; the
+    initial point is optional.
+
+    Examples
+    --------
+    Display the variables block created by a default instance of
+    GammaUncertain:
+
+    >>> v = GammaUncertain()
+    >>> print(v)
+    variables
+      gamma_uncertain = 2
+        descriptors = 'x1' 'x2'
+        alphas = 2.0 2.0
+        betas = 1.0 1.0
+    <BLANKLINE>
+    <BLANKLINE>
+
+    """
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to gamma distributions.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        from ..distributions import gamma_ppf
+
+        return gamma_ppf(u, self.alphas, self.betas)
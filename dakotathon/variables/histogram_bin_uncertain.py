@@ -0,0 +1,233 @@
+"""Implementation of a Dakota histogram bin uncertain variable."""
+
+from .base import VariablesBase, _to_array, _print_vector
+from ..utils import to_iterable
+
+
+classname = "HistogramBinUncertain"
+
+
+class HistogramBinUncertain(VariablesBase):
+
+    """Define attributes for Dakota histogram bin uncertain variables.
+
+    Each variable is distributed uniformly within each of a set of
+    bins, with a probability proportional to the bin's count. The
+    bins of all the variables are given in single vectors of
+    abscissas and counts, with the number of (abscissa, count) pairs
+    of each variable; the count paired with a variable's last
+    abscissa must be zero. The initial point is optional.
+
+    """
+
+    _vectors = ("abscissas", "counts", "initial_point")
+
+    def __init__(
+        self,
+        descriptors=("x1", "x2"),
+        pairs_per_variable=(3, 3),
+        abscissas=(0.0, 1.0, 2.0, 0.0, 1.0, 2.0),
+        counts=(1.0, 2.0, 0.0, 1.0, 2.0, 0.0),
+        initial_point=None,
+        **kwargs
+    ):
+        """Create the parameter set for a histogram bin uncertain variable.
+
+        Parameters
+        ----------
+        descriptors : str or tuple or list of str, optional
+            Labels for the variables.
+        pairs_per_variable : tuple or list of int
+            The number of (abscissa, count) pairs of each variable.
+        abscissas : tuple or list or array of numbers
+            The bin edges of all the variables, increasing for each
+            variable.
+        counts : tuple or list or array of numbers
+            The count of each bin, paired with its lower edge.
+        initial_point : tuple or list or array of numbers, optional
+            Start points used by study variables.
+        **kwargs
+            Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default instance of HistogramBinUncertain with:
+
+        >>> v = HistogramBinUncertain()
+
+        """
+        VariablesBase.__init__(self, **kwargs)
+        self.variables = self.__module__.rsplit(".")[-1]
+        self._descriptors = descriptors
+        self.pairs_per_variable = pairs_per_variable
+        self._abscissas = _to_array(abscissas, "Abscissas")
+        self._counts = _to_array(counts, "Counts")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
+
+    @property
+    def pairs_per_variable(self):
+        """The number of (abscissa, count) pairs of each study variable."""
+        return self._pairs_per_variable
+
+    @pairs_per_variable.setter
+    def pairs_per_variable(self, value):
+        """Set the number of (abscissa, count) pairs of each variable.
+
+        Parameters
+        ----------
+        value : list or tuple of int
+          The numbers of pairs.
+
+        """
+        if not isinstance(value, (tuple, list)):
+            raise TypeError("Pairs per variable must be a tuple or a list")
+        if not all(isinstance(n, int) for n in value):
+            raise TypeError("Pairs per variable must be integers")
+        self._pairs_per_variable = tuple(value)
+
+    @property
+    def abscissas(self):
+        """Bin edges of study variables."""
+        return self._abscissas
+
+    @abscissas.setter
+    def abscissas(self, value):
+        """Set the bin edges of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The bin edges.
+
+        """
+        self._abscissas = _to_array(value, "Abscissas", scalar=False)
+
+    @property
+    def counts(self):
+        """Bin counts of study variables."""
+        return self._counts
+
+    @counts.setter
+    def counts(self, value):
+        """Set the bin counts of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The bin counts.
+
+        """
+        self._counts = _to_array(value, "Counts", scalar=False)
+
+    @property
+    def initial_point(self):
+        """Start points used by study variables."""
+        return self._initial_point
+
+    @initial_point.setter
+    def initial_point(self, value):
+        """Set start points used by study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The new initial points.
+
+        """
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def _bins(self):
+        """Split the abscissas and counts into those of each variable."""
+        import numpy as np
+
+        edges = np.cumsum(self.pairs_per_variable)[:-1]
+        return zip(np.split(self.abscissas, edges), np.split(self.counts, edges))
+
+    def validate(self):
+        """Check that the bins of the variables are consistent.
+
+        Raises
+        ------
+        ValueError
+          If the pairs don't match the variables, or the bins of a
+          variable aren't valid.
+
+        """
+        import numpy as np
+
+        n_variables = len(to_iterable(self.descriptors))
+        if len(self.pairs_per_variable) != n_variables:
+            raise ValueError(
+                "Expected pairs for {} variables, got {}".format(
+                    n_variables, len(self.pairs_per_variable)
+                )
+            )
+        n_pairs = sum(self.pairs_per_variable)
+        if len(self.abscissas) != n_pairs or len(self.counts) != n_pairs:
+            raise ValueError(
+                "Expected {} abscissas and counts, got {} and {}".format(
+                    n_pairs, len(self.abscissas), len(self.counts)
+                )
+            )
+        if self.initial_point is not None and len(self.initial_point) != n_variables:
+            raise ValueError(
+                "Expected {} values for initial_point, got {}".format(
+                    n_variables, len(self.initial_point)
+                )
+            )
+        for abscissas, counts in self._bins():
+            if len(abscissas) < 2 or not np.all(np.diff(abscissas) > 0):
+                raise ValueError("Each variable needs increasing abscissas")
+            if np.any(counts < 0) or counts[-1] != 0 or counts.sum() <= 0:
+                raise ValueError(
+                    "Counts must be nonnegative, with a last count of zero"
+                )
+        self._validate_correlations()
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to histogram distributions.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        import numpy as np
+        from ..distributions import histogram_ppf
+
+        u = np.asarray(u, dtype=np.float64)
+        x = np.empty_like(u)
+        for j, (abscissas, counts) in enumerate(self._bins()):
+            x[..., j] = histogram_ppf(u[..., j], abscissas, counts)
+        return x
+
+    def __str__(self):
+        """Define the variables block for a histogram bin uncertain variable.
+
+        Examples
+        --------
+        Display the variables block created by a default instance of
+        HistogramBinUncertain:
+
+        >>> v = HistogramBinUncertain()
+        >>> print(v)
+        variables
+          histogram_bin_uncertain = 2
+            descriptors = 'x1' 'x2'
+            pairs_per_variable = 3 3
+            abscissas = 0.0 1.0 2.0 0.0 1.0 2.0
+            counts = 1.0 2.0 0.0 1.0 2.0 0.0
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.__str__
+
+        """
+        s = VariablesBase.__str__(self)
+        s += "\n" + _print_vector("pairs_per_variable", self.pairs_per_variable)
+        s += self._print_vectors()
+        s += "\n\n"
+        return s
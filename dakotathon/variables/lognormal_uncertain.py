@@ -0,0 +1,218 @@
+"""Implementation of a Dakota lognormal uncertain variable."""
+
+from .base import VariablesBase, _to_array
+
+
+classname = "LognormalUncertain"
+
+
+class LognormalUncertain(VariablesBase):
+
+    """Define attributes for Dakota lognormal uncertain variables.
+
+    The means and standard deviations of the variables (not of their
+    logs) are required specifications; the initial point, and the
+    distribution lower and upper bounds are optional.
+
+    """
+
+    _vectors = (
+        "means",
+        "std_deviations",
+        "lower_bounds",
+        "upper_bounds",
+        "initial_point",
+    )
+
+    def __init__(
+        self,
+        descriptors=("x1", "x2"),
+        means=(1.0, 1.0),
+        std_deviations=(0.5, 0.5),
+        lower_bounds=None,
+        upper_bounds=None,
+        initial_point=None,
+        **kwargs
+    ):
+        """Create the parameter set for a lognormal uncertain variable.
+
+        Parameters
+        ----------
+        descriptors : str or tuple or list of str, optional
+            Labels for the variables.
+        means : tuple or list or array of numbers
+            Mean values of the variables; they must be positive.
+        std_deviations : tuple or list or array of numbers
+            Standard deviations of the variables.
+        lower_bounds : tuple or list or array of numbers, optional
+            Minimum values used by the study variables.
+        upper_bounds : tuple or list or array of numbers, optional
+            Maximum values used by the study variables.
+        initial_point : tuple or list or array of numbers, optional
+            Start points used by study variables.
+        **kwargs
+            Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default instance of LognormalUncertain with:
+
+        >>> v = LognormalUncertain()
+
+        """
+        VariablesBase.__init__(self, **kwargs)
+        self.variables = self.__module__.rsplit(".")[-1]
+        self._descriptors = descriptors
+        self._means = _to_array(means, "Means")
+        self._std_deviations = _to_array(std_deviations, "Standard deviations")
+        self._lower_bounds = _to_array(lower_bounds, "Lower bounds")
+        self._upper_bounds = _to_array(upper_bounds, "Upper bounds")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
+
+    @property
+    def means(self):
+        """Mean values of study variables."""
+        return self._means
+
+    @means.setter
+    def means(self, value):
+        """Set mean values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The mean values.
+
+        """
+        self._means = _to_array(value, "Means", scalar=False)
+
+    @property
+    def std_deviations(self):
+        """Standard deviations of study variables."""
+        return self._std_deviations
+
+    @std_deviations.setter
+    def std_deviations(self, value):
+        """Set standard deviations of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The standard deviation values.
+
+        """
+        self._std_deviations = _to_array(value, "Standard deviations", scalar=False)
+
+    @property
+    def lower_bounds(self):
+        """Minimum values of study variables."""
+        return self._lower_bounds
+
+    @lower_bounds.setter
+    def lower_bounds(self, value):
+        """Set minimum values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The minimum values.
+
+        """
+        self._lower_bounds = _to_array(value, "Lower bounds", scalar=False)
+
+    @property
+    def upper_bounds(self):
+        """Maximum values of study variables."""
+        return self._upper_bounds
+
+    @upper_bounds.setter
+    def upper_bounds(self, value):
+        """Set maximum values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The maximum values.
+
+        """
+        self._upper_bounds = _to_array(value, "Upper bounds", scalar=False)
+
+    @property
+    def initial_point(self):
+        """Start points used by study variables."""
+        return self._initial_point
+
+    @initial_point.setter
+    def initial_point(self, value):
+        """Set start points used by study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The new initial points.
+
+        """
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def validate(self):
+        """Check the vectors of values, and that the parameters are positive.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.validate
+
+        """
+        import numpy as np
+
+        VariablesBase.validate(self)
+        if not np.all(self.means > 0) or not np.all(self.std_deviations > 0):
+            raise ValueError("Means and standard deviations must be positive")
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to lognormal distributions.
+
+        Values outside the optional bounds are moved to the bounds.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        import numpy as np
+        from ..distributions import lognormal_parameters, normal_ppf
+
+        lambdas, zetas = lognormal_parameters(self.means, self.std_deviations)
+        x = np.exp(lambdas + zetas * normal_ppf(u))
+        if self.lower_bounds is not None:
+            x = np.maximum(x, self.lower_bounds)
+        if self.upper_bounds is not None:
+            x = np.minimum(x, self.upper_bounds)
+        return x
+
+    def __str__(self):
+        """Define the variables block for a lognormal uncertain variable.
+
+        Examples
+        --------
+        Display the variables block created by a default instance of
+        LognormalUncertain:
+
+        >>> v = LognormalUncertain()
+        >>> print(v)
+        variables
+          lognormal_uncertain = 2
+            descriptors = 'x1' 'x2'
+            means = 1.0 1.0
+            std_deviations = 0.5 0.5
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.__str__
+
+        """
+        s = VariablesBase.__str__(self) + self._print_vectors()
+        s += "\n\n"
+        return s
@@ -0,0 +1,162 @@
+"""Implementation of a Dakota loguniform uncertain variable."""
+
+from .base import VariablesBase, _to_array
+
+
+classname = "LoguniformUncertain"
+
+
+class LoguniformUncertain(VariablesBase):
+
+    """Define attributes for Dakota loguniform uncertain variables.
+
+    The logs of the variables are uniformly distributed. The
+    distribution lower and upper bounds, which must be positive, are
+    required specifications; the initial point is optional.
+
+    """
+
+    _vectors = ("lower_bounds", "upper_bounds", "initial_point")
+
+    def __init__(
+        self,
+        descriptors=("x1", "x2"),
+        lower_bounds=(0.1, 0.1),
+        upper_bounds=(10.0, 10.0),
+        initial_point=None,
+        **kwargs
+    ):
+        """Create the parameter set for a loguniform uncertain variable.
+
+        Parameters
+        ----------
+        descriptors : str or tuple or list of str, optional
+            Labels for the variables.
+        lower_bounds : tuple or list or array of numbers
+            Minimum values used by the study variables.
+        upper_bounds : tuple or list or array of numbers
+            Maximum values used by the study variables.
+        initial_point : tuple or list or array of numbers, optional
+            Start points used by study variables.
+        **kwargs
+            Optional keyword arguments.
+
+        Examples
+        --------
+        Create a default instance of LoguniformUncertain with:
+
+        >>> v = LoguniformUncertain()
+
+        """
+        VariablesBase.__init__(self, **kwargs)
+        self.variables = self.__module__.rsplit(".")[-1]
+        self._descriptors = descriptors
+        self._lower_bounds = _to_array(lower_bounds, "Lower bounds")
+        self._upper_bounds = _to_array(upper_bounds, "Upper bounds")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
+
+    @property
+    def lower_bounds(self):
+        """Minimum values of study variables."""
+        return self._lower_bounds
+
+    @lower_bounds.setter
+    def lower_bounds(self, value):
+        """Set minimum values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The minimum values.
+
+        """
+        self._lower_bounds = _to_array(value, "Lower bounds", scalar=False)
+
+    @property
+    def upper_bounds(self):
+        """Maximum values of study variables."""
+        return self._upper_bounds
+
+    @upper_bounds.setter
+    def upper_bounds(self, value):
+        """Set maximum values of study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The maximum values.
+
+        """
+        self._upper_bounds = _to_array(value, "Upper bounds", scalar=False)
+
+    @property
+    def initial_point(self):
+        """Start points used by study variables."""
+        return self._initial_point
+
+    @initial_point.setter
+    def initial_point(self, value):
+        """Set start points used by study variables.
+
+        Parameters
+        ----------
+        value : list or tuple or array of numbers
+          The new initial points.
+
+        """
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def validate(self):
+        """Check the vectors of values, and that the bounds are positive.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.validate
+
+        """
+        import numpy as np
+
+        VariablesBase.validate(self)
+        if not np.all(self.lower_bounds > 0):
+            raise ValueError("Lower bounds must be positive")
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to loguniform distributions.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        import numpy as np
+
+        lower, upper = np.log(self.lower_bounds), np.log(self.upper_bounds)
+        return np.exp(lower + (upper - lower) * np.asarray(u, dtype=np.float64))
+
+    def __str__(self):
+        """Define the variables block for a loguniform uncertain variable.
+
+        Examples
+        --------
+        Display the variables block created by a default instance of
+        LoguniformUncertain:
+
+        >>> v = LoguniformUncertain()
+        >>> print(v)
+        variables
+          loguniform_uncertain = 2
+            descriptors = 'x1' 'x2'
+            lower_bounds = 0.1 0.1
+            upper_bounds = 10.0 10.0
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.__str__
+
+        """
+        s = VariablesBase.__str__(self) + self._print_vectors()
+        s += "\n\n"
+        return s
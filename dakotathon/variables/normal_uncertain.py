@@ -1,7 +1,6 @@
 """Implementation of a Dakota normal uncertain variable."""
 
-from .base import VariablesBase
-from ..utils import to_iterable
+from .base import VariablesBase, _to_array
 
 
 classname = "NormalUncertain"
@@ -21,6 +20,14 @@ class NormalUncertain(VariablesBase):
 
     """
 
+    _vectors = (
+        "means",
+        "std_deviations",
+        "lower_bounds",
+        "upper_bounds",
+        "initial_point",
+    )
+
     def __init__(
         self,
         descriptors=("x1", "x2"),
@@ -37,15 +44,15 @@ class NormalUncertain(VariablesBase):
         ----------
         descriptors : str or tuple or list of str, optional
             Labels for the variables.
-        means : tuple or list of numbers
+        means : tuple or list or array of numbers
             First parameter of Gaussian distribution.
-        std_deviations : tuple or list of numbers
+        std_deviations : tuple or list or array of numbers
             Second parameter of Gaussian distribution.
-        lower_bounds : tuple or list of numbers, optional
+        lower_bounds : tuple or list or array of numbers, optional
             Minimum values used by the study variables.
-        upper_bounds : tuple or list of numbers, optional
+        upper_bounds : tuple or list or array of numbers, optional
             Maximum values used by the study variables.
-        initial_point : tuple or list of numbers, optional
+        initial_point : tuple or list or array of numbers, optional
             Start points used by study variables.
         **kwargs
             Optional keyword arguments.
@@ -60,11 +67,12 @@ class NormalUncertain(VariablesBase):
         VariablesBase.__init__(self, **kwargs)
         self.variables = self.__module__.rsplit(".")[-1]
         self._descriptors = descriptors
-        self._means = means
-        self._std_deviations = std_deviations
-        self._lower_bounds = lower_bounds
-        self._upper_bounds = upper_bounds
-        self._initial_point = initial_point
+        self._means = _to_array(means, "Means")
+        self._std_deviations = _to_array(std_deviations, "Standard deviations")
+        self._lower_bounds = _to_array(lower_bounds, "Lower bounds")
+        self._upper_bounds = _to_array(upper_bounds, "Upper bounds")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
 
     @property
     def means(self):
@@ -77,13 +85,11 @@ class NormalUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The mean values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Means must be a tuple or a list")
-        self._means = value
+        self._means = _to_array(value, "Means", scalar=False)
 
     @property
     def std_deviations(self):
@@ -96,13 +102,11 @@ class NormalUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The standard deviation values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Standard deviations must be a tuple or a list")
-        self._std_deviations = value
+        self._std_deviations = _to_array(value, "Standard deviations", scalar=False)
 
     @property
     def lower_bounds(self):
@@ -115,13 +119,11 @@ class NormalUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The minimum values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Lower bounds must be a tuple or a list")
-        self._lower_bounds = value
+        self._lower_bounds = _to_array(value, "Lower bounds", scalar=False)
 
     @property
     def upper_bounds(self):
@@ -134,13 +136,11 @@ class NormalUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The maximum values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Upper bounds must be a tuple or a list")
-        self._upper_bounds = value
+        self._upper_bounds = _to_array(value, "Upper bounds", scalar=False)
 
     @property
     def initial_point(self):
@@ -153,13 +153,48 @@ class NormalUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The new initial points.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Initial points must be a tuple or a list")
-        self._initial_point = value
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def validate(self):
+        """Check the vectors of values, and that deviations are positive.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.validate
+
+        """
+        import numpy as np
+
+        VariablesBase.validate(self)
+        if self.std_deviations is not None and not np.all(self.std_deviations > 0):
+            raise ValueError("Standard deviations must be positive")
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to normal distributions.
+
+        With bounds, the points are mapped to the truncated normal
+        distributions, by first scaling them to the probabilities
+        between the bounds.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        import numpy as np
+        from ..distributions import normal_cdf, normal_ppf
+
+        lower, upper = 0.0, 1.0
+        if self.lower_bounds is not None:
+            lower = normal_cdf((self.lower_bounds - self.means) / self.std_deviations)
+        if self.upper_bounds is not None:
+            upper = normal_cdf((self.upper_bounds - self.means) / self.std_deviations)
+        u = lower + np.asarray(u, dtype=np.float64) * (upper - lower)
+        return self.means + self.std_deviations * normal_ppf(u)
 
     def __str__(self):
         """Define the variables block for a normal uncertain variable.
@@ -184,31 +219,6 @@ class NormalUncertain(VariablesBase):
         dakotathon.variables.base.VariablesBase.__str__
 
         """
-        s = VariablesBase.__str__(self)
-        if self.means is not None:
-            means = to_iterable(self.means)
-            s += "\n" + "    means ="
-            for m in means:
-                s += " {}".format(m)
-        if self.std_deviations is not None:
-            std_deviations = to_iterable(self.std_deviations)
-            s += "\n" + "    std_deviations ="
-            for m in std_deviations:
-                s += " {}".format(m)
-        if self.lower_bounds is not None:
-            lower_bounds = to_iterable(self.lower_bounds)
-            s += "\n" + "    lower_bounds ="
-            for b in lower_bounds:
-                s += " {}".format(b)
-        if self.upper_bounds is not None:
-            upper_bounds = to_iterable(self.upper_bounds)
-            s += "\n" + "    upper_bounds ="
-            for b in upper_bounds:
-                s += " {}".format(b)
-        if self.initial_point is not None:
-            initial_point = to_iterable(self.initial_point)
-            s += "\n" + "    initial_point ="
-            for pt in initial_point:
-                s += " {}".format(pt)
+        s = VariablesBase.__str__(self) + self._print_vectors()
         s += "\n\n"
         return s
@@ -0,0 +1,433 @@
+"""Implementation of a spatially distributed random field variable.
+
+A field, e.g., a precipitation multiplier for each cell of a model
+grid, is represented by a truncated Karhunen-Loeve (KL) expansion
+
+.. math::
+
+   f = \\bar{f} + \\sum_{k=1}^{K} \\sqrt{\\lambda_k} \\, \\xi_k \\, \\phi_k
+
+where :math:`\\phi_k` and :math:`\\lambda_k` are the eigenvectors and
+eigenvalues of the field's covariance, and the coefficients
+:math:`\\xi_k` are independent standard normal variables. Dakota
+samples only the *K* coefficients, as ``normal_uncertain`` variables,
+instead of one variable per cell. At each evaluation, the analysis
+driver expands the coefficients to the full field with
+`write_field`.
+
+The basis is stored in a NumPy ``.npz`` file, made from a covariance
+matrix with `basis_from_covariance`, or from an ensemble of fields
+(principal component analysis) with `basis_from_samples`, and saved
+with `save_field_basis`.
+
+"""
+
+import os
+from .base import VariablesBase, _to_array
+from ..utils import to_iterable
+
+
+classname = "RandomField"
+
+field_suffix = ".txt"
+
+
+def _truncate(eigenvalues, n_modes=None, energy=0.95):
+    """Get the number of modes that capture a fraction of the variance."""
+    import numpy as np
+
+    if n_modes is not None:
+        return min(int(n_modes), len(eigenvalues))
+    total = np.cumsum(eigenvalues)
+    if total[-1] <= 0.0:
+        return 1
+    return int(np.searchsorted(total / total[-1], energy) + 1)
+
+
+def basis_from_covariance(covariance, mean=None, n_modes=None, energy=0.95):
+    """Compute the KL basis of a field from its covariance matrix.
+
+    Parameters
+    ----------
+    covariance : array_like
+      The covariance between each pair of cells, an *N* x *N* matrix.
+    mean : array_like, optional
+      The mean field (default is zero).
+    n_modes : int, optional
+      The number of modes kept; by default, enough modes are kept to
+      capture the `energy` fraction of the variance.
+    energy : float, optional
+      The fraction of the variance captured (default is 0.95).
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+      The mean field, the basis (an *N* x *K* array of modes), and the
+      eigenvalues of the modes, largest first.
+
+    """
+    import numpy as np
+
+    covariance = np.asarray(covariance, dtype=np.float64)
+    eigenvalues, vectors = np.linalg.eigh(covariance)
+    order = np.argsort(eigenvalues)[::-1]
+    eigenvalues = np.clip(eigenvalues[order], 0.0, None)
+    k = _truncate(eigenvalues, n_modes, energy)
+    if mean is None:
+        mean = np.zeros(len(covariance))
+    return (
+        np.asarray(mean, dtype=np.float64).ravel(),
+        np.ascontiguousarray(vectors[:, order[:k]]),
+        eigenvalues[:k],
+    )
+
+
+def basis_from_samples(samples, n_modes=None, energy=0.95):
+    """Compute the PCA basis of a field from an ensemble of fields.
+
+    Parameters
+    ----------
+    samples : array_like
+      The ensemble, with one field per row; fields with more than one
+      dimension are flattened.
+    n_modes : int, optional
+      The number of modes kept; by default, enough modes are kept to
+      capture the `energy` fraction of the variance.
+    energy : float, optional
+      The fraction of the variance captured (default is 0.95).
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+      The mean field, the basis (an *N* x *K* array of modes), and the
+      eigenvalues of the modes, largest first.
+
+    """
+    import numpy as np
+
+    samples = np.asarray(samples, dtype=np.float64)
+    samples = samples.reshape(len(samples), -1)
+    mean = samples.mean(axis=0)
+    anomalies = (samples - mean) / np.sqrt(max(len(samples) - 1, 1))
+    _, singular_values, vectors = np.linalg.svd(anomalies, full_matrices=False)
+    eigenvalues = singular_values ** 2
+    k = _truncate(eigenvalues, n_modes, energy)
+    return mean, np.ascontiguousarray(vectors[:k].T), eigenvalues[:k]
+
+
+def save_field_basis(field_file, mean, basis, eigenvalues, shape=None):
+    """Save the basis of a random field.
+
+    Parameters
+    ----------
+    field_file : str
+      The path to the new ``.npz`` file.
+    mean : array_like
+      The mean field.
+    basis : array_like
+      The modes of the field, one per column.
+    eigenvalues : array_like
+      The eigenvalues of the modes.
+    shape : tuple of int, optional
+      The shape of the model grid (default is the number of cells).
+
+    """
+    import numpy as np
+
+    mean = np.asarray(mean, dtype=np.float64).ravel()
+    np.savez(
+        field_file,
+        mean=mean,
+        basis=np.asarray(basis, dtype=np.float64),
+        eigenvalues=np.asarray(eigenvalues, dtype=np.float64),
+        shape=np.asarray(shape or mean.shape, dtype=np.int64),
+    )
+
+
+def load_field_basis(field_file, n_modes=None):
+    """Load the basis of a random field.
+
+    Parameters
+    ----------
+    field_file : str
+      The path to a file written by `save_field_basis`.
+    n_modes : int, optional
+      Keep only the leading modes (default is all of them).
+
+    Returns
+    -------
+    dict
+      The *mean*, *basis*, *eigenvalues*, and *shape* of the field.
+
+    Raises
+    ------
+    ValueError
+      If the file has fewer than `n_modes` modes.
+
+    """
+    import numpy as np
+
+    with np.load(field_file) as data:
+        basis = {name: data[name] for name in data.files}
+    if n_modes is not None:
+        if n_modes > len(basis["eigenvalues"]):
+            raise ValueError(
+                "{} has only {} modes".format(field_file, len(basis["eigenvalues"]))
+            )
+        basis["basis"] = basis["basis"][:, :n_modes]
+        basis["eigenvalues"] = basis["eigenvalues"][:n_modes]
+    basis.setdefault("shape", basis["mean"].shape)
+    return basis
+
+
+def expand_field(coefficients, mean, basis, eigenvalues):
+    """Expand KL coefficients to the full field.
+
+    Parameters
+    ----------
+    coefficients : array_like
+      The coefficients of the modes; a two-dimensional array, with one
+      set of coefficients per row, is expanded in a single product.
+    mean : array_like
+      The mean field.
+    basis : array_like
+      The modes of the field, one per column.
+    eigenvalues : array_like
+      The eigenvalues of the modes.
+
+    Returns
+    -------
+    ndarray
+      The field, or one field per row of `coefficients`.
+
+    Examples
+    --------
+    >>> expand_field([1.0, -1.0], [0.0, 1.0], [[1.0, 0.0], [0.0, 1.0]], [4.0, 1.0])
+    array([2., 0.])
+
+    """
+    import numpy as np
+
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    scaled = coefficients * np.sqrt(eigenvalues)
+    return np.asarray(mean, dtype=np.float64) + scaled @ np.asarray(basis).T
+
+
+def get_field_output_file(config):
+    """Get the name of the file the expanded field is written to."""
+    return config.get("field_output_file") or config["field_name"] + field_suffix
+
+
+def write_field(config, params_file):
+    """Expand the coefficients of an evaluation, and write the field.
+
+    The field is written, in the shape of the model grid, to the
+    current directory, where a model's template or input can refer
+    to it.
+
+    Parameters
+    ----------
+    config : dict
+      Configuration settings for a Dakota experiment.
+    params_file : str
+      The path to the evaluation's parameters file.
+
+    Returns
+    -------
+    ndarray or None
+      The flattened field, or None if the experiment's variables
+      aren't a random field.
+
+    """
+    import numpy as np
+    from ..store import read_parameters
+
+    if config.get("variables") != "random_field":
+        return None
+    field = load_field_basis(config["field_file"], config.get("n_modes"))
+    names, values = read_parameters(params_file)
+    lookup = dict(zip(names, values))
+    coefficients = [lookup[name] for name in to_iterable(config["descriptors"])]
+    values = expand_field(
+        coefficients, field["mean"], field["basis"], field["eigenvalues"]
+    )
+    shape = tuple(field["shape"])
+    grid = values.reshape(shape if len(shape) <= 2 else (-1, shape[-1]))
+    np.savetxt(get_field_output_file(config), np.atleast_1d(grid))
+    return values
+
+
+class RandomField(VariablesBase):
+
+    """Define a random field by the coefficients of its KL expansion.
+
+    The coefficients are standard normal variables. Dakota sees them
+    as ``normal_uncertain`` variables, one per mode.
+
+    """
+
+    _keyword = "normal_uncertain"
+    _vectors = ("means", "std_deviations")
+
+    def __init__(
+        self,
+        field_file=None,
+        field_name="field",
+        n_modes=None,
+        descriptors=None,
+        field_output_file=None,
+        **kwargs
+    ):
+        """Create the coefficients of a random field.
+
+        Parameters
+        ----------
+        field_file : str, optional
+            The path to the ``.npz`` file that stores the basis of the
+            field.
+        field_name : str, optional
+            The name of the model input set by the field; a component
+            receives the field through its BMI `set_value` method
+            (default is 'field').
+        n_modes : int, optional
+            The number of modes kept, at most the number in the file;
+            more raises a ValueError (default is every mode in the
+            file, or 2 without a file).
+        descriptors : str or tuple or list of str, optional
+            Labels for the coefficients (default is 'xi1', 'xi2', ...).
+        field_output_file : str, optional
+            The file the expanded field is written to at each
+            evaluation (default is the field name, with a **.txt**
+            extension).
+        **kwargs
+            Optional keyword arguments.
+
+        Examples
+        --------
+        Create a random field with two coefficients:
+
+        >>> v = RandomField()
+
+        """
+        VariablesBase.__init__(self, **kwargs)
+        self.variables = self.__module__.rsplit(".")[-1]
+        self._field_file = None
+        self._field_name = field_name
+        self._field_output_file = field_output_file
+        if field_file is not None:
+            self.field_file = field_file
+        available = self._count_modes()
+        if n_modes is not None and self.field_file is not None:
+            if n_modes > available:
+                msg = "The field file has only {} modes".format(available)
+                raise ValueError(msg)
+        self._n_modes = n_modes or available
+        if descriptors is None:
+            descriptors = tuple("xi{}".format(i + 1) for i in range(self._n_modes))
+        self._descriptors = descriptors
+        self._means = _to_array([0.0] * self._n_modes, "Means")
+        self._std_deviations = _to_array([1.0] * self._n_modes, "Standard deviations")
+        self.validate()
+
+    def _count_modes(self):
+        """Count the modes in the field file."""
+        import numpy as np
+
+        if self.field_file is None:
+            return 2
+        with np.load(self.field_file) as data:
+            return len(data["eigenvalues"])
+
+    @property
+    def field_file(self):
+        """The path to the file that stores the basis of the field."""
+        return self._field_file
+
+    @field_file.setter
+    def field_file(self, value):
+        """Set the path to the basis of the field.
+
+        Parameters
+        ----------
+        value : str
+          The path to a ``.npz`` file.
+
+        """
+        if not isinstance(value, str):
+            raise TypeError("Field file must be a str")
+        if not os.path.isfile(value):
+            raise IOError("Field file not found: {}".format(value))
+        self._field_file = os.path.abspath(value)
+
+    @property
+    def field_name(self):
+        """The name of the model input set by the field."""
+        return self._field_name
+
+    @field_name.setter
+    def field_name(self, value):
+        """Set the name of the model input set by the field.
+
+        Parameters
+        ----------
+        value : str
+          The new name.
+
+        """
+        if not isinstance(value, str):
+            raise TypeError("Field name must be a str")
+        self._field_name = value
+
+    @property
+    def n_modes(self):
+        """The number of modes, or coefficients, of the field."""
+        return self._n_modes
+
+    @property
+    def means(self):
+        """Mean values of the coefficients."""
+        return self._means
+
+    @property
+    def std_deviations(self):
+        """Standard deviations of the coefficients."""
+        return self._std_deviations
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to the coefficients.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        from ..distributions import normal_ppf
+
+        return self.means + self.std_deviations * normal_ppf(u)
+
+    def __str__(self):
+        """Define the variables block for the coefficients of a field.
+
+        Examples
+        --------
+        Display the variables block created by a default instance of
+        RandomField:
+
+        >>> v = RandomField()
+        >>> print(v)
+        variables
+          normal_uncertain = 2
+            descriptors = 'xi1' 'xi2'
+            means = 0.0 0.0
+            std_deviations = 1.0 1.0
+        <BLANKLINE>
+        <BLANKLINE>
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.__str__
+
+        """
+        s = VariablesBase.__str__(self) + self._print_vectors()
+        s += "\n\n"
+        return s
@@ -1,7 +1,6 @@
 """Implementation of a Dakota uniform uncertain variable."""
 
-from .base import VariablesBase
-from ..utils import to_iterable
+from .base import VariablesBase, _to_array
 
 
 classname = "UniformUncertain"
@@ -16,6 +15,8 @@ class UniformUncertain(VariablesBase):
 
     """
 
+    _vectors = ("lower_bounds", "upper_bounds", "initial_point")
+
     def __init__(
         self,
         descriptors=("x1", "x2"),
@@ -30,11 +31,11 @@ class UniformUncertain(VariablesBase):
         ----------
         descriptors : str or tuple or list of str, optional
             Labels for the variables.
-        initial_point : tuple or list of numbers, optional
+        initial_point : tuple or list or array of numbers, optional
             Start points used by study variables.
-        lower_bounds : tuple or list of numbers
+        lower_bounds : tuple or list or array of numbers
             Minimum values used by the study variables.
-        upper_bounds : tuple or list of numbers
+        upper_bounds : tuple or list or array of numbers
             Maximum values used by the study variables.
         **kwargs
             Optional keyword arguments.
@@ -49,9 +50,10 @@ class UniformUncertain(VariablesBase):
         VariablesBase.__init__(self, **kwargs)
         self.variables = self.__module__.rsplit(".")[-1]
         self._descriptors = descriptors
-        self._lower_bounds = lower_bounds
-        self._upper_bounds = upper_bounds
-        self._initial_point = initial_point
+        self._lower_bounds = _to_array(lower_bounds, "Lower bounds")
+        self._upper_bounds = _to_array(upper_bounds, "Upper bounds")
+        self._initial_point = _to_array(initial_point, "Initial points")
+        self.validate()
 
     @property
     def lower_bounds(self):
@@ -64,13 +66,11 @@ class UniformUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The minimum values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Lower bounds must be a tuple or a list")
-        self._lower_bounds = value
+        self._lower_bounds = _to_array(value, "Lower bounds", scalar=False)
 
     @property
     def upper_bounds(self):
@@ -83,13 +83,11 @@ class UniformUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The maximum values.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Upper bounds must be a tuple or a list")
-        self._upper_bounds = value
+        self._upper_bounds = _to_array(value, "Upper bounds", scalar=False)
 
     @property
     def initial_point(self):
@@ -102,13 +100,24 @@ class UniformUncertain(VariablesBase):
 
         Parameters
         ----------
-        value : list or tuple of numbers
+        value : list or tuple or array of numbers
           The new initial points.
 
         """
-        if not isinstance(value, (tuple, list)):
-            raise TypeError("Initial points must be a tuple or a list")
-        self._initial_point = value
+        self._initial_point = _to_array(value, "Initial points", scalar=False)
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to uniform distributions.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        import numpy as np
+
+        u = np.asarray(u, dtype=np.float64)
+        return self.lower_bounds + (self.upper_bounds - self.lower_bounds) * u
 
     def __str__(self):
         """Define the variables block for a uniform uncertain variable.
@@ -133,21 +142,6 @@ class UniformUncertain(VariablesBase):
         dakotathon.variables.base.VariablesBase.__str__
 
         """
-        s = VariablesBase.__str__(self)
-        if self.lower_bounds is not None:
-            lower_bounds = to_iterable(self.lower_bounds)
-            s += "\n" + "    lower_bounds ="
-            for b in lower_bounds:
-                s += " {}".format(b)
-        if self.upper_bounds is not None:
-            upper_bounds = to_iterable(self.upper_bounds)
-            s += "\n" + "    upper_bounds ="
-            for b in upper_bounds:
-                s += " {}".format(b)
-        if self.initial_point is not None:
-            initial_point = to_iterable(self.initial_point)
-            s += "\n" + "    initial_point ="
-            for pt in initial_point:
-                s += " {}".format(pt)
+        s = VariablesBase.__str__(self) + self._print_vectors()
         s += "\n\n"
         return s
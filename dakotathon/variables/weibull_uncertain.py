@@ -0,0 +1,43 @@
+"""Implementation of a Dakota Weibull uncertain variable."""
+
+from .base import ShapeScaleUncertain
+
+
+classname = "WeibullUncertain"
+
+
+class WeibullUncertain(ShapeScaleUncertain):
+
+    """Define attributes for Dakota Weibull uncertain variables.
+
+    The shape and scale parameters are required specifications; the
+    initial point is optional.
+
+    Examples
+    --------
+    Display the variables block created by a default instance of
+    WeibullUncertain:
+
+    >>> v = WeibullUncertain()
+    >>> print(v)
+    variables
+      weibull_uncertain = 2
+        descriptors = 'x1' 'x2'
+        alphas = 2.0 2.0
+        betas = 1.0 1.0
+    <BLANKLINE>
+    <BLANKLINE>
+
+    """
+
+    def from_unit(self, u):
+        """Map points on the unit hypercube to Weibull distributions.
+
+        See Also
+        --------
+        dakotathon.variables.base.VariablesBase.from_unit
+
+        """
+        from ..distributions import weibull_ppf
+
+        return weibull_ppf(u, self.alphas, self.betas)
@@ -2,6 +2,9 @@ from setuptools import setup, find_packages
 from dakotathon import __version__
 from dakotathon.run_plugin import plugin_script
 from dakotathon.run_component import component_script
+from dakotathon.run_batch import batch_script
+from dakotathon.dispatch import agent_script
+from dakotathon.profiling import timing_script
 
 
 def read_requirements():
@@ -32,7 +35,11 @@ setup(
         "console_scripts": [
             plugin_script + " = dakotathon.run_plugin:main",
             component_script + " = dakotathon.run_component:main",
-        ]
+            batch_script + " = dakotathon.run_batch:main",
+            agent_script + " = dakotathon.dispatch:main",
+            timing_script + " = dakotathon.profiling:main",
+        ],
+        "dakotathon.plugins": ["hydrotrend = dakotathon.plugins.hydrotrend"],
     },
     keywords="CSDMS Dakota uncertainty sensitivity model modeling",
     classifiers=[